@@ -270,6 +270,17 @@ export async function installDesktopMocks(page, scenarioOverrides = {}) {
                 finals: state.listening ? [] : [{ text: "Финальный фрагмент" }],
               },
             });
+          case "get_streaming_transcript_since":
+            return envelope({
+              streaming_transcript: {
+                cursor: state.listening ? 0 : 1,
+                partial: state.listening ? "Слушаю встречу" : "",
+                finals: state.listening || Number(args.cursor) >= 1 ? [] : [{ seq: 1, text: "Финальный фрагмент" }],
+                more: false,
+                reset: false,
+                truncated: false,
+              },
+            });
           case "get_sessions":
             return envelope({ sessions: state.sessions });
           case "get_session_detail": {
@@ -296,7 +307,9 @@ export async function installDesktopMocks(page, scenarioOverrides = {}) {
           case "get_rag_stats":
             return envelope({ rag_stats: scenario.ragStats || { indexed_sources_count: 0, chunks_count: 0 } });
           case "index_paths":
-            return JSON.stringify({ ok: true, errors: [] });
+            return JSON.stringify({ ok: true, errors: [], job_id: "1" });
+          case "get_index_job_status":
+            return envelope({ index_jobs: [{ job_id: args.job_id || "1", state: "done", errors: [] }] });
           case "refine_copilot_answer":
             return JSON.stringify({ refined: (args.answer_text || "").trim() + " (refined)", cost_usd: 0.001 });
           case "set_system_audio_opt_in":
@@ -212,7 +212,7 @@ pub async fn get_rag_stats() -> Result<String, String> {
     call_method0(&conn, "GetRagStats").await
 }
 
-/// KC9: Index file/dir paths (JSON array of path strings). Returns JSON { ok, errors }.
+/// KC9: Queue file/dir paths (JSON array of path strings) for indexing. Returns JSON { ok, errors, job_id }.
 #[tauri::command]
 pub async fn index_paths(paths_json: String) -> Result<String, String> {
     let conn = connection().await?;
@@ -230,6 +230,24 @@ pub async fn index_paths(paths_json: String) -> Result<String, String> {
     Ok(body)
 }
 
+/// KC9: Return JSON array of indexing jobs (state, files_done/files_total, errors); one job if job_id given.
+#[tauri::command]
+pub async fn get_index_job_status(job_id: String) -> Result<String, String> {
+    let conn = connection().await?;
+    let reply = conn
+        .call_method(
+            Some(crate::DBUS_NAME),
+            crate::DBUS_PATH,
+            Some(crate::DBUS_INTERFACE),
+            "GetIndexJobStatus",
+            &(job_id.as_str(),),
+        )
+        .await
+        .map_err(|e| e.to_string())?;
+    let body: String = reply.body().deserialize().map_err(|e| e.to_string())?;
+    Ok(body)
+}
+
 /// KC11: Set system audio opt-in (consent + optional PipeWire monitor source). Persisted on daemon.
 #[tauri::command]
 pub async fn set_system_audio_opt_in(consent_given: bool, monitor_source: Option<String>) -> Result<String, String> {
@@ -304,6 +322,24 @@ pub async fn get_streaming_transcript() -> Result<String, String> {
     call_method0(&conn, "GetStreamingTranscript").await
 }
 
+/// Finals with seq > cursor plus the current partial; pass the returned cursor on the next call.
+#[tauri::command]
+pub async fn get_streaming_transcript_since(cursor: u32) -> Result<String, String> {
+    let conn = connection().await?;
+    let reply = conn
+        .call_method(
+            Some(crate::DBUS_NAME),
+            crate::DBUS_PATH,
+            Some(crate::DBUS_INTERFACE),
+            "GetStreamingTranscriptSince",
+            &(cursor,),
+        )
+        .await
+        .map_err(|e| e.to_string())?;
+    let body: String = reply.body().deserialize().map_err(|e| e.to_string())?;
+    Ok(body)
+}
+
 #[tauri::command]
 pub async fn get_upcoming_calendar_events() -> Result<String, String> {
     let conn = connection().await?;
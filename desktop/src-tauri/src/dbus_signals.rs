@@ -14,6 +14,7 @@ const EVENT_TRANSCRIPT_CHUNK: &str = "transcript-chunk";
 const EVENT_TRANSCRIPT_UPDATED: &str = "transcript-updated";
 const EVENT_STREAMING_ANALYSIS_CHUNK: &str = "streaming-analysis-chunk";
 const EVENT_CAPTURE_STATE_CHANGED: &str = "capture-state-changed";
+const EVENT_STREAMING_TRANSCRIPT_ADVANCED: &str = "streaming-transcript-advanced";
 
 fn rule_listen_state() -> Result<MatchRule<'static>, zbus::Error> {
     Ok(MatchRule::builder()
@@ -85,6 +86,16 @@ fn rule_capture_state_changed() -> Result<MatchRule<'static>, zbus::Error> {
         .build())
 }
 
+fn rule_streaming_transcript_advanced() -> Result<MatchRule<'static>, zbus::Error> {
+    Ok(MatchRule::builder()
+        .msg_type(Type::Signal)
+        .sender(DBUS_NAME)?
+        .path(DBUS_PATH)?
+        .interface(DBUS_INTERFACE)?
+        .member("StreamingTranscriptAdvanced")?
+        .build())
+}
+
 pub fn spawn_signal_listener(app: AppHandle) {
     tauri::async_runtime::spawn(async move {
         let conn = match connection().await {
@@ -193,6 +204,20 @@ pub fn spawn_signal_listener(app: AppHandle) {
             }
         };
 
+        let stream_transcript_advanced = match MessageStream::for_match_rule(
+            rule_streaming_transcript_advanced().expect("StreamingTranscriptAdvanced rule"),
+            &conn,
+            Some(8),
+        )
+        .await
+        {
+            Ok(s) => s,
+            Err(e) => {
+                eprintln!("dbus_signals: StreamingTranscriptAdvanced stream: {}", e);
+                return;
+            }
+        };
+
         let app_listen = app.clone();
         let app_analysis = app.clone();
         let app_session_created = app.clone();
@@ -200,6 +225,7 @@ pub fn spawn_signal_listener(app: AppHandle) {
         let app_updated = app.clone();
         let app_streaming_analysis = app.clone();
         let app_capture_state = app.clone();
+        let app_transcript_advanced = app.clone();
 
         tauri::async_runtime::spawn(async move {
             let mut stream = stream_listen;
@@ -299,5 +325,19 @@ pub fn spawn_signal_listener(app: AppHandle) {
                 }
             }
         });
+
+        tauri::async_runtime::spawn(async move {
+            let mut stream = stream_transcript_advanced;
+            while let Some(res) = stream.next().await {
+                if let Ok(msg) = res {
+                    if let Ok((cursor,)) = msg.body().deserialize::<(u32,)>() {
+                        let _ = app_transcript_advanced.emit(
+                            EVENT_STREAMING_TRANSCRIPT_ADVANCED,
+                            serde_json::json!({ "cursor": cursor }),
+                        );
+                    }
+                }
+            }
+        });
     });
 }
@@ -92,6 +92,7 @@ pub fn run() {
             commands::listen_stop,
             commands::analyze,
             commands::get_streaming_transcript,
+            commands::get_streaming_transcript_since,
             commands::get_upcoming_calendar_events,
             commands::create_event_from_session,
             commands::set_tray_theme,
@@ -103,6 +104,7 @@ pub fn run() {
             commands::get_indexed_paths,
             commands::get_rag_stats,
             commands::index_paths,
+            commands::get_index_job_status,
             commands::refine_copilot_answer,
             commands::set_system_audio_opt_in,
         ])
@@ -12,6 +12,7 @@ const STATE_LABELS = {
   recording: "Запись…",
   recording_warning: "Скоро стоп (5 с)", // KC3: 30s auto-stop warning
   analyzing: "Анализ…",
+  cards: "Анализ…", // fast-track cards published, deep-track may still be running
   error: "Ошибка",
 };
 
@@ -197,18 +198,23 @@ function startTranscriptPoll() {
   const el = document.getElementById("copilot-transcript-snippet");
   if (!el) return;
   el.setAttribute("aria-hidden", "false");
+  let cursor = 0;
   transcriptPollTimer = setInterval(async () => {
     try {
-      const raw = await invoke("get_streaming_transcript");
+      // Only the partial is shown: ask for finals after the last cursor so replies stay small
+      const raw = await invoke("get_streaming_transcript_since", { cursor });
       const data = typeof raw === "string" ? JSON.parse(raw) : raw;
       const envelope = data?.data ?? data;
-      let partial = envelope?.partial ?? "";
-      if (typeof envelope?.streaming_transcript === "string") {
+      let inner = envelope?.streaming_transcript ?? envelope;
+      if (typeof inner === "string") {
         try {
-          const inner = JSON.parse(envelope.streaming_transcript);
-          partial = inner?.partial ?? partial;
-        } catch (_) {}
+          inner = JSON.parse(inner);
+        } catch (_) {
+          inner = {};
+        }
       }
+      const partial = inner?.partial ?? "";
+      cursor = inner?.cursor ?? cursor;
       el.textContent = (partial || "").slice(0, 120) || "—";
     } catch {
       el.textContent = "—";
@@ -276,6 +282,8 @@ function applyState(state) {
     clearTranscriptPoll();
     if (s === "analyzing") {
       cardsPollTimer = setTimeout(checkAmbiguityHint, 3000);
+    } else if (s === "cards") {
+      fetchStatusAndRenderCards();
     } else {
       clearCards();
       const hintEl = document.getElementById("copilot-ambiguity-hint");
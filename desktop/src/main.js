@@ -581,9 +581,16 @@ function setStored(key, value) {
 let daemonOk = false;
 let listenState = false;
 let streamingInterval = null;
-/** Reactive buffer from D-Bus TranscriptChunk signals (finals + partial). */
+/** Finals fetched by cursor (GetStreamingTranscriptSince) + partial from TranscriptChunk signals. */
 let streamingFinals = [];
 let streamingPartial = "";
+let streamingCursor = 0;
+let streamingFetching = false;
+let streamingFetchPending = false;
+/** Fallback only: StreamingTranscriptAdvanced signals trigger fetches while listening. */
+const STREAMING_FALLBACK_POLL_MS = 10000;
+const INDEX_JOB_POLL_MS = 1000;
+const INDEX_JOB_MAX_WAIT_MS = 30 * 60 * 1000;
 
 function setDaemonOff(msg) {
   if (daemonOk) notify("VoiceForge", t("status_daemon_off"));
@@ -821,8 +828,10 @@ function applyListenState(isListening) {
     streamingCard.style.display = "block";
     streamingFinals = [];
     streamingPartial = "";
+    streamingCursor = 0;
     updateStreamingDisplay();
-    if (!streamingInterval) streamingInterval = setInterval(pollStreaming, 1500);
+    pollStreaming();
+    if (!streamingInterval) streamingInterval = setInterval(pollStreaming, STREAMING_FALLBACK_POLL_MS);
   } else {
     streamingCard.style.display = "none";
     if (streamingInterval) {
@@ -850,20 +859,33 @@ async function updateListenState() {
   }
 }
 
+/** Fetch only finals after streamingCursor (pages while "more"); one fetch in flight, signals coalesce. */
 async function pollStreaming() {
   if (!daemonOk) return;
+  if (streamingFetching) {
+    streamingFetchPending = true;
+    return;
+  }
+  streamingFetching = true;
   try {
-    const raw = await invoke("get_streaming_transcript");
-    const env = parseEnvelope(raw);
-    const hasStreaming = env?.streaming_transcript != null;
-    const data = env?.data?.streaming_transcript ?? (hasStreaming ? env : null);
-    const text = data?.partial || "";
-    const finals = data?.finals || [];
-    streamingPartial = text;
-    streamingFinals = finals.map((f) => (typeof f === "string" ? f : f?.text || ""));
+    do {
+      streamingFetchPending = false;
+      const raw = await invoke("get_streaming_transcript_since", { cursor: streamingCursor });
+      const env = parseEnvelope(raw);
+      const hasStreaming = env?.streaming_transcript != null;
+      const data = env?.data?.streaming_transcript ?? (hasStreaming ? env : null);
+      if (!data) break;
+      if (data.reset) streamingFinals = [];
+      for (const f of data.finals || []) streamingFinals.push(typeof f === "string" ? f : f?.text || "");
+      streamingPartial = data.partial || "";
+      streamingCursor = data.cursor ?? streamingCursor;
+      if (data.more) streamingFetchPending = true;
+    } while (streamingFetchPending && listenState);
     updateStreamingDisplay();
   } catch (e) {
     if (e != null) console.debug("pollStreaming", e);
+  } finally {
+    streamingFetching = false;
   }
 }
 
@@ -1285,16 +1307,15 @@ listen("capture-state-changed", (e) => {
   if (state) invoke("set_copilot_overlay_state", { state, show: true }).catch(() => {});
 });
 listen("transcript-chunk", (e) => {
-  const text = e.payload?.text ?? "";
-  const isFinal = !!e.payload?.is_final;
-  if (isFinal) {
-    if (text) streamingFinals.push(text);
-    streamingPartial = "";
-  } else {
-    streamingPartial = text;
-  }
+  // Finals arrive by cursor (streaming-transcript-advanced); the chunk only refreshes the partial quickly
+  if (e.payload?.is_final) return;
+  streamingPartial = e.payload?.text ?? "";
   updateStreamingDisplay();
 });
+listen("streaming-transcript-advanced", (e) => {
+  const cursor = e.payload?.cursor ?? 0;
+  if (listenState && cursor !== streamingCursor) pollStreaming();
+});
 listen("transcript-updated", () => {
   if (daemonOk) loadSessions();
 });
@@ -2189,6 +2210,20 @@ function renderKnowledgePacks(currentPaths) {
   listEl.innerHTML = packs.map((pack) => `<li data-pack-id="${escapeHtml(pack.id)}">${escapeHtml(pack.name)} (${(pack.paths || []).length} paths)</li>`).join("");
 }
 
+/** Poll GetIndexJobStatus until the queued IndexPaths job is done or failed (IndexPaths returns at once). */
+async function waitForIndexJob(jobId) {
+  const deadline = Date.now() + INDEX_JOB_MAX_WAIT_MS;
+  while (Date.now() < deadline) {
+    const env = parseEnvelope(await invoke("get_index_job_status", { job_id: String(jobId) }));
+    let jobs = env?.data?.index_jobs ?? env?.index_jobs ?? (Array.isArray(env) ? env : []);
+    if (typeof jobs === "string") try { jobs = JSON.parse(jobs); } catch { jobs = []; }
+    const job = Array.isArray(jobs) ? jobs.find((j) => String(j?.job_id) === String(jobId)) : null;
+    if (!job || job.state === "done" || job.state === "failed") return job;
+    await new Promise((r) => setTimeout(r, INDEX_JOB_POLL_MS));
+  }
+  return null;
+}
+
 function initKnowledgeTab() {
   const dropZone = document.getElementById("knowledge-drop-zone");
   const packAdd = document.getElementById("knowledge-pack-add");
@@ -2210,6 +2245,11 @@ function initKnowledgeTab() {
       }
       if (paths.length === 0) return;
       invoke("index_paths", { paths_json: JSON.stringify(paths) })
+        .then((raw) => {
+          let jobId = null;
+          try { jobId = JSON.parse(raw)?.job_id ?? null; } catch { jobId = null; }
+          return jobId ? waitForIndexJob(jobId) : null;
+        })
         .then(() => loadKnowledgeTab())
         .catch(() => loadKnowledgeTab());
     });
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import mmap
-from collections import deque
+import os
+import struct
+import threading
 from pathlib import Path
 
 import numpy as np
@@ -12,24 +14,117 @@ SAMPLE_RATE = 16000
 CHANNELS = 1
 BYTES_PER_SAMPLE = 2
 
+# Ring file layout: fixed header + circular s16le payload (preallocated, written in place via mmap).
+# Header: magic, sample_rate, capacity_samples, write_offset_samples, total_samples (monotonic),
+# writing_samples (total the writer announced before copying; readers drop samples below writing - capacity).
+RING_FILE_MAGIC = b"VFRING1\x00"
+RING_FILE_HEADER_SIZE = 64
+_RING_HEADER = struct.Struct("<8sIIQQQ")
+_RING_U64 = struct.Struct("<Q")
+_RING_WRITING_POS = 32
+
+
+def _empty() -> np.ndarray:
+    return np.array([], dtype=np.int16)
+
+
+def _parse_ring_header(mm: mmap.mmap) -> tuple[int, int, int, int] | None:
+    """Return (sample_rate, capacity, write_offset, total) or None if not a ring header. The write offset is
+    derived from total (one aligned 8-byte field), so a header update in progress cannot tear it."""
+    if len(mm) < RING_FILE_HEADER_SIZE:
+        return None
+    magic, rate, capacity, _offset, total, _writing = _RING_HEADER.unpack_from(mm, 0)
+    if magic != RING_FILE_MAGIC or capacity <= 0 or len(mm) < RING_FILE_HEADER_SIZE + capacity * BYTES_PER_SAMPLE:
+        return None
+    return (rate, capacity, total % capacity, total)
+
+
+def _overwritten_during_copy(mm: mmap.mmap, first_sample: int, capacity: int) -> int:
+    """Seqlock check after copying samples [first_sample, ...): how many leading samples the writer may have
+    overwritten meanwhile (it announces writing_samples before touching the payload)."""
+    writing = _RING_U64.unpack_from(mm, _RING_WRITING_POS)[0]
+    return max(0, writing - capacity - first_sample)
+
+
+def is_ring_file(path: Path | str) -> bool:
+    """True if path is a preallocated ring file (has the ring header), not legacy raw PCM."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(RING_FILE_MAGIC)) == RING_FILE_MAGIC
+    except OSError:
+        return False
+
+
+def ring_file_has_audio(path: Path | str) -> bool:
+    """True if the ring file (either format) holds at least one sample."""
+    path = Path(path)
+    if not path.is_file():
+        return False
+    if not is_ring_file(path):
+        return path.stat().st_size >= BYTES_PER_SAMPLE
+    with open(path, "rb") as f:
+        raw = f.read(_RING_HEADER.size)
+    if len(raw) < _RING_HEADER.size:
+        return False
+    return _RING_HEADER.unpack(raw)[4] > 0
+
+
+def _read_ring_format_last(path: Path, seconds: float, copy: bool) -> np.ndarray:
+    """Read last N seconds from a ring-format file. Contiguous tail is a view onto the mmap unless copy;
+    a wrapped tail is joined with a single copy."""
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    header = _parse_ring_header(mm)
+    if header is None:
+        mm.close()
+        return _empty()
+    rate, capacity, offset, total = header
+    want = min(int(seconds * rate * CHANNELS), total, capacity)
+    if want <= 0:
+        mm.close()
+        return _empty()
+    start = (offset - want) % capacity
+    first = min(want, capacity - start)
+    head = np.frombuffer(mm, dtype=np.int16, count=first, offset=RING_FILE_HEADER_SIZE + start * BYTES_PER_SAMPLE)
+    if first == want:
+        if not copy:
+            return head  # zero-copy: array keeps the mmap alive
+        out = head.copy()
+    else:
+        tail = np.frombuffer(mm, dtype=np.int16, count=want - first, offset=RING_FILE_HEADER_SIZE)
+        out = np.concatenate((head, tail))
+        del tail
+    del head
+    out = out[_overwritten_during_copy(mm, total - want, capacity) :]
+    mm.close()
+    return out
+
 
 def read_ring_file_last(
     path: Path | str,
     seconds: float,
     sample_rate: int = SAMPLE_RATE,
     use_mmap: bool = True,
+    copy: bool = True,
 ) -> np.ndarray:
-    """Read last N seconds from ring.raw. Uses mmap for zero-copy tail when use_mmap and file is large enough; else fallback to read_bytes."""
+    """Read last N seconds from ring.raw. Ring-format files (see RingFile) are read via mmap, unwrapping the tail;
+    copy=False returns a read-only view when the tail is contiguous (it may be overwritten by the writer later).
+    Legacy raw PCM files use mmap for the tail when use_mmap and file is large enough; else fallback to read_bytes."""
     path = Path(path)
     if not path.is_file():
-        return np.array([], dtype=np.int16)
+        return _empty()
+    if is_ring_file(path):
+        try:
+            return _read_ring_format_last(path, seconds, copy)
+        except (OSError, ValueError):
+            return _empty()
     want_bytes = int(seconds * sample_rate * CHANNELS * BYTES_PER_SAMPLE)
     file_size = path.stat().st_size
     if file_size == 0:
-        return np.array([], dtype=np.int16)
+        return _empty()
     want_bytes = min(want_bytes, file_size - (file_size % 2))
     if want_bytes <= 0:
-        return np.array([], dtype=np.int16)
+        return _empty()
     if use_mmap and file_size >= want_bytes:
         try:
             with open(path, "rb") as f:
@@ -47,46 +142,281 @@ def read_ring_file_last(
         raw = raw[-want_bytes:]
     raw = raw[: len(raw) - (len(raw) % 2)]
     if not raw:
-        return np.array([], dtype=np.int16)
+        return _empty()
     return np.frombuffer(raw, dtype=np.int16)
 
 
+def read_ring_file_since(
+    path: Path | str,
+    start_sample: int | None,
+    max_samples: int,
+) -> tuple[np.ndarray, int]:
+    """Read samples appended after start_sample (ring sample clock). Returns (samples, total_samples).
+    start_sample None (first read) or beyond total (ring was recreated) reads the newest max_samples.
+    Legacy raw PCM files have no sample clock: their length in samples is used instead."""
+    path = Path(path)
+    if not path.is_file():
+        return (_empty(), 0)
+    try:
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return (_empty(), 0)
+    try:
+        header = _parse_ring_header(mm)
+        if header is not None:
+            _rate, capacity, offset, total = header
+            available = min(total, capacity)
+            base, pos = RING_FILE_HEADER_SIZE, offset
+        elif mm[: len(RING_FILE_MAGIC)] == RING_FILE_MAGIC:
+            return (_empty(), 0)
+        else:
+            total = available = len(mm) // BYTES_PER_SAMPLE
+            capacity, base, pos = max(1, total), 0, 0
+        if start_sample is None or start_sample > total:
+            want = min(available, max_samples)
+        else:
+            want = min(total - start_sample, available, max_samples)
+        if want <= 0:
+            return (_empty(), total)
+        start = (pos - want) % capacity
+        first = min(want, capacity - start)
+        head = np.frombuffer(mm, dtype=np.int16, count=first, offset=base + start * BYTES_PER_SAMPLE)
+        if first == want:
+            out = head.copy()
+        else:
+            tail = np.frombuffer(mm, dtype=np.int16, count=want - first, offset=base)
+            out = np.concatenate((head, tail))
+            del tail
+        del head
+        if header is not None:
+            out = out[_overwritten_during_copy(mm, total - want, capacity) :]
+        return (out, total)
+    finally:
+        mm.close()
+
+
+class RingFile:
+    """Fixed-size, preallocated, memory-mapped ring file (crash persistence for listen).
+    append() writes only the new samples at the head pointer and updates the header, so persistence
+    cost is O(new audio), not O(ring size). Single writer; readers use read_ring_file_last.
+
+    An existing ring file with the same sample rate and capacity is reopened in place and its sample clock
+    continues (audio left by a crashed session stays readable until overwritten). It is reset only with
+    create=True or when its header does not match."""
+
+    def __init__(self, path: Path | str, maxlen_seconds: float, sample_rate: int = SAMPLE_RATE, create: bool = False) -> None:
+        self._path = Path(path)
+        self._sample_rate = sample_rate
+        self._capacity = max(1, int(maxlen_seconds * sample_rate * CHANNELS))
+        self._write_offset = 0
+        self._total = 0
+        self._pending = b""  # odd trailing byte from the previous append
+        self._lock = threading.Lock()
+        size = RING_FILE_HEADER_SIZE + self._capacity * BYTES_PER_SAMPLE
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if os.fstat(fd).st_size != size:
+                os.ftruncate(fd, size)  # header mismatch (or new file): nothing of ours to keep
+            self._mm: mmap.mmap | None = mmap.mmap(fd, size, access=mmap.ACCESS_WRITE)
+        finally:
+            os.close(fd)
+        header = None if create else _parse_ring_header(self._mm)
+        if header is not None and header[:2] == (self._sample_rate, self._capacity):
+            self._total = header[3]
+            self._write_offset = header[2]
+        self._write_header()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def total_samples(self) -> int:
+        """Monotonic count of samples ever appended (sample clock)."""
+        return self._total
+
+    def _write_header(self) -> None:
+        if self._mm is not None:
+            _RING_HEADER.pack_into(
+                self._mm,
+                0,
+                RING_FILE_MAGIC,
+                self._sample_rate,
+                self._capacity,
+                self._write_offset,
+                self._total,
+                self._total,
+            )
+
+    def append(self, data: bytes) -> None:
+        """Write new s16le bytes at the head pointer (wrapping), then publish the new offset in the header."""
+        with self._lock:
+            if self._mm is None:
+                return
+            if self._pending:
+                data = self._pending + data
+                self._pending = b""
+            if len(data) % BYTES_PER_SAMPLE:
+                self._pending = data[-1:]
+                data = data[:-1]
+            n_new = len(data) // BYTES_PER_SAMPLE
+            if n_new == 0:
+                return
+            src = memoryview(data)
+            n = n_new
+            if n > self._capacity:
+                src = src[-self._capacity * BYTES_PER_SAMPLE :]
+                n = self._capacity
+            offset = (self._write_offset + n_new - n) % self._capacity
+            _RING_U64.pack_into(self._mm, _RING_WRITING_POS, self._total + n_new)  # announce before overwriting
+            first = min(n, self._capacity - offset)
+            pos = RING_FILE_HEADER_SIZE + offset * BYTES_PER_SAMPLE
+            self._mm[pos : pos + first * BYTES_PER_SAMPLE] = src[: first * BYTES_PER_SAMPLE]
+            if n > first:
+                rest = (n - first) * BYTES_PER_SAMPLE
+                self._mm[RING_FILE_HEADER_SIZE : RING_FILE_HEADER_SIZE + rest] = src[first * BYTES_PER_SAMPLE :]
+            self._write_offset = (offset + n) % self._capacity
+            self._total += n_new
+            self._write_header()
+
+    def flush(self) -> None:
+        """msync dirty pages (only what was appended since the last flush)."""
+        with self._lock:
+            if self._mm is not None:
+                self._mm.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._mm is None:
+                return
+            self._mm.flush()
+            self._mm.close()
+            self._mm = None
+
+
+def pcm_to_float32(audio: np.ndarray) -> np.ndarray:
+    """int16 PCM to float32 in [-1, 1) for STT, VAD and diarization; float input is returned as float32 unchanged."""
+    if audio.dtype == np.int16:
+        out = audio.astype(np.float32)
+        out *= 1.0 / 32768.0
+        return out
+    return audio.astype(np.float32, copy=False)
+
+
 class RingBuffer:
-    """Fixed-size buffer (in seconds). Stores raw s16le bytes."""
+    """Fixed-size in-memory PCM ring (in seconds): a preallocated int16 array and, with float32=True, a float32
+    mirror filled once per written chunk, so readers that need float audio (STT, VAD) do not convert it again.
+
+    Positions are on a monotonic sample clock (total_samples counts every sample ever written). One writer thread
+    (the capture reader) and any number of readers, without a lock: the writer announces the range it is about to
+    overwrite, copies the samples in place, then publishes the new total. Readers take the published total, copy
+    the range they want and drop any leading part the writer reached meanwhile, so a copy never mixes old and new
+    audio. copy=False returns a view of the ring when the range does not wrap; it stays valid only until the writer
+    comes around again (capacity samples later)."""
 
-    def __init__(self, maxlen_seconds: float, sample_rate: int = SAMPLE_RATE) -> None:
+    def __init__(self, maxlen_seconds: float, sample_rate: int = SAMPLE_RATE, float32: bool = False) -> None:
         self._sample_rate = sample_rate
-        self._maxlen_bytes = int(maxlen_seconds * sample_rate * CHANNELS * BYTES_PER_SAMPLE)
-        self._chunks: deque[bytes] = deque()
-        self._total_bytes = 0
+        self._capacity = max(1, int(maxlen_seconds * sample_rate * CHANNELS))
+        self._pcm = np.zeros(self._capacity, dtype=np.int16)
+        self._float = np.zeros(self._capacity, dtype=np.float32) if float32 else None
+        self._total = 0  # published: samples [_total - capacity, _total) are readable
+        self._writing = 0  # announced: samples below _writing - capacity may be overwritten right now
+        self._pending = b""  # odd trailing byte of an incomplete sample
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def total_samples(self) -> int:
+        """Samples written since creation (monotonic, includes samples already overwritten)."""
+        return self._total
+
+    @property
+    def available_samples(self) -> int:
+        """Samples currently held (at most capacity)."""
+        return min(self._total, self._capacity)
 
     def write(self, data: bytes) -> None:
-        """Append chunk; oldest data beyond maxlen is dropped."""
+        """Append s16le bytes (single writer); the oldest samples beyond capacity are overwritten."""
+        if self._pending:
+            data = self._pending + data
+            self._pending = b""
+        if len(data) % BYTES_PER_SAMPLE:
+            self._pending = data[-1:]
+            data = data[:-1]
         if not data:
             return
-        self._chunks.append(data)
-        self._total_bytes += len(data)
-        while self._total_bytes > self._maxlen_bytes and self._chunks:
-            old = self._chunks.popleft()
-            self._total_bytes -= len(old)
-
-    def read_last(self, seconds: float) -> np.ndarray:
-        """Return last N seconds as int16 numpy array (mono). Thread-safe: snapshot of deque to avoid 'deque mutated during iteration' when capture thread writes."""
-        want_bytes = int(seconds * self._sample_rate * CHANNELS * BYTES_PER_SAMPLE)
-        total = self._total_bytes
-        if want_bytes <= 0 or total == 0:
-            return np.array([], dtype=np.int16)
-        want_bytes = min(want_bytes, total)
-        collected: list[bytes] = []
-        remaining = want_bytes
-        snapshot = list(self._chunks)
-        for chunk in reversed(snapshot):
-            if remaining <= 0:
-                break
-            take = min(remaining, len(chunk))
-            collected.append(chunk[-take:])
-            remaining -= take
-        if not collected:
-            return np.array([], dtype=np.int16)
-        data = b"".join(reversed(collected))
-        return np.frombuffer(data, dtype=np.int16)
+        samples = np.frombuffer(data, dtype=np.int16)
+        total = self._total
+        end = total + samples.size
+        if samples.size > self._capacity:
+            samples = samples[-self._capacity :]
+        self._writing = end
+        start = end - samples.size
+        pos = start % self._capacity
+        first = min(samples.size, self._capacity - pos)
+        self._pcm[pos : pos + first] = samples[:first]
+        self._pcm[: samples.size - first] = samples[first:]
+        if self._float is not None:
+            converted = pcm_to_float32(samples)
+            self._float[pos : pos + first] = converted[:first]
+            self._float[: samples.size - first] = converted[first:]
+        self._total = end
+
+    def _copy(self, start: int, end: int, dtype: type, copy: bool) -> tuple[np.ndarray, int]:
+        """Samples [start, end) of the clock as (array, first sample actually returned)."""
+        ring = self._float if self._float is not None and dtype == np.float32 else self._pcm
+        convert = dtype == np.float32 and ring.dtype != np.float32
+        pos = start % self._capacity
+        n = end - start
+        out: np.ndarray
+        if pos + n <= self._capacity:
+            out = ring[pos : pos + n]
+            if copy and not convert:
+                out = out.copy()
+        else:
+            out = np.concatenate((ring[pos:], ring[: pos + n - self._capacity]))
+        if convert:
+            out = pcm_to_float32(out)  # the conversion is the copy: take it before checking how far the writer got
+        floor = self._writing - self._capacity  # the writer may have reached these samples during the copy
+        if start < floor:
+            out = out[min(floor - start, n) :]
+            start = min(floor, end)
+        return (out, start)
+
+    def read_range(self, start_sample: int, end_sample: int, dtype: type = np.int16, copy: bool = True) -> tuple[np.ndarray, int]:
+        """Samples [start_sample, end_sample) clipped to what is held: (array, first sample returned).
+        dtype np.float32 returns normalized float audio (from the mirror when enabled)."""
+        total = self._total
+        start = max(start_sample, total - self._capacity, 0)
+        end = min(end_sample, total)
+        if start >= end:
+            return (np.empty(0, dtype=dtype), max(start, 0))
+        return self._copy(start, end, dtype, copy)
+
+    def read_since(
+        self, start_sample: int | None, max_samples: int | None = None, dtype: type = np.int16
+    ) -> tuple[np.ndarray, int]:
+        """Return (samples from start_sample up to now, total_samples). Only complete samples are returned.
+        start_sample=None or older than the retained audio returns what is still buffered (capped by max_samples),
+        so callers can detect a gap via total - len(samples) > start_sample."""
+        total = self._total
+        oldest = max(0, total - self._capacity)
+        start = oldest if start_sample is None else max(start_sample, oldest)
+        if max_samples is not None:
+            start = max(start, total - max_samples)
+        if start >= total:
+            return (np.empty(0, dtype=dtype), total)
+        return (self._copy(start, total, dtype, copy=True)[0], total)
+
+    def read_last(self, seconds: float, dtype: type = np.int16, copy: bool = True) -> np.ndarray:
+        """Return the last N seconds (mono) as one array: a single copy, or a view with copy=False when the range
+        does not wrap."""
+        want = int(seconds * self._sample_rate * CHANNELS)
+        total = self._total
+        if want <= 0 or total == 0:
+            return np.empty(0, dtype=dtype)
+        return self.read_range(total - want, total, dtype, copy)[0]
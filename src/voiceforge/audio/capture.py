@@ -2,12 +2,13 @@
 
 import subprocess  # nosec B404 -- pw-record for capture, args from config
 import threading
+from pathlib import Path
 from typing import BinaryIO
 
 import numpy as np
 import structlog
 
-from voiceforge.audio.buffer import BYTES_PER_SAMPLE, CHANNELS, SAMPLE_RATE, RingBuffer
+from voiceforge.audio.buffer import BYTES_PER_SAMPLE, CHANNELS, SAMPLE_RATE, RingBuffer, RingFile
 
 log = structlog.get_logger()
 
@@ -31,7 +32,9 @@ def _pw_record_cmd(target_source: str | None = None) -> list[str]:
 
 
 class AudioCapture:
-    """Two streams: mic and system monitor via PipeWire."""
+    """Two streams: mic and system monitor via PipeWire.
+    ring_file_path: if set, mic audio is also appended to a preallocated mmap RingFile (crash persistence).
+    mic_float32: keep a float32 mirror of the mic ring (converted once on write) for float readers (streaming STT)."""
 
     def __init__(
         self,
@@ -39,6 +42,8 @@ class AudioCapture:
         channels: int = CHANNELS,
         buffer_seconds: float = 60.0,
         monitor_source: str | None = None,
+        ring_file_path: str | Path | None = None,
+        mic_float32: bool = False,
     ) -> None:
         self._sample_rate = sample_rate
         self._channels = channels
@@ -46,6 +51,9 @@ class AudioCapture:
         self._monitor_source = monitor_source
         self._mic_buffer: RingBuffer | None = None
         self._monitor_buffer: RingBuffer | None = None
+        self._ring_file_path = Path(ring_file_path) if ring_file_path else None
+        self._mic_float32 = mic_float32
+        self._ring_file: RingFile | None = None
         self._mic_proc: subprocess.Popen[bytes] | None = None
         self._monitor_proc: subprocess.Popen[bytes] | None = None
         self._mic_thread: threading.Thread | None = None
@@ -58,8 +66,10 @@ class AudioCapture:
             log.warning("capture.already_started")
             return
         self._stop.clear()
-        self._mic_buffer = RingBuffer(self._buffer_seconds, self._sample_rate)
+        self._mic_buffer = RingBuffer(self._buffer_seconds, self._sample_rate, float32=self._mic_float32)
         self._monitor_buffer = RingBuffer(self._buffer_seconds, self._sample_rate)
+        if self._ring_file_path is not None:
+            self._ring_file = RingFile(self._ring_file_path, self._buffer_seconds, self._sample_rate)
 
         try:
             # pw-record is an expected system binary on Linux desktop targets.
@@ -71,11 +81,12 @@ class AudioCapture:
             )
         except FileNotFoundError:
             log.error("capture.pw_record_not_found", hint="dnf install pipewire-utils")
+            self._close_ring_file()
             raise
 
         self._mic_thread = threading.Thread(
             target=self._reader_loop,
-            args=(self._mic_proc, self._mic_proc.stdout, self._mic_buffer, "mic"),
+            args=(self._mic_proc, self._mic_proc.stdout, self._mic_buffer, "mic", self._ring_file),
             daemon=True,
         )
         self._mic_thread.start()
@@ -125,6 +136,7 @@ class AudioCapture:
         stream: BinaryIO | None,
         buf: RingBuffer,
         name: str,
+        ring_file: RingFile | None = None,
     ) -> None:
         if stream is None:
             return
@@ -139,6 +151,8 @@ class AudioCapture:
                     break
                 break
             buf.write(data)
+            if ring_file is not None:
+                ring_file.append(data)
         log.debug("capture.reader_stopped", name=name)
 
     @staticmethod
@@ -164,24 +178,45 @@ class AudioCapture:
             self._monitor_thread.join(timeout=2)
         self._mic_thread = None
         self._monitor_thread = None
+        self._close_ring_file()
         log.info("capture.stopped")
 
+    def _close_ring_file(self) -> None:
+        if self._ring_file is not None:
+            self._ring_file.close()
+            self._ring_file = None
+
+    def flush_ring_file(self) -> bool:
+        """Sync the mmap ring file to disk. Returns False when capture has no ring file."""
+        if self._ring_file is None:
+            return False
+        self._ring_file.flush()
+        return True
+
     def get_chunk(self, seconds: float) -> tuple[np.ndarray, np.ndarray]:
-        """Return last N seconds: (mic, monitor) as int16 arrays."""
+        """Return last N seconds: (mic, monitor) as int16 arrays (copies: callers keep them past the ring's wrap)."""
         mic = self._mic_buffer.read_last(seconds) if self._mic_buffer else np.array([], dtype=np.int16)
         mon = self._monitor_buffer.read_last(seconds) if self._monitor_buffer else np.array([], dtype=np.int16)
         return (mic, mon)
 
+    def read_mic_since(
+        self, start_sample: int | None, max_seconds: float | None = None, dtype: type = np.int16
+    ) -> tuple[np.ndarray, int]:
+        """Mic audio appended since start_sample on the capture's sample clock: (samples, total_samples).
+        Streaming STT keeps the returned total as its cursor instead of re-reading overlapping windows.
+        dtype np.float32 returns normalized audio (no conversion with mic_float32)."""
+        if self._mic_buffer is None:
+            return (np.array([], dtype=dtype), 0)
+        max_samples = int(max_seconds * self._sample_rate) if max_seconds is not None else None
+        return self._mic_buffer.read_since(start_sample, max_samples, dtype=dtype)
+
     def diagnostics(self) -> dict[str, object]:
         """Return runtime diagnostics useful for tests and troubleshooting."""
         mic_rc = self._mic_proc.poll() if self._mic_proc is not None else None
         mon_rc = self._monitor_proc.poll() if self._monitor_proc is not None else None
-        mic_samples = 0
-        mon_samples = 0
-        if self._mic_buffer is not None:
-            mic_samples = int(self._mic_buffer.read_last(1.0).size)
-        if self._monitor_buffer is not None:
-            mon_samples = int(self._monitor_buffer.read_last(1.0).size)
+        one_sec = self._sample_rate * self._channels
+        mic_samples = min(one_sec, self._mic_buffer.available_samples) if self._mic_buffer is not None else 0
+        mon_samples = min(one_sec, self._monitor_buffer.available_samples) if self._monitor_buffer is not None else 0
         return {
             "mic_returncode": mic_rc,
             "monitor_returncode": mon_rc,
@@ -1,14 +1,18 @@
 """Block 4.4: Smart Trigger — auto-analyze on semantic pause (silence after speech).
-Uses Silero VAD from faster-whisper."""
+Uses Silero VAD from faster-whisper. Incremental: each check consumes only audio appended to the ring
+since the previous check and keeps a rolling speech ledger, so cost per tick is O(new samples)."""
 
 from __future__ import annotations
 
 import time
+from collections import deque
 from pathlib import Path
 
 import numpy as np
 import structlog
 
+from voiceforge.audio.buffer import read_ring_file_since
+
 log = structlog.get_logger()
 
 # Defaults from BLOCKS.md: silence > 3 s after >= 30 s speech; cooldown 2 min
@@ -16,11 +20,21 @@ DEFAULT_MIN_SPEECH_SEC = 30.0
 DEFAULT_MIN_SILENCE_SEC = 3.0
 DEFAULT_COOLDOWN_SEC = 120.0
 DEFAULT_ANALYZE_SECONDS = 30
+DEFAULT_WINDOW_SEC = 300.0  # speech ledger horizon; matches default ring_seconds
+
+# Silero VAD scores fixed 512-sample windows (16 kHz)
+VAD_WINDOW_SAMPLES = 512
+VAD_THRESHOLD = 0.5
+VAD_MIN_SPEECH_MS = 250
+# Already-scored audio re-fed before new windows so the recurrent VAD state settles (~0.5 s at 16 kHz)
+_VAD_WARMUP_SAMPLES = 16 * VAD_WINDOW_SAMPLES
 
 
 class SmartTrigger:
     """Trigger analyze when silence > min_silence_sec after at least min_speech_sec of speech.
-    Uses Silero VAD from faster-whisper (no extra models)."""
+    Uses Silero VAD from faster-whisper (no extra models).
+    Speech is tracked on the ring's sample clock: closed segments in a ledger bounded by window_sec,
+    plus the currently open segment. Counters: samples_processed_last_tick / samples_processed_total / ticks."""
 
     def __init__(
         self,
@@ -29,53 +43,135 @@ class SmartTrigger:
         min_silence_sec: float = DEFAULT_MIN_SILENCE_SEC,
         cooldown_sec: float = DEFAULT_COOLDOWN_SEC,
         analyze_seconds: int = DEFAULT_ANALYZE_SECONDS,
+        window_sec: float = DEFAULT_WINDOW_SEC,
     ) -> None:
         self.sample_rate = sample_rate
         self.min_speech_sec = min_speech_sec
         self.min_silence_sec = min_silence_sec
         self.cooldown_sec = cooldown_sec
         self.analyze_seconds = analyze_seconds
+        self.window_sec = window_sec
         self._last_trigger_time: float = 0.0
+        self.samples_processed_last_tick = 0
+        self.samples_processed_total = 0
+        self.ticks = 0
+        self._reset(0)
+
+    def _reset(self, origin: int) -> None:
+        """Start a fresh ledger at sample `origin` (first check or ring recreated)."""
+        self._cursor: int | None = None  # ring sample clock consumed so far
+        self._origin = origin  # first sample seen by this ledger
+        self._scored_until = origin  # absolute sample where the next VAD window starts
+        self._pending = np.empty(0, dtype=np.float32)  # tail shorter than one VAD window
+        self._warmup = np.empty(0, dtype=np.float32)  # last scored samples (state warm-up)
+        self._segments: deque[tuple[int, int]] = deque()  # closed speech segments [start, end)
+        self._speech_start: int | None = None  # open segment start
+        self._temp_end = 0  # candidate end of open segment (first silent window)
+
+    def stats(self) -> dict[str, int]:
+        """Counters for monitoring: CPU per tick should stay flat as the ring grows."""
+        return {
+            "samples_processed_last_tick": self.samples_processed_last_tick,
+            "samples_processed_total": self.samples_processed_total,
+            "ticks": self.ticks,
+        }
+
+    @staticmethod
+    def _speech_probs(audio_f: np.ndarray) -> np.ndarray:
+        """Silero VAD probability per 512-sample window (len(audio_f) must be a multiple of 512)."""
+        from faster_whisper.vad import get_vad_model
+
+        return np.asarray(get_vad_model()(audio_f), dtype=np.float32).reshape(-1)
+
+    def _consume(self, audio_i16: np.ndarray) -> None:
+        """Score new complete VAD windows and advance the speech/silence state machine."""
+        buf = np.concatenate((self._pending, audio_i16.astype(np.float32) / 32768.0))
+        n_windows = len(buf) // VAD_WINDOW_SAMPLES
+        usable = n_windows * VAD_WINDOW_SAMPLES
+        self._pending = buf[usable:]
+        if n_windows == 0:
+            return
+        fresh = buf[:usable]
+        probs = self._speech_probs(np.concatenate((self._warmup, fresh)))
+        probs = probs[len(self._warmup) // VAD_WINDOW_SAMPLES :]
+        self._warmup = np.concatenate((self._warmup, fresh))[-_VAD_WARMUP_SAMPLES:]
+        neg_threshold = max(VAD_THRESHOLD - 0.15, 0.01)
+        min_silence = int(self.min_silence_sec * self.sample_rate)
+        min_speech = int(VAD_MIN_SPEECH_MS * self.sample_rate / 1000)
+        pos = self._scored_until
+        for prob in probs:
+            if prob >= VAD_THRESHOLD:
+                self._temp_end = 0
+                if self._speech_start is None:
+                    self._speech_start = pos
+            elif prob < neg_threshold and self._speech_start is not None:
+                if not self._temp_end:
+                    self._temp_end = pos
+                if pos - self._temp_end >= min_silence:
+                    if self._temp_end - self._speech_start >= min_speech:
+                        self._segments.append((self._speech_start, self._temp_end))
+                    self._speech_start = None
+                    self._temp_end = 0
+            pos += VAD_WINDOW_SAMPLES
+        self._scored_until = pos
+
+    def _trim(self, horizon: int) -> None:
+        """Drop ledger segments that ended before the window horizon."""
+        while self._segments and self._segments[0][1] <= horizon:
+            self._segments.popleft()
+
+    def _speech_and_silence(self, total: int, horizon: int) -> tuple[int, int | None]:
+        """Return (speech samples inside window, trailing silence samples or None while speech is open)."""
+        speech = sum(end - max(start, horizon) for start, end in self._segments)
+        if self._speech_start is not None:
+            speech += self._scored_until - max(self._speech_start, horizon)
+            return (speech, None)
+        if not self._segments:
+            return (speech, None)
+        return (speech, total - self._segments[-1][1])
+
+    def _record_tick(self, n: int) -> None:
+        self.ticks += 1
+        self.samples_processed_last_tick = n
+        self.samples_processed_total += n
+        try:
+            from voiceforge.core.observability import record_smart_trigger_tick
+
+            record_smart_trigger_tick(n)
+        except ImportError:
+            pass
 
     def check(self, ring_path: str | Path) -> bool:
-        """Read ring buffer, run VAD; return True if trigger fired (semantic pause + cooldown).
-        Call every ~2 sec from daemon."""
+        """Consume audio appended to the ring since the last call, update VAD state; return True if trigger
+        fired (semantic pause + cooldown). Call every ~2 sec from daemon."""
         path = Path(ring_path)
         if not path.is_file():
             return False
-        raw = path.read_bytes()
-        # Need at least min_speech_sec + min_silence_sec of audio
-        min_samples = int(self.sample_rate * (self.min_speech_sec + self.min_silence_sec))
-        if len(raw) < min_samples * 2:  # 2 bytes per sample (int16)
-            return False
-        audio_i16 = np.frombuffer(raw, dtype=np.int16)
-        audio_f = audio_i16.astype(np.float32) / 32768.0
-
+        max_samples = int(self.window_sec * self.sample_rate)
+        new, total = read_ring_file_since(path, self._cursor, max_samples)
+        if self._cursor is None or total < self._cursor or total - len(new) > self._cursor:
+            # First read, ring recreated, or fell behind by more than the window: restart the ledger
+            self._reset(total - len(new))
+        self._cursor = total
         try:
-            from faster_whisper.vad import VadOptions, get_speech_timestamps
+            self._consume(new)
         except ImportError:
             log.debug("smart_trigger.no_vad", hint="faster-whisper not installed")
+            self._record_tick(0)
             return False
+        self._record_tick(len(new))
 
-        vad_options = VadOptions(
-            min_silence_duration_ms=int(self.min_silence_sec * 1000),
-            min_speech_duration_ms=250,
-        )
-        segments = get_speech_timestamps(
-            audio_f,
-            vad_options=vad_options,
-            sampling_rate=self.sample_rate,
-        )
-        if not segments:
+        horizon = max(self._origin, total - max_samples)
+        self._trim(horizon)
+        # Need at least min_speech_sec + min_silence_sec of audio
+        min_samples = int(self.sample_rate * (self.min_speech_sec + self.min_silence_sec))
+        if total - horizon < min_samples:
             return False
 
-        total_speech_samples = sum(seg["end"] - seg["start"] for seg in segments)
-        total_speech_sec = total_speech_samples / self.sample_rate
-        if total_speech_sec < self.min_speech_sec:
+        speech_samples, silence_samples = self._speech_and_silence(total, horizon)
+        total_speech_sec = speech_samples / self.sample_rate
+        if total_speech_sec < self.min_speech_sec or silence_samples is None:
             return False
-
-        last_end = segments[-1]["end"]
-        silence_samples = len(audio_f) - last_end
         silence_sec = silence_samples / self.sample_rate
         if silence_sec < self.min_silence_sec:
             return False
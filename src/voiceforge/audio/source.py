@@ -0,0 +1,63 @@
+"""Audio sources for AnalysisPipeline: where the last N seconds of PCM come from.
+
+Processes that own a live capture (daemon, meeting) hand audio to the pipeline in memory: a captured segment
+(PcmSource, copilot) or the capture's buffers (CaptureSource, Smart Trigger, meeting). Other processes (CLI analyze,
+web) read the ring file (RingFileSource), which otherwise only persists audio across crashes."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Protocol
+
+import numpy as np
+
+
+class AudioSource(Protocol):
+    """int16 mono PCM at sample_rate. read_last returns None when the source is unavailable (no ring file yet)."""
+
+    sample_rate: int
+
+    def read_last(self, seconds: float) -> np.ndarray | None: ...
+
+
+@dataclass
+class PcmSource:
+    """In-memory PCM handed over by the caller (not modified afterwards); read_last returns a view, no copy.
+    stt: (segments, transcript) already decoded for all of audio (speculative copilot STT); the pipeline uses it
+    instead of running STT when the whole buffer is analyzed."""
+
+    audio: np.ndarray
+    sample_rate: int
+    stt: tuple[list[Any], str] | None = None
+
+    def read_last(self, seconds: float) -> np.ndarray:
+        n = int(seconds * self.sample_rate)
+        return self.audio[-n:] if n > 0 else self.audio[:0]
+
+
+@dataclass
+class CaptureSource:
+    """Live AudioCapture: the last N seconds from its in-memory buffers (mic, or monitor when the mic is empty)."""
+
+    capture: Any
+    sample_rate: int
+
+    def read_last(self, seconds: float) -> np.ndarray:
+        mic, monitor = self.capture.get_chunk(seconds)
+        return mic if mic.size > 0 or monitor.size == 0 else monitor
+
+
+@dataclass
+class RingFileSource:
+    """ring.raw written by another process's capture (mmap read of the tail)."""
+
+    path: str
+    sample_rate: int
+
+    def read_last(self, seconds: float) -> np.ndarray | None:
+        from voiceforge.audio.buffer import read_ring_file_last
+
+        if not Path(self.path).is_file():
+            return None
+        return read_ring_file_last(self.path, float(seconds), self.sample_rate, use_mmap=True)
@@ -1,4 +1,5 @@
-"""Calendar integration (roadmap 17): CalDAV poll from keyring. Block 79: create event (#95)."""
+"""Calendar integration (roadmap 17): CalDAV poll from keyring. Block 79: create event (#95).
+Lookups for analyze and the daemon go through the local mirror (calendar.mirror)."""
 
 from voiceforge.calendar.caldav_poll import (
     create_event,
@@ -0,0 +1,527 @@
+"""Local CalDAV mirror: events in SQLite, refreshed in the background (ctag / sync-token / ETag).
+
+Analyze (calendar context), the daemon calendar loops and GetUpcomingEvents read the mirror and never wait on
+the CalDAV server. CalendarSync keeps one DAVClient (one HTTP session) for the process; per calendar it skips
+unchanged collections by ctag, pulls changes with a sync-token REPORT when the server supports it, and downloads
+only resources whose ETag changed. Recurring events are expanded into occurrences for a rolling window."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from voiceforge.calendar.caldav_poll import _dt_to_aware, _event_dict, _require_caldav_credentials
+from voiceforge.core.fs import ensure_private_dir, ensure_private_file, voiceforge_data_dir
+
+log = structlog.get_logger()
+
+SYNC_INTERVAL_SEC = 120.0
+FIRST_SYNC_WAIT_SEC = 10.0  # a read with an empty/stale mirror waits this long for the process's first sync
+EXPAND_PAST_DAYS = 2  # occurrences kept behind now (auto-analyze looks back 2 h)
+EXPAND_AHEAD_DAYS = 14
+_CTAG = "{http://calendarserver.org/ns/}getctag"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS calendars (
+    url TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    ctag TEXT,
+    sync_token TEXT,
+    synced_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS resources (
+    calendar_url TEXT NOT NULL,
+    href TEXT NOT NULL,
+    etag TEXT,
+    ical TEXT NOT NULL,
+    PRIMARY KEY (calendar_url, href)
+);
+CREATE TABLE IF NOT EXISTS events (
+    calendar_url TEXT NOT NULL,
+    href TEXT NOT NULL,
+    calendar_name TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    start_ts REAL NOT NULL,
+    end_ts REAL,
+    start_iso TEXT NOT NULL,
+    end_iso TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_events_start ON events(start_ts);
+CREATE INDEX IF NOT EXISTS idx_events_end ON events(end_ts);
+CREATE INDEX IF NOT EXISTS idx_events_resource ON events(calendar_url, href);
+CREATE TABLE IF NOT EXISTS mirror_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+
+def mirror_db_path() -> Path:
+    return voiceforge_data_dir() / "calendar_mirror.db"
+
+
+@dataclass
+class SyncStats:
+    """Result of one CalendarSync.sync_once: calendars seen / skipped by ctag, resources fetched / deleted."""
+
+    calendars: int = 0
+    unchanged: int = 0
+    fetched: int = 0
+    deleted: int = 0
+    error: str | None = None
+
+
+def _expand(ical: str, cal_name: str, window_start: datetime, window_end: datetime) -> list[dict[str, Any]]:
+    """VEVENT occurrences of one resource in [window_start, window_end] as event dicts (see caldav_poll)."""
+    try:
+        import icalendar
+    except ImportError:
+        return []
+    try:
+        cal = icalendar.Calendar.from_ical(ical)
+    except Exception as e:
+        log.debug("calendar.mirror.parse_failed", error=str(e))
+        return []
+    try:
+        import recurring_ical_events
+
+        components = list(recurring_ical_events.of(cal).between(window_start, window_end))
+    except ImportError:
+        components = list(cal.walk("VEVENT"))
+    except Exception as e:
+        log.debug("calendar.mirror.expand_failed", error=str(e))
+        components = list(cal.walk("VEVENT"))
+    out: list[dict[str, Any]] = []
+    for comp in components:
+        if getattr(comp, "name", "VEVENT") != "VEVENT":
+            continue
+        start_dt = _dt_to_aware(getattr(comp.get("DTSTART"), "dt", comp.get("DTSTART")))
+        if start_dt is None:
+            continue
+        end_dt = _dt_to_aware(getattr(comp.get("DTEND"), "dt", comp.get("DTEND")))
+        out.append(_event_dict(comp, cal_name, start_dt, end_dt))
+    return out
+
+
+class CalendarMirror:
+    """SQLite copy of the CalDAV calendars: raw resources plus expanded, indexed event occurrences."""
+
+    def __init__(self, db_path: Path | None = None) -> None:
+        self.db_path = db_path or mirror_db_path()
+        ensure_private_dir(self.db_path.parent)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        ensure_private_file(self.db_path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    # --- reads (local only) ---
+
+    def _rows(self, sql: str, params: tuple[Any, ...]) -> list[dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [{"summary": r[0], "start_iso": r[1], "end_iso": r[2], "calendar_name": r[3]} for r in rows]
+
+    def events_starting(self, start: datetime, end: datetime) -> list[dict[str, Any]]:
+        """Occurrences with start in [start, end], earliest first."""
+        return self._rows(
+            "SELECT summary, start_iso, end_iso, calendar_name FROM events WHERE start_ts BETWEEN ? AND ? ORDER BY start_ts",
+            (start.timestamp(), end.timestamp()),
+        )
+
+    def events_ending(self, start: datetime, end: datetime) -> list[dict[str, Any]]:
+        """Occurrences with end in [start, end], latest end first."""
+        return self._rows(
+            "SELECT summary, start_iso, end_iso, calendar_name FROM events WHERE end_ts BETWEEN ? AND ? ORDER BY end_ts DESC",
+            (start.timestamp(), end.timestamp()),
+        )
+
+    def last_synced(self) -> float | None:
+        """Epoch of the latest successful calendar sync, or None before the first one."""
+        with self._lock:
+            row = self._conn.execute("SELECT MAX(synced_at) FROM calendars").fetchone()
+        return row[0] if row and row[0] is not None else None
+
+    # --- writes (CalendarSync) ---
+
+    def calendar_state(self, url: str) -> tuple[str | None, str | None] | None:
+        """(ctag, sync_token) stored for a calendar, or None if never synced."""
+        with self._lock:
+            row = self._conn.execute("SELECT ctag, sync_token FROM calendars WHERE url = ?", (url,)).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def etags(self, calendar_url: str) -> dict[str, str | None]:
+        with self._lock:
+            rows = self._conn.execute("SELECT href, etag FROM resources WHERE calendar_url = ?", (calendar_url,)).fetchall()
+        return dict(rows)
+
+    def _window(self, now: datetime) -> tuple[datetime, datetime]:
+        return (now - timedelta(days=EXPAND_PAST_DAYS), now + timedelta(days=EXPAND_AHEAD_DAYS))
+
+    def _write_events(self, cur: sqlite3.Cursor, calendar_url: str, href: str, cal_name: str, ical: str, now: datetime) -> None:
+        cur.execute("DELETE FROM events WHERE calendar_url = ? AND href = ?", (calendar_url, href))
+        rows = []
+        for ev in _expand(ical, cal_name, *self._window(now)):
+            start = datetime.fromisoformat(ev["start_iso"])
+            end = datetime.fromisoformat(ev["end_iso"]) if ev["end_iso"] else None
+            rows.append(
+                (
+                    calendar_url,
+                    href,
+                    cal_name,
+                    ev["summary"],
+                    start.timestamp(),
+                    end.timestamp() if end else None,
+                    ev["start_iso"],
+                    ev["end_iso"],
+                )
+            )
+        cur.executemany("INSERT INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def apply_changes(
+        self,
+        calendar_url: str,
+        cal_name: str,
+        *,
+        upserts: list[tuple[str, str | None, str]],
+        deletes: list[str],
+        ctag: str | None,
+        sync_token: str | None,
+        now: datetime | None = None,
+    ) -> None:
+        """Store changed resources (href, etag, ical), drop deleted hrefs and save the calendar's new ctag and
+        sync-token in one transaction; occurrences of changed resources are re-expanded."""
+        now = now or datetime.now(UTC)
+        with self._lock:
+            cur = self._conn.cursor()
+            try:
+                cur.execute("BEGIN IMMEDIATE")
+                for href, etag, ical in upserts:
+                    cur.execute(
+                        "INSERT OR REPLACE INTO resources (calendar_url, href, etag, ical) VALUES (?, ?, ?, ?)",
+                        (calendar_url, href, etag, ical),
+                    )
+                    self._write_events(cur, calendar_url, href, cal_name, ical, now)
+                for href in deletes:
+                    cur.execute("DELETE FROM resources WHERE calendar_url = ? AND href = ?", (calendar_url, href))
+                    cur.execute("DELETE FROM events WHERE calendar_url = ? AND href = ?", (calendar_url, href))
+                cur.execute(
+                    "INSERT OR REPLACE INTO calendars (url, name, ctag, sync_token, synced_at) VALUES (?, ?, ?, ?, ?)",
+                    (calendar_url, cal_name, ctag, sync_token, time.time()),
+                )
+                cur.execute("COMMIT")
+            except Exception:
+                cur.execute("ROLLBACK")
+                raise
+
+    def touch(self, calendar_url: str) -> None:
+        """Mark an unchanged calendar as synced now."""
+        with self._lock:
+            self._conn.execute("UPDATE calendars SET synced_at = ? WHERE url = ?", (time.time(), calendar_url))
+            self._conn.commit()
+
+    def drop_calendars_except(self, urls: set[str]) -> None:
+        """Forget calendars that are no longer on the server."""
+        with self._lock:
+            known = [r[0] for r in self._conn.execute("SELECT url FROM calendars")]
+            for url in known:
+                if url in urls:
+                    continue
+                for table, col in (("events", "calendar_url"), ("resources", "calendar_url"), ("calendars", "url")):
+                    self._conn.execute(f"DELETE FROM {table} WHERE {col} = ?", (url,))  # nosec B608 -- fixed names
+            self._conn.commit()
+
+    def reexpand_if_due(self, now: datetime | None = None) -> bool:
+        """Re-expand recurring events when the rolling window moved by a day (local only, no network)."""
+        now = now or datetime.now(UTC)
+        day = now.date().isoformat()
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM mirror_meta WHERE key = 'expanded_on'").fetchone()
+            if row and row[0] == day:
+                return False
+            cur = self._conn.cursor()
+            try:
+                cur.execute("BEGIN IMMEDIATE")
+                names = dict(cur.execute("SELECT url, name FROM calendars").fetchall())
+                for calendar_url, href, ical in cur.execute("SELECT calendar_url, href, ical FROM resources").fetchall():
+                    self._write_events(cur, calendar_url, href, names.get(calendar_url, ""), ical, now)
+                cur.execute("INSERT OR REPLACE INTO mirror_meta (key, value) VALUES ('expanded_on', ?)", (day,))
+                cur.execute("COMMIT")
+            except Exception:
+                cur.execute("ROLLBACK")
+                raise
+        return True
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _etag(obj: Any) -> str | None:
+    props = getattr(obj, "props", None) or {}
+    for key, value in props.items():
+        if str(key).endswith("getetag"):
+            return str(value) if value is not None else None
+    return None
+
+
+def _href(obj: Any) -> str:
+    url = obj.url
+    return str(url.canonical() if hasattr(url, "canonical") else url)
+
+
+def _ctag(cal: Any) -> str | None:
+    """Collection ctag (CalendarServer extension), or None when the server does not report one."""
+    try:
+        from caldav.elements.base import BaseElement
+
+        class GetCTag(BaseElement):
+            tag = _CTAG
+
+        value = cal.get_property(GetCTag())
+    except Exception as e:
+        log.debug("calendar.mirror.ctag_unavailable", error=str(e))
+        return None
+    return str(value) if value else None
+
+
+class CalendarSync:
+    """Background refresh of a CalendarMirror over one long-lived DAVClient."""
+
+    def __init__(self, mirror: CalendarMirror, interval_sec: float = SYNC_INTERVAL_SEC) -> None:
+        self.mirror = mirror
+        self.interval_sec = interval_sec
+        self._client: Any = None
+        self._client_creds: tuple[str, str, str] | None = None
+        self._principal: Any = None
+        self._sync_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._synced = threading.Event()  # set once a sync attempt of this process finished
+        self._creds_error: str | None = None
+        self._creds_checked_at: float | None = None  # monotonic time of the last keyring lookup
+
+    def _check_credentials(self) -> tuple[tuple[str, str, str], None] | tuple[None, str]:
+        result = _require_caldav_credentials()
+        self._creds_error = result[1]
+        self._creds_checked_at = time.monotonic()
+        return result
+
+    def credentials_error(self) -> str | None:
+        """None when CalDAV credentials are set, else the error. Cached from the last sync (or lookup) so reads
+        stay on SQLite; the keyring is asked again only when that result is older than interval_sec."""
+        checked = self._creds_checked_at
+        if checked is None or time.monotonic() - checked > self.interval_sec:
+            self._check_credentials()
+        return self._creds_error
+
+    def _calendars(self, creds: tuple[str, str, str]) -> list[Any]:
+        from caldav import davclient
+
+        if self._client is None or self._client_creds != creds:
+            url, username, password = creds
+            self._client = davclient.DAVClient(url=url, username=username, password=password)
+            self._client_creds = creds
+            self._principal = None
+        if self._principal is None:
+            self._principal = self._client.principal()
+        return list(self._principal.calendars())
+
+    def _sync_calendar(self, cal: Any, stats: SyncStats) -> None:
+        from caldav.lib import error as dav_error
+
+        url = str(cal.url)
+        name = getattr(cal, "name", None) or ""
+        state = self.mirror.calendar_state(url)
+        ctag = _ctag(cal)
+        if state is not None and ctag and state[0] == ctag:
+            self.mirror.touch(url)
+            stats.unchanged += 1
+            return
+        token = state[1] if state else None
+        incremental = bool(token) and not str(token).startswith("fake-")
+        try:
+            coll = cal.objects_by_sync_token(sync_token=token if incremental else None, load_objects=False)
+        except Exception as e:
+            if not incremental:
+                raise
+            log.info("calendar.mirror.sync_token_rejected", calendar=name, error=str(e))
+            incremental = False
+            coll = cal.objects_by_sync_token(sync_token=None, load_objects=False)
+        known = self.mirror.etags(url)
+        upserts: list[tuple[str, str | None, str]] = []
+        deletes: list[str] = []
+        seen: set[str] = set()
+        for obj in coll:
+            href = _href(obj)
+            seen.add(href)
+            etag = _etag(obj)
+            if etag is not None and href in known and known[href] == etag:
+                continue
+            data = getattr(obj, "data", None)
+            if not data:
+                try:
+                    obj.load()
+                except dav_error.NotFoundError:
+                    deletes.append(href)
+                    continue
+                data = obj.data
+                etag = _etag(obj) or etag
+            if data:
+                upserts.append((href, etag, str(data)))
+        if not incremental:
+            deletes.extend(h for h in known if h not in seen)
+        new_token = getattr(coll, "sync_token", None)
+        self.mirror.apply_changes(
+            url,
+            name,
+            upserts=upserts,
+            deletes=deletes,
+            ctag=ctag,
+            sync_token=str(new_token) if new_token else None,
+        )
+        stats.fetched += len(upserts)
+        stats.deleted += len(deletes)
+
+    def sync_once(self) -> SyncStats:
+        """One refresh of all calendars (network). Safe to call from any thread; concurrent calls serialize."""
+        try:
+            return self._sync_once()
+        finally:
+            self._synced.set()
+
+    def wait_first_sync(self, timeout: float) -> bool:
+        """Wait (at most timeout seconds) until a sync attempt of this process finished; True if one did."""
+        return self._synced.wait(timeout)
+
+    @property
+    def has_synced(self) -> bool:
+        return self._synced.is_set()
+
+    def _sync_once(self) -> SyncStats:
+        stats = SyncStats()
+        creds, err = self._check_credentials()
+        if creds is None:
+            stats.error = err
+            return stats
+        t0 = time.monotonic()
+        with self._sync_lock:
+            try:
+                calendars = self._calendars(creds)
+                stats.calendars = len(calendars)
+                for cal in calendars:
+                    try:
+                        self._sync_calendar(cal, stats)
+                    except Exception as e:
+                        log.warning("calendar.mirror.calendar_failed", calendar=getattr(cal, "name", ""), error=str(e))
+                        stats.error = str(e)
+                self.mirror.drop_calendars_except({str(cal.url) for cal in calendars})
+            except ImportError:
+                stats.error = "Install calendar deps: uv sync --extra calendar"
+                return stats
+            except Exception as e:
+                log.warning("calendar.mirror.sync_failed", error=str(e))
+                self._client = None  # reconnect next time
+                stats.error = str(e)
+                return stats
+            self.mirror.reexpand_if_due()
+        log.info(
+            "calendar.mirror.synced",
+            calendars=stats.calendars,
+            unchanged=stats.unchanged,
+            fetched=stats.fetched,
+            deleted=stats.deleted,
+            duration_sec=round(time.monotonic() - t0, 3),
+        )
+        return stats
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.sync_once()
+            self._wake.wait(self.interval_sec)
+            self._wake.clear()
+
+    def start(self) -> None:
+        """Start the background refresh thread (idempotent)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="calendar-sync", daemon=True)
+        self._thread.start()
+
+    def request_sync(self) -> None:
+        """Ask the background thread to refresh now (starts it if needed)."""
+        self.start()
+        self._wake.set()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+
+
+_service: CalendarSync | None = None
+_service_lock = threading.Lock()
+
+
+def get_calendar_sync(interval_sec: float | None = None) -> CalendarSync:
+    """Process-wide CalendarSync over the default mirror DB. The refresh thread starts on first read."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = CalendarSync(CalendarMirror(), interval_sec or SYNC_INTERVAL_SEC)
+        elif interval_sec:
+            _service.interval_sec = interval_sec
+        return _service
+
+
+def _mirror_for_read() -> tuple[CalendarMirror, None] | tuple[None, str]:
+    """(mirror, None) for lookups, or (None, error) without CalDAV credentials. Makes sure the background refresh
+    is running. When the mirror is empty or stale and this process has not synced yet (a one-shot CLI analyze),
+    waits for that first sync, at most FIRST_SYNC_WAIT_SEC; later reads never wait on the server."""
+    service = get_calendar_sync()
+    err = service.credentials_error()
+    if err is not None:
+        return None, err
+    service.start()
+    last = service.mirror.last_synced()
+    if not service.has_synced and (last is None or time.time() - last > 2 * service.interval_sec):
+        if not service.wait_first_sync(FIRST_SYNC_WAIT_SEC):
+            log.warning("calendar.mirror.first_sync_slow", waited_sec=FIRST_SYNC_WAIT_SEC)
+    return service.mirror, None
+
+
+def upcoming_events(hours_ahead: int = 48) -> tuple[list[dict[str, Any]], str | None]:
+    """Like caldav_poll.get_upcoming_events, from the mirror."""
+    mirror, err = _mirror_for_read()
+    if mirror is None:
+        return [], err
+    now = datetime.now(UTC)
+    return mirror.events_starting(now, now + timedelta(hours=hours_ahead)), None
+
+
+def events_ended_at_least_minutes_ago(minutes_ago: int = 1, lookback_hours: int = 2) -> tuple[list[dict[str, Any]], str | None]:
+    """Like caldav_poll.get_events_ended_at_least_minutes_ago, from the mirror."""
+    mirror, err = _mirror_for_read()
+    if mirror is None:
+        return [], err
+    now = datetime.now(UTC)
+    cutoff_end = now - timedelta(minutes=minutes_ago)
+    return mirror.events_ending(now - timedelta(hours=lookback_hours), cutoff_end), None
+
+
+def next_meeting_context(hours_ahead: int = 24) -> tuple[str, str | None]:
+    """Like caldav_poll.get_next_meeting_context, from the mirror; the error is set without CalDAV credentials."""
+    events, err = upcoming_events(hours_ahead=hours_ahead)
+    if not events:
+        return "", err
+    first = events[0]
+    parts = [f"Next meeting: {first['summary']}", first["start_iso"]]
+    if first.get("end_iso"):
+        parts.append(first["end_iso"])
+    return " — ".join(parts), None
@@ -9,6 +9,8 @@ from typing import Any
 from voiceforge.core.metrics import get_cost_for_date
 from voiceforge.core.transcript_log import TranscriptLog
 
+_LLM_DIGEST_MAX_CHARS = 6000  # transcript budget for the LLM daily summary, split evenly between sessions
+
 
 @dataclass
 class DailyDigest:
@@ -26,19 +28,17 @@ def build_daily_digest(log_db: TranscriptLog, day: date) -> DailyDigest:
     sessions = log_db.get_sessions_for_date(day)
     session_summaries = [(s.id, s.started_at, s.duration_sec) for s in sessions]
     session_ids = [s.id for s in sessions]
-    action_items: list[dict[str, Any]] = []
-    for sid in session_ids:
-        for row in log_db.get_action_items(limit=100, session_id=sid):
-            action_items.append(
-                {
-                    "session_id": row.session_id,
-                    "idx": row.idx_in_analysis,
-                    "description": row.description,
-                    "assignee": row.assignee,
-                    "deadline": row.deadline,
-                    "status": row.status,
-                }
-            )
+    action_items: list[dict[str, Any]] = [
+        {
+            "session_id": row.session_id,
+            "idx": row.idx_in_analysis,
+            "description": row.description,
+            "assignee": row.assignee,
+            "deadline": row.deadline,
+            "status": row.status,
+        }
+        for row in log_db.get_action_items_in_range(day, day)
+    ]
     total_cost_usd = get_cost_for_date(day)
     return DailyDigest(
         day=day,
@@ -97,7 +97,7 @@ def _format_action_item_line(action_item: dict[str, Any]) -> str:
 
 def summarize_daily_with_llm(day: date, log_db: TranscriptLog) -> str:
     """E10 (#133): optional LLM summary of daily transcripts. Returns empty string on failure or no content."""
-    raw = log_db.get_daily_transcript_text(day)
+    raw = log_db.get_daily_transcript_text(day, max_chars=_LLM_DIGEST_MAX_CHARS)
     text = (raw or "").strip()
     if len(text) < 50:
         return ""
@@ -109,7 +109,7 @@ def summarize_daily_with_llm(day: date, log_db: TranscriptLog) -> str:
     model, _ = cfg.get_effective_llm()
     if not model:
         model = "anthropic/claude-haiku-4-5"
-    prompt = f"Summarize the following daily meeting transcripts in 3–5 sentences. Use the same language as the content.\n\n{text[:6000]}"
+    prompt = f"Summarize the following daily meeting transcripts in 3–5 sentences. Use the same language as the content.\n\n{text[:_LLM_DIGEST_MAX_CHARS]}"
     try:
         from litellm import completion
 
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import os
 import signal
 import threading
 import time
@@ -13,23 +12,17 @@ from typing import Any
 import structlog
 import typer
 
+from voiceforge.audio.source import CaptureSource
 from voiceforge.core.contracts import extract_error_message
 from voiceforge.i18n import t
 
 log = structlog.get_logger()
 
 
-def _persist_ring_snapshot(capture: Any, ring_path: str, seconds: float) -> bool:
-    """Persist current capture snapshot to ring file; prefer mic, fall back to monitor."""
-    mic, monitor = capture.get_chunk(seconds)
-    audio = mic if mic.size > 0 else monitor
-    if audio.size <= 0:
-        return False
-    ring = Path(ring_path)
-    tmp = ring.with_suffix(".tmp")
-    tmp.write_bytes(audio.tobytes())
-    os.replace(tmp, ring)
-    return True
+def _persist_ring_file(capture: Any) -> bool:
+    """Persist capture audio for crash recovery. Reader threads append mic audio to the capture's mmap ring file;
+    here it is only synced to disk (as the daemon listen loop does), never copied or replaced while mapped."""
+    return bool(capture.flush_ring_file())
 
 
 def _run_meeting_preflight(cfg: Any) -> None:
@@ -58,6 +51,7 @@ def _build_capture(cfg: Any) -> Any:
         sample_rate=cfg.sample_rate,
         buffer_seconds=cfg.ring_seconds,
         monitor_source=cfg.monitor_source,
+        ring_file_path=cfg.get_ring_file_path(),
     )
 
 
@@ -93,10 +87,23 @@ def _log_session(duration_sec: float, segments_for_log: list[Any], analysis_for_
         return None
 
 
-def _analyze_and_log(seconds: int, template: str | None) -> tuple[str, int | None]:
+def _new_speaker_linker() -> Any:
+    """One SpeakerLinker per meeting: speaker labels match between smart-trigger analyses and the final one."""
+    try:
+        from voiceforge.stt.speaker_linker import SpeakerLinker
+    except ImportError:
+        return None
+    return SpeakerLinker()
+
+
+def _analyze_and_log(
+    seconds: int, template: str | None, audio_source: Any = None, speaker_linker: Any = None
+) -> tuple[str, int | None]:
     from voiceforge.main import run_analyze_pipeline
 
-    display_text, segments_for_log, analysis_for_log = run_analyze_pipeline(seconds, template=template)
+    display_text, segments_for_log, analysis_for_log = run_analyze_pipeline(
+        seconds, template=template, audio_source=audio_source, speaker_linker=speaker_linker
+    )
     err_msg = extract_error_message(display_text)
     if err_msg is not None:
         typer.echo(err_msg, err=True)
@@ -106,10 +113,12 @@ def _analyze_and_log(seconds: int, template: str | None) -> tuple[str, int | Non
     return display_text, session_id
 
 
-def _run_smart_trigger_analysis(trigger: Any, template: str | None) -> None:
+def _run_smart_trigger_analysis(trigger: Any, template: str | None, audio_source: Any = None, speaker_linker: Any = None) -> None:
     from voiceforge.main import run_analyze_pipeline
 
-    text, segments_for_log, analysis_for_log = run_analyze_pipeline(trigger.analyze_seconds, template=template)
+    text, segments_for_log, analysis_for_log = run_analyze_pipeline(
+        trigger.analyze_seconds, template=template, audio_source=audio_source, speaker_linker=speaker_linker
+    )
     if extract_error_message(text) is not None:
         log.warning("meeting.smart_trigger.analyze_failed", message=text[:100])
         return
@@ -122,7 +131,12 @@ def _run_smart_trigger_analysis(trigger: Any, template: str | None) -> None:
 
 
 def _start_smart_trigger_thread(
-    cfg: Any, ring_path: str, template: str | None, no_analyze: bool
+    cfg: Any,
+    ring_path: str,
+    template: str | None,
+    no_analyze: bool,
+    audio_source: Any = None,
+    speaker_linker: Any = None,
 ) -> tuple[threading.Event, threading.Thread | None]:
     trigger_stop = threading.Event()
     smart_trigger_enabled = getattr(cfg, "smart_trigger", True)
@@ -138,13 +152,14 @@ def _start_smart_trigger_thread(
             min_silence_sec=3.0,
             cooldown_sec=120.0,
             analyze_seconds=30,
+            window_sec=cfg.ring_seconds,
         )
         template_val = template or getattr(cfg, "smart_trigger_template", None)
         while not trigger_stop.wait(timeout=2.0):
             if not trigger.check(ring_path):
                 continue
             try:
-                _run_smart_trigger_analysis(trigger, template_val)
+                _run_smart_trigger_analysis(trigger, template_val, audio_source, speaker_linker)
             except Exception as e:
                 log.warning("meeting.smart_trigger.error", error=str(e))
 
@@ -155,15 +170,14 @@ def _start_smart_trigger_thread(
 
 def _run_capture_loop(
     capture: Any,
-    ring_path: str,
-    ring_seconds: float,
     persist_interval: float,
     should_stop: Callable[[], bool],
 ) -> None:
     last_persist_at: float = 0.0
     while not should_stop():
         now = time.monotonic()
-        if now - last_persist_at >= persist_interval and _persist_ring_snapshot(capture, ring_path, ring_seconds):
+        if now - last_persist_at >= persist_interval:
+            _persist_ring_file(capture)
             last_persist_at = now
         if should_stop():
             break
@@ -193,25 +207,28 @@ def run_meeting(
     signal.signal(signal.SIGINT, on_signal)
     signal.signal(signal.SIGTERM, on_signal)
 
-    trigger_stop, trigger_thread = _start_smart_trigger_thread(cfg, ring_path, template, no_analyze)
+    # Analyses read the capture's in-memory buffers; the ring file only persists audio across crashes
+    audio_source = CaptureSource(capture, cfg.sample_rate)
+    speaker_linker = _new_speaker_linker()
+    trigger_stop, trigger_thread = _start_smart_trigger_thread(cfg, ring_path, template, no_analyze, audio_source, speaker_linker)
 
     typer.echo(t("meeting.listening_hint"), err=True)
 
     persist_interval = max(1.0, getattr(cfg, "ring_persist_interval_sec", 10.0))
     try:
-        _run_capture_loop(capture, ring_path, cfg.ring_seconds, persist_interval, lambda: stop)
+        _run_capture_loop(capture, persist_interval, lambda: stop)
     finally:
         trigger_stop.set()
         if trigger_thread:
             trigger_thread.join(timeout=4.0)
-        _persist_ring_snapshot(capture, ring_path, cfg.ring_seconds)
+        _persist_ring_file(capture)
         capture.stop()
 
     if no_analyze:
         return
 
     analyze_seconds = int(cfg.ring_seconds) if seconds is None else seconds
-    display_text, session_id = _analyze_and_log(analyze_seconds, template)
+    display_text, session_id = _analyze_and_log(analyze_seconds, template, audio_source, speaker_linker)
 
     if session_id is not None:
         typer.echo(f"session_id={session_id}")
@@ -25,7 +25,7 @@ def get_status_text() -> str:
     """Return status string (RAM + cost + Ollama + PII) for CLI or D-Bus."""
     import psutil
 
-    from voiceforge.core.config import Settings
+    from voiceforge.core.backends import get_settings, ollama_available
     from voiceforge.core.metrics import get_cost_today
     from voiceforge.i18n import t
 
@@ -33,18 +33,13 @@ def get_status_text() -> str:
     cost = get_cost_today()
     used_gb = mem.used / 1024**3
     total_gb = mem.total / 1024**3
-    cfg = Settings()
+    cfg = get_settings()
     lines = [
         t("status.ram", used=used_gb, total=total_gb, percent=mem.percent),
         t("status.cost_today", cost=cost),
         t("status.pii_mode", mode=getattr(cfg, "pii_mode", "ON")),
     ]
-    try:
-        from voiceforge.llm.local_llm import is_available
-
-        lines.append(t("status.ollama_available") if is_available() else t("status.ollama_unavailable"))
-    except ImportError:
-        lines.append(t("status.ollama_unavailable"))
+    lines.append(t("status.ollama_available") if ollama_available() else t("status.ollama_unavailable"))
     # E6 (#129): show effective LLM backend (API or Ollama fallback)
     effective_model, is_ollama_fallback = cfg.get_effective_llm()
     if effective_model is not None:
@@ -58,9 +53,9 @@ def get_status_text() -> str:
 def _get_rag_stats() -> dict[str, Any] | None:
     """Return RAG DB stats (indexed_sources_count, chunks_count) or None if unavailable."""
     try:
-        from voiceforge.core.config import Settings
+        from voiceforge.core.backends import get_settings
 
-        cfg = Settings()
+        cfg = get_settings()
         db_path = Path(cfg.get_rag_db_path())
         if not db_path.is_file():
             return None
@@ -83,18 +78,11 @@ def get_status_data() -> dict[str, Any]:
     """Return machine-readable status data (includes pii_mode for PII UX)."""
     import psutil
 
-    from voiceforge.core.config import Settings
+    from voiceforge.core.backends import get_settings, ollama_available
     from voiceforge.core.metrics import get_cost_today
 
     mem = psutil.virtual_memory()
-    ollama_available = False
-    try:
-        from voiceforge.llm.local_llm import is_available
-
-        ollama_available = bool(is_available())
-    except ImportError:
-        ollama_available = False
-    cfg = Settings()
+    cfg = get_settings()
     prompt_version = None
     try:
         from voiceforge.llm.prompt_loader import get_prompt_version
@@ -111,7 +99,7 @@ def get_status_data() -> dict[str, Any]:
         },
         "cost_today_usd": round(float(get_cost_today()), 6),
         "pii_mode": getattr(cfg, "pii_mode", "ON"),
-        "ollama_available": ollama_available,
+        "ollama_available": ollama_available(),
         "llm_backend": effective_model,
         "llm_ollama_fallback": is_ollama_fallback,
     }
@@ -0,0 +1,193 @@
+"""Content-addressed cache of pipeline step 1 (STT) and step 2 (diarization, RAG, PII) results.
+
+The desktop app, Smart Trigger, copilot captures and web clients often analyze nearly the same last N seconds of the
+ring a few seconds apart. Results are keyed by a hash of the PCM window plus the settings that affect them (STT model,
+language, PII mode, RAG index mtime), so an identical window skips STT and step 2. For a window that is a shifted copy
+of a recent one, transcribed segments inside the overlap are reused and only the new tail is transcribed.
+Entries (including the PCM kept for overlap matching) are evicted LRU under analysis_cache_mb."""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+ANALYSIS_CACHE_MB = 64  # default memory cap (config analysis_cache_mb; 0 disables)
+OVERLAP_CANDIDATES = 4  # recent STT windows checked for a shifted overlap
+OVERLAP_MIN_SEC = 2.0  # shorter overlaps are transcribed from scratch
+OVERLAP_MARGIN_SEC = 1.0  # segments ending this close to the cached window's end may be cut off: re-transcribe them
+_SHIFT_PROBE_SAMPLES = 64  # samples compared to narrow down shift candidates before a full comparison
+_SHIFT_VERIFY_MAX = 8  # full comparisons per candidate window
+
+
+def audio_digest(audio: np.ndarray) -> str:
+    """Content hash of a PCM window (dtype and samples)."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(audio.dtype.str.encode("ascii"))
+    h.update(memoryview(np.ascontiguousarray(audio)).cast("B"))
+    return h.hexdigest()
+
+
+def _approx_nbytes(value: Any, depth: int = 0) -> int:
+    """Rough memory footprint for the LRU budget (arrays exact, text by length, containers one level deep per item)."""
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, str | bytes):
+        return len(value) + 48
+    if depth > 3:
+        return 64
+    if isinstance(value, list | tuple):
+        return 56 + sum(_approx_nbytes(v, depth + 1) for v in value)
+    if isinstance(value, dict):
+        return 64 + sum(_approx_nbytes(v, depth + 1) for v in value.values())
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return 64 + sum(_approx_nbytes(getattr(value, f.name), depth + 1) for f in dataclasses.fields(value))
+    return 64
+
+
+@dataclass
+class _SttEntry:
+    audio: np.ndarray  # kept for overlap matching with later shifted windows
+    sample_rate: int
+    stt_key: str
+    segments: list[Any]
+    transcript: str
+
+
+def _find_shift(old: np.ndarray, new: np.ndarray, min_overlap: int) -> int | None:
+    """Offset d with new[:n] == old[d:d + n] (n = overlap, at least min_overlap samples), or None."""
+    if len(new) < min_overlap or len(old) < min_overlap:
+        return None
+    candidates = np.flatnonzero(old[: len(old) - min_overlap + 1] == new[0])
+    for j in range(1, min(_SHIFT_PROBE_SAMPLES, min_overlap)):
+        if len(candidates) <= 1:
+            break
+        candidates = candidates[old[candidates + j] == new[j]]
+    for d in candidates[:_SHIFT_VERIFY_MAX]:
+        n = min(len(old) - int(d), len(new))
+        if np.array_equal(old[d : d + n], new[:n]):
+            return int(d)
+    return None
+
+
+def shift_segment(seg: Any, offset_sec: float) -> Any:
+    """Copy of a Transcriber.Segment moved by offset_sec (words too)."""
+    words = [dataclasses.replace(w, start=w.start + offset_sec, end=w.end + offset_sec) for w in getattr(seg, "words", [])]
+    return dataclasses.replace(seg, start=seg.start + offset_sec, end=seg.end + offset_sec, words=words)
+
+
+class AnalysisCache:
+    """LRU of pipeline artifacts under a byte budget. Thread-safe; values are shared, callers must not mutate them."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max(0, int(max_bytes))
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        self._bytes = 0
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            self._entries.move_to_end(key)
+            return item[0]
+
+    def put(self, key: str, value: Any, nbytes: int | None = None) -> None:
+        size = _approx_nbytes(value) if nbytes is None else int(nbytes)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            self._evict_locked()
+
+    def resize(self, max_bytes: int) -> None:
+        with self._lock:
+            self.max_bytes = max(0, int(max_bytes))
+            self._evict_locked()
+
+    def _evict_locked(self) -> None:
+        while self._bytes > self.max_bytes and self._entries:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._bytes -= evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    @property
+    def nbytes(self) -> int:
+        with self._lock:
+            return self._bytes
+
+    def get_stt(self, digest: str, stt_key: str) -> tuple[list[Any], str] | None:
+        entry = self.get(f"stt:{stt_key}:{digest}")
+        return (list(entry.segments), entry.transcript) if entry is not None else None
+
+    def put_stt(
+        self, digest: str, stt_key: str, audio: np.ndarray, sample_rate: int, segments: list[Any], transcript: str
+    ) -> None:
+        entry = _SttEntry(audio=audio, sample_rate=sample_rate, stt_key=stt_key, segments=list(segments), transcript=transcript)
+        self.put(f"stt:{stt_key}:{digest}", entry)
+
+    def find_overlap(self, audio: np.ndarray, sample_rate: int, stt_key: str) -> tuple[list[Any], int] | None:
+        """Reusable STT for a window that overlaps a recent one: (segments moved into this window's time base,
+        first sample still to transcribe). Only segments fully inside the overlap that end at least OVERLAP_MARGIN_SEC
+        before the cached window's end are reused (speech there may have been cut off). No margin at the start: the
+        cached transcript had context before this window, and transcription resumes after the last reused segment,
+        so a start margin would drop speech for good. Speech cut by this window's start is dropped."""
+        with self._lock:
+            recent = [v for v, _ in reversed(self._entries.values()) if isinstance(v, _SttEntry)]
+        recent = [e for e in recent if e.stt_key == stt_key and e.sample_rate == sample_rate][:OVERLAP_CANDIDATES]
+        min_overlap = int(OVERLAP_MIN_SEC * sample_rate)
+        for entry in recent:
+            shift = _find_shift(entry.audio, audio, min_overlap)
+            if shift is None:
+                continue
+            offset = shift / sample_rate
+            overlap_end = min(len(entry.audio) - shift, len(audio)) / sample_rate - OVERLAP_MARGIN_SEC
+            reused = [
+                shift_segment(s, -offset)
+                for s in entry.segments
+                if s.start >= offset and s.end - offset <= overlap_end and dataclasses.is_dataclass(s)
+            ]
+            if not reused:
+                continue
+            cut = min(len(audio), round(reused[-1].end * sample_rate))
+            return (reused, cut)
+        return None
+
+
+_cache: AnalysisCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_analysis_cache(cfg: Any = None) -> AnalysisCache | None:
+    """Process-wide cache sized by cfg.analysis_cache_mb (default ANALYSIS_CACHE_MB); None when set to 0."""
+    global _cache
+    max_bytes = int(getattr(cfg, "analysis_cache_mb", ANALYSIS_CACHE_MB)) * 1024 * 1024
+    if max_bytes <= 0:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = AnalysisCache(max_bytes)
+        elif _cache.max_bytes != max_bytes:
+            _cache.resize(max_bytes)
+        return _cache
+
+
+def clear_analysis_cache() -> None:
+    """Drop all cached artifacts (tests, model or index changes outside the cache key)."""
+    with _cache_lock:
+        if _cache is not None:
+            _cache.clear()
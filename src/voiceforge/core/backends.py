@@ -0,0 +1,195 @@
+"""Process-wide LLM backend registry: cached Settings, API-key presence and Ollama liveness.
+
+Settings.get_effective_llm, status (CLI, D-Bus, web /api/status) and complete_structured used to read keyring,
+probe Ollama over HTTP and re-read voiceforge.yaml on every call. Here settings are cached until the config file
+(mtime) or VOICEFORGE_* environment changes; key presence and Ollama health are kept with short TTLs and
+refreshed in the background once stale (callers get the last known value instead of waiting on HTTP)."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+import structlog
+
+from voiceforge.core.config import _config_base_dir, _config_yaml_paths
+
+log = structlog.get_logger()
+
+API_KEY_NAMES = ("anthropic", "openai", "google")
+API_KEY_TTL_SEC = 60.0
+OLLAMA_TTL_SEC = 15.0
+HEALTH_REFRESH_SEC = 15.0
+
+
+class _TTLValue:
+    """Value with a TTL: first read probes synchronously, later stale reads return the old value and refresh it
+    in a background thread (one refresh at a time)."""
+
+    def __init__(self, probe: Callable[[], Any], ttl_sec: float) -> None:
+        self._probe = probe
+        self._ttl_sec = ttl_sec
+        self._lock = threading.Lock()
+        self._value: Any = None
+        self._checked_at: float | None = None
+        self._refreshing = False
+
+    def _refresh(self) -> Any:
+        try:
+            value = self._probe()
+        except Exception as e:
+            log.debug("backends.probe_failed", error=str(e))
+            value = None
+        with self._lock:
+            self._value = value
+            self._checked_at = time.monotonic()
+            self._refreshing = False
+        return value
+
+    def get(self) -> Any:
+        with self._lock:
+            checked_at = self._checked_at
+            if checked_at is not None and time.monotonic() - checked_at < self._ttl_sec:
+                return self._value
+            if checked_at is not None:
+                if not self._refreshing:
+                    self._refreshing = True
+                    threading.Thread(target=self._refresh, name="backend-health", daemon=True).start()
+                return self._value
+        return self._refresh()
+
+    def age_sec(self) -> float | None:
+        with self._lock:
+            return None if self._checked_at is None else time.monotonic() - self._checked_at
+
+    def due(self, within_sec: float) -> bool:
+        """True when the value expires within within_sec (or was never probed)."""
+        age = self.age_sec()
+        return age is None or age >= self._ttl_sec - within_sec
+
+
+def _probe_api_keys() -> dict[str, bool]:
+    from voiceforge.core.secrets import get_api_key
+
+    return {name: bool(get_api_key(name)) for name in API_KEY_NAMES}
+
+
+def _probe_ollama() -> bool:
+    try:
+        from voiceforge.llm.local_llm import is_available
+    except ImportError:
+        return False
+    return bool(is_available())
+
+
+_api_keys = _TTLValue(_probe_api_keys, API_KEY_TTL_SEC)
+_ollama = _TTLValue(_probe_ollama, OLLAMA_TTL_SEC)
+_settings_lock = threading.Lock()
+_settings: Any = None
+_settings_key: tuple[Any, ...] | None = None
+_refresh_thread: threading.Thread | None = None
+_refresh_stop = threading.Event()
+
+
+def _config_fingerprint() -> tuple[Any, ...]:
+    """What Settings() depends on: voiceforge.yaml candidates (path, mtime) and VOICEFORGE_* / XDG env."""
+    files: list[tuple[str, int | None]] = []
+    for path in _config_yaml_paths(_config_base_dir()):
+        try:
+            files.append((str(path), path.stat().st_mtime_ns))
+        except OSError:
+            files.append((str(path), None))
+    env = tuple(sorted((k, v) for k, v in os.environ.items() if k.startswith(("VOICEFORGE_", "XDG_"))))
+    return (tuple(files), env)
+
+
+def get_settings() -> Any:
+    """Shared Settings instance; rebuilt when voiceforge.yaml (mtime) or the environment changes. Treat as read-only."""
+    global _settings, _settings_key
+    key = _config_fingerprint()
+    with _settings_lock:
+        if _settings is None or key != _settings_key:
+            from voiceforge.core.config import Settings
+
+            _settings = Settings()
+            _settings_key = key
+        return _settings
+
+
+def api_key_present(name: str | None = None) -> bool:
+    """True if the named provider key (or, without name, any of API_KEY_NAMES) is in keyring. Cached."""
+    keys = _api_keys.get() or {}
+    return bool(keys.get(name)) if name else any(keys.values())
+
+
+def ollama_available() -> bool:
+    """Ollama liveness, cached for OLLAMA_TTL_SEC (stale values are refreshed in the background)."""
+    return bool(_ollama.get())
+
+
+def resolve_effective_llm(copilot_mode: str, default_llm: str, ollama_model: str) -> tuple[str | None, bool]:
+    """(model_id, is_ollama_fallback) for the given settings from cached key presence / Ollama health.
+    offline → Ollama only; cloud → API only; hybrid → API with Ollama fallback. Ollama is probed only when needed."""
+    mode = copilot_mode or "hybrid"
+    if mode != "offline" and api_key_present():
+        return (default_llm, False)
+    if mode == "cloud" or not ollama_available():
+        return (None, False)
+    return (f"ollama/{ollama_model}", True)
+
+
+def snapshot() -> dict[str, Any]:
+    """Cheap view of the registry for status endpoints (never blocks on keyring or HTTP once warmed up)."""
+    cfg = get_settings()
+    model, fallback = cfg.get_effective_llm()
+    age = _ollama.age_sec()
+    return {
+        "llm_backend": model,
+        "llm_ollama_fallback": fallback,
+        "ollama_available": ollama_available(),
+        "api_keys": dict(_api_keys.get() or {}),
+        "ollama_checked_sec_ago": round(age, 1) if age is not None else None,
+    }
+
+
+def invalidate() -> None:
+    """Drop cached settings, key presence and health (e.g. after `keyring set` or in tests)."""
+    global _api_keys, _ollama, _settings, _settings_key
+    with _settings_lock:
+        _settings = None
+        _settings_key = None
+    _api_keys = _TTLValue(_probe_api_keys, API_KEY_TTL_SEC)
+    _ollama = _TTLValue(_probe_ollama, OLLAMA_TTL_SEC)
+
+
+def _refresh_loop(interval_sec: float, stop: threading.Event) -> None:
+    # Each value is re-probed on its own TTL (just before it expires), not on every tick: key probes go through
+    # the audited secrets.get_api_key path.
+    while not stop.wait(interval_sec):
+        for value in (_api_keys, _ollama):
+            if value.due(interval_sec / 2):
+                value._refresh()
+
+
+def start_health_refresh(interval_sec: float = HEALTH_REFRESH_SEC) -> None:
+    """Keep key presence and Ollama health warm from a background thread (daemon, web server). Idempotent."""
+    global _refresh_thread, _refresh_stop
+    if _refresh_thread is not None and _refresh_thread.is_alive():
+        return
+    _refresh_stop = threading.Event()
+    _refresh_thread = threading.Thread(
+        target=_refresh_loop, args=(interval_sec, _refresh_stop), name="backend-health-refresh", daemon=True
+    )
+    _refresh_thread.start()
+
+
+def stop_health_refresh(timeout: float = 2.0) -> None:
+    """Stop the start_health_refresh thread (server shutdown, tests); a probe in flight finishes first."""
+    global _refresh_thread
+    _refresh_stop.set()
+    thread, _refresh_thread = _refresh_thread, None
+    if thread is not None and thread is not threading.current_thread():
+        thread.join(timeout=timeout)
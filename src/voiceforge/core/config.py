@@ -103,7 +103,7 @@ class Settings(BaseSettings):
     ring_seconds: float = Field(default=300.0, description="Ring buffer length seconds")
     ring_persist_interval_sec: float = Field(
         default=10.0,
-        description="Interval (seconds) between full ring file writes in listen loop; reduces I/O (#100).",
+        description="Interval (seconds) between ring file syncs (msync) in listen loop; audio is appended in place (#100).",
     )
     copilot_pre_roll_seconds: float = Field(
         default=1.0,
@@ -136,6 +136,26 @@ class Settings(BaseSettings):
         ge=0,
         description="KC14: Seconds of copilot idle after which STT model is unloaded to save RAM/CPU (0=disabled).",
     )
+    copilot_speculative_stt: bool = Field(
+        default=True,
+        description="Transcribe copilot captures while the key is held; on release only the tail is decoded.",
+    )
+    stt_pool_mb: int = Field(
+        default=2048,
+        ge=0,
+        le=32768,
+        description="RAM budget (MB) for STT models kept resident in the daemon (e.g. small + copilot tiny); idle ones evicted LRU.",
+    )
+    copilot_fast_timeout_sec: float = Field(
+        default=15.0,
+        gt=0,
+        description="Deadline (seconds) for the copilot fast-track LLM call (Answer/Do/Don't/Clarify); late cards are dropped.",
+    )
+    copilot_deep_timeout_sec: float = Field(
+        default=45.0,
+        gt=0,
+        description="Deadline (seconds) for the copilot deep-track LLM call (Risk/Strategy/Emotion); late cards are dropped.",
+    )
     ring_file_path: str | None = Field(
         default=None,
         description="Ring file path; default XDG_RUNTIME_DIR/voiceforge/ring.raw",
@@ -145,6 +165,23 @@ class Settings(BaseSettings):
         default=None,
         description="E13 #136: path to auto-index on first analyze (e.g. ~/Documents). Default null = disabled.",
     )
+    rag_embed_batch_size: int = Field(
+        default=64,
+        ge=1,
+        le=1024,
+        description="Texts per ONNX embedding batch when indexing (voiceforge index / watch / auto-index).",
+    )
+    rag_ingest_workers: int = Field(
+        default=0,
+        ge=0,
+        description="Parse processes for multi-file indexing (index / watch); 0 = CPU count.",
+    )
+    rag_index_job_workers: int = Field(
+        default=2,
+        ge=1,
+        le=16,
+        description="Parse processes per daemon indexing job (IndexPaths); kept low so indexing does not starve STT.",
+    )
     rag_exclude_patterns: list[str] = Field(
         default_factory=list,
         description="Block 74: glob patterns to exclude paths from RAG indexing (e.g. *.tmp, */.git/*).",
@@ -185,6 +222,30 @@ class Settings(BaseSettings):
         default=120.0,
         description="Max seconds for a single analyze() call (D-Bus/CLI). On timeout returns ANALYZE_TIMEOUT error (#39).",
     )
+    analysis_cache_mb: int = Field(
+        default=64,
+        ge=0,
+        le=4096,
+        description="Memory cap (MB) for cached STT/diarization/RAG/PII results of recent analyze windows; 0 = off.",
+    )
+    web_analyze_workers: int = Field(
+        default=1,
+        ge=1,
+        le=8,
+        description="Concurrent analyses in the web server (/api/analyze, /api/analyze/stream).",
+    )
+    web_analyze_queue: int = Field(
+        default=2,
+        ge=0,
+        le=64,
+        description="Analyses waiting for a web worker; further requests get 429 with Retry-After.",
+    )
+    web_read_workers: int = Field(
+        default=8,
+        ge=1,
+        le=64,
+        description="Threads for light web endpoints (status, sessions, cost, export).",
+    )
     streaming_stt: bool = Field(
         default=False,
         description="Block 10.1: during listen, show partial/final transcript in real time (chunk-based STT).",
@@ -229,7 +290,13 @@ class Settings(BaseSettings):
     )
     calendar_auto_listen: bool = Field(
         default=False,
-        description="E11 #134: poll CalDAV every 5 min; auto-start listen when meeting in ≤2 min; auto-analyze when meeting ended ≥1 min ago.",
+        description="E11 #134: check the calendar mirror every minute; auto-start listen when meeting in ≤2 min; auto-analyze when meeting ended ≥1 min ago.",
+    )
+    calendar_sync_interval_sec: int = Field(
+        default=120,
+        ge=30,
+        le=3600,
+        description="Background CalDAV → local mirror refresh interval (ctag / sync-token / ETag incremental).",
     )
     encrypt_db: bool = Field(
         default=False,
@@ -395,38 +462,12 @@ class Settings(BaseSettings):
 
         Respects copilot_mode: offline → Ollama only; cloud → API only; hybrid → API with Ollama fallback.
         Returns (model_id, is_ollama_fallback). model_id is for LiteLLM (anthropic/... or ollama/...).
+        Keyring presence and Ollama liveness come from the cached backend registry (core.backends).
         """
-        from voiceforge.core.secrets import get_api_key
-
-        mode = getattr(self, "copilot_mode", "hybrid") or "hybrid"
-        has_api_key = any(get_api_key(name) for name in ("anthropic", "openai", "google"))
-
-        if mode == "offline":
-            try:
-                from voiceforge.llm.local_llm import is_available
-            except ImportError:
-                return (None, False)
-            if not is_available():
-                return (None, False)
-            model = (self.ollama_model or _DEFAULT_OLLAMA_MODEL).strip() or _DEFAULT_OLLAMA_MODEL
-            return (f"ollama/{model}", True)
-
-        if mode == "cloud":
-            if has_api_key:
-                return (self.default_llm, False)
-            return (None, False)
-
-        # hybrid: API primary, Ollama fallback when no keys
-        if has_api_key:
-            return (self.default_llm, False)
-        try:
-            from voiceforge.llm.local_llm import is_available
-        except ImportError:
-            return (None, False)
-        if not is_available():
-            return (None, False)
+        from voiceforge.core.backends import resolve_effective_llm
+
         model = (self.ollama_model or _DEFAULT_OLLAMA_MODEL).strip() or _DEFAULT_OLLAMA_MODEL
-        return (f"ollama/{model}", True)
+        return resolve_effective_llm(getattr(self, "copilot_mode", "hybrid") or "hybrid", self.default_llm, model)
 
 
 def get_effective_config_and_overrides() -> tuple[dict[str, Any], set[str]]:
@@ -6,14 +6,15 @@ from __future__ import annotations
 import asyncio
 import atexit
 import contextlib
+import contextvars
 import functools
 import json
+import math
 import os
 import queue
 import signal
 import threading
 import time
-from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from concurrent.futures import TimeoutError as FuturesTimeoutError
 from datetime import UTC, date, datetime, timedelta
@@ -22,11 +23,15 @@ from typing import TYPE_CHECKING, Any
 
 import structlog
 
+from voiceforge.audio.source import CaptureSource, PcmSource
 from voiceforge.core.config import Settings
 from voiceforge.core.dbus_service import DaemonVoiceForgeInterface, run_dbus_service
 from voiceforge.core.model_manager import ModelManager, set_model_manager
+from voiceforge.core.streaming_transcript import StreamingTranscript
 
 if TYPE_CHECKING:
+    import numpy as np
+
     from voiceforge.stt.streaming import StreamingSegment
 
 log = structlog.get_logger()
@@ -116,19 +121,20 @@ class VoiceForgeDaemon:
         self._trigger_thread: threading.Thread | None = None
 
         # Block 12.1: Emitter for streaming STT via D-Bus signals
-        self._streaming_chunk_queue: queue.Queue[tuple[str, str, float, bool]] = queue.Queue(maxsize=200)
+        # (text, speaker, timestamp_sec, is_final, transcript cursor)
+        self._streaming_chunk_queue: queue.Queue[tuple[str, str, float, bool, int]] = queue.Queue(maxsize=200)
         self._dbus_emitter_stop = threading.Event()
         self._dbus_emitter_thread: threading.Thread | None = None
 
-        # Block 10.1: streaming STT state (partial + finals for UI polling)
-        self._streaming_lock = threading.Lock()
-        self._streaming_partial = ""
-        self._streaming_finals: deque[dict] = deque(maxlen=500)
+        # Block 10.1: streaming STT state (sequence-numbered finals + partial for UI)
+        self._streaming_transcript = StreamingTranscript()
         self._streaming_stop = threading.Event()
         self._streaming_thread: threading.Thread | None = None
         self._streaming_capture: object = None
-        # KC4: cache transcribers by size (tiny for copilot capture, default otherwise)
-        self._streaming_transcriber_cache: dict[str, Any] = {}
+
+        # Speaker labels stay stable across the analyses of one listen session (stt.speaker_linker, created lazily)
+        self._speaker_linker: Any = None
+        self._speaker_linker_lock = threading.Lock()
 
         # KC3: copilot push-to-capture markers, pre-roll, 30s auto-stop
         self._copilot_lock = threading.Lock()
@@ -137,6 +143,9 @@ class VoiceForgeDaemon:
         self._copilot_warning_emitted = False
         self._copilot_watcher_stop = threading.Event()
         self._copilot_watcher_thread: threading.Thread | None = None
+        # Speculative STT of the running capture: (session, pooled transcriber to release)
+        self._copilot_speculative: tuple[Any, Any] | None = None
+        self._copilot_released_at: tuple[float, str] | None = None  # (monotonic, stt mode) until the first card
         self._last_copilot_stt_ambiguous = False
         self._last_copilot_transcript: str = ""  # KC4: transcript snippet for downstream/UI
         # KC5 (#177): evidence-first RAG for overlay
@@ -160,6 +169,9 @@ class VoiceForgeDaemon:
         self._last_copilot_follow_up_suggestions: list[str] = []
         # KC14: idle-unload — time.monotonic() when last capture_release finished (for STT unload after idle)
         self._last_copilot_release_monotonic: float | None = None
+        # KC9: IndexPaths job queue (created on first use)
+        self._index_jobs: Any = None
+        self._index_jobs_lock = threading.Lock()
 
     def _dbus_streaming_emitter_loop(self) -> None:
         """Worker to get transcript chunks from queue and emit them as D-Bus signals."""
@@ -171,9 +183,10 @@ class VoiceForgeDaemon:
         while not self._dbus_emitter_stop.is_set():
             try:
                 # Timeout allows the loop to check for the stop event periodically
-                text, speaker, ts, is_final = self._streaming_chunk_queue.get(timeout=1)
+                text, speaker, ts, is_final, cursor = self._streaming_chunk_queue.get(timeout=1)
                 # D-Bus signal expects timestamp in milliseconds
                 self._iface.TranscriptChunk(text, speaker, int(ts * 1000), is_final)
+                self._iface.StreamingTranscriptAdvanced(cursor)
                 self._streaming_chunk_queue.task_done()
             except queue.Empty:
                 continue
@@ -181,15 +194,31 @@ class VoiceForgeDaemon:
                 log.error("dbus.emitter.failed", error=str(e))
         log.info("dbus.emitter.stopped")
 
+    def _session_speaker_linker(self) -> Any:
+        """SpeakerLinker of the current listen session (None when diarization dependencies are missing)."""
+        with self._speaker_linker_lock:
+            if self._speaker_linker is None:
+                try:
+                    from voiceforge.stt.speaker_linker import SpeakerLinker
+                except ImportError:
+                    return None
+                self._speaker_linker = SpeakerLinker()
+            return self._speaker_linker
+
     def analyze(
         self,
         seconds: int,
         template: str | None = None,
         out_transcript: list[str] | None = None,
+        cards_signal: bool = False,
+        audio_source: Any = None,
     ) -> tuple[str, int | None]:
         """Run full pipeline, save session, return (formatted text, session_id). Block 62: session_id for SessionCreated.
         template: optional meeting template. Respects analyze_timeout_sec (#39).
-        KC4: if out_transcript is a list, it is filled with the raw STT transcript."""
+        KC4: if out_transcript is a list, it is filled with the raw STT transcript.
+        Copilot cards are published per track as soon as their LLM call completes; cards_signal additionally emits
+        CaptureStateChanged("cards") so the overlay refetches GetCopilotCaptureStatus right away.
+        audio_source: in-memory audio (audio.source); default the ring file."""
         from voiceforge.core.transcript_log import TranscriptLog
         from voiceforge.main import run_analyze_pipeline
 
@@ -199,10 +228,14 @@ class VoiceForgeDaemon:
             if self._iface:
                 self._iface.StreamingAnalysisChunk(delta if delta is not None else "")
 
+        def cards_cb(track: str, fields: dict[str, Any]) -> None:
+            self._publish_copilot_cards(track, fields, emit_signal=cards_signal)
+
         with self._copilot_lock:
             session_ctx = list(self._copilot_session_turns[-self._COPILOT_SESSION_MAX_TURNS :])
         with ThreadPoolExecutor(max_workers=1) as ex:
             future = ex.submit(
+                contextvars.copy_context().run,  # keeps a copilot STT size override (ModelManager.stt_size_override)
                 run_analyze_pipeline,
                 seconds,
                 template=template,
@@ -210,6 +243,9 @@ class VoiceForgeDaemon:
                 out_transcript=out_transcript,
                 for_copilot=True,
                 session_context=session_ctx if session_ctx else None,
+                on_copilot_cards=cards_cb,
+                audio_source=audio_source,
+                speaker_linker=self._session_speaker_linker(),
             )
             try:
                 text, segments_for_log, analysis_for_log = future.result(timeout=timeout_sec)
@@ -274,6 +310,29 @@ class VoiceForgeDaemon:
                 log.warning("daemon.analyze.log_failed", error=str(e))
         return (text, session_id)
 
+    def _publish_copilot_cards(self, track: str, fields: dict[str, Any], emit_signal: bool = False) -> None:
+        """Store one copilot track's cards (fast or deep) for GetCopilotCaptureStatus before the analysis finishes."""
+        with self._copilot_lock:
+            for key, value in fields.items():
+                if hasattr(self, f"_last_{key}"):
+                    setattr(self, f"_last_{key}", value)
+        log.info("daemon.copilot_cards_published", track=track)
+        with self._copilot_lock:
+            released = self._copilot_released_at
+            self._copilot_released_at = None
+        if released is not None:
+            elapsed = time.monotonic() - released[0]
+            log.info("daemon.copilot_release_to_first_card", seconds=round(elapsed, 3), stt=released[1])
+            try:
+                from voiceforge.core.observability import record_copilot_release_to_first_card
+
+                record_copilot_release_to_first_card(elapsed, released[1])
+            except ImportError:
+                pass
+        if emit_signal and self._iface:
+            with contextlib.suppress(Exception):
+                self._iface.CaptureStateChanged("cards")
+
     def status(self) -> str:
         """Return RAM + cost string."""
         from voiceforge.main import get_status_text
@@ -383,12 +442,12 @@ class VoiceForgeDaemon:
         return self._model_manager.swap_model(model_type, model_name)
 
     def get_streaming_transcript(self) -> str:
-        """Block 10.1: return JSON {partial, finals} for UI (polling)."""
-        with self._streaming_lock:
-            return json.dumps(
-                {"partial": self._streaming_partial, "finals": list(self._streaming_finals)},
-                ensure_ascii=False,
-            )
+        """Block 10.1: return JSON {partial, finals} for UI (polling); finals held in memory only."""
+        return json.dumps(self._streaming_transcript.snapshot(), ensure_ascii=False)
+
+    def get_streaming_transcript_since(self, cursor: int) -> str:
+        """Return JSON {cursor, partial, finals, more, reset, truncated}: finals with seq > cursor only."""
+        return json.dumps(self._streaming_transcript.since(cursor), ensure_ascii=False)
 
     def _copilot_watcher_loop(self) -> None:
         """KC3: every 1s check elapsed; at 25s emit recording_warning, at 30s auto-release."""
@@ -431,8 +490,9 @@ class VoiceForgeDaemon:
         self.listen_start()
         pre_roll = getattr(self._cfg, "copilot_pre_roll_seconds", 1.0)
         max_cap = getattr(self._cfg, "copilot_max_capture_seconds", 30.0)
+        started_at = time.monotonic()
         with self._copilot_lock:
-            self._copilot_capture_start_time = time.monotonic()
+            self._copilot_capture_start_time = started_at
             self._copilot_warning_emitted = False
             self._last_copilot_stt_ambiguous = False
             # KC6/KC7: clear fast-track and deep-track cards for new recording
@@ -449,13 +509,94 @@ class VoiceForgeDaemon:
         self._copilot_watcher_stop.clear()
         self._copilot_watcher_thread = threading.Thread(target=self._copilot_watcher_loop, daemon=True)
         self._copilot_watcher_thread.start()
+        if getattr(self._cfg, "stt_backend", "local") != "openai":
+            # Load the copilot model while the user speaks (and transcribe speculatively), so release does not wait
+            copilot_size = getattr(self._cfg, "copilot_stt_model_size", "tiny")
+            if getattr(self._cfg, "copilot_speculative_stt", True):
+                threading.Thread(
+                    target=self._start_speculative_stt, args=(started_at, copilot_size, pre_roll), daemon=True
+                ).start()
+            else:
+                self._model_manager.preload_stt(copilot_size)
         if self._iface:
             with contextlib.suppress(Exception):
                 self._iface.CaptureStateChanged("recording")
         log.info("daemon.copilot_capture_started", pre_roll=pre_roll, max_capture_seconds=max_cap)
 
+    def _start_speculative_stt(self, started_at: float, copilot_size: str, pre_roll: float) -> None:
+        """Capture-start helper thread: wait for the listen capture, pin the copilot model and start transcribing the
+        capture (from pre-roll) while the key is held. Dropped if the capture was released meanwhile."""
+        from voiceforge.stt.speculative import SpeculativeTranscription
+
+        deadline = time.monotonic() + 5.0
+        capture = None
+        while capture is None and time.monotonic() < deadline:
+            with self._copilot_lock:
+                capture = self._listen_capture
+                if self._copilot_capture_start_time != started_at:
+                    return
+            if capture is None:
+                time.sleep(0.05)
+        read_since = getattr(capture, "read_mic_since", None)
+        if read_since is None:
+            return
+        try:
+            _, total = read_since(None, 0.0)
+            transcriber = self._model_manager.acquire_stt(copilot_size)
+        except Exception as e:
+            log.warning("daemon.copilot_speculative_load_failed", error=str(e))
+            return
+        session = SpeculativeTranscription(
+            transcriber,
+            read_since,
+            self._cfg.sample_rate,
+            max(0, total - int(pre_roll * self._cfg.sample_rate)),
+            language=_streaming_language_hint(self._cfg),
+            max_seconds=getattr(self._cfg, "copilot_max_capture_seconds", 30.0),
+        )
+        previous = None
+        with self._copilot_lock:
+            current = self._copilot_capture_start_time == started_at
+            if current:
+                previous = self._copilot_speculative
+                self._copilot_speculative = (session.start(), transcriber)
+        if not current:
+            self._model_manager.release_stt(transcriber)
+        if previous is not None:  # left over from an earlier capture
+            self._release_speculative(previous)
+
+    def _release_speculative(self, speculative: tuple[Any, Any]) -> None:
+        session, transcriber = speculative
+        try:
+            session.cancel()
+        finally:
+            self._model_manager.release_stt(transcriber)
+
+    def _cancel_speculative_stt(self) -> None:
+        """Stop the capture's speculative STT without using its result and give back the pooled model."""
+        with self._copilot_lock:
+            speculative = self._copilot_speculative
+            self._copilot_speculative = None
+        if speculative is not None:
+            self._release_speculative(speculative)
+
+    def _finish_speculative_stt(self) -> tuple[np.ndarray, list[Any], str] | None:
+        """Stop the capture's speculative STT and decode its tail: (audio, segments, transcript) or None."""
+        with self._copilot_lock:
+            speculative = self._copilot_speculative
+            self._copilot_speculative = None
+        if speculative is None:
+            return None
+        session, transcriber = speculative
+        try:
+            return session.finish()
+        finally:
+            self._model_manager.release_stt(transcriber)
+
     def _do_capture_release_sync(self) -> tuple[str, int | None, bool]:
-        """KC3: get segment from ring, write to ring file, run analyze; return (status, session_id, stt_ambiguous)."""
+        """KC3: take the capture segment (speculative STT result or capture buffer), run analyze in memory;
+        return (status, session_id, stt_ambiguous)."""
+        released_at = time.monotonic()
         with self._copilot_lock:
             start = self._copilot_capture_start_time
             capture = self._listen_capture
@@ -465,40 +606,50 @@ class VoiceForgeDaemon:
             self._copilot_watcher_stop.set()
             self._copilot_watcher_thread.join(timeout=2.0)
             self._copilot_watcher_thread = None
-        if start is None and capture is None:
-            return ("error", None, False)
-        if capture is None:
-            log.warning("daemon.copilot_release_no_capture")
-            return ("error", None, False)
+        try:
+            if start is None and capture is None:
+                return ("error", None, False)
+            if capture is None:
+                log.warning("daemon.copilot_release_no_capture")
+                return ("error", None, False)
+            speculative = self._finish_speculative_stt()
+        finally:
+            self._cancel_speculative_stt()  # no-op once finished
         elapsed = time.monotonic() - start if start is not None else 0.0
         pre_roll = getattr(self._cfg, "copilot_pre_roll_seconds", 1.0)
         max_cap = getattr(self._cfg, "copilot_max_capture_seconds", 30.0)
         segment_sec = min(elapsed + pre_roll, max_cap)
         segment_sec = max(1.0, segment_sec)
-        try:
-            mic, _ = capture.get_chunk(segment_sec)
-        except Exception as e:
-            log.warning("daemon.copilot_release_get_chunk_failed", error=str(e))
-            return ("error", None, False)
-        ring_path = Path(self._cfg.get_ring_file_path())
-        ring_path.parent.mkdir(parents=True, exist_ok=True)
-        try:
-            tmp = ring_path.with_suffix(".tmp")
-            tmp.write_bytes(mic.tobytes())
-            os.replace(tmp, ring_path)
-        except Exception as e:
-            log.warning("daemon.copilot_release_write_ring_failed", error=str(e))
-            return ("error", None, False)
-        seconds_for_analyze = max(1, round(segment_sec))
+        if speculative is not None:
+            # Transcribed while the key was held: STT is skipped, only the tail was decoded just now
+            audio, segments, transcript = speculative
+            source = PcmSource(audio, self._cfg.sample_rate, stt=(segments, transcript))
+            seconds_for_analyze = max(1, math.ceil(audio.size / self._cfg.sample_rate))
+            stt_mode = "speculative"
+        else:
+            try:
+                mic, _ = capture.get_chunk(segment_sec)
+            except Exception as e:
+                log.warning("daemon.copilot_release_get_chunk_failed", error=str(e))
+                return ("error", None, False)
+            source = PcmSource(mic, self._cfg.sample_rate)
+            seconds_for_analyze = max(1, round(segment_sec))
+            stt_mode = "full"
+        with self._copilot_lock:
+            self._copilot_released_at = (released_at, stt_mode)
         out_transcript: list[str] = [""]
         copilot_size = getattr(self._cfg, "copilot_stt_model_size", "tiny")
-        saved_stt_size = self._model_manager.get_stt_model_size()
         try:
-            self._model_manager.swap_stt(copilot_size)
-            try:
-                text, session_id = self.analyze(seconds_for_analyze, template=None, out_transcript=out_transcript)
-            finally:
-                self._model_manager.swap_stt(saved_stt_size)
+            # Pooled copilot model (preloaded on capture start); the daemon-wide STT size stays as is
+            with self._model_manager.stt_size_override(copilot_size):
+                # The captured segment goes to STT in memory (no ring file write/read)
+                text, session_id = self.analyze(
+                    seconds_for_analyze,
+                    template=None,
+                    out_transcript=out_transcript,
+                    cards_signal=True,
+                    audio_source=source,
+                )
         except Exception as e:
             log.warning("daemon.copilot_release_analyze_failed", error=str(e))
             return ("error", None, False)
@@ -786,13 +937,48 @@ class VoiceForgeDaemon:
             log.warning("daemon.get_rag_stats_failed", error=str(e))
             return json.dumps({"indexed_sources_count": 0, "chunks_count": 0}, ensure_ascii=False)
 
+    def _get_index_jobs(self) -> Any:
+        """KC9: lazy in-process indexing queue (warm KnowledgeIndexer, one job at a time)."""
+        with self._index_jobs_lock:
+            if self._index_jobs is None:
+                from voiceforge.rag.jobs import IndexJobQueue
+
+                cfg = self._cfg
+
+                def make_indexer() -> Any:
+                    from voiceforge.rag.indexer import KnowledgeIndexer
+
+                    return KnowledgeIndexer(cfg.get_rag_db_path(), embed_batch_size=getattr(cfg, "rag_embed_batch_size", 64))
+
+                self._index_jobs = IndexJobQueue(
+                    make_indexer,
+                    workers=getattr(cfg, "rag_index_job_workers", 2),
+                    exclude_patterns=getattr(cfg, "rag_exclude_patterns", None) or [],
+                    on_update=self._emit_index_job_updated,
+                )
+            return self._index_jobs
+
+    def stop_index_jobs(self) -> None:
+        """Stop the indexing workers on shutdown; each closes its warm KnowledgeIndexer."""
+        with self._index_jobs_lock:
+            jobs, self._index_jobs = self._index_jobs, None
+        if jobs is not None:
+            jobs.stop()
+
+    def _emit_index_job_updated(self, job: Any) -> None:
+        if self._iface:
+            with contextlib.suppress(Exception):
+                self._iface.IndexJobUpdated(json.dumps(job.to_dict(), ensure_ascii=False))
+
     def index_paths(self, paths_json: str) -> str:
-        """KC9: Index file/dir paths (JSON array of strings). Runs voiceforge index for each; returns {ok, errors}."""
+        """KC9: Queue file/dir paths (JSON array of strings) for in-process indexing; returns {ok, errors, job_id}
+        without waiting. Progress: IndexJobUpdated signal and GetIndexJobStatus."""
         try:
             paths = json.loads(paths_json)
             if not isinstance(paths, list):
                 return json.dumps({"ok": False, "errors": ["paths must be a JSON array"]}, ensure_ascii=False)
             errors: list[str] = []
+            valid: list[Path] = []
             for path_str in paths:
                 if not isinstance(path_str, str) or not path_str.strip():
                     continue
@@ -800,28 +986,26 @@ class VoiceForgeDaemon:
                 if not p.exists():
                     errors.append(f"not found: {p}")
                     continue
-                try:
-                    import subprocess
-
-                    out = subprocess.run(
-                        ["voiceforge", "index", str(p)],
-                        capture_output=True,
-                        text=True,
-                        timeout=300,
-                    )
-                    if out.returncode != 0 and out.stderr:
-                        errors.append(out.stderr.strip()[:200])
-                except subprocess.TimeoutExpired:
-                    errors.append(f"timeout: {p}")
-                except Exception as e:
-                    errors.append(f"{p}: {e}")
-            return json.dumps({"ok": len(errors) == 0, "errors": errors}, ensure_ascii=False)
+                valid.append(p)
+            job_id = self._get_index_jobs().submit(valid).job_id if valid else None
+            return json.dumps({"ok": len(errors) == 0, "errors": errors, "job_id": job_id}, ensure_ascii=False)
         except json.JSONDecodeError as e:
             return json.dumps({"ok": False, "errors": [str(e)]}, ensure_ascii=False)
         except Exception as e:
             log.warning("daemon.index_paths_failed", error=str(e))
             return json.dumps({"ok": False, "errors": [str(e)]}, ensure_ascii=False)
 
+    def get_index_job_status(self, job_id: str = "") -> str:
+        """KC9: JSON array of indexing jobs (state, files_done/files_total, chunks, errors); one job if job_id given."""
+        if self._index_jobs is None:
+            return "[]"
+        if job_id:
+            job = self._index_jobs.get(job_id)
+            jobs = [job] if job is not None else []
+        else:
+            jobs = self._index_jobs.jobs()
+        return json.dumps([j.to_dict() for j in jobs], ensure_ascii=False)
+
     def search_rag(self, query: str, top_k: int = 10) -> str:
         """Return JSON array of RAG search hits: chunk_id, content, source, page, chunk_index, timestamp, score (block 75). Uses cached HybridSearcher (#100)."""
         if not query or not query.strip():
@@ -869,9 +1053,9 @@ class VoiceForgeDaemon:
     def get_upcoming_events(self, hours_ahead: int = 48) -> str:
         """Return JSON array of upcoming calendar events (block 64)."""
         try:
-            from voiceforge.calendar import get_upcoming_events as cal_get_upcoming
+            from voiceforge.calendar.mirror import upcoming_events
 
-            events, err = cal_get_upcoming(hours_ahead=hours_ahead)
+            events, err = upcoming_events(hours_ahead=hours_ahead)
             if err:
                 log.debug("daemon.get_upcoming_events_skipped", error=err)
                 return "[]"
@@ -959,11 +1143,13 @@ class VoiceForgeDaemon:
                     "listen": True,
                     "analyze": True,
                     "streaming_transcript": True,
+                    "streaming_transcript_since": True,
                     "swap_model": True,
                     "analytics": True,
                     "signals": True,
                     "signals_v1": True,
                     "analyze_timeout_v1": True,
+                    "index_jobs": True,
                     "envelope_v1": _env_flag("VOICEFORGE_IPC_ENVELOPE", default=True),
                 },
             },
@@ -971,11 +1157,9 @@ class VoiceForgeDaemon:
         )
 
     def _streaming_on_partial(self, text: str) -> None:
+        cursor = self._streaming_transcript.set_partial(text) if text else self._streaming_transcript.cursor
         with contextlib.suppress(queue.Full):
-            self._streaming_chunk_queue.put_nowait((text, "SPEAKER_??", 0.0, False))
-        if text:
-            with self._streaming_lock:
-                self._streaming_partial = text
+            self._streaming_chunk_queue.put_nowait((text, "SPEAKER_??", 0.0, False, cursor))
 
     def _streaming_on_final(self, segment: "StreamingSegment") -> None:  # noqa: UP037 — forward ref
         t = getattr(segment, "text", "") or ""
@@ -983,51 +1167,74 @@ class VoiceForgeDaemon:
             return
         start = getattr(segment, "start", 0.0)
         end = getattr(segment, "end", 0.0)
+        cursor = self._streaming_transcript.add_final(t, start, end)
         with contextlib.suppress(queue.Full):
-            self._streaming_chunk_queue.put_nowait((t, "SPEAKER_??", end, True))
-        with self._streaming_lock:
-            self._streaming_finals.append({"text": t, "start": start, "end": end})
+            self._streaming_chunk_queue.put_nowait((t, "SPEAKER_??", end, True, cursor))
 
     def _streaming_loop(self) -> None:
-        """Block 10.1: every 1.5s get 2s chunk, transcribe, update _streaming_partial/_streaming_finals.
+        """Block 10.1: one long-lived StreamingEngine per listen session. Every 1.5s feed mic audio appended since
+        the cursor, decode the sliding window and emit only newly committed words (absolute timestamps).
+        The listen capture keeps a float32 mirror of the mic ring, so reads need no per-tick conversion.
         KC4: during copilot capture use copilot_stt_model_size (tiny) for latency budget."""
         capture = self._streaming_capture
-        get_chunk = getattr(capture, "get_chunk", None) if capture else None
-        if not get_chunk:
+        read_since = getattr(capture, "read_mic_since", None) if capture else None
+        if not read_since:
             return
         try:
+            import numpy as np
+
             from voiceforge.stt import get_transcriber_for_config
-            from voiceforge.stt.streaming import StreamingTranscriber
+            from voiceforge.stt.streaming import ENGINE_MAX_BUFFER_SEC, StreamingEngine
         except ImportError:
             return
         language_hint = _streaming_language_hint(self._cfg)
-        chunk_sec, interval_sec = 2.0, 1.5
-        min_samples = int(self._cfg.sample_rate * chunk_sec * 0.5)
+        interval_sec = 1.5
+        engine = None
+        cursor: int | None = None
+        pooled = getattr(self._cfg, "stt_backend", "local") != "openai"
+        transcriber: Any = None
+        transcriber_size: str | None = None
 
-        while not self._streaming_stop.is_set():
-            if self._streaming_stop.wait(timeout=interval_sec):
-                break
-            with self._copilot_lock:
-                in_copilot = self._copilot_capture_start_time is not None
-            size = (
-                getattr(self._cfg, "copilot_stt_model_size", "tiny") if in_copilot else getattr(self._cfg, "model_size", "small")
-            )
-            if size not in self._streaming_transcriber_cache:
-                self._streaming_transcriber_cache[size] = get_transcriber_for_config(self._cfg, model_size_override=size)
-            transcriber = self._streaming_transcriber_cache[size]
-            stream = StreamingTranscriber(
-                transcriber,
-                sample_rate=self._cfg.sample_rate,
-                language=language_hint,
-                on_partial=self._streaming_on_partial,
-                on_final=self._streaming_on_final,
-            )
-            try:
-                mic, _ = get_chunk(chunk_sec)
-                if mic.size >= min_samples:
-                    stream.process_chunk(mic, start_offset_sec=0.0)
-            except Exception as e:
-                log.warning("daemon.streaming_stt.failed", error=str(e))
+        try:
+            while not self._streaming_stop.is_set():
+                if self._streaming_stop.wait(timeout=interval_sec):
+                    break
+                with self._copilot_lock:
+                    in_copilot = self._copilot_capture_start_time is not None
+                size = getattr(self._cfg, "copilot_stt_model_size", "tiny") if in_copilot else getattr(self._cfg, "model_size", "small")
+                try:
+                    if size != transcriber_size:
+                        # Pooled models are shared with analyze; hold this one until the size changes
+                        previous = transcriber
+                        if pooled:
+                            transcriber = self._model_manager.acquire_stt(size)
+                        else:
+                            transcriber = get_transcriber_for_config(self._cfg, model_size_override=size)
+                        transcriber_size = size
+                        if pooled and previous is not None:
+                            self._model_manager.release_stt(previous)
+                    if engine is None:
+                        engine = StreamingEngine(
+                            transcriber,
+                            sample_rate=self._cfg.sample_rate,
+                            language=language_hint,
+                            on_partial=self._streaming_on_partial,
+                            on_final=self._streaming_on_final,
+                        )
+                    else:
+                        engine.set_transcriber(transcriber)
+                    mic, total = read_since(cursor, ENGINE_MAX_BUFFER_SEC, dtype=np.float32)
+                    engine.feed(mic, start_sample=total - mic.size)
+                    cursor = total
+                    engine.process()
+                except Exception as e:
+                    log.warning("daemon.streaming_stt.failed", error=str(e))
+        finally:
+            if engine is not None:
+                with contextlib.suppress(Exception):
+                    engine.finish()
+            if pooled and transcriber is not None:
+                self._model_manager.release_stt(transcriber)
 
     def _listen_loop(self) -> None:
         try:
@@ -1045,31 +1252,29 @@ class VoiceForgeDaemon:
             sample_rate=self._cfg.sample_rate,
             buffer_seconds=self._cfg.ring_seconds,
             monitor_source=effective_monitor,
+            ring_file_path=ring_path,
+            mic_float32=bool(self._cfg.streaming_stt),
         )
         capture.start()
         with self._copilot_lock:
             self._listen_capture = capture
+        with self._speaker_linker_lock:
+            self._speaker_linker = None  # new session: speakers are numbered afresh
         if self._cfg.streaming_stt:
-            with self._streaming_lock:
-                self._streaming_partial = ""
-                self._streaming_finals.clear()
+            self._streaming_transcript.reset()
             self._streaming_stop.clear()
             self._streaming_capture = capture
             self._streaming_thread = threading.Thread(target=self._streaming_loop, daemon=True)
             self._streaming_thread.start()
+        # Capture reader threads append new audio to the mmap ring file; here we only msync it periodically.
         persist_interval = max(1.0, getattr(self._cfg, "ring_persist_interval_sec", 10.0))
         last_persist_at: float = 0.0
         try:
             while not self._listen_stop.wait(timeout=2.0):
-                mic, _ = capture.get_chunk(self._cfg.ring_seconds)
-                if mic.size > 0:
-                    now = time.monotonic()
-                    if now - last_persist_at >= persist_interval:
-                        ring = Path(ring_path)
-                        tmp = ring.with_suffix(".tmp")
-                        tmp.write_bytes(mic.tobytes())
-                        os.replace(tmp, ring)
-                        last_persist_at = now
+                now = time.monotonic()
+                if now - last_persist_at >= persist_interval:
+                    capture.flush_ring_file()
+                    last_persist_at = now
         finally:
             # Stop streaming thread before capture so it doesn't call get_chunk on stopped device
             if self._streaming_thread:
@@ -1092,6 +1297,7 @@ class VoiceForgeDaemon:
             min_silence_sec=3.0,
             cooldown_sec=120.0,
             analyze_seconds=30,
+            window_sec=self._cfg.ring_seconds,
         )
         while not self._trigger_stop.wait(timeout=2.0):
             if self._trigger_stop.is_set():
@@ -1102,7 +1308,15 @@ class VoiceForgeDaemon:
                 from voiceforge.main import run_analyze_pipeline
 
                 template = getattr(self._cfg, "smart_trigger_template", None)
-                text, segments_for_log, analysis_for_log = run_analyze_pipeline(trigger.analyze_seconds, template=template)
+                with self._copilot_lock:
+                    capture = self._listen_capture
+                source = CaptureSource(capture, self._cfg.sample_rate) if capture is not None else None
+                text, segments_for_log, analysis_for_log = run_analyze_pipeline(
+                    trigger.analyze_seconds,
+                    template=template,
+                    audio_source=source,
+                    speaker_linker=self._session_speaker_linker(),
+                )
                 if text.startswith(_ANALYZE_ERROR_PREFIX_RU) or text.startswith(_ANALYZE_ERROR_PREFIX_EN):
                     log.warning("smart_trigger.analyze_failed", message=text[:100])
                     continue
@@ -1163,12 +1377,14 @@ def _wire_daemon_iface(iface: DaemonVoiceForgeInterface, daemon: VoiceForgeDaemo
     iface._get_indexed_paths = daemon.get_indexed_paths
     iface._get_rag_stats = daemon.get_rag_stats
     iface._index_paths = daemon.index_paths
+    iface._get_index_job_status = daemon.get_index_job_status
     iface._get_session_ids_with_action_items = daemon.get_session_ids_with_action_items
     iface._get_upcoming_events = lambda: daemon.get_upcoming_events(48)
     iface._create_event_from_session = lambda session_id, calendar_url: daemon.create_event_from_session(
         session_id, (calendar_url or "").strip() or None
     )
     iface._get_streaming_transcript = daemon.get_streaming_transcript
+    iface._get_streaming_transcript_since = daemon.get_streaming_transcript_since
     iface._swap_model = daemon.swap_model
     iface._ping = lambda: "pong"
     iface._get_analytics = daemon.get_analytics
@@ -1275,14 +1491,29 @@ def _event_description_from_detail(detail: Any, sid: int) -> str:
     return "\n".join(parts) if parts else f"Session {sid} (VoiceForge)"
 
 
+def _start_calendar_sync(cfg: Any) -> None:
+    """Mirror CalDAV in the background when any calendar feature is on, so lookups never wait on the server."""
+    if not any(
+        getattr(cfg, key, False) for key in ("calendar_context_enabled", "calendar_autostart_enabled", "calendar_auto_listen")
+    ):
+        return
+    try:
+        from voiceforge.calendar.mirror import get_calendar_sync
+
+        get_calendar_sync(float(getattr(cfg, "calendar_sync_interval_sec", 120))).start()
+        log.info("daemon.calendar_sync_started", interval_sec=getattr(cfg, "calendar_sync_interval_sec", 120))
+    except Exception as e:
+        log.warning("daemon.calendar_sync_failed", error=str(e))
+
+
 def _calendar_try_start_listen(
     daemon: VoiceForgeDaemon, minutes_ahead: int, log_key: str = "calendar_autostart.starting"
 ) -> None:
     """If an event starts within minutes_ahead, start listen. log_key for log event (QA3: unified)."""
     try:
-        from voiceforge.calendar import get_upcoming_events
+        from voiceforge.calendar.mirror import upcoming_events
 
-        events, err = get_upcoming_events(hours_ahead=1)
+        events, err = upcoming_events(hours_ahead=1)
         if err or not events:
             return
         now = datetime.now(UTC)
@@ -1316,9 +1547,9 @@ def _calendar_autostart_loop(daemon: VoiceForgeDaemon) -> None:
 def _calendar_auto_listen_try_analyze(daemon: VoiceForgeDaemon, last_processed_end: list[str]) -> None:
     """E11: if an event ended ≥1 min ago (and not yet processed), run analyze on ring tail and log+notify."""
     try:
-        from voiceforge.calendar import get_events_ended_at_least_minutes_ago
+        from voiceforge.calendar.mirror import events_ended_at_least_minutes_ago
 
-        events, err = get_events_ended_at_least_minutes_ago(minutes_ago=1, lookback_hours=2)
+        events, err = events_ended_at_least_minutes_ago(minutes_ago=1, lookback_hours=2)
         if err or not events:
             return
         events_sorted = sorted(events, key=lambda e: e.get("end_iso") or "", reverse=True)
@@ -1346,10 +1577,10 @@ def _calendar_auto_listen_try_analyze(daemon: VoiceForgeDaemon, last_processed_e
 
 
 def _calendar_auto_listen_loop(daemon: VoiceForgeDaemon) -> None:
-    """E11 #134: every 5 min, upcoming ≤2 min → listen_start; ended ≥1 min → auto-analyze + notify."""
+    """E11 #134: every minute (local mirror lookups), upcoming ≤2 min → listen_start; ended ≥1 min → auto-analyze + notify."""
     if not getattr(daemon._cfg, "calendar_auto_listen", False):
         return
-    interval_sec = 300  # 5 min
+    interval_sec = 60
     last_processed_end: list[str] = []
     while True:
         try:
@@ -1443,10 +1674,14 @@ def run_daemon() -> None:
     _retention_purge_at_startup(daemon)
     _wire_daemon_iface(iface, daemon)
 
+    _start_calendar_sync(daemon._cfg)
+    from voiceforge.core.backends import start_health_refresh
+
+    start_health_refresh()  # status polling and analyze read cached key presence and Ollama health
     if getattr(daemon._cfg, "calendar_auto_listen", False):
         _calendar_thread = threading.Thread(target=_calendar_auto_listen_loop, args=(daemon,), daemon=True)
         _calendar_thread.start()
-        log.info("daemon.calendar_auto_listen_enabled", interval_sec=300)
+        log.info("daemon.calendar_auto_listen_enabled", interval_sec=60)
     elif getattr(daemon._cfg, "calendar_autostart_enabled", False):
         _calendar_thread = threading.Thread(target=_calendar_autostart_loop, args=(daemon,), daemon=True)
         _calendar_thread.start()
@@ -1478,3 +1713,10 @@ def run_daemon() -> None:
     atexit.register(lambda: pid_path.unlink(missing_ok=True))
 
     _run_daemon_loop(iface, daemon, stop_event, pid_path, loop_holder)
+    from voiceforge.core.backends import stop_health_refresh
+    from voiceforge.core.transcript_log import close_transcript_pools
+
+    stop_health_refresh()
+    daemon.stop_index_jobs()
+
+    close_transcript_pools()  # close the shared transcripts.db connections (last close checkpoints the WAL)
@@ -159,10 +159,12 @@ class _DaemonOptionalCallbacks(TypedDict, total=False):
     get_indexed_paths_fn: Callable[[], str]
     get_rag_stats_fn: Callable[[], str]
     index_paths_fn: Callable[[str], str]
+    get_index_job_status_fn: Callable[[str], str]
     get_session_ids_with_action_items_fn: Callable[[], str]
     get_upcoming_events_fn: Callable[[], str]
     create_event_from_session_fn: Callable[[int, str], str]
     get_streaming_transcript_fn: Callable[[], str]
+    get_streaming_transcript_since_fn: Callable[[int], str]
     swap_model_fn: Callable[[str, str], str]
     ping_fn: Callable[[], str]
     get_analytics_fn: Callable[[str], str]
@@ -203,10 +205,12 @@ class DaemonVoiceForgeInterface(ServiceInterface):
         self._get_indexed_paths = o.get("get_indexed_paths_fn")
         self._get_rag_stats = o.get("get_rag_stats_fn")
         self._index_paths = o.get("index_paths_fn")
+        self._get_index_job_status = o.get("get_index_job_status_fn")
         self._get_session_ids_with_action_items = o.get("get_session_ids_with_action_items_fn")
         self._get_upcoming_events = o.get("get_upcoming_events_fn")
         self._create_event_from_session = o.get("create_event_from_session_fn")
         self._get_streaming_transcript = o.get("get_streaming_transcript_fn")
+        self._get_streaming_transcript_since = o.get("get_streaming_transcript_since_fn")
         self._swap_model = o.get("swap_model_fn")
         self._ping = o.get("ping_fn")
         self._get_analytics = o.get("get_analytics_fn")
@@ -381,11 +385,22 @@ class DaemonVoiceForgeInterface(ServiceInterface):
 
     @dbus_method()
     def IndexPaths(self, paths_json: DBusStr) -> DBusStr:
-        """KC9: Index file/dir paths (JSON array). Returns {ok, errors}."""
+        """KC9: Queue file/dir paths (JSON array) for background indexing. Returns {ok, errors, job_id} at once."""
         if self._index_paths is None:
             return '{"ok":false,"errors":["not available"]}'
         return self._index_paths(paths_json or "[]")
 
+    @dbus_method()
+    def GetIndexJobStatus(self, job_id: DBusStr) -> DBusStr:
+        """KC9: JSON array of indexing jobs (queued/running/recent); job_id empty = all."""
+        if self._get_index_job_status is None:
+            payload = "[]"
+        else:
+            payload = self._get_index_job_status((job_id or "").strip())
+        if _uses_ipc_envelope():
+            return _wrap_envelope_with_json_key("index_jobs", payload)
+        return payload
+
     @dbus_method()
     def RefineCopilotAnswer(
         self, transcript: DBusStr, context: DBusStr, answer_text: DBusStr, mode: DBusStr, tone: DBusStr
@@ -450,6 +465,20 @@ class DaemonVoiceForgeInterface(ServiceInterface):
             return _wrap_envelope_with_json_key("streaming_transcript", payload)
         return payload
 
+    @dbus_method()
+    def GetStreamingTranscriptSince(self, cursor: DBusUint32) -> DBusStr:
+        """Return JSON {cursor, partial, finals, more, reset, truncated}: only finals with seq > cursor (0 = all).
+        Pass the returned cursor on the next call; StreamingTranscriptAdvanced signals when there is something new."""
+        if self._get_streaming_transcript_since is None:
+            payload = json.dumps(
+                {"cursor": cursor, "partial": "", "finals": [], "more": False, "reset": False, "truncated": False}
+            )
+        else:
+            payload = self._get_streaming_transcript_since(cursor)
+        if _uses_ipc_envelope():
+            return _wrap_envelope_with_json_key("streaming_transcript", payload)
+        return payload
+
     @dbus_method()
     def SwapModel(self, model_type: DBusStr, model_name: DBusStr) -> DBusStr:
         """Block 10.4: hot-swap STT or LLM model. model_type: 'stt'|'llm', model_name: e.g. 'tiny'|'small' or model id."""
@@ -527,6 +556,11 @@ class DaemonVoiceForgeInterface(ServiceInterface):
         """KC3: copilot capture state: recording | recording_warning (25s) | analyzing."""
         return state
 
+    @dbus_signal()
+    def IndexJobUpdated(self, job_json: DBusStr) -> DBusStr:
+        """KC9: indexing job state/progress changed (JSON: job_id, state, files_done, files_total, errors)."""
+        return job_json
+
     @dbus_signal()
     def TranscriptChunk(
         self, text: DBusStr, speaker: DBusStr, timestamp_ms: DBusUint32, is_final: DBusBool
@@ -534,6 +568,11 @@ class DaemonVoiceForgeInterface(ServiceInterface):
         """Signal: streaming STT sent a segment. is_final=false is partial, is_final=true is confirmed."""
         return text, speaker, timestamp_ms, is_final
 
+    @dbus_signal()
+    def StreamingTranscriptAdvanced(self, cursor: DBusUint32) -> DBusUint32:
+        """Signal: streaming transcript changed (new final or partial); cursor = seq of the latest final."""
+        return cursor
+
     @dbus_signal()
     def StreamingAnalysisChunk(self, delta: DBusStr) -> DBusStr:
         """Signal: LLM streaming analyze sent a text delta. Empty delta = stream ended (#91)."""
@@ -0,0 +1,84 @@
+-- Session listing without per-session subqueries: indexes, per-session counters and summary preview kept by triggers.
+CREATE INDEX IF NOT EXISTS idx_segments_session_id ON segments(session_id, start_sec);
+CREATE INDEX IF NOT EXISTS idx_analyses_session_id ON analyses(session_id, id);
+CREATE INDEX IF NOT EXISTS idx_sessions_started_at ON sessions(started_at, id, ended_at, duration_sec);
+CREATE TABLE IF NOT EXISTS session_stats (
+    session_id INTEGER PRIMARY KEY,
+    segments_count INTEGER NOT NULL DEFAULT 0,
+    speaker_count INTEGER NOT NULL DEFAULT 0,
+    summary_preview TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS session_speakers (
+    session_id INTEGER NOT NULL,
+    speaker TEXT NOT NULL,
+    segments INTEGER NOT NULL,
+    PRIMARY KEY (session_id, speaker)
+) WITHOUT ROWID;
+INSERT OR REPLACE INTO session_speakers (session_id, speaker, segments)
+    SELECT session_id, speaker, COUNT(*) FROM segments WHERE trim(speaker) != '' GROUP BY session_id, speaker;
+INSERT OR REPLACE INTO session_stats (session_id, segments_count, speaker_count, summary_preview)
+    SELECT s.id,
+           (SELECT COUNT(*) FROM segments WHERE session_id = s.id),
+           (SELECT COUNT(*) FROM session_speakers WHERE session_id = s.id),
+           COALESCE((SELECT CASE WHEN json_valid(a.answers) THEN
+                        substr(trim(replace(replace(COALESCE(json_extract(a.answers, '$[0]'), ''), '"', ''), char(10), ' ')), 1, 200)
+                     END
+                     FROM analyses a WHERE a.session_id = s.id ORDER BY a.id DESC LIMIT 1), '')
+    FROM sessions s;
+CREATE TRIGGER IF NOT EXISTS sessions_stats_ai AFTER INSERT ON sessions BEGIN
+    INSERT OR IGNORE INTO session_stats (session_id) VALUES (new.id);
+END;
+CREATE TRIGGER IF NOT EXISTS sessions_stats_ad AFTER DELETE ON sessions BEGIN
+    DELETE FROM session_stats WHERE session_id = old.id;
+    DELETE FROM session_speakers WHERE session_id = old.id;
+END;
+CREATE TRIGGER IF NOT EXISTS segments_stats_ai AFTER INSERT ON segments BEGIN
+    INSERT OR IGNORE INTO session_stats (session_id) VALUES (new.session_id);
+    INSERT INTO session_speakers (session_id, speaker, segments)
+        SELECT new.session_id, new.speaker, 1 WHERE trim(new.speaker) != ''
+        ON CONFLICT (session_id, speaker) DO UPDATE SET segments = segments + 1;
+    UPDATE session_stats SET
+        segments_count = segments_count + 1,
+        speaker_count = (SELECT COUNT(*) FROM session_speakers WHERE session_id = new.session_id)
+    WHERE session_id = new.session_id;
+END;
+CREATE TRIGGER IF NOT EXISTS segments_stats_ad AFTER DELETE ON segments BEGIN
+    UPDATE session_speakers SET segments = segments - 1 WHERE session_id = old.session_id AND speaker = old.speaker;
+    DELETE FROM session_speakers WHERE session_id = old.session_id AND speaker = old.speaker AND segments <= 0;
+    UPDATE session_stats SET
+        segments_count = segments_count - 1,
+        speaker_count = (SELECT COUNT(*) FROM session_speakers WHERE session_id = old.session_id)
+    WHERE session_id = old.session_id;
+END;
+CREATE TRIGGER IF NOT EXISTS segments_stats_au AFTER UPDATE OF session_id, speaker ON segments BEGIN
+    UPDATE session_speakers SET segments = segments - 1 WHERE session_id = old.session_id AND speaker = old.speaker;
+    DELETE FROM session_speakers WHERE session_id = old.session_id AND speaker = old.speaker AND segments <= 0;
+    UPDATE session_stats SET
+        segments_count = segments_count - 1,
+        speaker_count = (SELECT COUNT(*) FROM session_speakers WHERE session_id = old.session_id)
+    WHERE session_id = old.session_id;
+    INSERT OR IGNORE INTO session_stats (session_id) VALUES (new.session_id);
+    INSERT INTO session_speakers (session_id, speaker, segments)
+        SELECT new.session_id, new.speaker, 1 WHERE trim(new.speaker) != ''
+        ON CONFLICT (session_id, speaker) DO UPDATE SET segments = segments + 1;
+    UPDATE session_stats SET
+        segments_count = segments_count + 1,
+        speaker_count = (SELECT COUNT(*) FROM session_speakers WHERE session_id = new.session_id)
+    WHERE session_id = new.session_id;
+END;
+CREATE TRIGGER IF NOT EXISTS analyses_stats_ai AFTER INSERT ON analyses BEGIN
+    INSERT OR IGNORE INTO session_stats (session_id) VALUES (new.session_id);
+    UPDATE session_stats SET summary_preview = COALESCE(CASE WHEN json_valid(new.answers) THEN
+            substr(trim(replace(replace(COALESCE(json_extract(new.answers, '$[0]'), ''), '"', ''), char(10), ' ')), 1, 200)
+        END, '')
+    WHERE session_id = new.session_id
+      AND new.id = (SELECT MAX(id) FROM analyses WHERE session_id = new.session_id);
+END;
+CREATE TRIGGER IF NOT EXISTS analyses_stats_ad AFTER DELETE ON analyses BEGIN
+    UPDATE session_stats SET summary_preview = COALESCE((SELECT CASE WHEN json_valid(a.answers) THEN
+            substr(trim(replace(replace(COALESCE(json_extract(a.answers, '$[0]'), ''), '"', ''), char(10), ' ')), 1, 200)
+        END
+        FROM analyses a WHERE a.session_id = old.session_id ORDER BY a.id DESC LIMIT 1), '')
+    WHERE session_id = old.session_id;
+END;
+UPDATE schema_version SET version = 6 WHERE version < 6;
@@ -0,0 +1,22 @@
+-- Bulk segment inserts: per-row FTS / session_stats triggers are skipped for sessions listed in segments_bulk_load.
+-- TranscriptLog adds the session there inside its write transaction, inserts segments with executemany, fills
+-- segments_fts and session_stats set-based and removes the row before commit (other connections never see it).
+CREATE TABLE IF NOT EXISTS segments_bulk_load (session_id INTEGER PRIMARY KEY);
+DROP TRIGGER IF EXISTS segments_ai;
+CREATE TRIGGER IF NOT EXISTS segments_ai AFTER INSERT ON segments
+WHEN NOT EXISTS (SELECT 1 FROM segments_bulk_load WHERE session_id = new.session_id) BEGIN
+    INSERT INTO segments_fts(rowid, text) VALUES (new.id, new.text);
+END;
+DROP TRIGGER IF EXISTS segments_stats_ai;
+CREATE TRIGGER IF NOT EXISTS segments_stats_ai AFTER INSERT ON segments
+WHEN NOT EXISTS (SELECT 1 FROM segments_bulk_load WHERE session_id = new.session_id) BEGIN
+    INSERT OR IGNORE INTO session_stats (session_id) VALUES (new.session_id);
+    INSERT INTO session_speakers (session_id, speaker, segments)
+        SELECT new.session_id, new.speaker, 1 WHERE trim(new.speaker) != ''
+        ON CONFLICT (session_id, speaker) DO UPDATE SET segments = segments + 1;
+    UPDATE session_stats SET
+        segments_count = segments_count + 1,
+        speaker_count = (SELECT COUNT(*) FROM session_speakers WHERE session_id = new.session_id)
+    WHERE session_id = new.session_id;
+END;
+UPDATE schema_version SET version = 7 WHERE version < 7;
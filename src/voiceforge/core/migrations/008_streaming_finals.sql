@@ -0,0 +1,9 @@
+-- Streaming STT finals spilled from the daemon's in-memory ring (core.streaming_transcript) so clients that fall
+-- behind can still read them by sequence number. Holds the current listen session only; cleared on the next one.
+CREATE TABLE IF NOT EXISTS streaming_finals (
+    seq INTEGER PRIMARY KEY,
+    start_sec REAL NOT NULL,
+    end_sec REAL NOT NULL,
+    text TEXT NOT NULL
+);
+UPDATE schema_version SET version = 8 WHERE version < 8;
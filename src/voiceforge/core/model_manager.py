@@ -1,8 +1,20 @@
-"""Block 10.4: Model hot-swap — load/unload/swap STT and LLM without restarting daemon."""
+"""Block 10.4: Model hot-swap — load/unload/swap STT and LLM without restarting daemon.
+
+STT models live in a ref-counted pool shared by the analyze pipeline, streaming STT and copilot captures: several
+sizes (e.g. small for analyze, tiny for copilot) stay resident within stt_pool_mb and idle ones are evicted LRU, so
+switching sizes no longer reloads a model from disk. A copilot capture selects its size for the current context
+(stt_size_override) instead of swapping the daemon-wide size."""
 
 from __future__ import annotations
 
+import contextlib
 import gc
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from typing import Any
 
 import psutil
@@ -10,7 +22,22 @@ import structlog
 
 log = structlog.get_logger()
 
+STT_POOL_MB = 2048  # default RAM budget for resident STT models (config stt_pool_mb)
+# Approximate resident size of faster-whisper int8 CPU models, for the pool budget.
+_STT_MODEL_MB = {
+    "tiny": 120,
+    "base": 200,
+    "small": 500,
+    "medium": 1200,
+    "large-v3-turbo": 1200,
+    "large-v2": 2400,
+    "large-v3": 2400,
+    "large": 2400,
+}
+_DEFAULT_STT_MODEL_MB = 1200
+
 _instance: Any = None
+_stt_size_override: ContextVar[str | None] = ContextVar("voiceforge_stt_size_override", default=None)
 
 
 def get_model_manager() -> Any:
@@ -24,14 +51,48 @@ def set_model_manager(manager: Any) -> None:
     _instance = manager
 
 
+def effective_stt_model_size(cfg: Any) -> str:
+    """STT size the pipeline uses in this context: copilot override, else the daemon's size, else cfg.model_size."""
+    override = _stt_size_override.get()
+    if override:
+        return override
+    manager = get_model_manager()
+    if manager is not None:
+        return manager.get_stt_model_size()
+    return getattr(cfg, "model_size", "small")
+
+
+def _release_memory() -> None:
+    gc.collect()
+    try:
+        import torch
+
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+    except ImportError:
+        pass
+
+
+@dataclass
+class _PooledStt:
+    size: str
+    mb: int
+    transcriber: Any = None
+    refs: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)  # serializes the load of this size
+
+
 class ModelManager:
-    """Block 10.4: Hot-swap STT and LLM models. load/unload/swap with RSS logging."""
+    """Block 10.4: Hot-swap STT and LLM models. Ref-counted STT pool (LRU under stt_pool_mb) with RSS logging."""
 
     def __init__(self, cfg: Any) -> None:
         self._cfg = cfg
         self._stt_model_size: str = getattr(cfg, "model_size", "small")
         self._llm_model_id: str = getattr(cfg, "default_llm", "anthropic/claude-haiku-4-5")
-        self._transcriber: Any = None
+        budget = getattr(cfg, "stt_pool_mb", STT_POOL_MB)
+        self._stt_budget_mb = int(budget) if isinstance(budget, int | float) else STT_POOL_MB
+        self._pool_lock = threading.Lock()
+        self._stt_pool: OrderedDict[str, _PooledStt] = OrderedDict()  # LRU first
 
     def get_stt_model_size(self) -> str:
         return self._stt_model_size
@@ -39,65 +100,132 @@ class ModelManager:
     def get_llm_model_id(self) -> str:
         return self._llm_model_id
 
-    def get_transcriber(self, warnings: list[str] | None = None) -> Any:
-        """Return Transcriber for current STT model (lazy load). E4 (#127): optional warnings. E13 #136: resolve model_size=auto by RAM."""
+    def resident_stt_sizes(self) -> list[str]:
+        """Loaded STT sizes, least recently used first."""
+        with self._pool_lock:
+            return [e.size for e in self._stt_pool.values() if e.transcriber is not None]
+
+    @contextlib.contextmanager
+    def stt_size_override(self, model_size: str) -> Iterator[None]:
+        """Use model_size for STT in this context (thread / copied context) without changing the daemon's size."""
+        token = _stt_size_override.set(model_size)
+        try:
+            yield
+        finally:
+            _stt_size_override.reset(token)
+
+    def acquire_stt(self, model_size: str | None = None, warnings: list[str] | None = None) -> Any:
+        """Shared Transcriber for model_size (default: context override or current size), loaded on first use.
+        Pinned until release_stt(); pinned models are never evicted."""
         from voiceforge.stt.transcriber import Transcriber, resolve_stt_model_size
 
-        resolved_size = resolve_stt_model_size(self._stt_model_size)
-        if self._transcriber is not None and getattr(self._transcriber, "_model_size", None) == resolved_size:
-            return self._transcriber
-        self._transcriber = Transcriber(
-            model_size=resolved_size,
-            compute_type="int8",
-            device="cpu",
-            warnings=warnings,
-        )
-        return self._transcriber
+        size = resolve_stt_model_size(model_size or _stt_size_override.get() or self._stt_model_size)
+        with self._pool_lock:
+            entry = self._stt_pool.get(size)
+            if entry is None:
+                entry = self._stt_pool[size] = _PooledStt(size=size, mb=_STT_MODEL_MB.get(size, _DEFAULT_STT_MODEL_MB))
+            entry.refs += 1
+            self._stt_pool.move_to_end(size)
+        try:
+            with entry.lock:
+                if entry.transcriber is None:
+                    self._evict_stt(reserve_mb=entry.mb)
+                    t0 = time.monotonic()
+                    entry.transcriber = Transcriber(model_size=size, compute_type="int8", device="cpu", warnings=warnings)
+                    log.info(
+                        "model_manager.stt_loaded",
+                        size=size,
+                        load_sec=round(time.monotonic() - t0, 2),
+                        resident=self.resident_stt_sizes(),
+                    )
+        except BaseException:
+            with self._pool_lock:
+                entry.refs -= 1
+                if entry.transcriber is None and entry.refs == 0 and self._stt_pool.get(size) is entry:
+                    del self._stt_pool[size]
+            raise
+        return entry.transcriber
+
+    def release_stt(self, transcriber: Any) -> None:
+        """Unpin a transcriber from acquire_stt (unknown objects are ignored); evicts idle models over budget."""
+        with self._pool_lock:
+            for entry in self._stt_pool.values():
+                if entry.transcriber is transcriber and entry.refs > 0:
+                    entry.refs -= 1
+                    break
+            else:
+                return
+        self._evict_stt()
+
+    @contextlib.contextmanager
+    def stt(self, model_size: str | None = None, warnings: list[str] | None = None) -> Iterator[Any]:
+        """acquire_stt / release_stt around a block."""
+        transcriber = self.acquire_stt(model_size, warnings=warnings)
+        try:
+            yield transcriber
+        finally:
+            self.release_stt(transcriber)
+
+    def preload_stt(self, model_size: str) -> threading.Thread:
+        """Load model_size into the pool in a background thread (e.g. copilot tiny on capture start)."""
+
+        def load() -> None:
+            try:
+                with self.stt(model_size):
+                    pass
+            except Exception as e:
+                log.warning("model_manager.stt_preload_failed", size=model_size, error=str(e))
+
+        thread = threading.Thread(target=load, name="stt-preload", daemon=True)
+        thread.start()
+        return thread
+
+    def _evict_stt(self, reserve_mb: int = 0) -> None:
+        """Drop least recently used idle models until resident models (+ reserve_mb) fit stt_pool_mb."""
+        evicted: list[str] = []
+        with self._pool_lock:
+            total = sum(e.mb for e in self._stt_pool.values() if e.transcriber is not None)
+            for entry in list(self._stt_pool.values()):
+                if total + reserve_mb <= self._stt_budget_mb:
+                    break
+                if entry.refs == 0 and entry.transcriber is not None:
+                    del self._stt_pool[entry.size]
+                    total -= entry.mb
+                    evicted.append(entry.size)
+        if evicted:
+            _release_memory()
+            log.info("model_manager.stt_evicted", sizes=evicted, budget_mb=self._stt_budget_mb)
+
+    def get_transcriber(self, warnings: list[str] | None = None) -> Any:
+        """Return the pooled Transcriber for the current STT size (lazy load, not pinned: prefer stt()).
+        E4 (#127): optional warnings. E13 #136: resolve model_size=auto by RAM."""
+        with self.stt(warnings=warnings) as transcriber:
+            return transcriber
 
     def unload_stt(self) -> None:
-        """Unload current STT model to free RAM. Log RSS before/after."""
+        """Unload idle STT models to free RAM (models in use stay loaded). Log RSS before/after."""
         proc = psutil.Process()
         rss_before = proc.memory_info().rss
-        self._transcriber = None
-        gc.collect()
-        try:
-            import torch
-
-            if torch.cuda.is_available():
-                torch.cuda.empty_cache()
-        except ImportError:
-            pass
+        with self._pool_lock:
+            idle = [e.size for e in self._stt_pool.values() if e.refs == 0]
+            for size in idle:
+                del self._stt_pool[size]
+        _release_memory()
         rss_after = proc.memory_info().rss
         log.info(
             "model_manager.unload_stt",
+            sizes=idle,
             rss_before_mb=round(rss_before / 1024**2, 1),
             rss_after_mb=round(rss_after / 1024**2, 1),
             freed_mb=round((rss_before - rss_after) / 1024**2, 1),
         )
 
     def swap_stt(self, model_size: str) -> None:
-        """Swap STT model: unload current, set new size. Next get_transcriber() loads new model."""
-        proc = psutil.Process()
-        rss_before = proc.memory_info().rss
-        self._transcriber = None
-        gc.collect()
-        try:
-            import torch
-
-            if torch.cuda.is_available():
-                torch.cuda.empty_cache()
-        except ImportError:
-            pass
+        """Set the default STT size. The old model stays pooled (evicted LRU if over budget); next use loads the new."""
         old_size = self._stt_model_size
         self._stt_model_size = model_size
-        rss_after = proc.memory_info().rss
-        log.info(
-            "model_manager.swap_stt",
-            old=old_size,
-            new=model_size,
-            rss_before_mb=round(rss_before / 1024**2, 1),
-            rss_after_mb=round(rss_after / 1024**2, 1),
-        )
+        self._evict_stt()
+        log.info("model_manager.swap_stt", old=old_size, new=model_size, resident=self.resident_stt_sizes())
 
     def swap_llm(self, model_id: str) -> None:
         """Swap LLM model id. Next analyze uses new model."""
@@ -32,6 +32,17 @@ pipeline_step2_total_seconds = Histogram(
     "Step2 parallel (diarization + RAG + PII) total duration (#100 stage-level metric)",
     buckets=(0.5, 1.0, 2.0, 5.0, 10.0, 25.0, 60.0),
 )
+copilot_time_to_first_card_seconds = Histogram(
+    "voiceforge_copilot_time_to_first_card_seconds",
+    "Copilot analyze start to first published card (fast or deep track)",
+    buckets=(1.0, 2.0, 3.0, 5.0, 8.0, 12.0, 20.0, 30.0, 60.0),
+)
+copilot_release_to_first_card_seconds = Histogram(
+    "voiceforge_copilot_release_to_first_card_seconds",
+    "Copilot key release to first published card; stt = speculative (only the tail decoded on release) | full",
+    ["stt"],
+    buckets=(0.5, 1.0, 1.5, 2.0, 3.0, 5.0, 8.0, 12.0, 20.0, 30.0, 60.0),
+)
 
 # Counters
 llm_cost_usd_total = Counter(
@@ -49,6 +60,42 @@ pipeline_errors_total = Counter(
     "Pipeline errors by step",
     ["step"],
 )
+llm_response_cache_events_total = Counter(
+    "voiceforge_llm_response_cache_events_total",
+    "LLM response cache hits, misses and evictions (tier: memory LRU or SQLite)",
+    ["event", "tier"],
+)
+analysis_cache_events_total = Counter(
+    "voiceforge_analysis_cache_events_total",
+    "Analysis cache lookups per pipeline step (stt, diarization, rag, pii): hit | miss | partial (STT overlap reuse)",
+    ["step", "event"],
+)
+# Smart trigger: VAD work per tick must stay O(new audio), independent of ring length
+smart_trigger_samples_processed_total = Counter(
+    "voiceforge_smart_trigger_samples_processed_total",
+    "Samples consumed by smart trigger VAD",
+)
+smart_trigger_samples_last_tick = Gauge(
+    "voiceforge_smart_trigger_samples_last_tick",
+    "Samples consumed by smart trigger VAD on the last tick",
+)
+# Web request scheduler (web.scheduler): pool = analyze | read
+web_queue_depth = Gauge(
+    "voiceforge_web_queue_depth",
+    "Web requests waiting for a worker of the pool",
+    ["pool"],
+)
+web_queue_wait_seconds = Histogram(
+    "voiceforge_web_queue_wait_seconds",
+    "Time a web request waited for a worker of the pool",
+    ["pool"],
+    buckets=(0.005, 0.05, 0.25, 1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0),
+)
+web_rejected_total = Counter(
+    "voiceforge_web_rejected_total",
+    "Web requests rejected with 429 because the pool queue was full",
+    ["pool"],
+)
 # Circuit breaker state per model (0=closed, 1=half_open, 2=open). #62
 llm_circuit_breaker_state = Gauge(
     "voiceforge_llm_circuit_breaker_state",
@@ -89,10 +136,24 @@ def record_pipeline_step2_total(seconds: float) -> None:
     pipeline_step2_total_seconds.observe(seconds)
 
 
+def record_copilot_time_to_first_card(seconds: float) -> None:
+    copilot_time_to_first_card_seconds.observe(seconds)
+
+
+def record_copilot_release_to_first_card(seconds: float, stt: str) -> None:
+    """stt: speculative | full."""
+    copilot_release_to_first_card_seconds.labels(stt=stt).observe(seconds)
+
+
 def record_pipeline_error(step: str) -> None:
     pipeline_errors_total.labels(step=step).inc()
 
 
+def record_smart_trigger_tick(samples: int) -> None:
+    smart_trigger_samples_processed_total.inc(samples)
+    smart_trigger_samples_last_tick.set(samples)
+
+
 def record_llm_call(model: str, cost_usd: float, success: bool) -> None:
     status = "success" if success else "error"
     llm_calls_total.labels(model=model, status=status).inc()
@@ -100,6 +161,28 @@ def record_llm_call(model: str, cost_usd: float, success: bool) -> None:
         llm_cost_usd_total.labels(model=model).inc(cost_usd)
 
 
+def record_llm_response_cache(event: str, tier: str, n: int = 1) -> None:
+    """event: hit | miss | eviction; tier: memory | disk."""
+    llm_response_cache_events_total.labels(event=event, tier=tier).inc(n)
+
+
+def record_analysis_cache(step: str, event: str) -> None:
+    """step: stt | diarization | rag | pii; event: hit | miss | partial."""
+    analysis_cache_events_total.labels(step=step, event=event).inc()
+
+
+def set_web_queue_depth(pool: str, depth: int) -> None:
+    web_queue_depth.labels(pool=pool).set(depth)
+
+
+def record_web_queue_wait(pool: str, seconds: float) -> None:
+    web_queue_wait_seconds.labels(pool=pool).observe(seconds)
+
+
+def record_web_rejected(pool: str) -> None:
+    web_rejected_total.labels(pool=pool).inc()
+
+
 def set_circuit_breaker_states(states: dict[str, int]) -> None:
     """Update circuit breaker gauge from get_circuit_breaker().get_all_states(). #62"""
     for model, state in states.items():
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import threading
 import time
 from concurrent.futures import Future, ThreadPoolExecutor, wait
@@ -13,6 +14,9 @@ import numpy as np
 import psutil
 import structlog
 
+from voiceforge.audio.buffer import pcm_to_float32
+from voiceforge.audio.source import AudioSource, PcmSource, RingFileSource
+from voiceforge.core.model_manager import effective_stt_model_size
 from voiceforge.core.otel import span
 from voiceforge.i18n import t
 
@@ -78,25 +82,28 @@ def _step1_stt(
     cfg: Any = None,
     out_warnings: list[str] | None = None,
 ) -> tuple[list[Any], str]:
-    """Step 1: STT only. Returns (segments, transcript). E4 (#127): optional out_warnings for model download messages. E13 #136: model_size=auto resolved by RAM."""
+    """Step 1: STT only. Returns (segments, transcript). E4 (#127): optional out_warnings for model download messages. E13 #136: model_size=auto resolved by RAM.
+    Word timestamps are requested so speaker attribution can split segments at speaker turns."""
     from voiceforge.core.model_manager import get_model_manager
     from voiceforge.stt.transcriber import Transcriber, resolve_stt_model_size
 
     t0 = time.monotonic()
     effective_model_size = resolve_stt_model_size(model_size)
     stt_backend = getattr(cfg, "stt_backend", "local") if cfg else "local"
-    transcriber: Any
-    if stt_backend == "openai":
-        from voiceforge.stt.openai_whisper import OpenAIWhisperTranscriber
-
-        transcriber = OpenAIWhisperTranscriber()
+    manager = get_model_manager() if stt_backend != "openai" else None
+    if manager is not None:
+        # Pooled model, pinned while transcribing (shared with streaming STT and copilot captures)
+        with manager.stt(warnings=out_warnings) as pooled:
+            segments = pooled.transcribe(audio, sample_rate=sample_rate, language=language_hint, word_timestamps=True)
     else:
-        manager = get_model_manager()
-        if manager is not None:
-            transcriber = manager.get_transcriber(warnings=out_warnings)
+        transcriber: Any
+        if stt_backend == "openai":
+            from voiceforge.stt.openai_whisper import OpenAIWhisperTranscriber
+
+            transcriber = OpenAIWhisperTranscriber()
         else:
             transcriber = Transcriber(model_size=effective_model_size, warnings=out_warnings)
-    segments = transcriber.transcribe(audio, sample_rate=sample_rate, language=language_hint)
+        segments = transcriber.transcribe(audio, sample_rate=sample_rate, language=language_hint, word_timestamps=True)
     transcript = " ".join(s.text for s in segments if s.text).strip() or t("pipeline.silence")
     duration_sec = time.monotonic() - t0
     log.info("pipeline.step1_stt", segments=len(segments), duration_sec=round(duration_sec, 2), backend=stt_backend)
@@ -134,8 +141,10 @@ def _step2_diarization(
     audio_f: np.ndarray,
     sample_rate: int,
     pyannote_restart_hours: int,
+    linker: Any = None,
 ) -> tuple[list[Any], list[str]]:
-    """Diarization (pyannote). Returns (segments, warnings). E4 (#127): user-facing skip reason."""
+    """Diarization (pyannote). Returns (segments, warnings). E4 (#127): user-facing skip reason.
+    linker: the session's stt.speaker_linker.SpeakerLinker (labels stable across analyses); None = per call."""
     t0 = time.monotonic()
     out: list[Any] = []
     warnings: list[str] = []
@@ -164,7 +173,7 @@ def _step2_diarization(
             return (out, warnings)
         diarizer = _get_cached_diarizer(auth_token, pyannote_restart_hours)
         try:
-            out = diarizer.diarize(audio_f, sample_rate=sample_rate)
+            out = diarizer.diarize(audio_f, sample_rate=sample_rate, linker=linker)
         except MemoryError as e:
             log.warning("pipeline.diarization.oom", error=str(e))
             warnings.append(t(_T_FEEDBACK_DIARIZATION_SKIPPED_RAM, available_gb=0, required_gb=2))
@@ -196,15 +205,12 @@ def _rag_merge_results(queries: list[str], searcher: Any) -> str:
 
 
 def _rag_merge_results_with_results(queries: list[str], searcher: Any) -> tuple[str, list[Any]]:
-    """Run multi-query RAG search, merge by chunk_id; return (context_str, merged SearchResult list). KC5."""
-    by_id: dict[int, Any] = {}
-    for q in queries:
-        if not (q and q.strip()):
-            continue
-        for r in searcher.search(q, top_k=3):
-            if r.chunk_id not in by_id or r.score > by_id[r.chunk_id].score:
-                by_id[r.chunk_id] = r
-    merged = sorted(by_id.values(), key=lambda x: -x.score)[:5]
+    """Run multi-query RAG search (one batched HybridSearcher.search_many, merged by chunk_id);
+    return (context_str, merged SearchResult list). KC5."""
+    queries = [q for q in queries if q and q.strip()]
+    if not queries:
+        return ("", [])
+    merged = searcher.search_many(queries, top_k=3)[:5]
     context = "\n".join(r.content[:300] for r in merged)
     return (context, merged)
 
@@ -275,22 +281,22 @@ def _step2_pii(transcript: str, pii_mode: str = "ON") -> str:
     return out
 
 
-def _prepare_audio(cfg: Any, seconds: int) -> tuple[np.ndarray, int] | tuple[None, str]:
-    """Load and resample audio. Returns (audio, effective_rate) or (None, error_str). E18: uses mmap for ring file when beneficial."""
-    from voiceforge.audio.buffer import read_ring_file_last
-
-    ring_path = cfg.get_ring_file_path()
-    if not Path(ring_path).is_file():
+def _prepare_audio(cfg: Any, seconds: int, source: AudioSource | None = None) -> tuple[np.ndarray, int] | tuple[None, str]:
+    """Load and resample audio. Returns (audio, effective_rate) or (None, error_str). source: in-memory PCM or live
+    capture (no disk I/O); default the ring file (E18: mmap read)."""
+    if source is None:
+        source = RingFileSource(cfg.get_ring_file_path(), cfg.sample_rate)
+    audio = source.read_last(float(seconds))
+    if audio is None:
         return (None, t("pipeline.run_listen_first"))
-    audio = read_ring_file_last(ring_path, float(seconds), cfg.sample_rate, use_mmap=True)
-    if len(audio) < cfg.sample_rate:
+    if len(audio) < source.sample_rate:
         return (None, t("pipeline.insufficient_audio"))
-    effective_rate = cfg.sample_rate
+    effective_rate = source.sample_rate
     if effective_rate != TARGET_SAMPLE_RATE:
         audio = _resample_to_16k(audio, effective_rate)
         effective_rate = TARGET_SAMPLE_RATE
-        log.info("pipeline.resampled", original_rate=cfg.sample_rate, target=TARGET_SAMPLE_RATE)
-    log.info("pipeline.start", seconds=seconds, samples=len(audio))
+        log.info("pipeline.resampled", original_rate=source.sample_rate, target=TARGET_SAMPLE_RATE)
+    log.info("pipeline.start", seconds=seconds, samples=len(audio), source=type(source).__name__)
     return (audio, effective_rate)
 
 
@@ -306,7 +312,7 @@ def _step1_or_error(
         segments, transcript = _step1_stt(
             audio,
             sample_rate=effective_rate,
-            model_size=cfg.model_size,
+            model_size=effective_stt_model_size(cfg),
             language_hint=language_hint,
             cfg=cfg,
             out_warnings=out_warnings,
@@ -331,24 +337,156 @@ def _step1_or_error(
         return (None, t("error.stt_failed", e=str(e)))
 
 
+def _precomputed_stt(source: AudioSource | None, seconds: int) -> tuple[list[Any], str] | None:
+    """(segments, transcript) the source already decoded (speculative copilot STT) when all of its audio is analyzed."""
+    if not isinstance(source, PcmSource) or source.stt is None or seconds * source.sample_rate < len(source.audio):
+        return None
+    segments, transcript = source.stt
+    log.info("pipeline.step1_precomputed", segments=len(segments))
+    return (list(segments), transcript or t("pipeline.silence"))
+
+
+def _stt_cache_key(cfg: Any) -> str:
+    """Settings that change STT output for the same audio (part of the analysis cache key); "words": segments
+    carry word timestamps."""
+    return f"{getattr(cfg, 'stt_backend', 'local')}:{effective_stt_model_size(cfg)}:{_get_language_hint(cfg) or 'auto'}:words"
+
+
+def _record_cache_event(step: str, event: str) -> None:
+    try:
+        from voiceforge.core.observability import record_analysis_cache
+
+        record_analysis_cache(step, event)
+    except ImportError:
+        pass
+
+
+def _step1_cached(
+    audio: np.ndarray,
+    effective_rate: int,
+    cfg: Any,
+    audio_key: str | None,
+    out_warnings: list[str] | None = None,
+    audio_f: np.ndarray | None = None,
+) -> tuple[list[Any], str] | tuple[None, str]:
+    """Step 1 through the analysis cache: same window → cached segments; window overlapping a recent one → reuse
+    the segments inside the overlap and transcribe only the tail; otherwise full STT. audio_key None = no cache.
+    audio_f: the same window already converted to float32 (transcribed instead of audio; the cache keys on int16)."""
+    from voiceforge.core.analysis_cache import get_analysis_cache, shift_segment
+
+    stt_audio = audio if audio_f is None else audio_f
+    cache = get_analysis_cache(cfg) if audio_key is not None else None
+    if cache is None or audio_key is None:
+        return _step1_or_error(stt_audio, effective_rate, cfg, out_warnings=out_warnings)
+    stt_key = _stt_cache_key(cfg)
+    hit = cache.get_stt(audio_key, stt_key)
+    if hit is not None:
+        log.info("pipeline.step1_cache_hit", segments=len(hit[0]))
+        _record_cache_event("stt", "hit")
+        return hit
+    reuse = cache.find_overlap(audio, effective_rate, stt_key)
+    if reuse is None:
+        _record_cache_event("stt", "miss")
+        result = _step1_or_error(stt_audio, effective_rate, cfg, out_warnings=out_warnings)
+        if result[0] is None:
+            return result
+        segments, transcript = result
+    else:
+        reused, cut = reuse
+        tail = _step1_or_error(stt_audio[cut:], effective_rate, cfg, out_warnings=out_warnings)
+        if tail[0] is None:
+            return tail
+        offset = cut / effective_rate
+        segments = reused + [shift_segment(s, offset) for s in tail[0]]
+        transcript = " ".join(s.text for s in segments if s.text).strip() or t("pipeline.silence")
+        log.info("pipeline.step1_partial_reuse", reused=len(reused), tail_sec=round((len(audio) - cut) / effective_rate, 2))
+        _record_cache_event("stt", "partial")
+    cache.put_stt(audio_key, stt_key, audio, effective_rate, segments, transcript)
+    return (segments, transcript)
+
+
+def _cached_submit(
+    executor: ThreadPoolExecutor,
+    cache: Any,
+    key: str | None,
+    keep: Any,
+    fn: Any,
+    *args: Any,
+    **kwargs: Any,
+) -> Future[Any]:
+    """Submit a step 2 task unless its result is cached; results for which keep(result) is true are stored,
+    also when they arrive after the step 2 timeout (the next request for the same window gets them)."""
+    if cache is None or key is None:
+        return executor.submit(fn, *args, **kwargs)
+    step = key.split(":", 1)[0]
+    hit = cache.get(key)
+    if hit is not None:
+        _record_cache_event(step, "hit")
+        done: Future[Any] = Future()
+        done.set_result(hit)
+        return done
+    _record_cache_event(step, "miss")
+
+    def run() -> Any:
+        result = fn(*args, **kwargs)
+        if keep(result):
+            cache.put(key, result)
+        return result
+
+    return executor.submit(run)
+
+
+def _rag_index_stamp(rag_db_path: str) -> str:
+    try:
+        return str(Path(rag_db_path).stat().st_mtime_ns)
+    except OSError:
+        return "none"
+
+
 def _gather_step2(
     executor: ThreadPoolExecutor,
     cfg: Any,
     audio_f: np.ndarray,
     transcript: str,
     effective_rate: int,
+    audio_key: str | None = None,
+    speaker_linker: Any = None,
 ) -> tuple[list[Any], str, str, list[str]]:
-    """Run step2 parallel tasks; return (diar_segments, context, transcript_redacted, warnings)."""
+    """Run step2 parallel tasks; return (diar_segments, context, transcript_redacted, warnings).
+    With audio_key (analysis cache on) diarization is cached per window (and speaker session), RAG per transcript and
+    index mtime, PII per transcript and mode. Diarization skipped for RAM or a missing token and failed RAG lookups
+    are not cached."""
+    from voiceforge.core.analysis_cache import get_analysis_cache
+
     timeout_sec = max(1.0, float(getattr(cfg, "pipeline_step2_timeout_sec", 25.0)))
+    cache = get_analysis_cache(cfg) if audio_key is not None else None
+    rag_db_path = cfg.get_rag_db_path()
+    pii_mode = getattr(cfg, "pii_mode", "ON")
+    text_key = hashlib.blake2b(transcript.encode("utf-8"), digest_size=16).hexdigest()
+    speakers_key = getattr(speaker_linker, "session_id", 0)
     futures: dict[str, Future[Any]] = {
-        "diarization": executor.submit(_step2_diarization, audio_f, effective_rate, cfg.pyannote_restart_hours),
-        "rag": executor.submit(
+        "diarization": _cached_submit(
+            executor,
+            cache,
+            f"diarization:{cfg.pyannote_restart_hours}:{effective_rate}:{speakers_key}:{audio_key}",
+            lambda res: not res[1],
+            _step2_diarization,
+            audio_f,
+            effective_rate,
+            cfg.pyannote_restart_hours,
+            linker=speaker_linker,
+        ),
+        "rag": _cached_submit(
+            executor,
+            cache,
+            f"rag:{rag_db_path}:{_rag_index_stamp(rag_db_path)}:{text_key}",
+            lambda res: bool(res[0] or res[1]),
             _step2_rag,
             transcript,
-            cfg.get_rag_db_path(),
+            rag_db_path,
             for_short_capture=len(transcript) < 400,
         ),
-        "pii": executor.submit(_step2_pii, transcript, getattr(cfg, "pii_mode", "ON")),
+        "pii": _cached_submit(executor, cache, f"pii:{pii_mode}:{text_key}", bool, _step2_pii, transcript, pii_mode),
     }
     done, not_done = wait(futures.values(), timeout=timeout_sec)
     timed_out = [name for name, fut in futures.items() if fut in not_done]
@@ -369,13 +507,13 @@ def _gather_step2(
 
 
 def _with_calendar_context(context: str, cfg: Any) -> str:
-    """Append calendar context if enabled. D3 (#48)."""
+    """Append calendar context if enabled. D3 (#48). Reads the local CalDAV mirror (never the server)."""
     if not getattr(cfg, "calendar_context_enabled", False):
         return context
     try:
-        from voiceforge.calendar.caldav_poll import get_next_meeting_context
+        from voiceforge.calendar.mirror import next_meeting_context
 
-        cal_ctx, _ = get_next_meeting_context(hours_ahead=24)
+        cal_ctx, _ = next_meeting_context(hours_ahead=24)
         if cal_ctx:
             return (
                 (context + "\n\nCalendar (next meeting): " + cal_ctx).strip()
@@ -387,12 +525,21 @@ def _with_calendar_context(context: str, cfg: Any) -> str:
     return context
 
 
+def _audio_cache_key(cfg: Any, audio: np.ndarray) -> str | None:
+    """Content hash of the analysis window, or None when the analysis cache is disabled (analysis_cache_mb=0)."""
+    from voiceforge.core.analysis_cache import audio_digest, get_analysis_cache
+
+    return audio_digest(audio) if get_analysis_cache(cfg) is not None else None
+
+
 class AnalysisPipeline:
     """Block 10.2: Step 1 STT, Step 2 parallel (diarization + RAG + PII), profiling.
-    ThreadPoolExecutor is created once per instance (W15/QW3), use as context manager for cleanup."""
+    ThreadPoolExecutor is created once per instance (W15/QW3), use as context manager for cleanup.
+    speaker_linker: the listen/meeting session's SpeakerLinker, so speaker labels match across its analyses."""
 
-    def __init__(self, cfg: Any) -> None:
+    def __init__(self, cfg: Any, speaker_linker: Any = None) -> None:
         self._cfg = cfg
+        self._speaker_linker = speaker_linker
         self._executor = ThreadPoolExecutor(max_workers=3)
 
     def __enter__(self) -> AnalysisPipeline:
@@ -401,17 +548,24 @@ class AnalysisPipeline:
     def __exit__(self, *args: Any) -> None:
         self._executor.shutdown(wait=False, cancel_futures=True)
 
-    def run(self, seconds: int) -> tuple[PipelineResult | None, str | None]:
-        """Run steps 1–2. Returns (PipelineResult, None) or (None, error_str). OTel spans when #71 enabled."""
+    def run(self, seconds: int, source: AudioSource | None = None) -> tuple[PipelineResult | None, str | None]:
+        """Run steps 1–2 on the last seconds of source (default: ring file). Returns (PipelineResult, None) or
+        (None, error_str). OTel spans when #71 enabled."""
         with span("pipeline.run", seconds=seconds):
             with span("pipeline.prepare_audio"):
-                prep = _prepare_audio(self._cfg, seconds)
+                prep = _prepare_audio(self._cfg, seconds, source)
             if prep[0] is None:
                 return (None, prep[1])
             audio, effective_rate = prep
+            audio_key = _audio_cache_key(self._cfg, audio)
+            audio_f = pcm_to_float32(audio)  # converted once: STT and diarization share it
             step1_warnings: list[str] = []
             with span("pipeline.step1_stt"):
-                stt_result = _step1_or_error(audio, effective_rate, self._cfg, out_warnings=step1_warnings)
+                stt_result: tuple[list[Any], str] | tuple[None, str] | None = _precomputed_stt(source, seconds)
+                if stt_result is None:
+                    stt_result = _step1_cached(
+                        audio, effective_rate, self._cfg, audio_key, out_warnings=step1_warnings, audio_f=audio_f
+                    )
             if stt_result[0] is None:
                 return (None, stt_result[1])
             segments, transcript = stt_result
@@ -429,10 +583,15 @@ class AnalysisPipeline:
                     None,
                 )
             step2_start = time.monotonic()
-            audio_f = audio.astype(np.float32) / 32768.0
             with span("pipeline.step2_parallel"):
                 diar_segments, context, transcript_redacted, step2_warnings, rag_results = _gather_step2(
-                    self._executor, self._cfg, audio_f, transcript, effective_rate
+                    self._executor,
+                    self._cfg,
+                    audio_f,
+                    transcript,
+                    effective_rate,
+                    audio_key=audio_key,
+                    speaker_linker=self._speaker_linker,
                 )
             step2_duration = time.monotonic() - step2_start
             log.info("pipeline.step2_total", duration_sec=round(step2_duration, 2))
@@ -0,0 +1,149 @@
+"""Sequence-numbered log of streaming STT finals for incremental clients (D-Bus GetStreamingTranscriptSince).
+
+Every committed final gets the next sequence number of the daemon process (numbers keep growing across listen
+sessions). Clients keep the last number they received as a cursor and fetch only newer finals plus the current
+partial, so a poll costs O(new finals) instead of re-sending the whole meeting. The newest STREAMING_RING_FINALS
+finals stay in memory; older ones are spilled in batches to TranscriptLog (streaming_finals, current listen session
+only) and read back for clients that fell behind."""
+
+from __future__ import annotations
+
+import itertools
+import threading
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+import structlog
+
+log = structlog.get_logger()
+
+STREAMING_RING_FINALS = 500  # finals kept in memory (GetStreamingTranscript returns these)
+STREAMING_SPILL_BATCH = 100  # finals written to TranscriptLog per spill
+STREAMING_SINCE_MAX_FINALS = 500  # finals per since() reply; the client asks again while "more" is true
+
+
+def _default_log() -> Any:
+    from voiceforge.core.transcript_log import TranscriptLog
+
+    return TranscriptLog()
+
+
+class StreamingTranscript:
+    """Finals ring with sequence numbers and the current partial. add_final/set_partial come from the streaming
+    thread (single writer); since() and snapshot() may be called from any thread."""
+
+    def __init__(
+        self,
+        ring_size: int = STREAMING_RING_FINALS,
+        spill_batch: int = STREAMING_SPILL_BATCH,
+        log_factory: Callable[[], Any] = _default_log,
+    ) -> None:
+        self._ring_size = max(1, ring_size)
+        self._spill_batch = max(1, spill_batch)
+        self._log_factory = log_factory
+        self._lock = threading.Lock()
+        self._spill_lock = threading.Lock()  # spill writes vs clearing the spill on reset
+        self._ring: deque[dict[str, Any]] = deque()
+        self._partial = ""
+        self._seq = 0
+        self._spilled = False  # this listen session wrote to the spill table (earlier rows are replaced on first spill)
+
+    @property
+    def cursor(self) -> int:
+        """Sequence number of the latest final (0 before the first)."""
+        with self._lock:
+            return self._seq
+
+    def reset(self) -> None:
+        """New listen session: drop finals and partial (sequence numbers keep growing) and clear the spill."""
+        with self._spill_lock:
+            with self._lock:
+                self._ring.clear()
+                self._partial = ""
+                spilled, self._spilled = self._spilled, False
+            if spilled:
+                try:
+                    self._with_log(lambda db: db.clear_streaming_finals())
+                except Exception as e:
+                    log.warning("streaming_transcript.clear_failed", error=str(e))
+
+    def set_partial(self, text: str) -> int:
+        """Replace the unconfirmed tail. Returns the current cursor."""
+        with self._lock:
+            self._partial = text
+            return self._seq
+
+    def add_final(self, text: str, start: float, end: float) -> int:
+        """Append a committed final; returns its sequence number. Spills the oldest batch when the ring is full."""
+        with self._lock:
+            self._seq += 1
+            seq = self._seq
+            self._ring.append({"seq": seq, "text": text, "start": start, "end": end})
+            batch = list(itertools.islice(self._ring, self._spill_batch)) if len(self._ring) > self._ring_size else []
+        if batch:
+            self._spill(batch)
+        return seq
+
+    def _spill(self, batch: list[dict[str, Any]]) -> None:
+        """Write batch to TranscriptLog, then drop it from the ring (readers find it in one place or the other).
+        On a write error the batch is dropped anyway: memory stays bounded, late clients get a truncated reply."""
+        with self._spill_lock:
+            with self._lock:
+                first = not self._spilled
+            try:
+                self._with_log(lambda db: db.log_streaming_finals(batch, replace=first))
+                with self._lock:
+                    self._spilled = True
+            except Exception as e:
+                log.warning("streaming_transcript.spill_failed", error=str(e), finals=len(batch))
+            with self._lock:
+                last = batch[-1]["seq"]
+                while self._ring and self._ring[0]["seq"] <= last:
+                    self._ring.popleft()
+
+    def _with_log(self, fn: Callable[[Any], Any]) -> Any:
+        db = self._log_factory()
+        try:
+            return fn(db)
+        finally:
+            db.close()
+
+    def snapshot(self) -> dict[str, Any]:
+        """In-memory finals (without sequence numbers) and partial: the GetStreamingTranscript payload."""
+        with self._lock:
+            finals = [{"text": f["text"], "start": f["start"], "end": f["end"]} for f in self._ring]
+            return {"partial": self._partial, "finals": finals}
+
+    def since(self, cursor: int, limit: int = STREAMING_SINCE_MAX_FINALS) -> dict[str, Any]:
+        """Finals after cursor (oldest first, at most limit), the partial and the new cursor.
+        reset: cursor is ahead of this log (daemon restarted), finals start over from the beginning.
+        truncated: some finals after cursor are no longer available (previous listen session or a failed spill).
+        more: further finals are ready, call again with the returned cursor."""
+        limit = max(1, limit)
+        with self._lock:
+            latest = self._seq
+            partial = self._partial
+            reset = cursor > latest or cursor < 0
+            after = 0 if reset else cursor
+            oldest = self._ring[0]["seq"] if self._ring else latest + 1
+            skip = max(0, after + 1 - oldest)
+            recent = list(itertools.islice(self._ring, skip, skip + limit))
+            spilled = self._spilled
+        older: list[dict[str, Any]] = []
+        if after + 1 < oldest and spilled:
+            try:
+                older = self._with_log(lambda db: db.get_streaming_finals(after, oldest, limit))
+            except Exception as e:
+                log.warning("streaming_transcript.read_spill_failed", error=str(e))
+        first = older[0]["seq"] if older else (recent[0]["seq"] if recent else latest + 1)
+        finals = (older + recent)[:limit]
+        new_cursor = finals[-1]["seq"] if finals else max(after, latest)
+        return {
+            "cursor": new_cursor,
+            "partial": partial,
+            "finals": finals,
+            "more": new_cursor < latest,
+            "reset": reset,
+            "truncated": first > after + 1 and after < latest,
+        }
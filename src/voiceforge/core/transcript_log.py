@@ -6,9 +6,13 @@ import json
 import os
 import shutil
 import sqlite3
-from dataclasses import dataclass
-from datetime import UTC, date, datetime
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, timedelta
 from hashlib import sha256
+from itertools import groupby
 from pathlib import Path
 from typing import Any
 
@@ -25,14 +29,19 @@ except ImportError:
     _sqlcipher = None  # type: ignore[assignment]
 
 DB_NAME = "transcripts.db"
+POOL_READERS = 4  # read-only connections per shared pool (web threads, daemon D-Bus calls)
+PERIOD_FETCH_ROWS = 2000  # segment rows fetched per batch when streaming period reports
 _SCHEMA_ERROR_NO_SUCH_TABLE = "no such table"
-SCHEMA_VERSION_TARGET = 5  # Block 11.7: run migrations 001..005 (005 = action_items table, ADR-0002)
+SCHEMA_VERSION_TARGET = 8  # Block 11.7: run migrations 001..008 (008 = streaming finals spill)
 MIGRATION_HASHES = {
     "001_initial.sql": "59b9076a9a928c7d2b43e0b63b14e16cf0a4a2ec1a9f00a400aaf57efbc315f5",
     "002_add_daily_reports.sql": "0cdbaa0a88a392d97539d5768cbf62bd98f58394cbd96476c77d846240763844",
     "003_add_period_reports.sql": "3b58a4ec71e9445e77e9d7189b6b4811f33045123cfb1a550f1d5656182d77de",
     "004_add_template.sql": "534b84d0d2c6602f7b32ff6fd3faddb8828dd0c7e628cbead279f7d342efd7a6",
     "005_action_items_table.sql": "507b784b3482c1b5f0cf7b66f4f18dbe7dc88b8c1182726176241e1910072aec",
+    "006_session_stats.sql": "36ee3de75bcf0f902ecabb5ae0ed6227022b62200776d52b6824729cbbc976b5",
+    "007_segments_bulk_load.sql": "6bb8555df94ebb81dbb9b128ad4073d00dd0dcc1e8b6aac6b09c2f67f680ec1e",
+    "008_streaming_finals.sql": "c54b3db9b109fb4280e34a9be026f81e5852b652eca72b1dd4d079632adc6f53",
 }
 
 
@@ -156,6 +165,29 @@ class ActionItemRow:
     status: str
 
 
+@dataclass
+class SessionExcerpt:
+    """Per-session part of a period report (TranscriptLog.iter_period_sessions). text may be cut to a budget."""
+
+    session_id: int
+    started_at: str
+    segments_count: int
+    speakers: list[str]
+    text: str
+    truncated: bool = False
+
+
+@dataclass
+class PeriodStats:
+    """SQL aggregates for a date range (weekly-report): sessions, segments, duration, action items per status."""
+
+    sessions_count: int
+    sessions_with_segments: int
+    segments_count: int
+    duration_sec: float
+    action_items_by_status: dict[str, int] = field(default_factory=dict)
+
+
 @dataclass
 class AnalysisRow:
     timestamp: str
@@ -184,6 +216,20 @@ def _ensure_migrated(conn: sqlite3.Connection, db_path: Path) -> None:
     _run_migrations(conn, db_path)
 
 
+def _started_at_bounds(from_date: date, to_date: date) -> tuple[str, str]:
+    """Index range on sessions.started_at (ISO text) that contains every session whose date(started_at) is in
+    [from_date, to_date]; one day of slack on each side covers UTC offsets. Callers keep the exact date() check."""
+    return ((from_date - timedelta(days=1)).isoformat(), (to_date + timedelta(days=2)).isoformat())
+
+
+# Sessions (alias s) whose date(started_at) is in a range; params from _range_params.
+_SESSIONS_IN_RANGE = "s.started_at >= ? AND s.started_at < ? AND date(s.started_at) >= ? AND date(s.started_at) <= ?"
+
+
+def _range_params(from_date: date, to_date: date) -> tuple[str, str, str, str]:
+    return (*_started_at_bounds(from_date, to_date), from_date.isoformat(), to_date.isoformat())
+
+
 def _resolve_duration_sec(segments: list[dict[str, Any]], duration_sec: float | None) -> float:
     if duration_sec is not None:
         return duration_sec
@@ -194,18 +240,54 @@ def _resolve_duration_sec(segments: list[dict[str, Any]], duration_sec: float |
     return max_end - min_start
 
 
-def _insert_segments(cursor: sqlite3.Cursor, session_id: int, segments: list[dict[str, Any]]) -> None:
-    for segment in segments:
-        cursor.execute(
-            "INSERT INTO segments (session_id, start_sec, end_sec, speaker, text) VALUES (?, ?, ?, ?, ?)",
-            (
-                session_id,
-                float(segment.get("start_sec", 0) or 0),
-                float(segment.get("end_sec", 0) or 0),
-                str(segment.get("speaker", "") or ""),
-                str(segment.get("text", "") or ""),
-            ),
+def _require_session(cursor: sqlite3.Cursor, session_id: int) -> None:
+    if cursor.execute("SELECT 1 FROM sessions WHERE id = ?", (session_id,)).fetchone() is None:
+        raise ValueError(f"Unknown session_id: {session_id}")
+
+
+def _insert_segments(cursor: sqlite3.Cursor, session_id: int, segments: list[dict[str, Any]]) -> int:
+    """Append segments with one executemany inside the caller's transaction. Per-row FTS / session_stats triggers are
+    suspended for this session (segments_bulk_load); the FTS rows and counters are then written set-based."""
+    rows = [
+        (
+            session_id,
+            float(segment.get("start_sec", 0) or 0),
+            float(segment.get("end_sec", 0) or 0),
+            str(segment.get("speaker", "") or ""),
+            str(segment.get("text", "") or ""),
         )
+        for segment in segments
+    ]
+    if not rows:
+        return 0
+    last_id = cursor.execute("SELECT COALESCE(MAX(id), 0) FROM segments").fetchone()[0]
+    cursor.execute("INSERT OR IGNORE INTO segments_bulk_load (session_id) VALUES (?)", (session_id,))
+    cursor.executemany(
+        "INSERT INTO segments (session_id, start_sec, end_sec, speaker, text) VALUES (?, ?, ?, ?, ?)",
+        rows,
+    )
+    cursor.execute(
+        "INSERT INTO segments_fts(rowid, text) SELECT id, text FROM segments WHERE id > ? AND session_id = ?",
+        (last_id, session_id),
+    )
+    cursor.execute(
+        """
+        INSERT INTO session_speakers (session_id, speaker, segments)
+        SELECT session_id, speaker, COUNT(*) FROM segments
+        WHERE id > ? AND session_id = ? AND trim(speaker) != ''
+        GROUP BY speaker
+        ON CONFLICT (session_id, speaker) DO UPDATE SET segments = segments + excluded.segments
+        """,
+        (last_id, session_id),
+    )
+    cursor.execute("INSERT OR IGNORE INTO session_stats (session_id) VALUES (?)", (session_id,))
+    cursor.execute(
+        "UPDATE session_stats SET segments_count = segments_count + ?, "
+        "speaker_count = (SELECT COUNT(*) FROM session_speakers WHERE session_id = ?) WHERE session_id = ?",
+        (len(rows), session_id, session_id),
+    )
+    cursor.execute("DELETE FROM segments_bulk_load WHERE session_id = ?", (session_id,))
+    return len(rows)
 
 
 def _insert_analysis(
@@ -254,16 +336,22 @@ def _insert_action_items(
     """Insert action items into action_items table (ADR-0002). No-op if table missing (pre-005)."""
     if not action_items:
         return
+    rows = [
+        (
+            session_id,
+            idx,
+            str(ai.get("description") or "").strip() or "(без описания)",
+            (ai.get("assignee") or "").strip() or None,
+            _format_deadline(ai.get("deadline")),
+        )
+        for idx, ai in enumerate(action_items)
+    ]
     try:
-        for idx, ai in enumerate(action_items):
-            desc = str(ai.get("description") or "").strip() or "(без описания)"
-            assignee = (ai.get("assignee") or "").strip() or None
-            deadline = _format_deadline(ai.get("deadline"))
-            cursor.execute(
-                "INSERT INTO action_items (session_id, idx_in_analysis, description, assignee, deadline, status) "
-                "VALUES (?, ?, ?, ?, ?, 'open')",
-                (session_id, idx, desc, assignee, deadline),
-            )
+        cursor.executemany(
+            "INSERT INTO action_items (session_id, idx_in_analysis, description, assignee, deadline, status) "
+            "VALUES (?, ?, ?, ?, ?, 'open')",
+            rows,
+        )
     except sqlite3.OperationalError as e:
         if "action_items" in str(e).lower() or _SCHEMA_ERROR_NO_SUCH_TABLE in str(e).lower():
             log.debug("action_items table not yet available", error=str(e))
@@ -271,21 +359,21 @@ def _insert_action_items(
             raise
 
 
-def _connect_transcript_db(db_path: Path) -> sqlite3.Connection:
+def _connect_transcript_db(db_path: Path, check_same_thread: bool = True) -> sqlite3.Connection:
     """Open transcripts DB: SQLCipher if encrypt_db and key present, else standard sqlite3."""
-    from voiceforge.core.config import Settings
+    from voiceforge.core.backends import get_settings
     from voiceforge.core.secrets import get_api_key
 
-    cfg = Settings()
+    cfg = get_settings()
     use_encryption = getattr(cfg, "encrypt_db", False)
     key = get_api_key("db_encryption_key") if use_encryption else None
 
     if use_encryption and key and _sqlcipher is not None:
-        conn = _sqlcipher.connect(str(db_path))
+        conn = _sqlcipher.connect(str(db_path), check_same_thread=check_same_thread)
         conn.execute("PRAGMA key = ?", (key,))
         log.info("transcript_log.encrypted", path=str(db_path))
     else:
-        conn = sqlite3.connect(str(db_path))
+        conn = sqlite3.connect(str(db_path), check_same_thread=check_same_thread)
         if use_encryption and (not key or _sqlcipher is None):
             log.warning(
                 "transcript_log.encryption_skipped",
@@ -298,13 +386,133 @@ def _connect_transcript_db(db_path: Path) -> sqlite3.Connection:
     return conn
 
 
+class TranscriptPool:
+    """Process-wide connections to one transcripts DB: one writer (calls serialized by a lock) and up to `readers`
+    query_only WAL connections checked out per call. Connections are opened (SQLCipher key, migration check) once
+    per process and kept, so sqlite3's per-connection statement cache keeps the listing queries prepared."""
+
+    def __init__(self, db_path: Path, readers: int = POOL_READERS) -> None:
+        self.db_path = db_path
+        self._max_readers = max(1, int(readers))
+        self._writer_lock = threading.RLock()
+        self._writer_conn: sqlite3.Connection | None = None
+        self._available = threading.Condition()
+        self._idle: list[sqlite3.Connection] = []
+        self._opened = 0
+
+    def _ensure_writer(self) -> sqlite3.Connection:
+        with self._writer_lock:
+            if self._writer_conn is None:
+                conn = _connect_transcript_db(self.db_path, check_same_thread=False)
+                _init_db(conn)
+                _ensure_migrated(conn, self.db_path)
+                self._writer_conn = conn
+            return self._writer_conn
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """The shared writer connection, exclusive for the block. A block that raises leaves no open transaction
+        behind (it is rolled back), so the next writer never commits its half-done statements."""
+        with self._writer_lock:
+            conn = self._ensure_writer()
+            try:
+                yield conn
+            except BaseException:
+                if conn.in_transaction:
+                    conn.rollback()
+                raise
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        if self._writer_conn is None:
+            self._ensure_writer()  # schema is migrated before the first read
+        with self._available:
+            while not self._idle and self._opened >= self._max_readers:
+                self._available.wait()
+            conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                self._opened += 1
+        if conn is None:
+            try:
+                conn = _connect_transcript_db(self.db_path, check_same_thread=False)
+                conn.execute("PRAGMA query_only = ON")
+            except Exception:
+                with self._available:
+                    self._opened -= 1
+                    self._available.notify()
+                raise
+        try:
+            yield conn
+        finally:
+            with self._available:
+                self._idle.append(conn)
+                self._available.notify()
+
+    def close(self) -> None:
+        with self._writer_lock, self._available:
+            for conn in [*self._idle, *([self._writer_conn] if self._writer_conn else [])]:
+                conn.close()
+            self._opened -= len(self._idle)
+            self._idle.clear()
+            self._writer_conn = None
+
+
+_pools: dict[Path, TranscriptPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_transcript_pool(db_path: str | Path | None = None) -> TranscriptPool:
+    """Shared pool for db_path (default: transcripts.db under XDG_DATA_HOME)."""
+    path = Path(db_path or _db_path()).resolve()
+    with _pools_lock:
+        pool = _pools.get(path)
+        if pool is None:
+            ensure_private_dir(path.parent)
+            pool = _pools[path] = TranscriptPool(path)
+        return pool
+
+
+def close_transcript_pools() -> None:
+    """Close all shared connections (shutdown, tests)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
 class TranscriptLog:
-    """Persistent log: sessions, segments, analyses. FTS5 search on segment text."""
+    """Persistent log: sessions, segments, analyses. FTS5 search on segment text.
+    TranscriptLog() (default DB) uses the process-wide TranscriptPool, so web handlers and daemon methods can create
+    one per request cheaply; with an explicit db_path (or pooled=False) the instance owns a single connection."""
 
-    def __init__(self, db_path: str | Path | None = None) -> None:
+    def __init__(self, db_path: str | Path | None = None, pooled: bool | None = None) -> None:
         self.db_path = Path(db_path or _db_path())
         ensure_private_dir(self.db_path.parent)
         self._conn: sqlite3.Connection | None = None
+        self._pool = get_transcript_pool(self.db_path) if (db_path is None if pooled is None else pooled) else None
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        if self._pool is None:
+            yield self._get_conn()
+        else:
+            with self._pool.reader() as conn:
+                yield conn
+
+    @contextmanager
+    def _writer(self) -> Iterator[sqlite3.Connection]:
+        if self._pool is None:
+            conn = self._get_conn()
+            try:
+                yield conn
+            except BaseException:
+                if conn.in_transaction:
+                    conn.rollback()
+                raise
+        else:
+            with self._pool.writer() as conn:
+                yield conn
 
     def _get_conn(self) -> sqlite3.Connection:
         if self._conn is None:
@@ -313,6 +521,19 @@ class TranscriptLog:
             _ensure_migrated(self._conn, self.db_path)
         return self._conn
 
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        """One explicit write transaction (BEGIN IMMEDIATE): commit on success, rollback on error."""
+        with self._writer() as conn:
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn.cursor()
+            except Exception:
+                conn.rollback()
+                raise
+            conn.commit()
+
     def log_session(
         self,
         segments: list[dict[str, Any]],
@@ -326,189 +547,353 @@ class TranscriptLog:
         action_items: list[dict[str, Any]] | None = None,
         cost_usd: float = 0.0,
         template: str | None = None,
+        session_id: int | None = None,
     ) -> int:
-        """Write one session (segments + analysis). Returns session_id."""
+        """Write one session (segments + analysis) in one transaction. Returns session_id.
+        With session_id (from start_session), finish that session instead: append the remaining segments, set ended_at
+        and duration (default: span of all its segments) and add the analysis."""
         started_at = started_at or datetime.now(UTC)
         ended_at = ended_at or datetime.now(UTC)
-        duration_sec = _resolve_duration_sec(segments, duration_sec)
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute(
-            "INSERT INTO sessions (started_at, ended_at, duration_sec) VALUES (?, ?, ?)",
-            (started_at.isoformat(), ended_at.isoformat(), duration_sec),
-        )
-        session_id = cursor.lastrowid or 0
-        _insert_segments(cursor, session_id, segments)
-        _insert_analysis(
-            cursor, session_id, ended_at, model, questions, answers, recommendations, action_items, cost_usd, template
-        )
-        _insert_action_items(cursor, session_id, action_items)
-        conn.commit()
+        with self._transaction() as cursor:
+            if session_id is None:
+                cursor.execute(
+                    "INSERT INTO sessions (started_at, ended_at, duration_sec) VALUES (?, ?, ?)",
+                    (started_at.isoformat(), ended_at.isoformat(), _resolve_duration_sec(segments, duration_sec)),
+                )
+                session_id = cursor.lastrowid or 0
+                _insert_segments(cursor, session_id, segments)
+            else:
+                _require_session(cursor, session_id)
+                _insert_segments(cursor, session_id, segments)
+                if duration_sec is None:
+                    duration_sec = cursor.execute(
+                        "SELECT COALESCE(MAX(end_sec) - MIN(start_sec), 0) FROM segments WHERE session_id = ?",
+                        (session_id,),
+                    ).fetchone()[0]
+                cursor.execute(
+                    "UPDATE sessions SET ended_at = ?, duration_sec = ? WHERE id = ?",
+                    (ended_at.isoformat(), duration_sec, session_id),
+                )
+            _insert_analysis(
+                cursor, session_id, ended_at, model, questions, answers, recommendations, action_items, cost_usd, template
+            )
+            _insert_action_items(cursor, session_id, action_items)
         log.info("transcript_log.log_session", session_id=session_id, segments=len(segments))
         return session_id
 
+    def start_session(self, started_at: datetime | None = None) -> int:
+        """Open an empty session for streaming persistence (log_segments_incremental); finish with
+        log_session(..., session_id=...). Returns session_id."""
+        started = (started_at or datetime.now(UTC)).isoformat()
+        with self._transaction() as cursor:
+            cursor.execute(
+                "INSERT INTO sessions (started_at, ended_at, duration_sec) VALUES (?, ?, 0)",
+                (started, started),
+            )
+            session_id = cursor.lastrowid or 0
+        log.info("transcript_log.start_session", session_id=session_id)
+        return session_id
+
+    def log_segments_incremental(self, session_id: int, segments: list[dict[str, Any]]) -> int:
+        """Append segments to an existing session in one transaction (streaming sessions persist as they go).
+        ended_at moves to now and duration_sec grows to the latest end_sec. Returns the number of segments written."""
+        if not segments:
+            return 0
+        max_end = max(float(s.get("end_sec", 0) or 0) for s in segments)
+        with self._transaction() as cursor:
+            _require_session(cursor, session_id)
+            n = _insert_segments(cursor, session_id, segments)
+            cursor.execute(
+                "UPDATE sessions SET ended_at = ?, duration_sec = MAX(duration_sec, ?) WHERE id = ?",
+                (datetime.now(UTC).isoformat(), max_end, session_id),
+            )
+        log.debug("transcript_log.log_segments_incremental", session_id=session_id, segments=n)
+        return n
+
+    def log_streaming_finals(self, finals: list[dict[str, Any]], replace: bool = False) -> int:
+        """Spill streaming finals ({seq, text, start, end}) from the daemon's in-memory ring in one transaction.
+        replace: drop previously spilled finals first (first spill of a listen session)."""
+        if not finals:
+            return 0
+        with self._transaction() as cursor:
+            if replace:
+                cursor.execute("DELETE FROM streaming_finals")
+            cursor.executemany(
+                "INSERT OR REPLACE INTO streaming_finals (seq, start_sec, end_sec, text) VALUES (?, ?, ?, ?)",
+                [(int(f["seq"]), float(f.get("start", 0.0)), float(f.get("end", 0.0)), f.get("text", "")) for f in finals],
+            )
+        return len(finals)
+
+    def get_streaming_finals(self, after_seq: int, before_seq: int, limit: int) -> list[dict[str, Any]]:
+        """Spilled streaming finals with after_seq < seq < before_seq, oldest first (at most limit)."""
+        with self._reader() as conn:
+            rows = conn.execute(
+                "SELECT seq, start_sec, end_sec, text FROM streaming_finals WHERE seq > ? AND seq < ? ORDER BY seq LIMIT ?",
+                (after_seq, before_seq, max(0, limit)),
+            ).fetchall()
+        return [{"seq": r["seq"], "text": r["text"], "start": r["start_sec"], "end": r["end_sec"]} for r in rows]
+
+    def clear_streaming_finals(self) -> int:
+        """Drop all spilled streaming finals (new listen session). Returns the number of rows deleted."""
+        with self._transaction() as cursor:
+            return cursor.execute("DELETE FROM streaming_finals").rowcount
+
     def get_sessions(self, last_n: int = 10, offset: int = 0) -> list[SessionSummary]:
         """Return last N sessions (newest first), with optional offset (block 51 pagination)."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT s.id, s.started_at, s.ended_at, s.duration_sec,
-                   (SELECT COUNT(*) FROM segments WHERE session_id = s.id) AS segments_count
-            FROM sessions s
-            ORDER BY s.id DESC
-            LIMIT ? OFFSET ?
-            """,
-            (last_n, max(0, offset)),
-        )
-        return [
-            SessionSummary(
-                id=row["id"],
-                started_at=row["started_at"],
-                ended_at=row["ended_at"],
-                duration_sec=row["duration_sec"],
-                segments_count=row["segments_count"],
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT s.id, s.started_at, s.ended_at, s.duration_sec, COALESCE(st.segments_count, 0) AS segments_count
+                FROM sessions s
+                LEFT JOIN session_stats st ON st.session_id = s.id
+                ORDER BY s.id DESC
+                LIMIT ? OFFSET ?
+                """,
+                (last_n, max(0, offset)),
             )
-            for row in cursor.fetchall()
-        ]
+            return [
+                SessionSummary(
+                    id=row["id"],
+                    started_at=row["started_at"],
+                    ended_at=row["ended_at"],
+                    duration_sec=row["duration_sec"],
+                    segments_count=row["segments_count"],
+                )
+                for row in cursor.fetchall()
+            ]
 
     def get_sessions_for_display(self, last_n: int = 10, offset: int = 0) -> list[SessionListDisplay]:
         """E10 (#133): sessions with summary_preview (first 200 chars) and speaker_count for human-friendly list."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT s.id, s.started_at, s.ended_at, s.duration_sec,
-                   (SELECT COUNT(*) FROM segments WHERE session_id = s.id) AS segments_count,
-                   (SELECT COUNT(DISTINCT speaker) FROM segments WHERE session_id = s.id
-                    AND COALESCE(trim(speaker), '') != '') AS speaker_count,
-                   (SELECT substr(trim(replace(replace(COALESCE(json_extract(a.answers, '$[0]'), ''), '"', ''), char(10), ' ')), 1, 200)
-                    FROM analyses a WHERE a.session_id = s.id ORDER BY a.id DESC LIMIT 1) AS summary_preview
-            FROM sessions s
-            ORDER BY s.id DESC
-            LIMIT ? OFFSET ?
-            """,
-            (last_n, max(0, offset)),
-        )
-        return [
-            SessionListDisplay(
-                id=row["id"],
-                started_at=row["started_at"],
-                ended_at=row["ended_at"],
-                duration_sec=row["duration_sec"],
-                segments_count=row["segments_count"],
-                speaker_count=row["speaker_count"] or 0,
-                summary_preview=(row["summary_preview"] or "").strip(),
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT s.id, s.started_at, s.ended_at, s.duration_sec,
+                       COALESCE(st.segments_count, 0) AS segments_count,
+                       COALESCE(st.speaker_count, 0) AS speaker_count,
+                       st.summary_preview
+                FROM sessions s
+                LEFT JOIN session_stats st ON st.session_id = s.id
+                ORDER BY s.id DESC
+                LIMIT ? OFFSET ?
+                """,
+                (last_n, max(0, offset)),
             )
-            for row in cursor.fetchall()
-        ]
+            return [
+                SessionListDisplay(
+                    id=row["id"],
+                    started_at=row["started_at"],
+                    ended_at=row["ended_at"],
+                    duration_sec=row["duration_sec"],
+                    segments_count=row["segments_count"],
+                    speaker_count=row["speaker_count"] or 0,
+                    summary_preview=(row["summary_preview"] or "").strip(),
+                )
+                for row in cursor.fetchall()
+            ]
 
     def get_sessions_for_date(self, day: date) -> list[SessionSummary]:
         """Return all sessions that started on the given date (local date string YYYY-MM-DD)."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        day_str = day.isoformat()
-        cursor.execute(
-            """
-            SELECT s.id, s.started_at, s.ended_at, s.duration_sec,
-                   (SELECT COUNT(*) FROM segments WHERE session_id = s.id) AS segments_count
-            FROM sessions s
-            WHERE date(s.started_at) = ?
-            ORDER BY s.started_at
-            """,
-            (day_str,),
-        )
-        return [
-            SessionSummary(
-                id=row["id"],
-                started_at=row["started_at"],
-                ended_at=row["ended_at"],
-                duration_sec=row["duration_sec"],
-                segments_count=row["segments_count"],
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            day_str = day.isoformat()
+            lo, hi = _started_at_bounds(day, day)
+            cursor.execute(
+                """
+                SELECT s.id, s.started_at, s.ended_at, s.duration_sec, COALESCE(st.segments_count, 0) AS segments_count
+                FROM sessions s
+                LEFT JOIN session_stats st ON st.session_id = s.id
+                WHERE s.started_at >= ? AND s.started_at < ? AND date(s.started_at) = ?
+                ORDER BY s.started_at
+                """,
+                (lo, hi, day_str),
             )
-            for row in cursor.fetchall()
-        ]
+            return [
+                SessionSummary(
+                    id=row["id"],
+                    started_at=row["started_at"],
+                    ended_at=row["ended_at"],
+                    duration_sec=row["duration_sec"],
+                    segments_count=row["segments_count"],
+                )
+                for row in cursor.fetchall()
+            ]
 
     def get_sessions_in_range(self, from_date: date, to_date: date) -> list[SessionSummary]:
         """Return all sessions that started between from_date and to_date (inclusive)."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        from_str = from_date.isoformat()
-        to_str = to_date.isoformat()
-        cursor.execute(
-            """
-            SELECT s.id, s.started_at, s.ended_at, s.duration_sec,
-                   (SELECT COUNT(*) FROM segments WHERE session_id = s.id) AS segments_count
-            FROM sessions s
-            WHERE date(s.started_at) >= ? AND date(s.started_at) <= ?
-            ORDER BY s.started_at
-            """,
-            (from_str, to_str),
-        )
-        return [
-            SessionSummary(
-                id=row["id"],
-                started_at=row["started_at"],
-                ended_at=row["ended_at"],
-                duration_sec=row["duration_sec"],
-                segments_count=row["segments_count"],
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            from_str = from_date.isoformat()
+            to_str = to_date.isoformat()
+            lo, hi = _started_at_bounds(from_date, to_date)
+            cursor.execute(
+                """
+                SELECT s.id, s.started_at, s.ended_at, s.duration_sec, COALESCE(st.segments_count, 0) AS segments_count
+                FROM sessions s
+                LEFT JOIN session_stats st ON st.session_id = s.id
+                WHERE s.started_at >= ? AND s.started_at < ? AND date(s.started_at) >= ? AND date(s.started_at) <= ?
+                ORDER BY s.started_at
+                """,
+                (lo, hi, from_str, to_str),
+            )
+            return [
+                SessionSummary(
+                    id=row["id"],
+                    started_at=row["started_at"],
+                    ended_at=row["ended_at"],
+                    duration_sec=row["duration_sec"],
+                    segments_count=row["segments_count"],
+                )
+                for row in cursor.fetchall()
+            ]
+
+    def iter_period_segments(
+        self, from_date: date, to_date: date, *, batch_size: int = PERIOD_FETCH_ROWS
+    ) -> Iterator[tuple[int, str, SegmentRow]]:
+        """Stream (session_id, started_at, segment) for sessions that started in [from_date, to_date], ordered by
+        session then start_sec. One join query fetched batch_size rows at a time; the reader connection is held
+        until the iterator is exhausted or closed."""
+        with self._reader() as conn:
+            cursor = conn.execute(
+                f"""
+                SELECT s.id, s.started_at, g.start_sec, g.end_sec, g.speaker, g.text
+                FROM sessions s
+                JOIN segments g ON g.session_id = s.id
+                WHERE {_SESSIONS_IN_RANGE}
+                ORDER BY s.started_at, s.id, g.start_sec, g.id
+                """,  # nosec B608 -- constant clause, values bound
+                _range_params(from_date, to_date),
+            )
+            try:
+                while rows := cursor.fetchmany(max(1, batch_size)):
+                    for row in rows:
+                        yield (
+                            row["id"],
+                            row["started_at"],
+                            SegmentRow(
+                                start_sec=row["start_sec"],
+                                end_sec=row["end_sec"],
+                                speaker=row["speaker"] or "",
+                                text=row["text"] or "",
+                            ),
+                        )
+            finally:
+                cursor.close()
+
+    def iter_period_sessions(
+        self, from_date: date, to_date: date, *, max_chars_per_session: int | None = None
+    ) -> Iterator[SessionExcerpt]:
+        """One SessionExcerpt per session with segments in the range (map step of period reports). With
+        max_chars_per_session only that much text is kept; the remaining segments are counted, not stored."""
+        budget = max_chars_per_session
+        for (session_id, started_at), rows in groupby(self.iter_period_segments(from_date, to_date), key=lambda r: (r[0], r[1])):
+            parts: list[str] = []
+            speakers: set[str] = set()
+            size = count = 0
+            truncated = False
+            for _, _, seg in rows:
+                count += 1
+                if seg.speaker.strip():
+                    speakers.add(seg.speaker)
+                if budget is not None and size + len(seg.text) > budget:
+                    if size < budget:
+                        parts.append(seg.text[: budget - size])
+                        size = budget
+                    truncated = True
+                    continue
+                parts.append(seg.text)
+                size += len(seg.text) + 1
+            yield SessionExcerpt(
+                session_id=session_id,
+                started_at=started_at,
+                segments_count=count,
+                speakers=sorted(speakers),
+                text="\n".join(parts),
+                truncated=truncated,
             )
-            for row in cursor.fetchall()
-        ]
 
-    def get_period_text(self, from_date: date, to_date: date) -> str:
-        """Concatenate segment texts from all sessions in the date range. Empty if none."""
-        sessions = self.get_sessions_in_range(from_date, to_date)
-        parts: list[str] = []
-        for sess in sessions:
-            detail = self.get_session_detail(sess.id)
-            if not detail:
-                continue
-            segments, _ = detail
-            if segments:
-                parts.append(f"[Сессия {sess.id} {sess.started_at}]\n" + "\n".join(s.text for s in segments))
-        return "\n\n".join(parts) if parts else ""
+    def get_period_text(self, from_date: date, to_date: date, max_chars: int | None = None) -> str:
+        """Concatenate segment texts from all sessions in the date range (one block per session). Empty if none.
+        With max_chars the budget is split evenly between sessions, so every session is represented."""
+        per_session = None
+        if max_chars is not None:
+            sessions = self.get_period_stats(from_date, to_date).sessions_with_segments
+            per_session = max(1, max_chars // max(1, sessions) - 48)  # 48 ≈ "[Сессия id started_at]" header
+        parts = [
+            f"[Сессия {ex.session_id} {ex.started_at}]\n{ex.text}"
+            for ex in self.iter_period_sessions(from_date, to_date, max_chars_per_session=per_session)
+        ]
+        text = "\n\n".join(parts)
+        return text[:max_chars] if max_chars is not None else text
+
+    def get_period_stats(self, from_date: date, to_date: date) -> PeriodStats:
+        """Sessions, segments, total duration and action items per status for the range, aggregated in SQL."""
+        params = _range_params(from_date, to_date)
+        with self._reader() as conn:
+            row = conn.execute(
+                f"""
+                SELECT COUNT(*) AS sessions_count,
+                       COALESCE(SUM(st.segments_count), 0) AS segments_count,
+                       COALESCE(SUM(st.segments_count > 0), 0) AS sessions_with_segments,
+                       COALESCE(SUM(s.duration_sec), 0) AS duration_sec
+                FROM sessions s
+                LEFT JOIN session_stats st ON st.session_id = s.id
+                WHERE {_SESSIONS_IN_RANGE}
+                """,  # nosec B608 -- constant clause, values bound
+                params,
+            ).fetchone()
+            by_status = {
+                r["status"]: r["n"]
+                for r in conn.execute(
+                    f"""
+                    SELECT COALESCE(NULLIF(a.status, ''), 'open') AS status, COUNT(*) AS n
+                    FROM action_items a
+                    JOIN sessions s ON s.id = a.session_id
+                    WHERE {_SESSIONS_IN_RANGE}
+                    GROUP BY 1
+                    """,  # nosec B608 -- constant clause, values bound
+                    params,
+                )
+            }
+        return PeriodStats(
+            sessions_count=row["sessions_count"],
+            sessions_with_segments=row["sessions_with_segments"],
+            segments_count=row["segments_count"],
+            duration_sec=float(row["duration_sec"] or 0.0),
+            action_items_by_status=by_status,
+        )
 
     def save_period_report(self, period_from: date, period_to: date, report_text: str) -> None:
         """Insert a period report (no dedup by range; each run adds a row)."""
-        conn = self._get_conn()
-        now = datetime.now(UTC).isoformat()
-        conn.execute(
-            """
-            INSERT INTO period_reports (period_from, period_to, report_text, created_at)
-            VALUES (?, ?, ?, ?)
-            """,
-            (period_from.isoformat(), period_to.isoformat(), report_text, now),
-        )
-        conn.commit()
+        with self._transaction() as cursor:
+            now = datetime.now(UTC).isoformat()
+            cursor.execute(
+                """
+                INSERT INTO period_reports (period_from, period_to, report_text, created_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                (period_from.isoformat(), period_to.isoformat(), report_text, now),
+            )
 
     def get_period_report(self, period_from: date, period_to: date) -> str | None:
         """Return the latest period report text for the range, or None."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT report_text FROM period_reports
-            WHERE period_from = ? AND period_to = ?
-            ORDER BY id DESC LIMIT 1
-            """,
-            (period_from.isoformat(), period_to.isoformat()),
-        )
-        row = cursor.fetchone()
-        return row["report_text"] if row else None
-
-    def get_daily_transcript_text(self, day: date) -> str:
-        """Concatenate segment texts from sessions on the given date. Returns empty if none."""
-        sessions = self.get_sessions_for_date(day)
-        parts: list[str] = []
-        for sess in sessions:
-            detail = self.get_session_detail(sess.id)
-            if not detail:
-                continue
-            segments, _ = detail
-            if segments:
-                parts.append(f"[Сессия {sess.id} {sess.started_at}]\n" + "\n".join(s.text for s in segments))
-        return "\n\n".join(parts) if parts else ""
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT report_text FROM period_reports
+                WHERE period_from = ? AND period_to = ?
+                ORDER BY id DESC LIMIT 1
+                """,
+                (period_from.isoformat(), period_to.isoformat()),
+            )
+            row = cursor.fetchone()
+            return row["report_text"] if row else None
+
+    def get_daily_transcript_text(self, day: date, max_chars: int | None = None) -> str:
+        """Concatenate segment texts from sessions on the given date. Returns empty if none. See get_period_text."""
+        return self.get_period_text(day, day, max_chars=max_chars)
 
     def save_daily_report(
         self,
@@ -518,91 +903,90 @@ class TranscriptLog:
         status: str = "completed",
     ) -> None:
         """Insert or replace daily report row. status: pending, submitted, completed, failed."""
-        conn = self._get_conn()
-        day_str = day.isoformat()
-        now = datetime.now(UTC).isoformat()
-        conn.execute(
-            """
-            INSERT INTO daily_reports (date, report_text, batch_id, status, created_at)
-            VALUES (?, ?, ?, ?, ?)
-            ON CONFLICT(date) DO UPDATE SET
-                report_text = COALESCE(excluded.report_text, daily_reports.report_text),
-                batch_id = COALESCE(excluded.batch_id, daily_reports.batch_id),
-                status = excluded.status
-            """,
-            (day_str, report_text, batch_id, status, now),
-        )
-        conn.commit()
+        with self._transaction() as cursor:
+            day_str = day.isoformat()
+            now = datetime.now(UTC).isoformat()
+            cursor.execute(
+                """
+                INSERT INTO daily_reports (date, report_text, batch_id, status, created_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(date) DO UPDATE SET
+                    report_text = COALESCE(excluded.report_text, daily_reports.report_text),
+                    batch_id = COALESCE(excluded.batch_id, daily_reports.batch_id),
+                    status = excluded.status
+                """,
+                (day_str, report_text, batch_id, status, now),
+            )
 
     def get_daily_report(self, day: date) -> tuple[str | None, str | None, str] | None:
         """Return (report_text, batch_id, status) for the date, or None."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT report_text, batch_id, status FROM daily_reports WHERE date = ?",
-            (day.isoformat(),),
-        )
-        row = cursor.fetchone()
-        if not row:
-            return None
-        return (row["report_text"], row["batch_id"], row["status"] or "pending")
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT report_text, batch_id, status FROM daily_reports WHERE date = ?",
+                (day.isoformat(),),
+            )
+            row = cursor.fetchone()
+            if not row:
+                return None
+            return (row["report_text"], row["batch_id"], row["status"] or "pending")
 
     def get_session_meta(self, session_id: int) -> tuple[str, str, float] | None:
         """Return (started_at, ended_at, duration_sec) for session_id, or None if not found."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT started_at, ended_at, duration_sec FROM sessions WHERE id = ?",
-            (session_id,),
-        )
-        row = cursor.fetchone()
-        if not row:
-            return None
-        return (row["started_at"], row["ended_at"], row["duration_sec"] or 0.0)
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT started_at, ended_at, duration_sec FROM sessions WHERE id = ?",
+                (session_id,),
+            )
+            row = cursor.fetchone()
+            if not row:
+                return None
+            return (row["started_at"], row["ended_at"], row["duration_sec"] or 0.0)
 
     def get_session_detail(self, session_id: int) -> tuple[list[SegmentRow], AnalysisRow | None] | None:
         """Return segments and analysis for session_id, or None if not found."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute("SELECT id FROM sessions WHERE id = ?", (session_id,))
-        if cursor.fetchone() is None:
-            return None
-        cursor.execute(
-            "SELECT start_sec, end_sec, speaker, text FROM segments WHERE session_id = ? ORDER BY start_sec",
-            (session_id,),
-        )
-        segments = [
-            SegmentRow(
-                start_sec=row["start_sec"],
-                end_sec=row["end_sec"],
-                speaker=row["speaker"],
-                text=row["text"],
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT id FROM sessions WHERE id = ?", (session_id,))
+            if cursor.fetchone() is None:
+                return None
+            cursor.execute(
+                "SELECT start_sec, end_sec, speaker, text FROM segments WHERE session_id = ? ORDER BY start_sec",
+                (session_id,),
             )
-            for row in cursor.fetchall()
-        ]
-        cursor.execute(
-            "SELECT timestamp, model, questions, answers, recommendations, action_items, cost_usd, template "
-            "FROM analyses WHERE session_id = ? ORDER BY id DESC LIMIT 1",
-            (session_id,),
-        )
-        row = cursor.fetchone()
-        if not row:
-            return (segments, None)
-        try:
-            template_val = row["template"] if row["template"] else None
-        except (KeyError, TypeError):
-            template_val = None
-        analysis = AnalysisRow(
-            timestamp=row["timestamp"],
-            model=row["model"],
-            questions=json.loads(row["questions"] or "[]"),
-            answers=json.loads(row["answers"] or "[]"),
-            recommendations=json.loads(row["recommendations"] or "[]"),
-            action_items=json.loads(row["action_items"] or "[]"),
-            cost_usd=row["cost_usd"] or 0.0,
-            template=template_val,
-        )
-        return (segments, analysis)
+            segments = [
+                SegmentRow(
+                    start_sec=row["start_sec"],
+                    end_sec=row["end_sec"],
+                    speaker=row["speaker"],
+                    text=row["text"],
+                )
+                for row in cursor.fetchall()
+            ]
+            cursor.execute(
+                "SELECT timestamp, model, questions, answers, recommendations, action_items, cost_usd, template "
+                "FROM analyses WHERE session_id = ? ORDER BY id DESC LIMIT 1",
+                (session_id,),
+            )
+            row = cursor.fetchone()
+            if not row:
+                return (segments, None)
+            try:
+                template_val = row["template"] if row["template"] else None
+            except (KeyError, TypeError):
+                template_val = None
+            analysis = AnalysisRow(
+                timestamp=row["timestamp"],
+                model=row["model"],
+                questions=json.loads(row["questions"] or "[]"),
+                answers=json.loads(row["answers"] or "[]"),
+                recommendations=json.loads(row["recommendations"] or "[]"),
+                action_items=json.loads(row["action_items"] or "[]"),
+                cost_usd=row["cost_usd"] or 0.0,
+                template=template_val,
+            )
+            return (segments, analysis)
 
     def get_action_items(
         self,
@@ -611,31 +995,61 @@ class TranscriptLog:
     ) -> list[ActionItemRow]:
         """Return action items from action_items table (ADR-0002). Newest first. Empty if table missing."""
         try:
-            conn = self._get_conn()
-            cursor = conn.cursor()
-            if session_id is not None:
-                cursor.execute(
-                    "SELECT session_id, idx_in_analysis, description, assignee, deadline, status "
-                    "FROM action_items WHERE session_id = ? ORDER BY idx_in_analysis",
-                    (session_id,),
-                )
-            else:
-                cursor.execute(
-                    "SELECT session_id, idx_in_analysis, description, assignee, deadline, status "
-                    "FROM action_items ORDER BY session_id DESC, idx_in_analysis LIMIT ?",
-                    (limit,),
-                )
-            return [
-                ActionItemRow(
-                    session_id=row["session_id"],
-                    idx_in_analysis=row["idx_in_analysis"],
-                    description=row["description"] or "",
-                    assignee=row["assignee"] if row["assignee"] else None,
-                    deadline=row["deadline"] if row["deadline"] else None,
-                    status=row["status"] or "open",
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                if session_id is not None:
+                    cursor.execute(
+                        "SELECT session_id, idx_in_analysis, description, assignee, deadline, status "
+                        "FROM action_items WHERE session_id = ? ORDER BY idx_in_analysis",
+                        (session_id,),
+                    )
+                else:
+                    cursor.execute(
+                        "SELECT session_id, idx_in_analysis, description, assignee, deadline, status "
+                        "FROM action_items ORDER BY session_id DESC, idx_in_analysis LIMIT ?",
+                        (limit,),
+                    )
+                return [
+                    ActionItemRow(
+                        session_id=row["session_id"],
+                        idx_in_analysis=row["idx_in_analysis"],
+                        description=row["description"] or "",
+                        assignee=row["assignee"] if row["assignee"] else None,
+                        deadline=row["deadline"] if row["deadline"] else None,
+                        status=row["status"] or "open",
+                    )
+                    for row in cursor.fetchall()
+                ]
+        except sqlite3.OperationalError as e:
+            if _SCHEMA_ERROR_NO_SUCH_TABLE in str(e).lower():
+                return []
+            raise
+
+    def get_action_items_in_range(self, from_date: date, to_date: date) -> list[ActionItemRow]:
+        """Action items of sessions that started in [from_date, to_date], in session order (one join query)."""
+        try:
+            with self._reader() as conn:
+                cursor = conn.execute(
+                    f"""
+                    SELECT a.session_id, a.idx_in_analysis, a.description, a.assignee, a.deadline, a.status
+                    FROM action_items a
+                    JOIN sessions s ON s.id = a.session_id
+                    WHERE {_SESSIONS_IN_RANGE}
+                    ORDER BY s.started_at, s.id, a.idx_in_analysis
+                    """,  # nosec B608 -- constant clause, values bound
+                    _range_params(from_date, to_date),
                 )
-                for row in cursor.fetchall()
-            ]
+                return [
+                    ActionItemRow(
+                        session_id=row["session_id"],
+                        idx_in_analysis=row["idx_in_analysis"],
+                        description=row["description"] or "",
+                        assignee=row["assignee"] if row["assignee"] else None,
+                        deadline=row["deadline"] if row["deadline"] else None,
+                        status=row["status"] or "open",
+                    )
+                    for row in cursor.fetchall()
+                ]
         except sqlite3.OperationalError as e:
             if _SCHEMA_ERROR_NO_SUCH_TABLE in str(e).lower():
                 return []
@@ -644,10 +1058,10 @@ class TranscriptLog:
     def get_session_ids_with_action_items(self) -> list[int]:
         """Return distinct session_id that have at least one action item (for filter UI)."""
         try:
-            conn = self._get_conn()
-            cursor = conn.cursor()
-            cursor.execute("SELECT DISTINCT session_id FROM action_items ORDER BY session_id DESC")
-            return [row["session_id"] for row in cursor.fetchall()]
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT DISTINCT session_id FROM action_items ORDER BY session_id DESC")
+                return [row["session_id"] for row in cursor.fetchall()]
         except sqlite3.OperationalError as e:
             if _SCHEMA_ERROR_NO_SUCH_TABLE in str(e).lower():
                 return []
@@ -662,16 +1076,14 @@ class TranscriptLog:
         if not updates:
             return
         try:
-            conn = self._get_conn()
-            cursor = conn.cursor()
-            for idx, status in updates:
-                if status not in ("done", "cancelled"):
-                    continue
-                cursor.execute(
-                    "UPDATE action_items SET status = ? WHERE session_id = ? AND idx_in_analysis = ?",
-                    (status, from_session_id, idx),
-                )
-            conn.commit()
+            with self._transaction() as cursor:
+                for idx, status in updates:
+                    if status not in ("done", "cancelled"):
+                        continue
+                    cursor.execute(
+                        "UPDATE action_items SET status = ? WHERE session_id = ? AND idx_in_analysis = ?",
+                        (status, from_session_id, idx),
+                    )
         except sqlite3.OperationalError as e:
             if _SCHEMA_ERROR_NO_SUCH_TABLE in str(e).lower():
                 log.debug("action_items table not available for status update")
@@ -681,63 +1093,62 @@ class TranscriptLog:
     def purge_before(self, cutoff_date: date) -> int:
         """Delete sessions with started_at before cutoff_date (exclusive). Returns count of deleted sessions.
         Order: action_items, segments (FTS updated by trigger), analyses, sessions (#43)."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        cutoff_str = cutoff_date.isoformat()
-        cursor.execute(
-            "SELECT id FROM sessions WHERE date(started_at) < ?",
-            (cutoff_str,),
-        )
-        session_ids = [row["id"] for row in cursor.fetchall()]
-        if not session_ids:
-            return 0
-        placeholders = ",".join("?" * len(session_ids))
-        try:
+        with self._transaction() as cursor:
+            cutoff_str = cutoff_date.isoformat()
+            cursor.execute(
+                "SELECT id FROM sessions WHERE started_at < ? AND date(started_at) < ?",
+                (_started_at_bounds(cutoff_date, cutoff_date)[1], cutoff_str),
+            )
+            session_ids = [row["id"] for row in cursor.fetchall()]
+            if not session_ids:
+                return 0
+            placeholders = ",".join("?" * len(session_ids))
+            try:
+                cursor.execute(
+                    f"DELETE FROM action_items WHERE session_id IN ({placeholders})",  # nosec B608
+                    session_ids,
+                )
+            except sqlite3.OperationalError as e:
+                if _SCHEMA_ERROR_NO_SUCH_TABLE in str(e).lower():
+                    # Ignore missing table (e.g. fresh DB without action_items)
+                    _ = e
+                else:
+                    raise
             cursor.execute(
-                f"DELETE FROM action_items WHERE session_id IN ({placeholders})",  # nosec B608
+                f"DELETE FROM segments WHERE session_id IN ({placeholders})",  # nosec B608
                 session_ids,
             )
-        except sqlite3.OperationalError as e:
-            if _SCHEMA_ERROR_NO_SUCH_TABLE in str(e).lower():
-                # Ignore missing table (e.g. fresh DB without action_items)
-                _ = e
-            else:
-                raise
-        cursor.execute(
-            f"DELETE FROM segments WHERE session_id IN ({placeholders})",  # nosec B608
-            session_ids,
-        )
-        cursor.execute(
-            f"DELETE FROM analyses WHERE session_id IN ({placeholders})",  # nosec B608
-            session_ids,
-        )
-        cursor.execute(
-            f"DELETE FROM sessions WHERE id IN ({placeholders})",  # nosec B608
-            session_ids,
-        )
-        conn.commit()
-        log.info("transcript_log.purge_before", cutoff=cutoff_str, deleted=len(session_ids))
-        return len(session_ids)
+            cursor.execute(
+                f"DELETE FROM analyses WHERE session_id IN ({placeholders})",  # nosec B608
+                session_ids,
+            )
+            cursor.execute(
+                f"DELETE FROM sessions WHERE id IN ({placeholders})",  # nosec B608
+                session_ids,
+            )
+            log.info("transcript_log.purge_before", cutoff=cutoff_str, deleted=len(session_ids))
+            return len(session_ids)
 
     def search_transcripts(self, query: str, limit: int = 20) -> list[tuple[int, str, float, float, str]]:
         """FTS5 search on segment text. Returns (session_id, text, start_sec, end_sec, snippet)."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT s.session_id, s.text, s.start_sec, s.end_sec,
-                   snippet(segments_fts, 0, '', '', '…', 32) AS snippet
-            FROM segments_fts f
-            JOIN segments s ON s.id = f.rowid
-            WHERE segments_fts MATCH ?
-            ORDER BY s.session_id DESC, s.start_sec
-            LIMIT ?
-            """,
-            (query, limit),
-        )
-        return [(r["session_id"], r["text"], r["start_sec"], r["end_sec"], r["snippet"] or "") for r in cursor.fetchall()]
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT s.session_id, s.text, s.start_sec, s.end_sec,
+                       snippet(segments_fts, 0, '', '', '…', 32) AS snippet
+                FROM segments_fts f
+                JOIN segments s ON s.id = f.rowid
+                WHERE segments_fts MATCH ?
+                ORDER BY s.session_id DESC, s.start_sec
+                LIMIT ?
+                """,
+                (query, limit),
+            )
+            return [(r["session_id"], r["text"], r["start_sec"], r["end_sec"], r["snippet"] or "") for r in cursor.fetchall()]
 
     def close(self) -> None:
+        """Close the instance's own connection; shared pool connections stay open for the next request."""
         if self._conn:
             self._conn.close()
             self._conn = None
@@ -1,4 +1,5 @@
-"""LLM response cache: content-hash key, SQLite, TTL. C4 (#44)."""
+"""LLM response cache: content-hash key, SQLite, TTL. C4 (#44).
+Per process: one WAL connection and an in-memory LRU front tier (ResponseCache)."""
 
 from __future__ import annotations
 
@@ -7,14 +8,19 @@ import json
 import os
 import sqlite3
 import threading
+import time
+from collections import OrderedDict
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, TypeVar
 
+import structlog
 from pydantic import BaseModel
 
 from voiceforge.core.fs import ensure_private_dir, ensure_private_file
 
+log = structlog.get_logger()
+
 T = TypeVar("T", bound=BaseModel)
 
 TABLE_DDL = """
@@ -27,9 +33,13 @@ CREATE TABLE IF NOT EXISTS response_cache (
     created_at TEXT NOT NULL
 );
 """
+INDEX_DDL = "CREATE INDEX IF NOT EXISTS idx_response_cache_created_at ON response_cache(created_at)"
+
+MEMORY_CACHE_SIZE = 128  # validated responses kept in RAM per process
+PURGE_INTERVAL_SEC = 600.0  # background expiry purge at most this often
 
-_init_done_paths: set[str] = set()
-_init_lock = threading.Lock()
+_caches: dict[str, ResponseCache] = {}
+_caches_lock = threading.Lock()
 
 
 def _cache_db_path() -> Path:
@@ -37,19 +47,135 @@ def _cache_db_path() -> Path:
     return Path(base) / "voiceforge" / "llm_response_cache.db"
 
 
-def _get_conn() -> sqlite3.Connection:
+def _record(event: str, tier: str, n: int = 1) -> None:
+    try:
+        from voiceforge.core.observability import record_llm_response_cache
+
+        record_llm_response_cache(event, tier, n)
+    except ImportError:
+        pass
+
+
+class ResponseCache:
+    """One long-lived WAL connection plus an in-memory LRU of validated responses.
+    Hits from RAM skip SQLite, JSON parsing and model_validate; expired rows are purged in the background."""
+
+    def __init__(self, path: Path, memory_size: int = MEMORY_CACHE_SIZE) -> None:
+        ensure_private_dir(path.parent)
+        self.path = path
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        ensure_private_file(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(TABLE_DDL)
+        self._conn.execute(INDEX_DDL)
+        self._conn.commit()
+        self._lock = threading.Lock()
+        # key_hash → (instance, cost_usd, created epoch seconds)
+        self._memory: OrderedDict[str, tuple[BaseModel, float, float]] = OrderedDict()
+        self._memory_size = memory_size
+        self._last_purge = 0.0
+        self._purging = False
+
+    def _remember(self, key_hash: str, instance: BaseModel, cost_usd: float, created: float) -> None:
+        """Insert into the LRU (lock held)."""
+        self._memory[key_hash] = (instance, cost_usd, created)
+        self._memory.move_to_end(key_hash)
+        evicted = 0
+        while len(self._memory) > self._memory_size:
+            self._memory.popitem(last=False)
+            evicted += 1
+        if evicted:
+            _record("eviction", "memory", evicted)
+
+    def get(self, key_hash: str, response_model: type[T], ttl_seconds: int) -> tuple[T, float] | None:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key_hash)
+            if entry is not None:
+                instance, cost_usd, created = entry
+                if now - created <= ttl_seconds and isinstance(instance, response_model):
+                    self._memory.move_to_end(key_hash)
+                    _record("hit", "memory")
+                    return (instance.model_copy(deep=True), cost_usd)
+                del self._memory[key_hash]
+            row = self._conn.execute(
+                "SELECT result_json, cost_usd, created_at FROM response_cache WHERE key_hash = ?",
+                (key_hash,),
+            ).fetchone()
+            if not row:
+                _record("miss", "disk")
+                return None
+            result_json, cost_usd, created_at_str = row
+            created = datetime.fromisoformat(created_at_str.replace("Z", "+00:00")).timestamp()
+            if now - created > ttl_seconds:
+                self._conn.execute("DELETE FROM response_cache WHERE key_hash = ?", (key_hash,))
+                self._conn.commit()
+                _record("miss", "disk")
+                return None
+            instance = response_model.model_validate(json.loads(result_json))
+            self._remember(key_hash, instance, float(cost_usd), created)
+        _record("hit", "disk")
+        return (instance.model_copy(deep=True), float(cost_usd))
+
+    def set(
+        self,
+        key_hash: str,
+        model_id: str,
+        response_model_name: str,
+        result: BaseModel,
+        cost_usd: float,
+        ttl_seconds: int,
+    ) -> None:
+        created = datetime.now(UTC)
+        result_json = result.model_dump_json()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO response_cache (key_hash, model_id, response_model_name, result_json, cost_usd, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (key_hash, model_id, response_model_name, result_json, cost_usd, created.isoformat()),
+            )
+            self._conn.commit()
+            self._remember(key_hash, result.model_copy(deep=True), float(cost_usd), created.timestamp())
+            due = not self._purging and time.monotonic() - self._last_purge >= PURGE_INTERVAL_SEC
+            if due:
+                self._purging = True
+                self._last_purge = time.monotonic()
+        if due:
+            threading.Thread(target=self.purge_expired, args=(ttl_seconds,), name="llm-cache-purge", daemon=True).start()
+
+    def purge_expired(self, ttl_seconds: int) -> int:
+        """Delete rows older than ttl_seconds (range scan on the created_at index); return rows deleted."""
+        cutoff_iso = datetime.fromtimestamp(time.time() - ttl_seconds, tz=UTC).isoformat()
+        deleted = 0
+        try:
+            with self._lock:
+                deleted = self._conn.execute("DELETE FROM response_cache WHERE created_at < ?", (cutoff_iso,)).rowcount
+                self._conn.commit()
+        except sqlite3.Error as e:
+            log.warning("llm.cache.purge_failed", error=str(e))
+        finally:
+            self._purging = False
+        if deleted > 0:
+            _record("eviction", "disk", deleted)
+        return deleted
+
+    def close(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._conn.close()
+
+
+def _get_cache() -> ResponseCache:
+    """Process-wide ResponseCache for the current data dir (XDG_DATA_HOME)."""
     path = _cache_db_path()
-    ensure_private_dir(path.parent)
-    db_str = str(path)
-    conn = sqlite3.connect(db_str)
-    ensure_private_file(path)
-    if db_str not in _init_done_paths:
-        with _init_lock:
-            if db_str not in _init_done_paths:
-                conn.execute(TABLE_DDL)
-                conn.commit()
-                _init_done_paths.add(db_str)
-    return conn
+    key = str(path)
+    cache = _caches.get(key)
+    if cache is None:
+        with _caches_lock:
+            cache = _caches.get(key)
+            if cache is None:
+                cache = _caches[key] = ResponseCache(path)
+    return cache
 
 
 def cache_key(prompt: list[dict[str, Any]], model_id: str, response_model_name: str) -> str:
@@ -70,24 +196,7 @@ def get(
     """Return (parsed instance, cost_usd) if cached and not expired; else None."""
     if ttl_seconds <= 0:
         return None
-    conn = _get_conn()
-    try:
-        row = conn.execute(
-            "SELECT result_json, cost_usd, created_at FROM response_cache WHERE key_hash = ?",
-            (key_hash,),
-        ).fetchone()
-        if not row:
-            return None
-        result_json, cost_usd, created_at_str = row
-        created = datetime.fromisoformat(created_at_str.replace("Z", "+00:00"))
-        if (datetime.now(UTC) - created).total_seconds() > ttl_seconds:
-            conn.execute("DELETE FROM response_cache WHERE key_hash = ?", (key_hash,))
-            conn.commit()
-            return None
-        data = json.loads(result_json)
-        return (response_model.model_validate(data), float(cost_usd))
-    finally:
-        conn.close()
+    return _get_cache().get(key_hash, response_model, ttl_seconds)
 
 
 def set(
@@ -98,30 +207,7 @@ def set(
     cost_usd: float,
     ttl_seconds: int,
 ) -> None:
-    """Store result in cache. TTL is enforced on get; optionally purge expired rows."""
+    """Store result in cache. TTL is enforced on get; expired rows are purged in the background."""
     if ttl_seconds <= 0:
         return
-    conn = _get_conn()
-    try:
-        created_at = datetime.now(UTC).isoformat()
-        result_json = result.model_dump_json()
-        conn.execute(
-            "INSERT OR REPLACE INTO response_cache (key_hash, model_id, response_model_name, result_json, cost_usd, created_at) VALUES (?, ?, ?, ?, ?, ?)",
-            (key_hash, model_id, response_model_name, result_json, cost_usd, created_at),
-        )
-        conn.commit()
-        _purge_expired(conn, ttl_seconds)
-    finally:
-        conn.close()
-
-
-def _purge_expired(conn: sqlite3.Connection, ttl_seconds: int) -> None:
-    """Remove entries older than ttl_seconds. Call after set to limit DB size."""
-    try:
-        cutoff = (datetime.now(UTC).timestamp() - ttl_seconds) * 1000
-        # SQLite stores ISO text; compare as string for simplicity (ISO sortable)
-        cutoff_iso = datetime.fromtimestamp(cutoff / 1000.0, tz=UTC).isoformat()
-        conn.execute("DELETE FROM response_cache WHERE created_at < ?", (cutoff_iso,))
-        conn.commit()
-    except sqlite3.OperationalError:
-        conn.rollback()
+    _get_cache().set(key_hash, model_id, response_model_name, result, cost_usd, ttl_seconds)
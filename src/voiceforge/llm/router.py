@@ -3,6 +3,7 @@ Budget $75/mo. Block 5.1: prompt caching for Claude."""
 
 from __future__ import annotations
 
+import threading
 from typing import Any, TypeVar, cast
 
 import structlog
@@ -21,6 +22,11 @@ _REASON_FILE_MISSING = "file missing"
 _LOG_LLM_OLLAMA_FALLBACK = "llm.ollama_fallback"
 _OLLAMA_MODEL_PREFIX = "ollama/"
 
+# Worst-case cost of structured calls still in flight; counted by the budget check so that concurrent calls
+# (analysis + copilot fast/deep) cannot all pass against the same committed daily total.
+_budget_lock = threading.Lock()
+_inflight_reserved_usd = 0.0
+
 # Anthropic: Opus 4.6 $5/$25, Sonnet 4.6 $3/$15, Haiku 4.5 $1/$5 (per MTok in/out)
 MODEL_CLAUDE_OPUS = "anthropic/claude-opus-4-6"
 MODEL_CLAUDE_SONNET = "anthropic/claude-sonnet-4-6"
@@ -247,7 +253,9 @@ def analyze_meeting_stream(
     pii_mode: str = "ON",
     stream_callback: Any = None,
 ) -> tuple[Any, float]:
-    """Like analyze_meeting but streams deltas via stream_callback(delta). Returns (result, cost). (#91)"""
+    """Like analyze_meeting but streams deltas via stream_callback(delta). Returns (result, cost). (#91)
+    The streaming call reserves its worst-case cost against the daily budget like complete_structured."""
+    from voiceforge.core.backends import get_settings
     from voiceforge.llm.local_llm import DEFAULT_MODEL as OLLAMA_DEFAULT
     from voiceforge.llm.schemas import MeetingAnalysis
 
@@ -280,7 +288,12 @@ def analyze_meeting_stream(
         system_prompt_override=system_prompt_override,
         pii_mode=pii_mode,
     )
-    return _stream_accumulate_and_parse(prompt, model_id, stream_callback, response_model)
+    reserved = _estimate_call_cost(prompt, model_id, 1024)
+    _reserve_budget(get_settings(), reserved)
+    try:
+        return _stream_accumulate_and_parse(prompt, model_id, stream_callback, response_model)
+    finally:
+        _release_budget(reserved)
 
 
 def _live_summary_system() -> str:
@@ -448,10 +461,10 @@ def analyze_copilot_fast(
 ) -> tuple[CopilotFastCards, float]:
     """KC6 (#178): One LLM call for Answer, Do/Don't, Clarify cards. Short token budget for live use.
     Returns (CopilotFastCards, cost_usd)."""
-    from voiceforge.core.config import Settings
+    from voiceforge.core.backends import get_settings
 
     model_id = model or DEFAULT_MODEL
-    _complete_structured_check_budget(Settings())
+    _complete_structured_check_budget(get_settings())
     set_env_keys_from_keyring()
     from voiceforge.core.preflight import NetworkUnavailableError, check_network_for_llm
 
@@ -494,10 +507,10 @@ def analyze_copilot_deep(
     model: str | None = None,
 ) -> tuple[CopilotDeepCards, float]:
     """KC7 (#179): One LLM call for Risk, Strategy, Emotion cards. KC12: objections, follow_up_suggestions."""
-    from voiceforge.core.config import Settings
+    from voiceforge.core.backends import get_settings
 
     model_id = model or DEFAULT_MODEL
-    _complete_structured_check_budget(Settings())
+    _complete_structured_check_budget(get_settings())
     set_env_keys_from_keyring()
     from voiceforge.core.preflight import NetworkUnavailableError, check_network_for_llm
 
@@ -554,10 +567,10 @@ def refine_copilot_answer(
     model: str | None = None,
 ) -> tuple[str, float]:
     """KC12 (#184): On-demand refinement (deep / rewrite / tone). Returns (refined_text, cost_usd). Preserves grounding."""
-    from voiceforge.core.config import Settings
+    from voiceforge.core.backends import get_settings
 
     model_id = model or DEFAULT_MODEL
-    _complete_structured_check_budget(Settings())
+    _complete_structured_check_budget(get_settings())
     set_env_keys_from_keyring()
     from voiceforge.core.preflight import NetworkUnavailableError, check_network_for_llm
 
@@ -663,10 +676,10 @@ def get_budget_warning_if_near_limit(cfg: Any, estimate_usd: float = 0.03) -> st
 
 
 def _complete_structured_check_budget(cfg: Any) -> None:
-    """Raise BudgetExceeded or log warning if near limit."""
+    """Raise BudgetExceeded or log warning if near limit. Reservations of in-flight calls count as spent."""
     from voiceforge.core.metrics import get_cost_today
 
-    cost_today = get_cost_today()
+    cost_today = get_cost_today() + _inflight_reserved_usd
     daily_limit = cfg.daily_budget_limit_usd or 0.0
     if daily_limit > 0 and cost_today >= daily_limit:
         raise BudgetExceeded(
@@ -682,6 +695,33 @@ def _complete_structured_check_budget(cfg: Any) -> None:
         )
 
 
+def _estimate_call_cost(prompt: list[dict[str, Any]], model_id: str, max_tokens: int) -> float:
+    """Upper-bound cost of one structured call: prompt tokens (≈ chars / 4) plus the full output token limit."""
+    try:
+        from litellm import cost_per_token
+
+        chars = sum(len(str(m.get("content") or "")) for m in prompt)
+        prompt_c, completion_c = cost_per_token(model=model_id, prompt_tokens=chars // 4, completion_tokens=max_tokens)
+        return float(prompt_c or 0) + float(completion_c or 0)
+    except Exception:
+        return 0.0
+
+
+def _reserve_budget(cfg: Any, estimate_usd: float) -> None:
+    """Check the daily budget and reserve estimate_usd for an in-flight call (atomic across threads)."""
+    global _inflight_reserved_usd
+    with _budget_lock:
+        _complete_structured_check_budget(cfg)
+        _inflight_reserved_usd += estimate_usd
+
+
+def _release_budget(estimate_usd: float) -> None:
+    """Drop a reservation once the call finished (its real cost is in metrics by then)."""
+    global _inflight_reserved_usd
+    with _budget_lock:
+        _inflight_reserved_usd = max(0.0, _inflight_reserved_usd - estimate_usd)
+
+
 def _complete_structured_finish(
     parsed: TModel,
     raw_used: Any,
@@ -728,14 +768,14 @@ def complete_structured(
 ) -> tuple[TModel, float]:
     """Call LLM with fallbacks; return (validated Pydantic model, cost_usd).
     Uses Instructor retry (max_retries=3) with validation context on parse errors (#33).
-    Pre-call budget check: reject if daily cost >= daily_budget_limit_usd (#38).
+    Pre-call budget check: reject if daily cost >= daily_budget_limit_usd (#38); concurrent in-flight calls
+    reserve their worst-case cost so parallel copilot tracks cannot overshoot the limit together.
     Response cache: content-hash key, TTL from config (#44).
     KC6 (#178): max_tokens limits output length (default 1024; copilot fast-track uses 384)."""
-    from voiceforge.core.config import Settings
-    from voiceforge.core.metrics import log_response_cache
+    from voiceforge.core.backends import get_settings
     from voiceforge.llm.cache import cache_key
 
-    cfg = Settings()
+    cfg = get_settings()
     ttl = int(getattr(cfg, "response_cache_ttl_seconds", 0) or 0)
     model_id = model or DEFAULT_MODEL
     key = cache_key(prompt, model_id, response_model.__name__) if ttl > 0 else ""
@@ -743,7 +783,26 @@ def complete_structured(
         hit = _complete_structured_cached(key, response_model, ttl)
         if hit is not None:
             return hit
-    _complete_structured_check_budget(cfg)
+    token_limit = 1024 if max_tokens is None else max(256, min(max_tokens, 4096))
+    reserved = _estimate_call_cost(prompt, model_id, token_limit)
+    _reserve_budget(cfg, reserved)
+    try:
+        return _complete_structured_call(prompt, response_model, model_id, token_limit, key, ttl)
+    finally:
+        _release_budget(reserved)
+
+
+def _complete_structured_call(
+    prompt: list[dict[str, Any]],
+    response_model: type[TModel],
+    model_id: str,
+    token_limit: int,
+    key: str,
+    ttl: int,
+) -> tuple[TModel, float]:
+    """Uncached LLM call for complete_structured (budget already checked and reserved)."""
+    from voiceforge.core.metrics import log_response_cache
+
     log_response_cache(False)
     set_env_keys_from_keyring()
     from voiceforge.core.preflight import NetworkUnavailableError, check_network_for_llm
@@ -759,7 +818,6 @@ def complete_structured(
 
     # E6 (#129): when using Ollama fallback, do not fall back to API models (no keys).
     fallbacks = None if model_id.startswith(_OLLAMA_MODEL_PREFIX) else [m for m in FALLBACK_MODELS if m != model_id][:3]
-    token_limit = 1024 if max_tokens is None else max(256, min(max_tokens, 4096))
     client = instructor.from_litellm(wrap_completion(completion))
     try:
         parsed, raw_used = client.create_with_completion(
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import contextlib
+import contextvars
 import json
 import logging
 import os
@@ -12,6 +14,7 @@ import sys
 import threading
 import time
 import warnings
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import UTC
 from pathlib import Path
 from typing import Any
@@ -369,20 +372,6 @@ def _hint_for_error(message: str) -> str | None:
     return None
 
 
-def _speaker_for_interval(start: float, end: float, diar_segments: list[Any]) -> str:
-    best = ""
-    best_overlap = 0.0
-    for d in diar_segments:
-        o_start = max(start, getattr(d, "start", 0.0))
-        o_end = min(end, getattr(d, "end", 0.0))
-        if o_end > o_start:
-            overlap = o_end - o_start
-            if overlap > best_overlap:
-                best_overlap = overlap
-                best = getattr(d, "speaker", "") or ""
-    return best
-
-
 def _format_template_standup(d: dict) -> tuple[list[str], list[str], list[dict[str, Any]]]:
     lines, answers = [], []
     for key, label in [
@@ -554,9 +543,14 @@ def _ensure_rag_auto_index(cfg: Any) -> list[str]:
 
         ensure_private_dir(sentinel.parent)
         db_path = cfg.get_rag_db_path()
-        indexer = KnowledgeIndexer(db_path)
+        indexer = KnowledgeIndexer(db_path, embed_batch_size=getattr(cfg, "rag_embed_batch_size", 64))
         try:
-            total, _ = _index_directory(indexer, path, getattr(cfg, "rag_exclude_patterns", None) or [])
+            total, _ = _index_directory(
+                indexer,
+                path,
+                getattr(cfg, "rag_exclude_patterns", None) or [],
+                workers=getattr(cfg, "rag_ingest_workers", 0) or None,
+            )
             log.info("rag.auto_index_done", path=str(path), chunks=total)
         finally:
             indexer.close()
@@ -571,6 +565,125 @@ def _ensure_rag_auto_index(cfg: Any) -> list[str]:
     return warnings
 
 
+def _copilot_card_fields(track: str, cards: Any) -> dict[str, Any]:
+    """analysis_for_log fields of one copilot track (KC6 fast, KC7/KC12 deep); cards=None gives empty defaults."""
+    if track == "fast":
+        if cards is None:
+            return {
+                "copilot_answer": [],
+                "copilot_dos": [],
+                "copilot_donts": [],
+                "copilot_clarify": [],
+                "copilot_confidence": 0.0,
+            }
+        return {
+            "copilot_answer": list(cards.answer) if cards.answer else [],
+            "copilot_dos": list(cards.dos) if cards.dos else [],
+            "copilot_donts": list(cards.donts) if cards.donts else [],
+            "copilot_clarify": list(cards.clarify) if cards.clarify else [],
+            "copilot_confidence": float(cards.confidence),
+        }
+    if cards is None:
+        return {
+            "copilot_risk": [],
+            "copilot_strategy": "",
+            "copilot_emotion": None,
+            "copilot_objections": [],
+            "copilot_follow_up_suggestions": [],
+        }
+    return {
+        "copilot_risk": list(cards.risks) if cards.risks else [],
+        "copilot_strategy": (cards.strategy or "").strip(),
+        "copilot_emotion": (cards.emotion or "").strip() or None,
+        "copilot_objections": list(cards.objections) if getattr(cards, "objections", None) else [],
+        "copilot_follow_up_suggestions": (
+            list(cards.follow_up_suggestions) if getattr(cards, "follow_up_suggestions", None) else []
+        ),
+    }
+
+
+def _log_late_copilot_track(track: str) -> Any:
+    """Done-callback for a track that missed its deadline: its cost is in metrics.db but not in the session cost."""
+
+    def _done(fut: Any) -> None:
+        if fut.cancelled() or fut.exception() is not None:
+            return
+        log.info("analyze.copilot_late_result", track=track, cost_usd=fut.result()[1])
+
+    return _done
+
+
+def _run_llm_stage(
+    main_call: Any,
+    copilot_calls: dict[str, Any],
+    deadlines_sec: dict[str, float],
+    on_copilot_cards: Any = None,
+    started: float | None = None,
+) -> tuple[Any, float, dict[str, Any], float]:
+    """Run the analysis call and copilot tracks concurrently; return (llm_result, cost_usd, copilot_fields, copilot_cost).
+    Each track is published via on_copilot_cards(track, fields) as soon as it completes (fast cards do not wait for
+    deep or for the analysis). A track that fails or misses its deadline (seconds from stage start) gets empty fields.
+    Exceptions of main_call propagate; pending tracks are then abandoned."""
+    if not copilot_calls:
+        llm_result, cost_usd = main_call()
+        return (llm_result, cost_usd, {}, 0.0)
+    stage_start = time.monotonic()
+    pool = ThreadPoolExecutor(max_workers=1 + len(copilot_calls), thread_name_prefix="analyze-llm")
+    try:
+        # copy_context: workers keep the run's trace_id (structlog contextvars)
+        main_future = pool.submit(contextvars.copy_context().run, main_call)
+        tracks = {pool.submit(contextvars.copy_context().run, fn): track for track, fn in copilot_calls.items()}
+        fields: dict[str, Any] = {}
+        copilot_cost = 0.0
+        published = False
+        pending = set(tracks)
+        while pending:
+            next_deadline = min(stage_start + deadlines_sec[tracks[f]] for f in pending)
+            waitables = pending if main_future.done() else pending | {main_future}
+            done, _ = wait(waitables, timeout=max(0.0, next_deadline - time.monotonic()), return_when=FIRST_COMPLETED)
+            if main_future in done and main_future.exception() is not None:
+                main_future.result()
+            for fut in done & pending:
+                pending.discard(fut)
+                track = tracks[fut]
+                try:
+                    cards, cost = fut.result()
+                except Exception as e:
+                    log.warning(f"analyze.copilot_{track}_failed", error=str(e))
+                    fields.update(_copilot_card_fields(track, None))
+                    continue
+                copilot_cost += cost
+                track_fields = _copilot_card_fields(track, cards)
+                fields.update(track_fields)
+                if not published:
+                    published = True
+                    elapsed = time.monotonic() - (stage_start if started is None else started)
+                    log.info("analyze.copilot_first_card", track=track, seconds=round(elapsed, 3))
+                    try:
+                        from voiceforge.core.observability import record_copilot_time_to_first_card
+
+                        record_copilot_time_to_first_card(elapsed)
+                    except ImportError:
+                        pass
+                if on_copilot_cards is not None:
+                    try:
+                        on_copilot_cards(track, track_fields)
+                    except Exception as e:
+                        log.warning("analyze.copilot_publish_failed", track=track, error=str(e))
+            now = time.monotonic()
+            for fut in [f for f in pending if now >= stage_start + deadlines_sec[tracks[f]]]:
+                pending.discard(fut)
+                track = tracks[fut]
+                log.warning("analyze.copilot_timeout", track=track, timeout_sec=deadlines_sec[track])
+                if not fut.cancel():
+                    fut.add_done_callback(_log_late_copilot_track(track))
+                fields.update(_copilot_card_fields(track, None))
+        llm_result, cost_usd = main_future.result()
+        return (llm_result, cost_usd, fields, copilot_cost)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
 def run_analyze_pipeline(
     seconds: int,
     template: str | None = None,
@@ -579,20 +692,29 @@ def run_analyze_pipeline(
     out_transcript: list[str] | None = None,
     for_copilot: bool = False,
     session_context: list[str] | None = None,
+    on_copilot_cards: Any = None,
+    audio_source: Any = None,
+    speaker_linker: Any = None,
 ) -> tuple[str, list[dict[str, Any]], dict[str, Any]]:
     """Run core analyze pipeline and return (display_text, segments_for_log, analysis_for_log).
+    audio_source: audio.source AudioSource (in-memory segment or live capture); default the ring file.
+    speaker_linker: stt.speaker_linker.SpeakerLinker of the listen/meeting session (stable speaker labels).
     If stream_callback is set, LLM output is streamed via stream_callback(delta) (#91).
     KC4: if out_transcript is a list, out_transcript[0] is set to the raw STT transcript.
     KC6 (#178): when for_copilot=True, also run fast-track LLM and add Answer/Do/Don't/Clarify to analysis_for_log.
-    KC7 (#179): session_context = previous turns in this conversation (prepended to RAG context for LLM)."""
+    KC7 (#179): session_context = previous turns in this conversation (prepended to RAG context for LLM).
+    for_copilot: analysis, fast-track and deep-track run concurrently with per-track deadlines
+    (copilot_fast_timeout_sec / copilot_deep_timeout_sec); each track's fields are passed to
+    on_copilot_cards(track, fields) as soon as it completes, before the analysis finishes."""
+    started = time.monotonic()
     bind_trace_id()  # one trace_id per pipeline run (CLI or daemon worker)
     cfg = _get_config()
     auto_index_warnings = _ensure_rag_auto_index(cfg)
     try:
         from voiceforge.core.pipeline import AnalysisPipeline
 
-        with AnalysisPipeline(cfg) as pipeline:
-            result, err = pipeline.run(seconds)
+        with AnalysisPipeline(cfg, speaker_linker=speaker_linker) as pipeline:
+            result, err = pipeline.run(seconds, source=audio_source)
     except ImportError:
         return (t("error.install_deps"), [], {})
 
@@ -612,14 +734,11 @@ def run_analyze_pipeline(
     transcript_redacted = result.transcript_redacted
     pipeline_warnings: list[str] = (getattr(result, "warnings", None) or []) + auto_index_warnings
 
+    from voiceforge.stt.speaker_attribution import attribute_segments
+
     segments_for_log = [
-        {
-            "start_sec": s.start,
-            "end_sec": s.end,
-            "speaker": _speaker_for_interval(s.start, s.end, diar_segments),
-            "text": s.text or "",
-        }
-        for s in segments
+        {"start_sec": a.start, "end_sec": a.end, "speaker": a.speaker, "text": a.text}
+        for a in attribute_segments(segments, diar_segments or [])
     ]
 
     if dry_run:
@@ -653,22 +772,29 @@ def run_analyze_pipeline(
         log.info(_LOG_LLM_OLLAMA_FALLBACK, model=effective_model, message="No API keys found. Using Ollama as LLM backend.")
 
     try:
-        from voiceforge.llm.router import analyze_meeting, analyze_meeting_stream, get_budget_warning_if_near_limit
+        from voiceforge.llm.router import (
+            analyze_copilot_deep,
+            analyze_copilot_fast,
+            analyze_meeting,
+            analyze_meeting_stream,
+            get_budget_warning_if_near_limit,
+        )
 
         budget_warn = get_budget_warning_if_near_limit(cfg)
-        if stream_callback is not None:
-            llm_result, cost_usd = analyze_meeting_stream(
-                transcript,
-                context=context,
-                model=effective_model,
-                template=template,
-                transcript_pre_redacted=transcript_redacted,
-                ollama_model=cfg.ollama_model,
-                pii_mode=cfg.pii_mode,
-                stream_callback=stream_callback,
-            )
-        else:
-            llm_result, cost_usd = analyze_meeting(
+
+        def main_call() -> tuple[Any, float]:
+            if stream_callback is not None:
+                return analyze_meeting_stream(
+                    transcript,
+                    context=context,
+                    model=effective_model,
+                    template=template,
+                    transcript_pre_redacted=transcript_redacted,
+                    ollama_model=cfg.ollama_model,
+                    pii_mode=cfg.pii_mode,
+                    stream_callback=stream_callback,
+                )
+            return analyze_meeting(
                 transcript,
                 context=context,
                 model=effective_model,
@@ -677,6 +803,25 @@ def run_analyze_pipeline(
                 ollama_model=cfg.ollama_model,
                 pii_mode=cfg.pii_mode,
             )
+
+        copilot_calls: dict[str, Any] = {}
+        if for_copilot:
+            copilot_calls = {
+                "fast": lambda: analyze_copilot_fast(
+                    transcript,
+                    context=context,
+                    model=effective_model,
+                    rag_groundedness=getattr(result, "rag_groundedness", None),
+                ),
+                "deep": lambda: analyze_copilot_deep(transcript, context=context, model=effective_model),
+            }
+        deadlines = {
+            "fast": float(getattr(cfg, "copilot_fast_timeout_sec", 15.0)),
+            "deep": float(getattr(cfg, "copilot_deep_timeout_sec", 45.0)),
+        }
+        llm_result, cost_usd, copilot_fields, copilot_cost = _run_llm_stage(
+            main_call, copilot_calls, deadlines, on_copilot_cards=on_copilot_cards, started=started
+        )
     except ImportError:
         return (t("error.install_llm_deps"), [], {})
     except BudgetExceeded as e:
@@ -700,112 +845,25 @@ def run_analyze_pipeline(
         analysis_for_log["model"] = effective_model
         analysis_for_log["cost_usd"] = cost_usd
         analysis_for_log.update(_rag_evidence_from_result(result))
-        if for_copilot:
-            try:
-                from voiceforge.llm.router import analyze_copilot_fast
-
-                fast_cards, fast_cost = analyze_copilot_fast(
-                    transcript,
-                    context=context,
-                    model=effective_model,
-                    rag_groundedness=getattr(result, "rag_groundedness", None),
-                )
-                analysis_for_log["copilot_answer"] = list(fast_cards.answer) if fast_cards.answer else []
-                analysis_for_log["copilot_dos"] = list(fast_cards.dos) if fast_cards.dos else []
-                analysis_for_log["copilot_donts"] = list(fast_cards.donts) if fast_cards.donts else []
-                analysis_for_log["copilot_clarify"] = list(fast_cards.clarify) if fast_cards.clarify else []
-                analysis_for_log["copilot_confidence"] = float(fast_cards.confidence)
-                analysis_for_log["cost_usd"] = analysis_for_log.get("cost_usd", 0.0) + fast_cost
-            except Exception as e:
-                log.warning("analyze.copilot_fast_failed", error=str(e))
-                analysis_for_log["copilot_answer"] = []
-                analysis_for_log["copilot_dos"] = []
-                analysis_for_log["copilot_donts"] = []
-                analysis_for_log["copilot_clarify"] = []
-                analysis_for_log["copilot_confidence"] = 0.0
-        if for_copilot:
-            try:
-                from voiceforge.llm.router import analyze_copilot_deep
-
-                deep_cards, deep_cost = analyze_copilot_deep(transcript, context=context, model=effective_model)
-                analysis_for_log["copilot_risk"] = list(deep_cards.risks) if deep_cards.risks else []
-                analysis_for_log["copilot_strategy"] = (deep_cards.strategy or "").strip()
-                analysis_for_log["copilot_emotion"] = (deep_cards.emotion or "").strip() or None
-                analysis_for_log["copilot_objections"] = (
-                    list(deep_cards.objections) if getattr(deep_cards, "objections", None) else []
-                )
-                analysis_for_log["copilot_follow_up_suggestions"] = (
-                    list(deep_cards.follow_up_suggestions) if getattr(deep_cards, "follow_up_suggestions", None) else []
-                )
-                analysis_for_log["cost_usd"] = analysis_for_log.get("cost_usd", 0.0) + deep_cost
-            except Exception as e:
-                log.warning("analyze.copilot_deep_failed", error=str(e))
-                analysis_for_log["copilot_risk"] = []
-                analysis_for_log["copilot_strategy"] = ""
-                analysis_for_log["copilot_emotion"] = None
-                analysis_for_log["copilot_objections"] = []
-                analysis_for_log["copilot_follow_up_suggestions"] = []
-        return ("\n".join(header_lines + lines), segments_for_log, analysis_for_log)
-
-    lines = _format_meeting_analysis_lines(llm_result)
-    analysis_for_log = _build_analysis_for_log_default(llm_result, cfg, cost_usd, effective_model)
-    analysis_for_log.update(_rag_evidence_from_result(result))
+    else:
+        lines = _format_meeting_analysis_lines(llm_result)
+        analysis_for_log = _build_analysis_for_log_default(llm_result, cfg, cost_usd, effective_model)
+        analysis_for_log.update(_rag_evidence_from_result(result))
     if for_copilot:
-        try:
-            from voiceforge.llm.router import analyze_copilot_fast
-
-            fast_cards, fast_cost = analyze_copilot_fast(
-                transcript,
-                context=context,
-                model=effective_model,
-                rag_groundedness=getattr(result, "rag_groundedness", None),
-            )
-            analysis_for_log["copilot_answer"] = list(fast_cards.answer) if fast_cards.answer else []
-            analysis_for_log["copilot_dos"] = list(fast_cards.dos) if fast_cards.dos else []
-            analysis_for_log["copilot_donts"] = list(fast_cards.donts) if fast_cards.donts else []
-            analysis_for_log["copilot_clarify"] = list(fast_cards.clarify) if fast_cards.clarify else []
-            analysis_for_log["copilot_confidence"] = float(fast_cards.confidence)
-            analysis_for_log["cost_usd"] = analysis_for_log.get("cost_usd", 0.0) + fast_cost
-        except Exception as e:
-            log.warning("analyze.copilot_fast_failed", error=str(e))
-            analysis_for_log["copilot_answer"] = []
-            analysis_for_log["copilot_dos"] = []
-            analysis_for_log["copilot_donts"] = []
-            analysis_for_log["copilot_clarify"] = []
-            analysis_for_log["copilot_confidence"] = 0.0
-        if for_copilot:
-            try:
-                from voiceforge.llm.router import analyze_copilot_deep
-
-                deep_cards, deep_cost = analyze_copilot_deep(transcript, context=context, model=effective_model)
-                analysis_for_log["copilot_risk"] = list(deep_cards.risks) if deep_cards.risks else []
-                analysis_for_log["copilot_strategy"] = (deep_cards.strategy or "").strip()
-                analysis_for_log["copilot_emotion"] = (deep_cards.emotion or "").strip() or None
-                analysis_for_log["copilot_objections"] = (
-                    list(deep_cards.objections) if getattr(deep_cards, "objections", None) else []
-                )
-                analysis_for_log["copilot_follow_up_suggestions"] = (
-                    list(deep_cards.follow_up_suggestions) if getattr(deep_cards, "follow_up_suggestions", None) else []
-                )
-                analysis_for_log["cost_usd"] = analysis_for_log.get("cost_usd", 0.0) + deep_cost
-            except Exception as e:
-                log.warning("analyze.copilot_deep_failed", error=str(e))
-                analysis_for_log["copilot_risk"] = []
-                analysis_for_log["copilot_strategy"] = ""
-                analysis_for_log["copilot_emotion"] = None
-                analysis_for_log["copilot_objections"] = []
-                analysis_for_log["copilot_follow_up_suggestions"] = []
+        analysis_for_log.update(copilot_fields)
+        analysis_for_log["cost_usd"] = analysis_for_log.get("cost_usd", 0.0) + copilot_cost
     return ("\n".join(header_lines + lines), segments_for_log, analysis_for_log)
 
 
-def run_live_summary_pipeline(seconds: int) -> tuple[list[str], float]:
-    """Block 10: run pipeline on last N seconds, return (display lines, cost_usd). No session log."""
+def run_live_summary_pipeline(seconds: int, audio_source: Any = None) -> tuple[list[str], float]:
+    """Block 10: run pipeline on last N seconds (audio_source or ring file), return (display lines, cost_usd).
+    No session log."""
     cfg = _get_config()
     try:
         from voiceforge.core.pipeline import AnalysisPipeline
 
         with AnalysisPipeline(cfg) as pipeline:
-            result, err = pipeline.run(seconds)
+            result, err = pipeline.run(seconds, source=audio_source)
     except ImportError:
         return ([t("error.install_deps")], 0.0)
 
@@ -883,8 +941,10 @@ def _streaming_listen_worker(
 ) -> None:
     """Block 10.1: stream STT in a thread — partial/final to stdout (CLI listen)."""
     try:
+        import numpy as np
+
         from voiceforge.stt import get_transcriber_for_config
-        from voiceforge.stt.streaming import StreamingSegment, StreamingTranscriber
+        from voiceforge.stt.streaming import ENGINE_MAX_BUFFER_SEC, StreamingEngine, StreamingSegment
     except ImportError:
         return
     transcriber = get_transcriber_for_config(cfg)
@@ -903,30 +963,34 @@ def _streaming_listen_worker(
         sys.stdout.write("\n  " + t + "\n")
         sys.stdout.flush()
 
-    stream = StreamingTranscriber(
+    engine = StreamingEngine(
         transcriber,
         sample_rate=cfg.sample_rate,
         language=language_hint,
         on_partial=on_partial,
         on_final=on_final,
     )
-    chunk_sec, interval_sec = 2.0, 1.5
-    get_chunk = getattr(capture, "get_chunk", None)
-    if not get_chunk:
+    interval_sec = 1.5
+    read_since = getattr(capture, "read_mic_since", None)
+    if not read_since:
         return
+    cursor: int | None = None
     while not stop_event.wait(timeout=interval_sec):
         try:
-            mic, _ = get_chunk(chunk_sec)
-            if mic.size >= cfg.sample_rate * int(chunk_sec) * 0.5:
-                stream.process_chunk(mic, start_offset_sec=0.0)
+            mic, total = read_since(cursor, ENGINE_MAX_BUFFER_SEC, dtype=np.float32)
+            engine.feed(mic, start_sample=total - mic.size)
+            cursor = total
+            engine.process()
         except Exception as e:
             log.warning("listen.streaming_stt.failed", error=str(e))
+    with contextlib.suppress(Exception):
+        engine.finish()
 
 
-def _live_summary_listen_worker(stop_event: threading.Event, interval_sec: int) -> None:
-    """Block 10: periodically run live summary on ring buffer and print to stdout."""
+def _live_summary_listen_worker(stop_event: threading.Event, interval_sec: int, audio_source: Any = None) -> None:
+    """Block 10: periodically run live summary on the capture buffer and print to stdout."""
     while not stop_event.wait(timeout=interval_sec):
-        lines, cost = run_live_summary_pipeline(interval_sec)
+        lines, cost = run_live_summary_pipeline(interval_sec, audio_source=audio_source)
         err_prefix = t("error.legacy_prefix").rstrip(":")
         if not lines or (len(lines) == 1 and lines[0].startswith(err_prefix)):
             continue
@@ -983,15 +1047,18 @@ def listen(
 
     ring_path = cfg.get_ring_file_path()
     Path(ring_path).parent.mkdir(parents=True, exist_ok=True)
+    streaming_stt = stream if stream is not None else cfg.streaming_stt
     capture = AudioCapture(
         sample_rate=cfg.sample_rate,
         buffer_seconds=cfg.ring_seconds,
         monitor_source=cfg.monitor_source,
+        ring_file_path=ring_path,
+        mic_float32=bool(streaming_stt),
     )
     capture.start()
+    from voiceforge.audio.source import CaptureSource
 
     stop = False
-    streaming_stt = stream if stream is not None else cfg.streaming_stt
     streaming_stop = threading.Event()
     streaming_thread: threading.Thread | None = None
     if streaming_stt:
@@ -1009,7 +1076,7 @@ def listen(
         interval_sec = getattr(cfg, "live_summary_interval_sec", 90)
         live_summary_thread = threading.Thread(
             target=_live_summary_listen_worker,
-            args=(live_summary_stop, interval_sec),
+            args=(live_summary_stop, interval_sec, CaptureSource(capture, cfg.sample_rate)),
             daemon=True,
         )
         live_summary_thread.start()
@@ -1026,12 +1093,6 @@ def listen(
     try:
         while not stop and (duration <= 0 or (time.monotonic() - started) < duration):
             time.sleep(2)
-            mic, _mon = capture.get_chunk(cfg.ring_seconds)
-            if mic.size > 0:
-                ring = Path(ring_path)
-                tmp = ring.with_suffix(".tmp")
-                tmp.write_bytes(mic.tobytes())
-                os.replace(tmp, ring)
     finally:
         streaming_stop.set()
         if streaming_thread:
@@ -1046,8 +1107,9 @@ def listen(
         capture.stop()
 
         # E9 (#132): Post-listen prompt to run analyze on full buffer
-        ring_file = Path(ring_path)
-        if ring_file.exists() and ring_file.stat().st_size > 0:
+        from voiceforge.audio.buffer import ring_file_has_audio
+
+        if ring_file_has_audio(ring_path):
             do_analyze = auto_analyze
             if not do_analyze and sys.stdin.isatty():
                 try:
@@ -1058,7 +1120,7 @@ def listen(
             if do_analyze:
                 analyze_seconds = int(cfg.ring_seconds)
                 display_text, segments_for_log, analysis_for_log = run_analyze_pipeline(
-                    analyze_seconds, template=None, dry_run=False
+                    analyze_seconds, template=None, dry_run=False, audio_source=CaptureSource(capture, cfg.sample_rate)
                 )
                 error_message = _extract_error_message(display_text)
                 if error_message is not None:
@@ -1498,26 +1560,38 @@ def action_items_export(
         typer.echo(text)
 
 
-def _index_directory(indexer: Any, p: Path, exclude_patterns: list[str] | None = None) -> tuple[int, set[str]]:
-    """Index all supported files under directory p. Block 74: skip paths matching rag_exclude_patterns."""
-    import fnmatch
+def _index_directory(
+    indexer: Any, p: Path, exclude_patterns: list[str] | None = None, workers: int | None = None
+) -> tuple[int, set[str]]:
+    """Index all supported files under directory p. Block 74: skip paths matching rag_exclude_patterns.
+    Files go through the staged ingestion pipeline (indexer.add_files); progress is reported on stderr.
+    File selection is shared with daemon IndexPaths jobs (rag.jobs.collect_files)."""
+    from voiceforge.rag.jobs import collect_files
 
-    total = 0
-    indexed_paths: set[str] = set()
-    patterns = exclude_patterns or []
-    for ext in _INDEX_EXTENSIONS:
-        for f in sorted(p.glob(f"**/*{ext}")):
-            if not f.is_file():
-                continue
-            path_str = str(f.resolve())
-            if any(fnmatch.fnmatch(path_str, pat) or fnmatch.fnmatch(f.name, pat) for pat in patterns):
-                continue
-            try:
-                total += indexer.add_file(f)
-                indexed_paths.add(path_str)
-            except Exception as e:
-                typer.echo(t("index.skip_file", path=str(f), e=str(e)), err=True)
-    return (total, indexed_paths)
+    files = collect_files(p, exclude_patterns, _INDEX_EXTENSIONS)
+    last_report = [time.monotonic()]
+
+    def on_progress(stats: Any) -> None:
+        now = time.monotonic()
+        if now - last_report[0] < 2.0 and stats.files_done < stats.files_total:
+            return
+        last_report[0] = now
+        typer.echo(
+            t(
+                "index.progress",
+                done=stats.files_done,
+                total=stats.files_total,
+                files_per_sec=f"{stats.files_per_sec:.1f}",
+                chunks_per_sec=f"{stats.chunks_per_sec:.0f}",
+            ),
+            err=True,
+        )
+
+    def on_error(path: str, error: str) -> None:
+        typer.echo(t("index.skip_file", path=path, e=error), err=True)
+
+    stats = indexer.add_files(files, workers=workers, on_progress=on_progress, on_error=on_error)
+    return (sum(stats.indexed.values()), set(stats.indexed))
 
 
 @app.command()
@@ -1539,7 +1613,7 @@ def index(
         typer.echo(t("error.rag_deps"), err=True)
         raise SystemExit(1) from None
 
-    indexer = KnowledgeIndexer(db_path)
+    indexer = KnowledgeIndexer(db_path, embed_batch_size=getattr(cfg, "rag_embed_batch_size", 64))
     try:
         if p.is_file():
             if p.suffix.lower() not in _INDEX_EXTENSIONS:
@@ -1549,7 +1623,12 @@ def index(
             typer.echo(t("index.chunks_added", n=added))
             return
         if p.is_dir():
-            total, indexed_paths = _index_directory(indexer, p, getattr(cfg, "rag_exclude_patterns", None) or [])
+            total, indexed_paths = _index_directory(
+                indexer,
+                p,
+                getattr(cfg, "rag_exclude_patterns", None) or [],
+                workers=getattr(cfg, "rag_ingest_workers", 0) or None,
+            )
             pruned = indexer.prune_sources_not_in(indexed_paths, only_under_prefix=str(p.resolve()))
             if pruned:
                 typer.echo(t("index.chunks_pruned", n=pruned))
@@ -1576,7 +1655,12 @@ def watch(
     try:
         from voiceforge.rag.watcher import KBWatcher
 
-        watcher = KBWatcher(watch_dir, Path(db_path))
+        watcher = KBWatcher(
+            watch_dir,
+            Path(db_path),
+            workers=getattr(cfg, "rag_ingest_workers", 0) or None,
+            embed_batch_size=getattr(cfg, "rag_embed_batch_size", 64),
+        )
         typer.echo(get_watch_banner(path, db_path, t))
         install_watch_stop_signal_handlers(signal, watcher.stop)
         watcher.run()
@@ -1881,10 +1965,8 @@ def weekly_report(
     from_date = to_date - timedelta(days=days)
     log_db = TranscriptLog()
     try:
-        sessions = log_db.get_sessions_in_range(from_date, to_date)
-        session_ids = {s.id for s in sessions}
-        items = log_db.get_action_items(limit=500)
-        week_items = [r for r in items if r.session_id in session_ids]
+        period = log_db.get_period_stats(from_date, to_date)
+        week_items = log_db.get_action_items_in_range(from_date, to_date)
     finally:
         log_db.close()
     try:
@@ -1897,9 +1979,10 @@ def weekly_report(
         payload = {
             "from_date": from_date.isoformat(),
             "to_date": to_date.isoformat(),
-            "sessions_count": len(sessions),
+            "sessions_count": period.sessions_count,
             "total_cost_usd": total_cost,
             "action_items_count": len(week_items),
+            "action_items_by_status": period.action_items_by_status,
             "action_items": [{"session_id": r.session_id, "description": r.description, "status": r.status} for r in week_items],
         }
         out = json.dumps(payload, ensure_ascii=False, indent=2)
@@ -1907,7 +1990,7 @@ def weekly_report(
         lines = [
             f"# Отчёт за {days} дн. ({from_date} — {to_date})",
             "",
-            f"- **Сессий:** {len(sessions)}",
+            f"- **Сессий:** {period.sessions_count}",
             f"- **Затраты (LLM):** ${total_cost:.2f}",
             f"- **Action items:** {len(week_items)}",
             "",
@@ -1920,7 +2003,7 @@ def weekly_report(
     else:
         lines = [
             f"Period: {from_date} — {to_date} ({days} days)",
-            f"Sessions: {len(sessions)}",
+            f"Sessions: {period.sessions_count}",
             f"Cost (LLM): ${total_cost:.2f}",
             f"Action items: {len(week_items)}",
             "",
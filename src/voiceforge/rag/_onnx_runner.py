@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import itertools
 from pathlib import Path
 from typing import Any
 
@@ -35,44 +36,63 @@ def load(model_dir: Path) -> tuple[Any, Any]:
     if not tokenizer_path.is_file():
         raise FileNotFoundError("tokenizer.json not in model dir or parent")
     tokenizer = Tokenizer.from_file(str(tokenizer_path))
+    tokenizer.no_padding()  # padding is per bucket in encode_batch, not the fixed length from tokenizer.json
     return session, tokenizer
 
 
-def encode_batch(
-    session: Any,
-    tokenizer: Any,
-    texts: list[str],
-    max_length: int,
-) -> np.ndarray:
-    enc = tokenizer.encode_batch(texts, add_special_tokens=True)
-    pad_len = max_length
-    ids_list: list[list[int]] = []
-    mask_list: list[list[int]] = []
-    for e in enc:
-        ids = e.ids[:pad_len]
-        mask = [1] * len(ids)
-        if len(ids) < pad_len:
-            ids = ids + [0] * (pad_len - len(ids))
-            mask = mask + [0] * (pad_len - len(mask))
-        ids_list.append(ids)
-        mask_list.append(mask)
-    input_ids = np.array(ids_list, dtype=np.int64)
-    attention_mask = np.array(mask_list, dtype=np.int64)
-    token_type_ids = np.zeros_like(input_ids, dtype=np.int64)
+def _token_arrays(encodings: list[Any], max_length: int) -> tuple[np.ndarray, np.ndarray]:
+    """Tokenizer output → (input_ids, attention_mask) int64, padded to the longest sequence (≤ max_length)."""
+    lengths = np.fromiter((len(e.ids) for e in encodings), dtype=np.int64, count=len(encodings))
+    np.minimum(lengths, max_length, out=lengths)
+    width = int(lengths.max()) if lengths.size else 0
+    mask = np.arange(width) < lengths[:, None]
+    input_ids = np.zeros((len(encodings), width), dtype=np.int64)
+    # Row-major boolean assignment fills each row's first `length` slots in order
+    input_ids[mask] = np.fromiter(
+        itertools.chain.from_iterable(e.ids[:max_length] for e in encodings), dtype=np.int64, count=int(lengths.sum())
+    )
+    return input_ids, mask.astype(np.int64)
+
+
+def _run(session: Any, input_ids: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
     feed: dict[str, np.ndarray] = {
         "input_ids": input_ids,
         "attention_mask": attention_mask,
     }
     input_names = {inp.name for inp in session.get_inputs()}
     if "token_type_ids" in input_names:
-        feed["token_type_ids"] = token_type_ids
+        feed["token_type_ids"] = np.zeros_like(input_ids)
     outputs = session.run(None, feed)
-    # Prefer sentence_embedding (batch, 384); else mean-pool token_embeddings (batch, seq, 384)
+    # Prefer sentence_embedding (batch, 384); else mean-pool token_embeddings (batch, seq, 384) over real tokens
     for o in outputs:
         if o.ndim == 2 and o.shape[1] == 384:
             return o.astype(np.float32)
     out = outputs[0]
     if out.ndim == 3:
-        # (batch, seq, 384) -> mean over seq (with attention_mask if needed)
-        out = out.mean(axis=1)
+        mask = attention_mask[:, :, None].astype(np.float32)
+        out = (out * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1.0)
     return out.astype(np.float32)
+
+
+def encode_batch(
+    session: Any,
+    tokenizer: Any,
+    texts: list[str],
+    max_length: int,
+    batch_size: int | None = None,
+) -> np.ndarray:
+    """Embed texts → (n, dim) float32 in input order. Texts are tokenized once, sorted by token length and run in
+    buckets of batch_size (default: one run), each padded only to its own longest sequence."""
+    enc = tokenizer.encode_batch(texts, add_special_tokens=True)
+    lengths = np.fromiter((len(e.ids) for e in enc), dtype=np.int64, count=len(enc))
+    order = np.argsort(-lengths, kind="stable")
+    step = max(1, batch_size or len(enc))
+    out: np.ndarray | None = None
+    for i in range(0, len(order), step):
+        bucket = order[i : i + step]
+        input_ids, attention_mask = _token_arrays([enc[j] for j in bucket], max_length)
+        emb = _run(session, input_ids, attention_mask)
+        if out is None:
+            out = np.empty((len(enc), emb.shape[1]), dtype=np.float32)
+        out[bucket] = emb
+    return out if out is not None else np.zeros((0, 0), dtype=np.float32)
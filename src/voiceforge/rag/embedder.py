@@ -34,15 +34,11 @@ class MiniLMEmbedder:
         log.info("embedder.loaded", dir=str(self._dir))
 
     def encode(self, texts: list[str], batch_size: int = 32) -> np.ndarray:
-        """Encode texts to (n, 384) float32."""
+        """Encode texts to (n, 384) float32. Batches group texts of similar token length (see _onnx_runner)."""
         if not texts:
             return np.zeros((0, EMBED_DIM), dtype=np.float32)
-        out: list[np.ndarray] = []
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
-            emb = _onnx_runner.encode_batch(self._session, self._tokenizer, batch, MAX_LENGTH)
-            out.append(emb)
-        return np.vstack(out).astype(np.float32)
+        emb = _onnx_runner.encode_batch(self._session, self._tokenizer, texts, MAX_LENGTH, batch_size=batch_size)
+        return np.asarray(emb, dtype=np.float32)
 
 
 def get_default_model_dir() -> str:
@@ -6,7 +6,7 @@ import sqlite3
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import structlog
@@ -42,11 +42,18 @@ from voiceforge.rag.parsers import (
     parse_txt,
 )
 
+if TYPE_CHECKING:
+    from voiceforge.rag.ingest import IngestStats
+
 log = structlog.get_logger()
 
 _INSERT_FTS_CHUNKS = "INSERT INTO fts_chunks(content, chunk_id) VALUES (?,?)"
+_INSERT_CHUNKS = "INSERT INTO chunks(id, source, page, chunk_index, timestamp, content, content_hash) VALUES (?,?,?,?,?,?,?)"
+_INSERT_VEC_CHUNKS = "INSERT INTO vec_chunks(rowid, embedding) VALUES (?,?)"
 CHUNK_TOKENS = 400
 CHUNK_OVERLAP_RATIO = 0.10
+EMBED_BATCH_SIZE = 64  # texts per ONNX run (MiniLMEmbedder.encode batch_size)
+_DEDUP_SCAN_ROWS = 4096  # vec_chunks rows compared per block in the dedup pass
 
 # Block 5.4: extensions and parser dispatch
 _SUPPORTED_EXTENSIONS = {
@@ -73,6 +80,25 @@ _PARSERS = {
 }
 
 
+@dataclass
+class DocumentPlan:
+    """Incremental diff of one source against the index; texts() are the chunks that need embeddings."""
+
+    source: str
+    to_add: list[NewChunk]
+    to_update: list[tuple[int, NewChunk]]
+    to_delete: list[int]
+
+    def texts(self) -> list[str]:
+        return [n.content for n in self.to_add] + [n.content for _id, n in self.to_update]
+
+
+def plan_document(cursor: sqlite3.Cursor, source: str, new_chunks: list[NewChunk]) -> DocumentPlan:
+    """Plan adds/updates/deletes for source by content_hash (read-only; any connection to the RAG DB). Block 10.3."""
+    to_add, to_update, to_delete = plan_diff(get_existing_chunks(cursor, source), new_chunks)
+    return DocumentPlan(source=source, to_add=to_add, to_update=to_update, to_delete=to_delete)
+
+
 @dataclass
 class ChunkMeta:
     source: str
@@ -124,29 +150,19 @@ def _add_texts_legacy_reindex(
     conn: sqlite3.Connection,
     source: str,
     new_chunks: list,
-    embedder: Any,
+    embed: Any,
     ts: str,
     dup_threshold: float,
 ) -> tuple[int, int, int]:
     """Backward compat: old DB without content_hash → full re-index for this source."""
+    embeddings = embed([n.content for n in new_chunks])
+    if not conn.in_transaction:
+        conn.execute("BEGIN IMMEDIATE")
     cursor.execute("SELECT id FROM chunks WHERE source = ?", (source,))
     for (cid,) in cursor.fetchall():
         incremental_delete_chunk(cursor, cid)
-    added = 0
-    for n in new_chunks:
-        emb = embedder.encode([n.content])[0]
-        if _is_duplicate_via_vec(cursor, emb, dup_threshold):
-            continue
-        cursor.execute(
-            "INSERT INTO chunks(source, page, chunk_index, timestamp, content, content_hash) VALUES (?,?,?,?,?,?)",
-            (source, n.page, n.chunk_index, ts, n.content, n.content_hash),
-        )
-        chunk_id = cursor.lastrowid
-        if chunk_id is None:
-            raise RuntimeError("Failed to get chunk id after insert")
-        _insert_vec(cursor, chunk_id, emb)
-        cursor.execute(_INSERT_FTS_CHUNKS, (n.content, chunk_id))
-        added += 1
+    keep = _dedup_keep_mask(cursor, embeddings, dup_threshold)
+    added = _insert_chunks(cursor, source, [n for n, k in zip(new_chunks, keep, strict=True) if k], embeddings[keep], ts)
     conn.commit()
     log.info(
         "incremental.full_reindex",
@@ -195,10 +211,12 @@ class KnowledgeIndexer:
         db_path: str | Path,
         model_dir: str | Path | None = None,
         cosine_dup_threshold: float = 0.95,
+        embed_batch_size: int = EMBED_BATCH_SIZE,
     ) -> None:
         self.db_path = Path(db_path)
         self.model_dir = Path(model_dir or get_default_model_dir())
         self.dup_threshold = cosine_dup_threshold
+        self.embed_batch_size = max(1, int(embed_batch_size))
         self._embedder: MiniLMEmbedder | None = None
         self._conn: sqlite3.Connection | None = None
 
@@ -215,63 +233,82 @@ class KnowledgeIndexer:
             self._embedder = MiniLMEmbedder(self.model_dir)
         return self._embedder
 
+    def _embed(self, texts: list[str]) -> np.ndarray:
+        """Embed texts in batches of embed_batch_size; (n, 384) float32."""
+        return self._get_embedder().encode(texts, batch_size=self.embed_batch_size)
+
     def _add_texts(self, source: str, sections: list[str]) -> tuple[int, int, int]:
-        """Index text sections; incremental by content_hash. Return (added, updated, deleted). Block 10.3."""
+        """Index text sections; incremental by content_hash. Return (added, updated, deleted). Block 10.3.
+        New and changed chunks are embedded together in batches; new chunks are deduplicated in one vectorized pass
+        (against each other and the index) and written with executemany in a single transaction."""
         if not sections:
             return (0, 0, 0)
         conn = self._get_conn()
-        embedder = self._get_embedder()
         cursor = conn.cursor()
         ts = datetime.now(UTC).isoformat()
         new_chunks = _sections_to_new_chunks(sections)
 
         if not has_content_hash_column(cursor):
-            return _add_texts_legacy_reindex(cursor, conn, source, new_chunks, embedder, ts, self.dup_threshold)
+            return _add_texts_legacy_reindex(cursor, conn, source, new_chunks, self._embed, ts, self.dup_threshold)
 
-        existing = get_existing_chunks(cursor, source)
-        to_add, to_update, to_delete_ids = plan_diff(existing, new_chunks)
-
-        for cid in to_delete_ids:
-            incremental_delete_chunk(cursor, cid)
-        deleted = len(to_delete_ids)
-
-        for _id, n in to_update:
-            emb = embedder.encode([n.content])[0]
-            cursor.execute(
-                "UPDATE chunks SET content = ?, content_hash = ?, timestamp = ? WHERE id = ?",
-                (n.content, n.content_hash, ts, _id),
-            )
-            cursor.execute("DELETE FROM vec_chunks WHERE rowid = ?", (_id,))
-            _insert_vec(cursor, _id, emb)
-            cursor.execute("DELETE FROM fts_chunks WHERE chunk_id = ?", (_id,))
-            cursor.execute(_INSERT_FTS_CHUNKS, (n.content, _id))
-        updated_count = len(to_update)
-
-        added = 0
-        for n in to_add:
-            emb = embedder.encode([n.content])[0]
-            if _is_duplicate_via_vec(cursor, emb, self.dup_threshold):
-                continue
-            cursor.execute(
-                "INSERT INTO chunks(source, page, chunk_index, timestamp, content, content_hash) VALUES (?,?,?,?,?,?)",
-                (source, n.page, n.chunk_index, ts, n.content, n.content_hash),
-            )
-            chunk_id = cursor.lastrowid
-            if chunk_id is None:
-                raise RuntimeError("Failed to get chunk id after insert")
-            _insert_vec(cursor, chunk_id, emb)
-            cursor.execute(_INSERT_FTS_CHUNKS, (n.content, chunk_id))
-            added += 1
+        plan = plan_document(cursor, source, new_chunks)
+        # Embed before taking the write lock: ONNX is the slow part
+        return self._write_document(plan, self._embed(plan.texts()), ts)
 
+    def _write_document(self, plan: DocumentPlan, embeddings: np.ndarray, ts: str | None = None) -> tuple[int, int, int]:
+        """Apply plan in one transaction (embeddings aligned with plan.texts()). Return (added, updated, deleted).
+        New chunks are deduplicated in one vectorized pass (against each other and the index) before executemany."""
+        conn = self._get_conn()
+        cursor = conn.cursor()
+        ts = ts or datetime.now(UTC).isoformat()
+        to_add, to_update = plan.to_add, plan.to_update
+        add_emb, update_emb = embeddings[: len(to_add)], embeddings[len(to_add) :]
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        try:
+            for cid in plan.to_delete:
+                incremental_delete_chunk(cursor, cid)
+            if to_update:
+                ids = [(_id,) for _id, _n in to_update]
+                cursor.executemany(
+                    "UPDATE chunks SET content = ?, content_hash = ?, timestamp = ? WHERE id = ?",
+                    [(n.content, n.content_hash, ts, _id) for _id, n in to_update],
+                )
+                cursor.executemany("DELETE FROM vec_chunks WHERE rowid = ?", ids)
+                cursor.executemany(
+                    _INSERT_VEC_CHUNKS, [(_id, _vec_blob(e)) for (_id, _n), e in zip(to_update, update_emb, strict=True)]
+                )
+                cursor.executemany("DELETE FROM fts_chunks WHERE chunk_id = ?", ids)
+                cursor.executemany(_INSERT_FTS_CHUNKS, [(n.content, _id) for _id, n in to_update])
+            keep = _dedup_keep_mask(cursor, add_emb, self.dup_threshold)
+            added = _insert_chunks(cursor, plan.source, [n for n, k in zip(to_add, keep, strict=True) if k], add_emb[keep], ts)
+        except Exception:
+            conn.rollback()
+            raise
         conn.commit()
         log.info(
             "incremental.diff",
-            source=source,
+            source=plan.source,
             chunks_added=added,
-            chunks_updated=updated_count,
-            chunks_deleted=deleted,
+            chunks_updated=len(to_update),
+            chunks_deleted=len(plan.to_delete),
+            chunks_duplicate=len(to_add) - added,
         )
-        return (added, updated_count, deleted)
+        return (added, len(to_update), len(plan.to_delete))
+
+    def add_files(
+        self,
+        paths: list[str | Path],
+        *,
+        workers: int | None = None,
+        on_progress: Any = None,
+        on_error: Any = None,
+    ) -> IngestStats:
+        """Index many files through the staged pipeline (parse pool → batched embedding → this writer).
+        See rag.ingest.run_ingest; returns throughput and per-source counts."""
+        from voiceforge.rag.ingest import run_ingest
+
+        return run_ingest(self, paths, workers=workers, on_progress=on_progress, on_error=on_error)
 
     def add_file(self, path: str | Path) -> int:
         """Index one file by extension (PDF, MD, HTML, DOCX, TXT). Return chunks added."""
@@ -318,23 +355,53 @@ class KnowledgeIndexer:
             self._conn = None
 
 
-def _is_duplicate_via_vec(cursor: sqlite3.Cursor, embedding: np.ndarray, threshold: float) -> bool:
-    """True if vec_chunks has a row with cosine sim >= threshold (cosine dist <= 1 - threshold)."""
-    from sqlite_vec import serialize_float32
+def _vec_blob(embedding: np.ndarray) -> bytes:
+    """sqlite-vec float32 blob (same bytes as sqlite_vec.serialize_float32)."""
+    return np.ascontiguousarray(embedding, dtype="<f4").tobytes()
+
 
-    blob = serialize_float32(embedding.astype(np.float32).tolist())
-    row = cursor.execute(
-        "SELECT distance FROM vec_chunks WHERE embedding MATCH ? AND k = 1",
-        [blob],
-    ).fetchone()
-    if row is None:
-        return False
-    dist = row[0]
-    return dist <= (1.0 - threshold)
+def _unit_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms > 0, norms, 1.0)
 
 
-def _insert_vec(cursor: sqlite3.Cursor, rowid: int, embedding: np.ndarray) -> None:
-    from sqlite_vec import serialize_float32
+def _dedup_keep_mask(cursor: sqlite3.Cursor, embeddings: np.ndarray, threshold: float) -> np.ndarray:
+    """Boolean mask of embeddings to insert: drop rows with cosine sim >= threshold to an indexed chunk or to an
+    earlier kept row of the same batch (same result as inserting one by one with a k=1 vec_chunks lookup).
+    The index is scanned once per batch in blocks instead of one vec0 query (itself a full scan) per chunk."""
+    n = len(embeddings)
+    if n == 0:
+        return np.zeros(0, dtype=bool)
+    unit = _unit_rows(np.asarray(embeddings, dtype=np.float32))
+    best = np.full(n, -1.0, dtype=np.float32)
+    rows = cursor.execute("SELECT embedding FROM vec_chunks")
+    while block := rows.fetchmany(_DEDUP_SCAN_ROWS):
+        indexed = np.frombuffer(b"".join(r[0] for r in block), dtype="<f4").reshape(len(block), -1)
+        best = np.maximum(best, (unit @ _unit_rows(indexed).T).max(axis=1))
+    keep = best < threshold
+    sims = unit @ unit.T
+    for i in range(1, n):
+        if keep[i] and (sims[i, :i][keep[:i]] >= threshold).any():
+            keep[i] = False
+    return keep
 
-    blob = serialize_float32(embedding.astype(np.float32).tolist())
-    cursor.execute("INSERT INTO vec_chunks(rowid, embedding) VALUES (?,?)", (rowid, blob))
+
+def _insert_chunks(
+    cursor: sqlite3.Cursor,
+    source: str,
+    chunks: list[NewChunk],
+    embeddings: np.ndarray,
+    ts: str,
+) -> int:
+    """Insert chunks + vectors + FTS rows with executemany; ids are assigned up front (caller holds the write lock)."""
+    if not chunks:
+        return 0
+    first_id = int(cursor.execute("SELECT COALESCE(MAX(id), 0) FROM chunks").fetchone()[0]) + 1
+    ids = range(first_id, first_id + len(chunks))
+    cursor.executemany(
+        _INSERT_CHUNKS,
+        [(cid, source, n.page, n.chunk_index, ts, n.content, n.content_hash) for cid, n in zip(ids, chunks, strict=True)],
+    )
+    cursor.executemany(_INSERT_VEC_CHUNKS, [(cid, _vec_blob(e)) for cid, e in zip(ids, embeddings, strict=True)])
+    cursor.executemany(_INSERT_FTS_CHUNKS, [(n.content, cid) for cid, n in zip(ids, chunks, strict=True)])
+    return len(chunks)
@@ -0,0 +1,269 @@
+"""Staged multi-document ingestion for `voiceforge index` / `watch`: parse pool → batched embedding → single writer.
+
+Parsing and chunking (PyMuPDF, DOCX/ODT extraction) are CPU-bound and independent per file, so they run in a
+process pool. One embedding stage batches chunks across files through the ONNX embedder, and the calling thread
+is the only SQLite writer. Stages are connected by bounded queues, so memory stays flat on large knowledge bases."""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import structlog
+
+from voiceforge.rag.incremental import NewChunk
+
+log = structlog.get_logger()
+
+INGEST_QUEUE_SIZE = 32  # documents buffered between stages (backpressure on the parse pool)
+EMBED_GROUP_CHUNKS = 256  # chunks from several documents embedded together
+_POLL_SEC = 0.2
+
+
+@dataclass
+class ParsedDocument:
+    """Output of the parse stage: chunks of one file, or the error that stopped it."""
+
+    source: str
+    chunks: list[NewChunk] = field(default_factory=list)
+    error: str | None = None
+
+
+@dataclass
+class IngestStats:
+    """Progress and throughput of one ingestion run. indexed: source → chunks added + updated; failed: source → error."""
+
+    files_total: int
+    chunks_added: int = 0
+    chunks_updated: int = 0
+    chunks_deleted: int = 0
+    chunks_embedded: int = 0
+    elapsed_sec: float = 0.0
+    indexed: dict[str, int] = field(default_factory=dict)
+    failed: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def files_done(self) -> int:
+        return len(self.indexed) + len(self.failed)
+
+    @property
+    def files_per_sec(self) -> float:
+        return self.files_done / self.elapsed_sec if self.elapsed_sec > 0 else 0.0
+
+    @property
+    def chunks_per_sec(self) -> float:
+        return self.chunks_embedded / self.elapsed_sec if self.elapsed_sec > 0 else 0.0
+
+
+def parse_document(path: str) -> ParsedDocument:
+    """Parse and chunk one file (runs in a worker process)."""
+    from voiceforge.rag.indexer import _PARSERS, _sections_to_new_chunks
+
+    parser = _PARSERS.get(Path(path).suffix.lower())
+    if parser is None:
+        return ParsedDocument(source=path, error=f"Unsupported format: {Path(path).suffix.lower()}")
+    try:
+        return ParsedDocument(source=path, chunks=_sections_to_new_chunks(parser(Path(path))))
+    except Exception as e:
+        return ParsedDocument(source=path, error=str(e))
+
+
+def _put(q: queue.Queue, item: Any, stop: threading.Event) -> bool:
+    """Blocking put that gives up when the pipeline is stopping."""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=_POLL_SEC)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _parse_stage(paths: list[str], workers: int, out: queue.Queue, stop: threading.Event) -> None:
+    """Feed parsed documents to out; at most 2 × workers files in flight in the pool. Ends with a None sentinel."""
+    try:
+        if workers <= 1:
+            for path in paths:
+                if not _put(out, parse_document(path), stop):
+                    return
+            return
+        # spawn: workers must not inherit the ONNX session / embedding threads of this process
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+            pending = iter(paths)
+            in_flight: dict[Any, str] = {}
+            while not stop.is_set():
+                for path in pending:
+                    in_flight[pool.submit(parse_document, path)] = path
+                    if len(in_flight) >= 2 * workers:
+                        break
+                if not in_flight:
+                    break
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    path = in_flight.pop(fut)
+                    try:
+                        doc = fut.result()
+                    except Exception as e:  # worker crashed (e.g. parser segfault kills the process)
+                        doc = ParsedDocument(source=path, error=str(e))
+                    if not _put(out, doc, stop):
+                        return
+            if stop.is_set():
+                for fut in in_flight:
+                    fut.cancel()
+    finally:
+        _put(out, None, stop)
+
+
+def _embed_stage(
+    indexer: Any,
+    inbox: queue.Queue,
+    out: queue.Queue,
+    stop: threading.Event,
+    errors: list[BaseException],
+) -> None:
+    """Plan each document against the index, embed chunks of several documents per ONNX call, pass on to the writer."""
+    from voiceforge.rag.indexer import plan_document
+
+    reader = sqlite3.connect(str(indexer.db_path))
+    group: list[Any] = []
+    group_chunks = 0
+
+    def flush() -> bool:
+        nonlocal group, group_chunks
+        plans = [p for p in group if not isinstance(p, ParsedDocument)]
+        texts = [t for p in plans for t in p.texts()]
+        embeddings = indexer._embed(texts) if texts else np.zeros((0, 0), dtype=np.float32)
+        offset = 0
+        for item in group:
+            if isinstance(item, ParsedDocument):  # parse error, forwarded as is
+                ok = _put(out, (item, None), stop)
+            else:
+                n = len(item.texts())
+                ok = _put(out, (item, embeddings[offset : offset + n]), stop)
+                offset += n
+            if not ok:
+                return False
+        group, group_chunks = [], 0
+        return True
+
+    try:
+        while not stop.is_set():
+            try:
+                doc = inbox.get(timeout=_POLL_SEC)
+            except queue.Empty:
+                if group and not flush():
+                    return
+                continue
+            if doc is None:
+                break
+            if doc.error is not None:
+                group.append(doc)
+            else:
+                plan = plan_document(reader.cursor(), doc.source, doc.chunks)
+                group.append(plan)
+                group_chunks += len(plan.texts())
+            if group_chunks >= EMBED_GROUP_CHUNKS or inbox.empty():
+                if not flush():
+                    return
+        if group:
+            flush()
+    except BaseException as e:
+        errors.append(e)
+        stop.set()
+    finally:
+        reader.close()
+        _put(out, None, stop)
+
+
+def run_ingest(
+    indexer: Any,
+    paths: list[str | Path],
+    *,
+    workers: int | None = None,
+    queue_size: int = INGEST_QUEUE_SIZE,
+    on_progress: Any = None,
+    on_error: Any = None,
+) -> IngestStats:
+    """Index paths with indexer (KnowledgeIndexer): parse pool → batched embedding → single writer (this thread).
+    workers: parse processes (default: CPU count). on_progress(stats) after each written file;
+    on_error(source, message) for files that could not be parsed or written (they are skipped)."""
+    sources = list(dict.fromkeys(str(Path(p).resolve()) for p in paths))
+    stats = IngestStats(files_total=len(sources))
+    if not sources:
+        return stats
+    workers = max(1, min(workers or os.cpu_count() or 1, len(sources)))
+    indexer._get_conn()  # schema/migrations before the embedding stage opens its reader
+    stop = threading.Event()
+    errors: list[BaseException] = []
+    parsed: queue.Queue = queue.Queue(maxsize=queue_size)
+    embedded: queue.Queue = queue.Queue(maxsize=queue_size)
+    stages = [
+        threading.Thread(target=_parse_stage, args=(sources, workers, parsed, stop), daemon=True),
+        threading.Thread(target=_embed_stage, args=(indexer, parsed, embedded, stop, errors), daemon=True),
+    ]
+    started = time.monotonic()
+    for t in stages:
+        t.start()
+
+    def fail(source: str, message: str) -> None:
+        stats.failed[source] = message
+        if on_error is not None:
+            on_error(source, message)
+
+    try:
+        while True:
+            try:
+                item = embedded.get(timeout=_POLL_SEC)
+            except queue.Empty:
+                if stop.is_set():
+                    break
+                continue
+            if item is None:
+                break
+            doc, embeddings = item
+            if isinstance(doc, ParsedDocument):
+                fail(doc.source, doc.error or "parse failed")
+            else:
+                try:
+                    added, updated, deleted = indexer._write_document(doc, embeddings)
+                except Exception as e:
+                    fail(doc.source, str(e))
+                else:
+                    stats.indexed[doc.source] = added + updated
+                    stats.chunks_added += added
+                    stats.chunks_updated += updated
+                    stats.chunks_deleted += deleted
+                    stats.chunks_embedded += len(embeddings)
+            stats.elapsed_sec = time.monotonic() - started
+            if on_progress is not None:
+                on_progress(stats)
+    finally:
+        stop.set()
+        for t in stages:
+            t.join(timeout=30)
+    if errors:
+        raise errors[0]
+    stats.elapsed_sec = time.monotonic() - started
+    log.info(
+        "rag.ingest.done",
+        files=stats.files_total,
+        files_failed=len(stats.failed),
+        workers=workers,
+        chunks_added=stats.chunks_added,
+        chunks_updated=stats.chunks_updated,
+        chunks_deleted=stats.chunks_deleted,
+        elapsed_sec=round(stats.elapsed_sec, 2),
+        files_per_sec=round(stats.files_per_sec, 2),
+        chunks_per_sec=round(stats.chunks_per_sec, 1),
+    )
+    return stats
@@ -0,0 +1,228 @@
+"""In-process indexing jobs for the daemon (D-Bus IndexPaths): queue → warm KnowledgeIndexer → staged ingestion.
+
+IndexPaths used to run `voiceforge index <path>` as a subprocess per path (interpreter start-up, cold ONNX session,
+D-Bus call blocked until done). Here paths are queued as a job and the call returns its id at once. Worker threads
+keep one KnowledgeIndexer (and its embedder) across jobs; paths already waiting in a queued job are coalesced into
+it. At most max_concurrent jobs run, each with a small parse pool, so indexing does not starve live STT."""
+
+from __future__ import annotations
+
+import fnmatch
+import itertools
+import queue
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Collection
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+log = structlog.get_logger()
+
+INDEX_JOB_WORKERS = 2  # parse processes per job (daemon shares the CPU with STT)
+INDEX_JOB_HISTORY = 32  # finished jobs kept for GetIndexJobStatus
+PROGRESS_INTERVAL_SEC = 1.0  # min time between progress updates of one job
+
+_job_ids = itertools.count(1)
+
+
+@dataclass
+class IndexJob:
+    """One IndexPaths request. state: queued | running | done | failed."""
+
+    job_id: str
+    paths: list[str]
+    state: str = "queued"
+    files_total: int = 0
+    files_done: int = 0
+    chunks_added: int = 0
+    chunks_updated: int = 0
+    chunks_pruned: int = 0
+    errors: list[str] = field(default_factory=list)
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def collect_files(root: Path, exclude_patterns: list[str] | None = None, extensions: Collection[str] | None = None) -> list[Path]:
+    """Supported files under root (or root itself), minus rag_exclude_patterns matches (full path or name).
+    Shared by IndexPaths jobs and `voiceforge index <dir>`; extensions defaults to the indexer's parser table."""
+    if extensions is None:
+        from voiceforge.rag.indexer import _SUPPORTED_EXTENSIONS as default_extensions
+
+        extensions = default_extensions
+
+    if root.is_file():
+        candidates = [root] if root.suffix.lower() in extensions else []
+    else:
+        candidates = [f for f in sorted(root.glob("**/*")) if f.is_file() and f.suffix.lower() in extensions]
+    patterns = exclude_patterns or []
+    return [
+        f
+        for f in candidates
+        if not any(fnmatch.fnmatch(str(f.resolve()), pat) or fnmatch.fnmatch(f.name, pat) for pat in patterns)
+    ]
+
+
+class IndexJobQueue:
+    """Background indexing jobs. indexer_factory builds the KnowledgeIndexer once per worker thread (kept warm);
+    on_update(job) is called on state changes and at most every PROGRESS_INTERVAL_SEC while a job runs."""
+
+    def __init__(
+        self,
+        indexer_factory: Callable[[], Any],
+        *,
+        workers: int = INDEX_JOB_WORKERS,
+        max_concurrent: int = 1,
+        exclude_patterns: list[str] | None = None,
+        on_update: Callable[[IndexJob], None] | None = None,
+        history: int = INDEX_JOB_HISTORY,
+    ) -> None:
+        self._indexer_factory = indexer_factory
+        self._workers = max(1, int(workers))
+        self._max_concurrent = max(1, int(max_concurrent))
+        self._exclude_patterns = list(exclude_patterns or [])
+        self._on_update = on_update
+        self._history = max(1, int(history))
+        self._lock = threading.Lock()
+        self._jobs: OrderedDict[str, IndexJob] = OrderedDict()
+        self._queued_paths: dict[str, str] = {}  # path → id of the queued job that will index it
+        self._queue: queue.Queue[IndexJob | None] = queue.Queue()
+        self._threads: list[threading.Thread] = []
+
+    def submit(self, paths: list[str | Path]) -> IndexJob:
+        """Queue paths (files or directories); returns the job that will index them. Paths already waiting in a
+        queued job are coalesced into it; if nothing is left, that job is returned instead of a new one."""
+        resolved = list(dict.fromkeys(str(Path(p).resolve()) for p in paths))
+        with self._lock:
+            fresh = [p for p in resolved if p not in self._queued_paths]
+            if not fresh and resolved:
+                return self._jobs[self._queued_paths[resolved[0]]]
+            job = IndexJob(job_id=str(next(_job_ids)), paths=fresh)
+            for p in fresh:
+                self._queued_paths[p] = job.job_id
+            self._jobs[job.job_id] = job
+            self._trim_history()
+            self._ensure_workers()
+        if len(fresh) < len(resolved):
+            log.info("rag.index_job.coalesced", job_id=job.job_id, coalesced=len(resolved) - len(fresh))
+        self._queue.put(job)
+        self._notify(job)
+        return job
+
+    def get(self, job_id: str) -> IndexJob | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self) -> list[IndexJob]:
+        """Queued, running and recently finished jobs, oldest first."""
+        with self._lock:
+            return list(self._jobs.values())
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Let running jobs finish their current file batch and stop the worker threads."""
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._queue.put(None)
+        for t in threads:
+            t.join(timeout=timeout)
+
+    def _trim_history(self) -> None:
+        finished = [j.job_id for j in self._jobs.values() if j.state in ("done", "failed")]
+        for job_id in finished[: max(0, len(finished) - self._history)]:
+            del self._jobs[job_id]
+
+    def _ensure_workers(self) -> None:
+        self._threads = [t for t in self._threads if t.is_alive()]
+        while len(self._threads) < self._max_concurrent:
+            t = threading.Thread(target=self._worker, name=f"index-job-{len(self._threads)}", daemon=True)
+            self._threads.append(t)
+            t.start()
+
+    def _notify(self, job: IndexJob) -> None:
+        if self._on_update is None:
+            return
+        try:
+            self._on_update(job)
+        except Exception as e:
+            log.debug("rag.index_job.notify_failed", error=str(e))
+
+    def _worker(self) -> None:
+        indexer: Any = None
+        try:
+            while True:
+                job = self._queue.get()
+                if job is None:
+                    return
+                with self._lock:
+                    for p in job.paths:
+                        if self._queued_paths.get(p) == job.job_id:
+                            del self._queued_paths[p]
+                    job.state = "running"
+                    job.started_at = time.time()
+                self._notify(job)
+                try:
+                    if indexer is None:
+                        indexer = self._indexer_factory()
+                    self._run(indexer, job)
+                    job.state = "done"
+                except Exception as e:
+                    job.errors.append(str(e))
+                    job.state = "failed"
+                    log.warning("rag.index_job.failed", job_id=job.job_id, error=str(e))
+                job.finished_at = time.time()
+                log.info(
+                    "rag.index_job.finished",
+                    job_id=job.job_id,
+                    state=job.state,
+                    files=job.files_done,
+                    chunks_added=job.chunks_added,
+                    chunks_updated=job.chunks_updated,
+                    errors=len(job.errors),
+                    elapsed_sec=round(job.finished_at - (job.started_at or job.finished_at), 2),
+                )
+                self._notify(job)
+        finally:
+            if indexer is not None:
+                indexer.close()
+
+    def _run(self, indexer: Any, job: IndexJob) -> None:
+        """Index all files of the job in one staged ingestion run, then prune deleted files under each directory."""
+        files: list[Path] = []
+        for p in job.paths:
+            root = Path(p)
+            if not root.exists():
+                job.errors.append(f"not found: {root}")
+                continue
+            found = collect_files(root, self._exclude_patterns)
+            if root.is_file() and not found:
+                job.errors.append(f"unsupported format: {root}")
+            files.extend(found)
+        job.files_total = len(files)
+        last_update = [time.monotonic()]
+
+        def on_progress(stats: Any) -> None:
+            job.files_done = stats.files_done
+            job.chunks_added = stats.chunks_added
+            job.chunks_updated = stats.chunks_updated
+            now = time.monotonic()
+            if now - last_update[0] >= PROGRESS_INTERVAL_SEC:
+                last_update[0] = now
+                self._notify(job)
+
+        def on_error(source: str, message: str) -> None:
+            job.errors.append(f"{source}: {message}"[:200])
+
+        stats = indexer.add_files(files, workers=self._workers, on_progress=on_progress, on_error=on_error)
+        job.files_done = stats.files_done
+        indexed = set(stats.indexed)
+        for p in job.paths:
+            if Path(p).is_dir():
+                job.chunks_pruned += indexer.prune_sources_not_in(indexed, only_under_prefix=p)
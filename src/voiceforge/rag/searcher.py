@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 
 import numpy as np
@@ -18,6 +20,7 @@ from voiceforge.rag.embedder import MiniLMEmbedder, get_default_model_dir
 log = structlog.get_logger()
 
 RRF_K = 60
+QUERY_CACHE_SIZE = 256  # query embeddings kept across searches (copilot captures repeat keywords)
 
 
 def _sanitize_fts5_query(query: str) -> str:
@@ -54,22 +57,32 @@ def _reciprocal_rank_fusion(
     return sorted(scores.items(), key=lambda x: -x[1])
 
 
+def _normalize_query(query: str) -> str:
+    """Cache key for a query: case- and whitespace-insensitive (MiniLM is uncased)."""
+    return " ".join(query.lower().split())
+
+
 class HybridSearcher:
-    """BM25 (FTS5) + cosine (sqlite-vec), RRF fusion."""
+    """BM25 (FTS5) + cosine (sqlite-vec), RRF fusion. Query embeddings are kept in an LRU cache."""
 
     def __init__(
         self,
         db_path: str,
         model_dir: str | None = None,
+        query_cache_size: int = QUERY_CACHE_SIZE,
     ) -> None:
         self.db_path = db_path
         self.model_dir = model_dir or get_default_model_dir()
         self._conn: sqlite3.Connection | None = None
         self._embedder: MiniLMEmbedder | None = None
+        # Process-scoped (core.pipeline cache): used from pipeline workers and the D-Bus thread
+        self._lock = threading.Lock()
+        self._query_cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._query_cache_size = query_cache_size
 
     def _get_conn(self) -> sqlite3.Connection:
         if self._conn is None:
-            self._conn = sqlite3.connect(self.db_path)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
             if sqlite_vec:
                 self._conn.enable_load_extension(True)
                 sqlite_vec.load(self._conn)
@@ -81,38 +94,43 @@ class HybridSearcher:
             self._embedder = MiniLMEmbedder(self.model_dir)
         return self._embedder
 
-    def search(self, query: str, top_k: int = 5) -> list[SearchResult]:
-        """Hybrid search: FTS5 + vec, RRF; return top_k SearchResults."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        # FTS5: phrase search, get chunk_id and bm25 score
-        fts_ids: list[tuple[int, float]] = []
+    def _embed_queries(self, queries: list[str]) -> list[np.ndarray]:
+        """Embeddings for queries (same order): cached ones from the LRU, the rest in one encode call."""
+        keys = [_normalize_query(q) for q in queries]
+        found: dict[str, np.ndarray] = {}
+        for key in keys:
+            emb = self._query_cache.get(key)
+            if emb is not None:
+                self._query_cache.move_to_end(key)
+                found[key] = emb
+        missing = [k for k in dict.fromkeys(keys) if k not in found]
+        if missing:
+            embeddings = self._get_embedder().encode(missing, batch_size=len(missing))
+            for key, emb in zip(missing, embeddings, strict=True):
+                found[key] = self._query_cache[key] = emb.astype(np.float32)
+            while len(self._query_cache) > self._query_cache_size:
+                self._query_cache.popitem(last=False)
+        return [found[k] for k in keys]
+
+    def _fts_ranked(self, cursor: sqlite3.Cursor, query: str, limit: int) -> list[tuple[int, float]]:
+        """FTS5 phrase search: (chunk_id, bm25) best first."""
+        fts_sql = "SELECT chunk_id, bm25(fts_chunks) FROM fts_chunks WHERE fts_chunks MATCH ? ORDER BY bm25(fts_chunks) LIMIT ?"
         try:
-            fts_sql = (
-                "SELECT chunk_id, bm25(fts_chunks) FROM fts_chunks WHERE fts_chunks MATCH ? ORDER BY bm25(fts_chunks) LIMIT ?"
-            )
-            for row in cursor.execute(fts_sql, (_sanitize_fts5_query(query), top_k * 3)):
-                fts_ids.append((row[0], row[1]))
+            return [(row[0], row[1]) for row in cursor.execute(fts_sql, (_sanitize_fts5_query(query), limit))]
         except sqlite3.OperationalError as e:
             log.warning("rag.fts_fallback_to_vector", error=str(e))
-        # Vec: embed query, k-NN
-        vec_ids: list[tuple[int, float]] = []
-        if sqlite_vec:
-            embedder = self._get_embedder()
-            q_emb = embedder.encode([query])[0]
-            from sqlite_vec import serialize_float32
-
-            blob = serialize_float32(q_emb.astype(np.float32).tolist())
-            k_vec = top_k * 3
-            vec_sql = "SELECT rowid, distance FROM vec_chunks WHERE embedding MATCH ? AND k = ? ORDER BY distance"
-            for row in cursor.execute(vec_sql, [blob, k_vec]):
-                vec_ids.append((row[0], row[1]))
-        # RRF
-        merged = _reciprocal_rank_fusion(fts_ids, vec_ids, k=RRF_K)[:top_k]
+            return []
+
+    def _vec_ranked(self, cursor: sqlite3.Cursor, q_emb: np.ndarray, limit: int) -> list[tuple[int, float]]:
+        """k-NN over vec_chunks: (rowid, distance) nearest first."""
+        vec_sql = "SELECT rowid, distance FROM vec_chunks WHERE embedding MATCH ? AND k = ? ORDER BY distance"
+        return [(row[0], row[1]) for row in cursor.execute(vec_sql, [q_emb.astype(np.float32).tobytes(), limit])]
+
+    def _fetch_results(self, cursor: sqlite3.Cursor, merged: list[tuple[int, float]]) -> list[SearchResult]:
+        """Load chunk rows for (chunk_id, score) pairs in one query; keeps the given order."""
         if not merged:
             return []
-        ids = [m[0] for m in merged]
-        ids_json = "[" + ",".join(str(int(i)) for i in ids) + "]"
+        ids_json = "[" + ",".join(str(int(cid)) for cid, _ in merged) + "]"
         cursor.execute(
             "SELECT id, content, source, page, chunk_index, timestamp FROM chunks WHERE id IN (SELECT value FROM json_each(?))",
             (ids_json,),
@@ -136,7 +154,35 @@ class HybridSearcher:
             )
         return results
 
+    def _fused_many(self, queries: list[str], top_k: int) -> list[tuple[int, float]]:
+        """Per-query RRF top_k, merged across queries by chunk_id (higher score wins), best first."""
+        cursor = self._get_conn().cursor()
+        embeddings = self._embed_queries(queries) if sqlite_vec else [None] * len(queries)
+        best: dict[int, float] = {}
+        for query, q_emb in zip(queries, embeddings, strict=True):
+            fts_ids = self._fts_ranked(cursor, query, top_k * 3)
+            vec_ids = self._vec_ranked(cursor, q_emb, top_k * 3) if q_emb is not None else []
+            for cid, score in _reciprocal_rank_fusion(fts_ids, vec_ids, k=RRF_K)[:top_k]:
+                if score > best.get(cid, float("-inf")):
+                    best[cid] = score
+        return sorted(best.items(), key=lambda x: -x[1])
+
+    def search(self, query: str, top_k: int = 5) -> list[SearchResult]:
+        """Hybrid search: FTS5 + vec, RRF; return top_k SearchResults."""
+        with self._lock:
+            return self._fetch_results(self._get_conn().cursor(), self._fused_many([query], top_k))
+
+    def search_many(self, queries: list[str], top_k: int = 5) -> list[SearchResult]:
+        """Hybrid search for several queries: one embedding batch (uncached queries only), FTS/vec lookups per
+        query on one cursor, per-query RRF top_k merged by chunk_id (higher score wins). Best first."""
+        queries = [q.strip() for q in queries if q and q.strip()]
+        if not queries:
+            return []
+        with self._lock:
+            return self._fetch_results(self._get_conn().cursor(), self._fused_many(queries, top_k))
+
     def close(self) -> None:
-        if self._conn:
-            self._conn.close()
-            self._conn = None
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
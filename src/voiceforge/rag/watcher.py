@@ -1,4 +1,5 @@
-"""KB watcher: auto-index PDFs on create/modify. Debounce 3 sec, SHA-256 dedup."""
+"""KB watcher: auto-index PDFs on create/modify. Debounce 3 sec, SHA-256 dedup.
+Several files due in the same tick are indexed together through the staged pipeline (rag.ingest)."""
 
 from __future__ import annotations
 
@@ -8,6 +9,7 @@ import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 import structlog
 
@@ -50,11 +52,15 @@ class KBWatcher:
         db_path: Path,
         poll_interval: float = 5.0,
         debounce_sec: float = DEBOUNCE_SEC,
+        workers: int | None = None,
+        embed_batch_size: int | None = None,
     ) -> None:
         self.watch_dir = Path(watch_dir).resolve()
         self.db_path = Path(db_path)
         self.poll_interval = poll_interval
         self.debounce_sec = debounce_sec
+        self.workers = workers
+        self.embed_batch_size = embed_batch_size  # rag_embed_batch_size; None = indexer default
         self._pending: dict[str, float] = {}
         self._lock = threading.Lock()
         self._stop = threading.Event()
@@ -87,9 +93,74 @@ class KBWatcher:
                     to_process.append(path)
                     del self._pending[path]
 
+        if len(to_process) <= 1:
+            return [self._index_if_needed(Path(path_str)) for path_str in to_process]
+        return self._index_many([Path(path_str) for path_str in to_process])
+
+    def _open_indexer(self) -> Any:
+        from voiceforge.rag.indexer import KnowledgeIndexer
+
+        if self.embed_batch_size is None:
+            return KnowledgeIndexer(self.db_path)
+        return KnowledgeIndexer(self.db_path, embed_batch_size=self.embed_batch_size)
+
+    def _index_many(self, paths: list[Path]) -> list[WatchIndexResult]:
+        """Several debounced files (e.g. a folder copied in): SHA-256 dedup, then one staged ingestion run."""
         results: list[WatchIndexResult] = []
-        for path_str in to_process:
-            results.append(self._index_if_needed(Path(path_str)))
+        changed: dict[str, str] = {}
+        conn = sqlite3.connect(str(self.db_path))
+        try:
+            _ensure_indexed_table(conn)
+            for path in paths:
+                resolved = self._normalize_pdf_path(path)
+                path_str = str(Path(path).resolve())
+                if resolved is None:
+                    results.append(WatchIndexResult(path=path_str, status="ignored", reason="not_a_pdf"))
+                    continue
+                try:
+                    sha = _file_sha256(resolved)
+                except OSError as e:
+                    log.error("watcher.sha256_failed", path=path_str, error=str(e))
+                    results.append(WatchIndexResult(path=path_str, status="sha256_failed", reason=str(e)))
+                    continue
+                row = conn.execute("SELECT sha256 FROM indexed_files WHERE path = ?", (path_str,)).fetchone()
+                if row and row[0] == sha:
+                    log.info("watcher.skipped", path=path_str, reason="unchanged")
+                    results.append(WatchIndexResult(path=path_str, status="skipped", sha256=sha, reason="unchanged"))
+                    continue
+                changed[path_str] = sha
+        finally:
+            conn.close()
+        if not changed:
+            return results
+
+        try:
+            indexer = self._open_indexer()
+            try:
+                stats = indexer.add_files(list(changed), workers=self.workers)
+            finally:
+                indexer.close()
+        except Exception as e:
+            log.error("watcher.error", paths=len(changed), error=str(e))
+            return results + [WatchIndexResult(path=p, status="error", sha256=sha, reason=str(e)) for p, sha in changed.items()]
+
+        conn = sqlite3.connect(str(self.db_path))
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO indexed_files(path, sha256) VALUES (?,?)",
+                [(p, changed[p]) for p in stats.indexed],
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        for path_str, sha in changed.items():
+            if path_str in stats.indexed:
+                log.info("watcher.indexed", path=path_str, added=stats.indexed[path_str])
+                results.append(WatchIndexResult(path=path_str, status="indexed", sha256=sha, added=stats.indexed[path_str]))
+            else:
+                reason = stats.failed.get(path_str, "not indexed")
+                log.error("watcher.error", path=path_str, error=reason)
+                results.append(WatchIndexResult(path=path_str, status="error", sha256=sha, reason=reason))
         return results
 
     def _index_if_needed(self, path: Path) -> WatchIndexResult:
@@ -112,9 +183,7 @@ class KBWatcher:
             return WatchIndexResult(path=path_str, status="skipped", sha256=sha, reason="unchanged")
 
         try:
-            from voiceforge.rag.indexer import KnowledgeIndexer
-
-            indexer = KnowledgeIndexer(self.db_path)
+            indexer = self._open_indexer()
             added = indexer.add_pdf(resolved)
             indexer.close()
             conn.execute(
@@ -1,4 +1,5 @@
-"""Speaker diarization via pyannote.audio (3.x/4.x compatible loading)."""
+"""Speaker diarization via pyannote.audio (3.x/4.x compatible loading).
+Windows are diarized independently; SpeakerLinker maps window-local speakers to session-wide labels."""
 
 from __future__ import annotations
 
@@ -84,11 +85,14 @@ import psutil
 import structlog
 from pyannote.audio import Pipeline
 
+from voiceforge.stt.speaker_linker import SpeakerLinker
+
 log = structlog.get_logger()
 
 WINDOW_SEC = 30.0
 RSS_GUARD_BYTES = 5 * 1024**3
 DEFAULT_MODEL = "pyannote/speaker-diarization-3.0"
+_EMBED_MAX_SEC = 10.0  # audio per local speaker when the pipeline returns no embeddings
 
 
 @dataclass
@@ -100,6 +104,19 @@ class DiarSegment:
     speaker: str
 
 
+def _as_embedding_matrix(value: Any, rows: int) -> np.ndarray | None:
+    """(rows, dim) float32 matrix or None if value is not a usable embedding array."""
+    if value is None:
+        return None
+    try:
+        arr = np.asarray(value, dtype=np.float32)
+    except (TypeError, ValueError):
+        return None
+    if arr.ndim != 2 or arr.shape[0] < rows or arr.shape[1] == 0:
+        return None
+    return arr[:rows]
+
+
 class Diarizer:
     """Wrapper around pyannote.audio Pipeline. Call AFTER STT, not in parallel."""
 
@@ -154,19 +171,76 @@ class Diarizer:
             log.warning("diarizer.high_rss", rss_gb=round(rss / 1024**3, 2))
             gc.collect()
 
+    def _embed_local_speakers(
+        self,
+        pipeline: Pipeline,
+        chunk: np.ndarray,
+        sample_rate: int,
+        tracks: list[tuple[float, float, str]],
+        labels: list[str],
+    ) -> np.ndarray | None:
+        """Fallback when the pipeline output has no speaker_embeddings: one embedding per local speaker
+        from up to _EMBED_MAX_SEC of its speech, via the pipeline's own embedding model."""
+        embedding = getattr(pipeline, "_embedding", None)
+        if not callable(embedding):
+            return None
+        max_samples = int(_EMBED_MAX_SEC * sample_rate)
+        rows: list[np.ndarray] = []
+        try:
+            for label in labels:
+                parts = [chunk[int(s * sample_rate) : int(e * sample_rate)] for s, e, lab in tracks if lab == label]
+                audio = np.concatenate(parts)[:max_samples] if parts else np.empty(0, dtype=np.float32)
+                if audio.size == 0:
+                    return None
+                with torch.no_grad():
+                    emb = embedding(torch.from_numpy(np.ascontiguousarray(audio)).reshape(1, 1, -1))
+                rows.append(np.asarray(emb, dtype=np.float32).reshape(-1))
+        except Exception as e:
+            log.debug("diarizer.embedding_failed", error=str(e))
+            return None
+        return _as_embedding_matrix(np.stack(rows), len(labels)) if rows else None
+
+    def _link_window(
+        self,
+        pipeline: Pipeline,
+        diar: Any,
+        chunk: np.ndarray,
+        sample_rate: int,
+        tracks: list[tuple[float, float, str]],
+        linker: SpeakerLinker,
+    ) -> dict[str, str] | None:
+        """Map this window's local labels to session labels, or None when no embeddings are available."""
+        annotation = getattr(diar, "speaker_diarization", diar)
+        labels_fn = getattr(annotation, "labels", None)
+        labels = list(labels_fn()) if callable(labels_fn) else []
+        if not labels or any(lab not in labels for _, _, lab in tracks):
+            labels = sorted({lab for _, _, lab in tracks})
+        embeddings = _as_embedding_matrix(getattr(diar, "speaker_embeddings", None), len(labels))
+        if embeddings is None:
+            embeddings = self._embed_local_speakers(pipeline, chunk, sample_rate, tracks, labels)
+        if embeddings is None:
+            return None
+        durations = [sum(e - s for s, e, lab in tracks if lab == label) for label in labels]
+        return dict(zip(labels, linker.link(embeddings, durations, labels), strict=True))
+
     def diarize(
         self,
         audio: np.ndarray,
         sample_rate: int = 16000,
+        linker: SpeakerLinker | None = None,
     ) -> list[DiarSegment]:
-        """Diarize audio in 30s windows. Returns list of DiarSegment."""
+        """Diarize audio in 30s windows. Returns list of DiarSegment with session-wide speaker labels.
+        linker: pass the same SpeakerLinker across calls to keep labels stable for a whole session."""
         if audio.dtype == np.int16:
             audio_f = audio.astype(np.float32) / 32768.0
         else:
             audio_f = audio.astype(np.float32)
 
+        if linker is None:
+            linker = SpeakerLinker()
         duration_sec = len(audio_f) / sample_rate
         out: list[DiarSegment] = []
+        unlinked_windows = 0
         pipeline = self._get_pipeline()
         # (channel, time) for waveform input
         step = WINDOW_SEC
@@ -192,16 +266,30 @@ class Diarizer:
             itertracks = getattr(annotation, "itertracks", None)
             if not callable(itertracks):
                 raise TypeError(f"Unsupported diarization output: {type(diar).__name__}")
-            for segment, _, speaker in itertracks(yield_label=True):
+            tracks = [(segment.start, segment.end, speaker) for segment, _, speaker in itertracks(yield_label=True)]
+            mapping = self._link_window(pipeline, diar, chunk, sample_rate, tracks, linker) if tracks else {}
+            if mapping is None:
+                # No embeddings: labels cannot be linked; reuse each local label's last session label
+                unlinked_windows += 1
+                local = list(dict.fromkeys(lab for _, _, lab in tracks))
+                mapping = dict(zip(local, linker.map_unlinked(local), strict=True))
+            for start, end, speaker in tracks:
                 out.append(
                     DiarSegment(
-                        start=segment.start + t,
-                        end=segment.end + t,
-                        speaker=speaker,
+                        start=start + t,
+                        end=end + t,
+                        speaker=mapping.get(speaker, speaker),
                     )
                 )
             t = t_end
 
         self._memory_guard()
-        log.info("diarize.done", segments=len(out), duration_sec=round(duration_sec, 1))
+        if unlinked_windows:
+            log.warning("diarize.unlinked_windows", windows=unlinked_windows, hint="no speaker embeddings; local labels reused")
+        log.info(
+            "diarize.done",
+            segments=len(out),
+            speakers=linker.num_speakers,
+            duration_sec=round(duration_sec, 1),
+        )
         return out
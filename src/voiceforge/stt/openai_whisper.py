@@ -69,8 +69,10 @@ class OpenAIWhisperTranscriber:
         beam_size: int = 1,  # NOSONAR keep for Transcriber interface
         vad_filter: bool = True,  # NOSONAR
         vad_parameters: dict | None = None,  # NOSONAR
+        word_timestamps: bool = False,  # NOSONAR
+        initial_prompt: str | None = None,  # NOSONAR
     ) -> list[Segment]:
-        """Send audio to OpenAI Whisper API; return list of Segment. Ignores beam_size/vad_*."""
+        """Send audio to OpenAI Whisper API; return list of Segment. Ignores beam_size/vad_*/word_timestamps/initial_prompt."""
         from voiceforge.core.secrets import get_api_key
 
         api_key = get_api_key("openai")
@@ -0,0 +1,118 @@
+"""Speaker attribution: join transcript segments with diarization turns by time.
+
+Each interval gets the speaker of the diarization turn it overlaps most (ties: the earliest turn; no overlap: "").
+Turns are sorted once and candidates are found with searchsorted over turn starts and the running maximum of turn
+ends (pyannote turns may overlap), so attributing S segments against D turns costs O((S + D) log D + K) for K
+candidate (segment, turn) pairs, about S + D for diarization output, instead of a Python scan of all turns per
+segment. A segment with word timestamps that spans a speaker change is split at the change."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+
+@dataclass
+class AttributedSegment:
+    """Transcript text attributed to one speaker (a whole STT segment or a run of its words)."""
+
+    start: float
+    end: float
+    speaker: str
+    text: str
+
+
+class SpeakerTimeline:
+    """Diarization turns sorted for interval queries. Turns are objects with start, end and speaker."""
+
+    def __init__(self, turns: Sequence[Any]) -> None:
+        starts = np.fromiter((getattr(d, "start", 0.0) for d in turns), dtype=np.float64, count=len(turns))
+        ends = np.fromiter((getattr(d, "end", 0.0) for d in turns), dtype=np.float64, count=len(turns))
+        order = np.argsort(starts, kind="stable")
+        self._starts = starts[order]
+        self._ends = ends[order]
+        self._max_end = np.maximum.accumulate(self._ends) if len(turns) else self._ends
+        labels = [getattr(turns[i], "speaker", "") or "" for i in order.tolist()]
+        self._labels = np.array([*labels, ""], dtype=object)  # last slot: "no overlap"
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def assign(self, starts: Any, ends: Any) -> list[str]:
+        """Speaker of the maximum-overlap turn for each interval (starts[i], ends[i])."""
+        q_start = np.asarray(starts, dtype=np.float64).reshape(-1)
+        q_end = np.asarray(ends, dtype=np.float64).reshape(-1)
+        n = len(q_start)
+        best = np.full(n, len(self._starts), dtype=np.intp)
+        if n == 0 or len(self._starts) == 0:
+            return self._labels[best].tolist()
+        # Candidates for interval i are turns lo[i]..hi[i]-1: earlier turns all end by q_start (running max of ends),
+        # later ones start at or after q_end.
+        lo = np.searchsorted(self._max_end, q_start, side="right")
+        hi = np.searchsorted(self._starts, q_end, side="left")
+        counts = np.maximum(hi - lo, 0)
+        total = int(counts.sum())
+        if total:
+            query = np.repeat(np.arange(n), counts)
+            group_start = np.cumsum(counts) - counts
+            turn = np.arange(total) - np.repeat(group_start, counts) + np.repeat(lo, counts)
+            overlap = np.minimum(q_end[query], self._ends[turn]) - np.maximum(q_start[query], self._starts[turn])
+            hit = overlap > 0
+            query, turn, overlap = query[hit], turn[hit], overlap[hit]
+            # Per interval: largest overlap first, earliest turn among equals.
+            order = np.lexsort((turn, -overlap, query))
+            query, turn = query[order], turn[order]
+            first = np.ones(len(query), dtype=bool)
+            first[1:] = query[1:] != query[:-1]
+            best[query[first]] = turn[first]
+        return self._labels[best].tolist()
+
+
+def speaker_for_interval(start: float, end: float, turns: Sequence[Any]) -> str:
+    """Speaker of the turn overlapping [start, end) the most, or ""."""
+    return SpeakerTimeline(turns).assign([start], [end])[0]
+
+
+def _split_words(seg: Any, words: list[Any], speakers: list[str]) -> list[AttributedSegment]:
+    """Runs of consecutive words with the same speaker; words without a speaker join the current run."""
+    runs: list[tuple[str, list[Any]]] = []
+    for word, speaker in zip(words, speakers, strict=True):
+        if runs and (not speaker or speaker == runs[-1][0]):
+            runs[-1][1].append(word)
+        elif runs and not runs[-1][0]:  # leading words without a speaker take the first speaker found
+            runs[-1] = (speaker, [*runs[-1][1], word])
+        else:
+            runs.append((speaker, [word]))
+    if len(runs) == 1:
+        return [AttributedSegment(seg.start, seg.end, runs[0][0], seg.text or "")]
+    out = []
+    for i, (speaker, run) in enumerate(runs):
+        start = seg.start if i == 0 else run[0].start
+        end = seg.end if i == len(runs) - 1 else run[-1].end
+        out.append(AttributedSegment(start, end, speaker, " ".join(w.text for w in run if w.text)))
+    return out
+
+
+def attribute_segments(segments: Sequence[Any], turns: Sequence[Any], split_words: bool = True) -> list[AttributedSegment]:
+    """Attribute STT segments to diarization speakers. With split_words, a segment whose words fall into different
+    turns becomes one AttributedSegment per speaker run (segments without words are attributed as a whole)."""
+    timeline = SpeakerTimeline(turns)
+    speakers = timeline.assign([s.start for s in segments], [s.end for s in segments])
+    if not split_words or len(timeline) < 2:
+        return [AttributedSegment(s.start, s.end, sp, s.text or "") for s, sp in zip(segments, speakers, strict=True)]
+    seg_words = [list(getattr(s, "words", None) or []) for s in segments]
+    flat = [w for words in seg_words for w in words]
+    word_speakers = timeline.assign([w.start for w in flat], [w.end for w in flat])
+    out: list[AttributedSegment] = []
+    pos = 0
+    for seg, speaker, words in zip(segments, speakers, seg_words, strict=True):
+        own = word_speakers[pos : pos + len(words)]
+        pos += len(words)
+        if len({sp for sp in own if sp}) > 1:
+            out.extend(_split_words(seg, words, own))
+        else:
+            out.append(AttributedSegment(seg.start, seg.end, speaker, seg.text or ""))
+    return out
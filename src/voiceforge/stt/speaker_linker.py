@@ -0,0 +1,118 @@
+"""Session-wide speaker labels for windowed diarization (stt.diarizer).
+
+pyannote labels restart in every window; SpeakerLinker maps each window's local speakers to session labels by their
+embeddings. Kept apart from the diarizer (no torch/pyannote import), so a listen or meeting session can own one
+from the start and pass it to every analysis."""
+
+from __future__ import annotations
+
+import itertools
+import threading
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+
+# Cross-window linking: cosine similarity to a session centroid needed to reuse its label
+LINK_SIMILARITY_THRESHOLD = 0.4
+MAX_SESSION_SPEAKERS = 32
+
+_linker_ids = itertools.count(1)
+
+
+def _speaker_label(index: int) -> str:
+    return f"SPEAKER_{index:02d}"
+
+
+class SpeakerLinker:
+    """Online centroid matching of window-local speakers to session speakers.
+
+    Each window contributes one embedding per local speaker; locals are assigned one-to-one (Hungarian) to the
+    most similar session centroids above `threshold`, otherwise they open a new session speaker. Centroids are
+    duration-weighted running means, at most `max_speakers` of them, so memory stays constant however long the
+    session runs. Keep one linker per meeting/listen session to get stable labels across diarize() calls.
+    Speakers of windows without embeddings cannot be linked (map_unlinked): each local label reuses the session
+    label it got last time, so such windows add at most one label per distinct local label."""
+
+    def __init__(self, threshold: float = LINK_SIMILARITY_THRESHOLD, max_speakers: int = MAX_SESSION_SPEAKERS) -> None:
+        self.threshold = threshold
+        self.max_speakers = max_speakers
+        self.session_id = next(_linker_ids)  # distinguishes sessions in the analysis cache key
+        self._lock = threading.Lock()  # analyses of one session may diarize concurrently
+        self._centroids: np.ndarray | None = None  # (n_speakers, dim), unit rows
+        self._weights: list[float] = []
+        self._labels: list[str] = []  # label of each centroid
+        self._last_by_local: dict[str, str] = {}  # window-local label -> session label it got last time
+        self._next_label = 0
+
+    @property
+    def num_speakers(self) -> int:
+        return len(self._weights)
+
+    def map_unlinked(self, local_labels: list[str]) -> list[str]:
+        """Session labels for a window without embeddings: the label each local label got last time (linked or
+        not), else a fresh one that does not collide with linked speakers."""
+        with self._lock:
+            labels: list[str] = []
+            for local in local_labels:
+                label = self._last_by_local.get(local)
+                if label is None or label in labels:
+                    label = self._take_label()
+                self._last_by_local[local] = label
+                labels.append(label)
+            return labels
+
+    def _take_label(self) -> str:
+        label = _speaker_label(self._next_label)
+        self._next_label += 1
+        return label
+
+    def link(self, embeddings: np.ndarray, durations: list[float], local_labels: list[str] | None = None) -> list[str]:
+        """Map local speakers (rows of embeddings, speech seconds in durations) to session labels.
+        local_labels (the window's own labels, same order) are remembered for map_unlinked."""
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        valid = norms[:, 0] > 0
+        unit = np.divide(embeddings, norms, out=np.zeros_like(embeddings), where=norms > 0)
+        with self._lock:
+            if self._centroids is None:
+                self._centroids = np.empty((0, embeddings.shape[1]), dtype=np.float32)
+            assigned: list[int | None] = [None] * len(embeddings)
+            if self.num_speakers:
+                sim = unit @ self._centroids.T
+                sim[~valid] = -1.0
+                rows, cols = linear_sum_assignment(-sim)
+                for r, c in zip(rows, cols, strict=True):
+                    if sim[r, c] >= self.threshold:
+                        assigned[r] = int(c)
+            labels: list[str] = []
+            for r, g in enumerate(assigned):
+                if g is None:
+                    g = (
+                        self._add(unit[r])
+                        if self.num_speakers < self.max_speakers
+                        else int(np.argmax(unit[r] @ self._centroids.T))
+                    )
+                if valid[r]:
+                    self._update(g, unit[r], durations[r])
+                labels.append(self._labels[g])
+            if local_labels is not None:
+                self._last_by_local.update(zip(local_labels, labels, strict=True))
+            return labels
+
+    def _add(self, unit: np.ndarray) -> int:
+        centroids = self._centroids if self._centroids is not None else np.empty((0, unit.size), dtype=np.float32)
+        self._centroids = np.vstack((centroids, unit[None, :]))
+        self._weights.append(0.0)
+        self._labels.append(self._take_label())
+        return self.num_speakers - 1
+
+    def _update(self, g: int, unit: np.ndarray, duration: float) -> None:
+        centroids = self._centroids
+        if centroids is None:
+            return
+        w = self._weights[g]
+        weight = max(duration, 1e-3)
+        merged = centroids[g] * w + unit * weight if w else unit
+        norm = float(np.linalg.norm(merged))
+        if norm > 0:
+            centroids[g] = merged / norm
+        self._weights[g] = w + weight
@@ -0,0 +1,151 @@
+"""Speculative STT for copilot captures: transcribe while the key is held, decode only the tail on release.
+
+A StreamingEngine (LocalAgreement-2) decodes the capture every SPECULATIVE_INTERVAL_SEC from the capture start
+(with pre-roll) on the copilot model, so by release most words are already committed. finish() feeds the last audio,
+decodes the uncommitted tail once and returns the capture audio with its segments, which AnalysisPipeline takes
+instead of running STT on the whole capture (audio.source.PcmSource.stt)."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+import structlog
+
+from voiceforge.stt.streaming import StreamingEngine
+from voiceforge.stt.transcriber import Segment
+
+log = structlog.get_logger()
+
+SPECULATIVE_INTERVAL_SEC = 1.0  # decode cadence while the copilot key is held
+
+
+class SpeculativeTranscription:
+    """Incremental transcription of one capture. read_since(cursor, max_seconds) -> (int16 samples, total) is the
+    capture's mic clock (AudioCapture.read_mic_since); start_sample is where the capture begins on that clock.
+    max_seconds bounds the kept capture audio (the newest part is kept, like the capture segment on release)."""
+
+    def __init__(
+        self,
+        transcriber: Any,
+        read_since: Callable[..., tuple[np.ndarray, int]],
+        sample_rate: int,
+        start_sample: int,
+        *,
+        language: str | None = None,
+        interval_sec: float = SPECULATIVE_INTERVAL_SEC,
+        max_seconds: float | None = None,
+    ) -> None:
+        self._read_since = read_since
+        self._sample_rate = sample_rate
+        self._interval_sec = interval_sec
+        self._max_samples = int(max_seconds * sample_rate) if max_seconds is not None else None
+        self._engine = StreamingEngine(transcriber, sample_rate=sample_rate, language=language)
+        self._lock = threading.Lock()  # engine and chunks: capture thread vs finish()
+        self._chunks: deque[np.ndarray] = deque()
+        self._kept = 0  # samples in _chunks
+        self._origin: int | None = None  # clock sample of the first kept sample
+        self._cursor = start_sample
+        self._finals: list[Any] = []
+        self._broken = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="copilot-speculative-stt", daemon=True)
+
+    def start(self) -> SpeculativeTranscription:
+        self._thread.start()
+        return self
+
+    def _pull(self) -> None:
+        """Feed capture audio since the cursor and decode it if enough arrived (caller holds _lock)."""
+        if self._broken:
+            return
+        chunk, total = self._read_since(self._cursor)
+        if chunk.size == 0:
+            return
+        start = total - chunk.size
+        if self._origin is None:
+            self._origin = start
+        elif start != self._cursor:  # capture buffer overran the cursor: audio is no longer contiguous
+            self._broken = True
+            log.warning("speculative_stt.gap", cursor=self._cursor, start=start)
+            return
+        self._cursor = total
+        self._chunks.append(chunk)
+        self._kept += chunk.size
+        self._trim()
+        self._engine.feed(chunk, start_sample=start)
+        self._finals.extend(self._engine.process())
+
+    def _trim(self) -> None:
+        """Drop the oldest kept audio beyond max_samples (caller holds _lock)."""
+        if self._max_samples is None or self._origin is None:
+            return
+        excess = self._kept - self._max_samples
+        while excess > 0 and self._chunks:
+            head = self._chunks[0]
+            drop = min(excess, head.size)
+            if drop == head.size:
+                self._chunks.popleft()
+            else:
+                self._chunks[0] = head[drop:]
+            self._kept -= drop
+            self._origin += drop
+            excess -= drop
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval_sec):
+            try:
+                with self._lock:
+                    self._pull()
+            except Exception as e:
+                with self._lock:
+                    self._broken = True
+                log.warning("speculative_stt.failed", error=str(e))
+                return
+
+    def cancel(self) -> None:
+        self._stop.set()
+        self._thread.join(timeout=5.0)
+
+    def finish(self) -> tuple[np.ndarray, list[Segment], str] | None:
+        """Stop, transcribe the remaining tail and return (capture audio, segments relative to its start, transcript),
+        or None when speculation failed (caller falls back to full STT)."""
+        self.cancel()
+        t0 = time.monotonic()
+        try:
+            with self._lock:
+                self._pull()
+                if self._broken or self._origin is None:
+                    return None
+                tail_samples = self._engine.buffered_samples
+                self._finals.extend(self._engine.flush())
+                audio = np.concatenate(self._chunks) if len(self._chunks) > 1 else self._chunks[0]
+                origin_sec = self._origin / self._sample_rate
+                finals = [f for f in self._finals if f.end > origin_sec]  # words in trimmed audio are dropped
+        except Exception as e:
+            log.warning("speculative_stt.finish_failed", error=str(e))
+            return None
+        segments = [
+            Segment(
+                start=max(0.0, f.start - origin_sec),
+                end=max(0.0, f.end - origin_sec),
+                text=f.text,
+                language=f.language,
+                confidence=f.confidence,
+            )
+            for f in finals
+        ]
+        transcript = " ".join(s.text for s in segments if s.text).strip()
+        log.info(
+            "speculative_stt.finished",
+            segments=len(segments),
+            audio_sec=round(audio.size / self._sample_rate, 2),
+            tail_sec=round(tail_samples / self._sample_rate, 2),
+            tail_stt_sec=round(time.monotonic() - t0, 3),
+            decodes=self._engine.decodes,
+        )
+        return (audio, segments, transcript)
@@ -1,7 +1,9 @@
-"""Block 10.1: Chunk-based streaming STT — reuse Transcriber, 2s chunks, 0.5s overlap, callbacks."""
+"""Block 10.1: Streaming STT over the existing Transcriber (one model, no extra RAM).
+StreamingEngine: long-lived sliding-window streaming with a LocalAgreement committed prefix (daemon, listen)."""
 
 from __future__ import annotations
 
+import re
 from collections import deque
 from collections.abc import Callable
 from dataclasses import dataclass
@@ -9,7 +11,7 @@ from dataclasses import dataclass
 import numpy as np
 import structlog
 
-from voiceforge.stt.transcriber import Segment, Transcriber
+from voiceforge.stt.transcriber import Segment, Transcriber, Word
 
 log = structlog.get_logger()
 
@@ -36,12 +38,6 @@ def _resample_float_to_16k(audio_f: np.ndarray, from_rate: int) -> tuple[np.ndar
     return (out, TARGET_SAMPLE_RATE)
 
 
-# Chunk 2s, overlap 0.5s → step 1.5s (latency ~2s for first partial)
-CHUNK_DURATION_SEC = 2.0
-CHUNK_OVERLAP_SEC = 0.5
-CHUNK_STEP_SEC = CHUNK_DURATION_SEC - CHUNK_OVERLAP_SEC
-
-
 @dataclass
 class StreamingSegment:
     """Segment with optional stream offset (same as Segment for compatibility)."""
@@ -53,140 +49,233 @@ class StreamingSegment:
     confidence: float
 
 
-def _segment_from_transcriber(s: Segment) -> StreamingSegment:
-    return StreamingSegment(
-        start=s.start,
-        end=s.end,
-        text=s.text,
-        language=s.language,
-        confidence=s.confidence,
-    )
+# StreamingEngine defaults: decode when >= 1 s of new audio, keep 1 s of committed audio as acoustic context,
+# force-commit the hypothesis before the window approaches Whisper's 30 s limit.
+ENGINE_MIN_CHUNK_SEC = 1.0
+ENGINE_CONTEXT_SEC = 1.0
+ENGINE_MAX_BUFFER_SEC = 15.0
+_PROMPT_CHARS = 200
+_NGRAM_MAX = 5
+_WORD_NORM_RE = re.compile(r"[^\w]+")
+
+
+@dataclass
+class _HypWord:
+    start: float  # absolute stream seconds
+    end: float
+    text: str
+    confidence: float
+    language: str | None
+
+    @property
+    def key(self) -> str:
+        return _WORD_NORM_RE.sub("", self.text.lower())
+
+
+def _segment_words(s: Segment) -> list[Word]:
+    """Word timings from the transcriber, or evenly spread over the segment when the backend has none."""
+    words = getattr(s, "words", None)
+    if words:
+        return list(words)
+    tokens = (s.text or "").split()
+    if not tokens:
+        return []
+    total_chars = sum(len(t) for t in tokens)
+    span = max(s.end - s.start, 0.0)
+    out: list[Word] = []
+    t = s.start
+    for tok in tokens:
+        dur = span * len(tok) / total_chars
+        out.append(Word(start=t, end=t + dur, text=tok))
+        t += dur
+    return out
+
 
+class StreamingEngine:
+    """Long-lived streaming STT over a growing audio window with a LocalAgreement-2 committed prefix.
 
-class StreamingTranscriber:
-    """Chunk-based streaming using existing Transcriber (one model, no extra RAM).
-    Buffer: 2s chunks with 0.5s overlap. Callbacks: on_partial(text), on_final(segment).
-    Latency target: partial/final within ~2s of speech."""
+    Audio is fed with its position on the capture sample clock (feed(audio, start_sample)). Each process()
+    decodes the window [buffer_start, cursor); words that agree with the previous hypothesis are committed
+    and emitted once via on_final with absolute stream timestamps (seconds since the clock origin); the rest
+    is the partial. Audio before the last committed word minus context_sec is dropped, so committed speech is
+    never re-decoded beyond that tail. Counters: stats()."""
 
     def __init__(
         self,
         transcriber: Transcriber,
         sample_rate: int = 16000,
-        chunk_duration_sec: float = CHUNK_DURATION_SEC,
-        overlap_sec: float = CHUNK_OVERLAP_SEC,
         *,
         language: str | None = None,
         on_partial: Callable[[str], None] | None = None,
         on_final: Callable[[StreamingSegment], None] | None = None,
+        min_chunk_sec: float = ENGINE_MIN_CHUNK_SEC,
+        context_sec: float = ENGINE_CONTEXT_SEC,
+        max_buffer_sec: float = ENGINE_MAX_BUFFER_SEC,
     ) -> None:
         self._transcriber = transcriber
         self._sample_rate = sample_rate
         self._language = language
-        self._chunk_duration = chunk_duration_sec
-        self._overlap = overlap_sec
-        self._step_sec = chunk_duration_sec - overlap_sec
         self._on_partial = on_partial or (lambda _: None)
         self._on_final = on_final or (lambda _: None)
-        self._buffer: deque[tuple[np.ndarray, float]] = deque()  # (samples, start_time)
-        self._buffer_duration = 0.0
-        self._stream_time = 0.0
+        self._min_chunk = int(min_chunk_sec * sample_rate)
+        self._context = int(context_sec * sample_rate)
+        self._max_buffer = int(max_buffer_sec * sample_rate)
+        self._audio = np.empty(0, dtype=np.float32)
+        self._buffer_start = 0  # absolute sample of self._audio[0]
+        self._cursor: int | None = None  # absolute sample after the last fed sample
+        self._undecoded = 0  # samples fed since the last decode
+        self._committed_until = 0.0  # absolute seconds, end of last committed word
+        self._committed_tail: deque[_HypWord] = deque(maxlen=64)  # prompt + n-gram dedup
+        self._hypothesis: list[_HypWord] = []
+        self._last_partial = ""
+        self.fed_samples_total = 0
+        self.decoded_samples_total = 0
+        self.decodes = 0
+        self.committed_words_total = 0
+
+    @property
+    def cursor(self) -> int | None:
+        """Absolute sample position after the last fed sample (None before the first feed)."""
+        return self._cursor
+
+    @property
+    def buffered_samples(self) -> int:
+        """Samples in the decode window: uncommitted audio plus the context tail."""
+        return int(self._audio.size)
 
-    def feed(self, audio: np.ndarray) -> None:
-        """Append audio (int16 or float32, mono). Flush when buffer >= chunk_duration."""
+    def set_transcriber(self, transcriber: Transcriber) -> None:
+        """Swap the model (e.g. copilot size) without losing committed state or the audio window."""
+        self._transcriber = transcriber
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "fed_samples_total": self.fed_samples_total,
+            "decoded_samples_total": self.decoded_samples_total,
+            "decodes": self.decodes,
+            "committed_words_total": self.committed_words_total,
+        }
+
+    def feed(self, audio: np.ndarray, start_sample: int | None = None) -> None:
+        """Append audio (int16 or float32, mono) that starts at start_sample on the capture clock.
+        A gap (audio lost) or a clock restart finalizes the current hypothesis and starts a new window."""
         if audio.size == 0:
             return
+        if start_sample is None:
+            start_sample = self._cursor if self._cursor is not None else 0
+        if self._cursor is None:
+            self._buffer_start = start_sample
+        elif start_sample != self._cursor:
+            self.finish()
+            self._audio = np.empty(0, dtype=np.float32)
+            self._buffer_start = start_sample
+            self._committed_until = start_sample / self._sample_rate
+            self._undecoded = 0
         if audio.dtype == np.int16:
-            audio = audio.astype(np.float32) / 32768.0
+            audio_f = audio.astype(np.float32) / 32768.0
         else:
-            audio = audio.astype(np.float32).copy()
-        dur = audio.size / self._sample_rate
-        self._buffer.append((audio, self._stream_time))
-        self._buffer_duration += dur
-        self._stream_time += dur
-        while self._buffer_duration >= self._chunk_duration:
-            self._flush_chunk()
-
-    def _flush_chunk(self) -> None:
-        """Take chunk_duration from buffer, transcribe, emit; then push back overlap for next window."""
-        if not self._buffer:
-            return
-        want_samples = int(self._chunk_duration * self._sample_rate)
-        overlap_samples = int(self._overlap * self._sample_rate)
-        chunks: list[np.ndarray] = []
-        taken = 0
-        start_time = self._buffer[0][1]
-        while self._buffer and taken < want_samples:
-            block, t0 = self._buffer.popleft()
-            self._buffer_duration -= block.size / self._sample_rate
-            need = want_samples - taken
-            if block.size <= need:
-                chunks.append(block)
-                taken += block.size
-            else:
-                head = block[:need]
-                rest = block[need:]
-                chunks.append(head)
-                taken += need
-                self._buffer.appendleft((rest, t0 + need / self._sample_rate))
-                self._buffer_duration += rest.size / self._sample_rate
-                break
-        if not chunks:
-            return
-        chunk = np.concatenate(chunks) if len(chunks) > 1 else chunks[0]
-        eff: int | None = None
+            audio_f = audio.astype(np.float32, copy=False)
+        self._audio = np.concatenate((self._audio, audio_f))
+        self._cursor = start_sample + audio_f.size
+        self._undecoded += audio_f.size
+        self.fed_samples_total += audio_f.size
+
+    def process(self) -> list[StreamingSegment]:
+        """Decode the current window if enough new audio arrived; commit agreed words. Returns new finals."""
+        if self._undecoded < self._min_chunk or self._audio.size < 100:
+            return []
+        new = self._decode()
+        agreed = 0
+        while agreed < min(len(new), len(self._hypothesis)) and new[agreed].key == self._hypothesis[agreed].key:
+            agreed += 1
+        to_commit, self._hypothesis = new[:agreed], new[agreed:]
+        if self._audio.size > self._max_buffer and self._hypothesis:
+            # No agreement for a whole window: commit what we have rather than outgrow Whisper's context
+            to_commit, self._hypothesis = to_commit + self._hypothesis, []
+        finals = self._commit(to_commit)
+        if not new and not self._hypothesis and self._cursor is not None:
+            self._trim(self._cursor - self._context)  # nothing spoken in the window: keep only the context tail
+        self._emit_partial()
+        return finals
+
+    def flush(self) -> list[StreamingSegment]:
+        """End of utterance: decode the uncommitted tail once more if new audio arrived and commit all of it
+        (no later hypothesis will confirm it). Returns new finals."""
+        if self._undecoded > 0 and self._audio.size >= 100:
+            self._hypothesis = self._decode()
+        return self.finish()
+
+    def finish(self) -> list[StreamingSegment]:
+        """Commit the remaining hypothesis (end of stream or audio gap)."""
+        finals = self._commit(self._hypothesis)
+        self._hypothesis = []
+        self._last_partial = ""
+        return finals
+
+    def _decode(self) -> list[_HypWord]:
+        audio = self._audio
+        effective_rate = self._sample_rate
         if self._sample_rate != TARGET_SAMPLE_RATE:
-            chunk, eff = _resample_float_to_16k(chunk, self._sample_rate)
-        self._process_chunk(chunk, start_time, effective_rate=eff)
-        # Push back last overlap_sec so next window overlaps
-        if overlap_samples > 0 and chunk.size >= overlap_samples:
-            tail = chunk[-overlap_samples:]
-            overlap_time = start_time + self._step_sec
-            self._buffer.appendleft((tail, overlap_time))
-            self._buffer_duration += self._overlap
-
-    def _process_chunk(
-        self,
-        audio: np.ndarray,
-        start_offset_sec: float = 0.0,
-        effective_rate: int | None = None,
-    ) -> None:
-        """Transcribe one chunk and call on_partial / on_final for each segment."""
-        if audio.size < 100:  # too short
-            return
-        rate = effective_rate if effective_rate is not None else self._sample_rate
+            audio, effective_rate = _resample_float_to_16k(audio, self._sample_rate)
+        prompt = " ".join(w.text for w in self._committed_tail)[-_PROMPT_CHARS:]
         segments = self._transcriber.transcribe(
             audio,
-            sample_rate=rate,
+            sample_rate=effective_rate,
             language=self._language,
             beam_size=1,
             vad_filter=True,
+            word_timestamps=True,
+            initial_prompt=prompt or None,
         )
-        for s in segments:
-            seg = _segment_from_transcriber(s)
-            seg = StreamingSegment(
-                start=seg.start + start_offset_sec,
-                end=seg.end + start_offset_sec,
-                text=seg.text,
-                language=seg.language,
-                confidence=seg.confidence,
-            )
-            if seg.text:
-                self._on_partial(seg.text)
-                self._on_final(seg)
-        if segments:
-            log.debug("streaming.chunk_done", segments=len(segments), start_offset=start_offset_sec)
-
-    def process_chunk(self, audio: np.ndarray, start_offset_sec: float = 0.0) -> None:
-        """Process a pre-cut chunk (e.g. last 2s from ring buffer). No internal buffering.
-        Use from listen/daemon: get_chunk(2) → process_chunk(mic).
-        W2: when sample_rate != 16 kHz, resample to 16k before transcribe."""
-        if audio.size == 0:
-            return
-        if audio.dtype == np.int16:
-            audio = audio.astype(np.float32) / 32768.0
-        else:
-            audio = audio.astype(np.float32, copy=False)
-        effective_rate: int | None = None
-        if self._sample_rate != TARGET_SAMPLE_RATE:
-            audio, effective_rate = _resample_float_to_16k(audio, self._sample_rate)
-        self._process_chunk(audio, start_offset_sec, effective_rate=effective_rate)
+        self.decodes += 1
+        self.decoded_samples_total += self._audio.size
+        self._undecoded = 0
+        offset = self._buffer_start / self._sample_rate
+        words = [
+            _HypWord(offset + w.start, offset + w.end, w.text, s.confidence, s.language)
+            for s in segments
+            for w in _segment_words(s)
+            if w.text.strip()
+        ]
+        return self._drop_committed(words)
+
+    def _drop_committed(self, words: list[_HypWord]) -> list[_HypWord]:
+        """Remove words re-decoded from the context tail: by time, then by n-gram overlap with committed text."""
+        words = [w for w in words if w.start > self._committed_until - 0.1]
+        if not words or not self._committed_tail or abs(words[0].start - self._committed_until) >= 1.0:
+            return words
+        tail = [w.key for w in self._committed_tail]
+        for n in range(min(_NGRAM_MAX, len(words), len(tail)), 0, -1):
+            if tail[-n:] == [w.key for w in words[:n]]:
+                return words[n:]
+        return words
+
+    def _commit(self, words: list[_HypWord]) -> list[StreamingSegment]:
+        if not words:
+            return []
+        self._committed_tail.extend(words)
+        self._committed_until = words[-1].end
+        self.committed_words_total += len(words)
+        self._trim(int(self._committed_until * self._sample_rate) - self._context)
+        seg = StreamingSegment(
+            start=words[0].start,
+            end=words[-1].end,
+            text=" ".join(w.text.strip() for w in words),
+            language=words[-1].language,
+            confidence=min(w.confidence for w in words),
+        )
+        self._on_final(seg)
+        log.debug("streaming.committed", words=len(words), start=round(seg.start, 2), end=round(seg.end, 2))
+        return [seg]
+
+    def _trim(self, keep_from: int) -> None:
+        """Drop buffered audio before absolute sample keep_from."""
+        drop = min(keep_from - self._buffer_start, self._audio.size)
+        if drop > 0:
+            self._audio = self._audio[drop:]
+            self._buffer_start += drop
+
+    def _emit_partial(self) -> None:
+        text = " ".join(w.text.strip() for w in self._hypothesis)
+        if text and text != self._last_partial:
+            self._on_partial(text)
+        self._last_partial = text
@@ -1,7 +1,7 @@
 """STT via faster-whisper (CTranslate2, INT8)."""
 
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import numpy as np
 import psutil
@@ -59,6 +59,15 @@ _WHISPER_SIZE_MB: dict[str, int] = {
 }
 
 
+@dataclass
+class Word:
+    """One word with timestamps (only filled when transcribe(word_timestamps=True))."""
+
+    start: float
+    end: float
+    text: str
+
+
 @dataclass
 class Segment:
     """One transcribed segment."""
@@ -68,6 +77,7 @@ class Segment:
     text: str
     language: str | None
     confidence: float
+    words: list[Word] = field(default_factory=list)
 
 
 def _load_whisper_model(
@@ -182,8 +192,11 @@ class Transcriber:
         beam_size: int = 1,
         vad_filter: bool = True,
         vad_parameters: dict | None = None,
+        word_timestamps: bool = False,
+        initial_prompt: str | None = None,
     ) -> list[Segment]:
-        """Transcribe audio (int16 or float32). Returns list of Segment."""
+        """Transcribe audio (int16 or float32). Returns list of Segment.
+        word_timestamps fills Segment.words; initial_prompt conditions decoding on preceding text (streaming)."""
         if audio.dtype == np.int16:
             audio_f = audio.astype(np.float32) / 32768.0
         else:
@@ -200,6 +213,8 @@ class Transcriber:
             beam_size=beam_size,
             vad_filter=vad_filter,
             vad_parameters=vad_params,
+            word_timestamps=word_timestamps,
+            initial_prompt=initial_prompt or None,
         )
 
         out: list[Segment] = []
@@ -209,6 +224,7 @@ class Transcriber:
             text = (s.text or "").strip()
             if confidence < 0.3 and text:
                 text = "[unclear]"  # E13 #136: low-confidence segments marked; reduce LLM noise
+            words = [Word(start=w.start, end=w.end, text=w.word.strip()) for w in (getattr(s, "words", None) or [])]
             out.append(
                 Segment(
                     start=s.start,
@@ -216,6 +232,7 @@ class Transcriber:
                     text=text,
                     language=lang,
                     confidence=confidence,
+                    words=words if text != "[unclear]" else [],
                 )
             )
 
@@ -0,0 +1,170 @@
+"""Web request scheduling: bounded worker pools shared by the sync and async web servers.
+
+Analyze requests (/api/analyze, /api/analyze/stream) each load STT, pyannote and an LLM call; running several at once
+can exhaust RAM. They run on one small executor with a bounded queue, and a request that finds it full is rejected
+with 429 and Retry-After instead of piling up. Light endpoints (status, sessions, cost, export) run on a separate
+read pool, so they stay responsive while analyses run. Queue depth, wait time and rejections go to Prometheus."""
+
+from __future__ import annotations
+
+import contextvars
+import math
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+import structlog
+
+log = structlog.get_logger()
+
+ANALYZE_WORKERS = 1  # concurrent analyses (each holds STT + diarization models)
+ANALYZE_QUEUE = 2  # analyses waiting for a worker before 429
+READ_WORKERS = 8  # threads for light endpoints
+DEFAULT_RETRY_AFTER_SEC = 30  # Retry-After before any analysis has finished (no duration estimate yet)
+
+
+class ExecutorFull(Exception):
+    """BoundedExecutor.submit: all workers busy and the queue is full. retry_after: seconds (Retry-After header)."""
+
+    def __init__(self, pool: str, retry_after: int) -> None:
+        super().__init__(f"{pool} queue is full, retry in {retry_after}s")
+        self.pool = pool
+        self.retry_after = retry_after
+
+
+def _record(fn_name: str, *args: Any) -> None:
+    try:
+        from voiceforge.core import observability
+
+        getattr(observability, fn_name)(*args)
+    except ImportError:
+        pass
+
+
+class BoundedExecutor:
+    """Thread pool that admits at most workers + queue_size tasks (running or waiting); queue_size=None is unbounded.
+    Tasks run in a copy of the caller's context (trace id), like asyncio.to_thread."""
+
+    def __init__(self, name: str, workers: int, queue_size: int | None = None) -> None:
+        self.name = name
+        self.workers = max(1, int(workers))
+        self.queue_size = None if queue_size is None else max(0, int(queue_size))
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=f"web-{name}")
+        self._lock = threading.Lock()
+        self._admitted = 0  # running + waiting
+        self._running = 0
+        self._avg_run_sec: float | None = None
+
+    @property
+    def capacity(self) -> int | None:
+        return None if self.queue_size is None else self.workers + self.queue_size
+
+    @property
+    def queued(self) -> int:
+        with self._lock:
+            return self._admitted - self._running
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future[Any]:
+        """Schedule fn(*args, **kwargs); raises ExecutorFull when capacity is reached."""
+        depth = retry_after = 0
+        with self._lock:
+            capacity = self.capacity
+            if capacity is not None and self._admitted >= capacity:
+                retry_after = self._retry_after_locked()
+            else:
+                self._admitted += 1
+                depth = self._admitted - self._running
+        if retry_after:
+            _record("record_web_rejected", self.name)
+            log.warning("web.scheduler.rejected", pool=self.name, capacity=capacity, retry_after=retry_after)
+            raise ExecutorFull(self.name, retry_after)
+        _record("set_web_queue_depth", self.name, depth)
+        ctx = contextvars.copy_context()
+        try:
+            return self._executor.submit(ctx.run, self._run, time.monotonic(), fn, args, kwargs)
+        except RuntimeError:  # executor shut down
+            with self._lock:
+                self._admitted -= 1
+            raise
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._executor.shutdown(wait=wait)
+
+    def _run(self, enqueued: float, fn: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        started = time.monotonic()
+        with self._lock:
+            self._running += 1
+            depth = self._admitted - self._running
+        _record("record_web_queue_wait", self.name, started - enqueued)
+        _record("set_web_queue_depth", self.name, depth)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            elapsed = time.monotonic() - started
+            with self._lock:
+                self._running -= 1
+                self._admitted -= 1
+                self._avg_run_sec = elapsed if self._avg_run_sec is None else 0.8 * self._avg_run_sec + 0.2 * elapsed
+                depth = self._admitted - self._running
+            _record("set_web_queue_depth", self.name, depth)
+
+    def _retry_after_locked(self) -> int:
+        """Seconds until a queue slot is expected to free up: one average task, spread over the workers."""
+        if self._avg_run_sec is None:
+            return DEFAULT_RETRY_AFTER_SEC
+        return max(1, math.ceil(self._avg_run_sec / self.workers))
+
+
+_executors: dict[str, BoundedExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def _get_executor(name: str, factory: Callable[[], BoundedExecutor]) -> BoundedExecutor:
+    with _executors_lock:
+        executor = _executors.get(name)
+        if executor is None:
+            executor = _executors[name] = factory()
+            log.info("web.scheduler.started", pool=name, workers=executor.workers, queue=executor.queue_size)
+        return executor
+
+
+def get_analyze_executor() -> BoundedExecutor:
+    """Process-wide analysis pool (web_analyze_workers, web_analyze_queue)."""
+
+    def build() -> BoundedExecutor:
+        from voiceforge.core.backends import get_settings
+
+        cfg = get_settings()
+        return BoundedExecutor(
+            "analyze",
+            getattr(cfg, "web_analyze_workers", ANALYZE_WORKERS),
+            getattr(cfg, "web_analyze_queue", ANALYZE_QUEUE),
+        )
+
+    return _get_executor("analyze", build)
+
+
+def get_read_executor() -> BoundedExecutor:
+    """Process-wide pool for light endpoints (web_read_workers), unbounded queue."""
+
+    def build() -> BoundedExecutor:
+        from voiceforge.core.backends import get_settings
+
+        return BoundedExecutor("read", getattr(get_settings(), "web_read_workers", READ_WORKERS))
+
+    return _get_executor("read", build)
+
+
+def shutdown_executors(wait: bool = False) -> None:
+    """Stop both pools and the backend health refresh thread (server shutdown, tests); the next get_* call builds
+    new pools from current settings."""
+    from voiceforge.core.backends import stop_health_refresh
+
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=wait)
+    stop_health_refresh()
@@ -5,9 +5,9 @@ from __future__ import annotations
 import contextlib
 import json
 import logging
-import socketserver
 import urllib.parse
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from typing import Any
 
@@ -17,6 +17,7 @@ _HTTP_STATUS_TO_CODE = {
     401: "UNAUTHORIZED",
     404: "NOT_FOUND",
     422: "UNPROCESSABLE_ENTITY",
+    429: "TOO_MANY_REQUESTS",
     500: "INTERNAL_ERROR",
     501: "NOT_IMPLEMENTED",
     503: "SERVICE_UNAVAILABLE",
@@ -347,11 +348,13 @@ def _html_index() -> str:
 
 
 class _VoiceForgeHandler(BaseHTTPRequestHandler):
-    def _send_json(self, obj: Any, status: int = 200) -> None:
+    def _send_json(self, obj: Any, status: int = 200, headers: dict[str, str] | None = None) -> None:
         self.send_response(status)
         tid = get_trace_id()
         if tid:
             self.send_header("X-Trace-Id", tid)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
         self.send_header("Content-Type", _CONTENT_TYPE_JSON)
         self.end_headers()
         self.wfile.write(json.dumps(obj, ensure_ascii=False).encode("utf-8"))
@@ -365,9 +368,9 @@ class _VoiceForgeHandler(BaseHTTPRequestHandler):
         self.end_headers()
         self.wfile.write(html.encode("utf-8"))
 
-    def _send_error_json(self, message: str, status: int = 400) -> None:
+    def _send_error_json(self, message: str, status: int = 400, headers: dict[str, str] | None = None) -> None:
         code = _HTTP_STATUS_TO_CODE.get(status, "ERROR")
-        self._send_json({"error": {"code": code, "message": message}}, status=status)
+        self._send_json({"error": {"code": code, "message": message}}, status=status, headers=headers)
 
     def _parse_path(self) -> tuple[str, dict[str, str]]:
         path = urllib.parse.unquote(self.path)
@@ -688,11 +691,18 @@ class _VoiceForgeHandler(BaseHTTPRequestHandler):
         if template is not None and template not in _VALID_TEMPLATES:
             self._send_error_json(f"template must be one of: {', '.join(_VALID_TEMPLATES)}", 400)
             return
+        from voiceforge.web.scheduler import ExecutorFull, get_analyze_executor
+
         try:
             from voiceforge.core.transcript_log import TranscriptLog
             from voiceforge.main import run_analyze_pipeline
 
-            display_text, segments_for_log, analysis_for_log = run_analyze_pipeline(seconds, template=template)
+            try:
+                future = get_analyze_executor().submit(run_analyze_pipeline, seconds, template=template)
+            except ExecutorFull as e:
+                self._send_error_json(str(e), 429, headers={"Retry-After": str(e.retry_after)})
+                return
+            display_text, segments_for_log, analysis_for_log = future.result()
             error_message = None
             try:
                 from voiceforge.core.contracts import extract_error_message
@@ -803,11 +813,41 @@ class _VoiceForgeHandler(BaseHTTPRequestHandler):
         pass  # quiet by default; set log_request=True on server to enable
 
 
-class _ThreadedHTTPServer(socketserver.ThreadingMixIn, HTTPServer):
-    """One request per thread so /api/status is not blocked by long /api/analyze (#66)."""
+class _PooledHTTPServer(HTTPServer):
+    """Requests are handled on a fixed thread pool instead of one thread per connection. The pool has room for every
+    admitted analysis (they wait on web.scheduler's analyze executor) plus web_read_workers, so /api/status is not
+    blocked by long /api/analyze (#66)."""
+
+    def __init__(self, server_address: tuple[str, int], handler_cls: Any, workers: int) -> None:
+        super().__init__(server_address, handler_cls)
+        self._pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="web-conn")
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        self._pool.submit(self._process_request_pooled, request, client_address)
+
+    def _process_request_pooled(self, request: Any, client_address: Any) -> None:
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self._pool.shutdown(wait=False)
 
 
 def run_server(host: str = "127.0.0.1", port: int = 8765) -> None:
-    with _ThreadedHTTPServer((host, port), _VoiceForgeHandler) as httpd:
-        print(f"VoiceForge Web UI: http://{host}:{port}")
-        httpd.serve_forever()
+    from voiceforge.core.backends import start_health_refresh
+    from voiceforge.web.scheduler import get_analyze_executor, get_read_executor, shutdown_executors
+
+    start_health_refresh()  # /api/status answers from cached key presence and Ollama health
+    analyze = get_analyze_executor()
+    workers = get_read_executor().workers + (analyze.capacity or analyze.workers)
+    try:
+        with _PooledHTTPServer((host, port), _VoiceForgeHandler, workers) as httpd:
+            print(f"VoiceForge Web UI: http://{host}:{port}")
+            httpd.serve_forever()
+    finally:
+        shutdown_executors()
@@ -1,11 +1,12 @@
-"""Optional async web server (Starlette + uvicorn). Phase C #66. Use with uv sync --extra web-async and VOICEFORGE_WEB_ASYNC=1 or voiceforge web --async."""
+"""Optional async web server (Starlette + uvicorn). Phase C #66. Use with uv sync --extra web-async and VOICEFORGE_WEB_ASYNC=1 or voiceforge web --async.
+
+Handlers run on the web.scheduler pools: analyze on the bounded analysis executor (429 when full), the rest on the read pool."""
 
 from __future__ import annotations
 
 import asyncio
 import contextlib
 import json
-import threading
 from typing import Any
 
 from voiceforge.core.tracing import bind_trace_id, clear_trace_context, get_trace_id
@@ -17,6 +18,7 @@ _HTTP_STATUS_TO_CODE = {
     401: "UNAUTHORIZED",
     404: "NOT_FOUND",
     422: "UNPROCESSABLE_ENTITY",
+    429: "TOO_MANY_REQUESTS",
     500: "INTERNAL_ERROR",
     501: "NOT_IMPLEMENTED",
     503: "SERVICE_UNAVAILABLE",
@@ -52,17 +54,31 @@ def _response_from_sync_result(response_cls: Any, result: tuple[int, str, bytes]
     return response_cls(body, status_code=status, media_type=content_type)
 
 
-async def _to_thread_response(response_cls: Any, sync_fn: Any, *args: Any):
-    result = await asyncio.to_thread(sync_fn, *args)
+def _busy_response(response_cls: Any, exc: Any):
+    """429 with Retry-After when the analysis queue is full (web.scheduler.ExecutorFull)."""
+    status, content_type, body = _err(429, str(exc))
+    return response_cls(body, status_code=status, media_type=content_type, headers={"Retry-After": str(exc.retry_after)})
+
+
+async def _to_thread_response(response_cls: Any, sync_fn: Any, *args: Any, analyze: bool = False):
+    """Run sync_fn on the read pool (or the bounded analysis pool) and wrap its (status, type, body) result."""
+    from voiceforge.web.scheduler import ExecutorFull, get_analyze_executor, get_read_executor
+
+    executor = get_analyze_executor() if analyze else get_read_executor()
+    try:
+        future = executor.submit(sync_fn, *args)
+    except ExecutorFull as e:
+        return _busy_response(response_cls, e)
+    result = await asyncio.wrap_future(future)
     return _response_from_sync_result(response_cls, result)
 
 
-async def _json_request_to_response(request: Any, response_cls: Any, sync_fn: Any):
+async def _json_request_to_response(request: Any, response_cls: Any, sync_fn: Any, analyze: bool = False):
     try:
         data = await request.json()
     except Exception:
         return response_cls(_invalid_json_body(), status_code=400, media_type=_CONTENT_TYPE_JSON)
-    return await _to_thread_response(response_cls, sync_fn, data)
+    return await _to_thread_response(response_cls, sync_fn, data, analyze=analyze)
 
 
 def _sync_index() -> tuple[int, str, bytes]:
@@ -428,7 +444,7 @@ def _build_app():  # NOSONAR S3776 — single place wiring all async routes; spl
         )
 
     async def get_health(_request: Request) -> Response:
-        return await _to_thread_response(Response, _sync_health)
+        return _response_from_sync_result(Response, _sync_health())  # no I/O: answer even when pools are busy
 
     async def get_ready(_request: Request) -> Response:
         return await _to_thread_response(Response, _sync_ready)
@@ -437,7 +453,7 @@ def _build_app():  # NOSONAR S3776 — single place wiring all async routes; spl
         return await _to_thread_response(Response, _sync_metrics)
 
     async def post_analyze(request: Request) -> Response:
-        return await _json_request_to_response(request, Response, _sync_analyze)
+        return await _json_request_to_response(request, Response, _sync_analyze, analyze=True)
 
     async def post_analyze_stream(request: Request):
         """SSE stream of LLM analyze output (#91). POST body: {seconds, template?}."""
@@ -467,7 +483,12 @@ def _build_app():  # NOSONAR S3776 — single place wiring all async routes; spl
             finally:
                 put(None)
 
-        threading.Thread(target=run, daemon=True).start()
+        from voiceforge.web.scheduler import ExecutorFull, get_analyze_executor
+
+        try:
+            get_analyze_executor().submit(run)
+        except ExecutorFull as e:
+            return _busy_response(Response, e)
 
         async def event_stream():
             while True:
@@ -522,6 +543,14 @@ def _build_app():  # NOSONAR S3776 — single place wiring all async routes; spl
 def run_async_server(host: str = "127.0.0.1", port: int = 8765) -> None:
     import uvicorn
 
+    from voiceforge.core.backends import start_health_refresh
+
+    start_health_refresh()  # /api/status answers from cached key presence and Ollama health
+    from voiceforge.web.scheduler import shutdown_executors
+
     app = _build_app()
     print(f"VoiceForge Web UI (async): http://{host}:{port}")
-    uvicorn.run(app, host=host, port=port, log_level="warning")
+    try:
+        uvicorn.run(app, host=host, port=port, log_level="warning")
+    finally:
+        shutdown_executors()
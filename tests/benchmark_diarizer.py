@@ -0,0 +1,147 @@
+"""Benchmark: cross-window speaker linking in Diarizer on synthetic multi-speaker audio.
+
+Run: uv run pytest tests/benchmark_diarizer.py -s. The pyannote pipeline is replaced by a fake that diarizes each
+30 s window from the known script, restarts its labels per window (like pyannote) and returns audio-derived
+speaker embeddings (log spectrum). Reports labelling consistency (best one-to-one mapping of session labels to
+true speakers, by speech time) and diarize wall time per audio minute, with and without linking.
+"""
+
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from scipy.optimize import linear_sum_assignment
+
+from voiceforge.stt.diarizer import WINDOW_SEC, Diarizer
+
+SAMPLE_RATE = 16000
+_VOICES = {"alice": 140.0, "bob": 210.0, "carol": 290.0, "dave": 370.0}  # fundamental Hz per synthetic voice
+
+
+class _Seg:
+    def __init__(self, start: float, end: float) -> None:
+        self.start = start
+        self.end = end
+
+
+class _Annotation:
+    def __init__(self, tracks: list[tuple[float, float, str]]) -> None:
+        self._tracks = tracks
+
+    def itertracks(self, yield_label: bool = False):
+        return [(_Seg(s, e), None, lab) for s, e, lab in self._tracks]
+
+    def labels(self) -> list[str]:
+        return sorted({lab for _, _, lab in self._tracks})
+
+
+def _synthetic_meeting(minutes: float, seed: int = 0) -> tuple[np.ndarray, list[tuple[float, float, str]]]:
+    """Harmonic voices with jittered pitch and noise; turns of 2-8 s in random speaker order."""
+    rng = np.random.default_rng(seed)
+    total = minutes * 60.0
+    script: list[tuple[float, float, str]] = []
+    t = 0.0
+    names = list(_VOICES)
+    while t < total:
+        dur = min(float(rng.uniform(2.0, 8.0)), total - t)
+        script.append((t, t + dur, names[int(rng.integers(len(names)))]))
+        t += dur
+    audio = np.zeros(int(total * SAMPLE_RATE), dtype=np.float32)
+    for start, end, name in script:
+        n = int(end * SAMPLE_RATE) - int(start * SAMPLE_RATE)
+        tt = np.arange(n) / SAMPLE_RATE
+        f0 = _VOICES[name] * (1.0 + 0.02 * np.sin(2 * np.pi * 0.7 * tt))
+        phase = 2 * np.pi * np.cumsum(f0) / SAMPLE_RATE
+        wave = sum(np.sin(k * phase) / k for k in range(1, 6)) + 0.3 * rng.standard_normal(n)
+        audio[int(start * SAMPLE_RATE) : int(start * SAMPLE_RATE) + n] = 0.1 * wave
+    return audio, script
+
+
+def _spectral_embedding(audio: np.ndarray) -> np.ndarray:
+    spec = np.abs(np.fft.rfft(audio[: SAMPLE_RATE * 4], n=8192))[:512]
+    return np.log1p(spec.reshape(64, 8).mean(axis=1)).astype(np.float32) - 1.0
+
+
+def _fake_pipeline(script: list[tuple[float, float, str]], with_embeddings: bool):
+    window = {"t": 0.0}
+
+    def run(input_dict: dict) -> SimpleNamespace:
+        chunk = input_dict["waveform"].numpy().reshape(-1)
+        t0 = window["t"]
+        t1 = t0 + chunk.size / SAMPLE_RATE
+        window["t"] = t1
+        local: dict[str, str] = {}
+        tracks: list[tuple[float, float, str]] = []
+        for s, e, name in script:
+            if e <= t0 or s >= t1:
+                continue
+            label = local.setdefault(name, f"SPEAKER_{len(local):02d}")
+            tracks.append((max(s, t0) - t0, min(e, t1) - t0, label))
+        annotation = _Annotation(tracks)
+        embeddings = None
+        if with_embeddings:
+            rows = []
+            for label in annotation.labels():
+                parts = [chunk[int(s * SAMPLE_RATE) : int(e * SAMPLE_RATE)] for s, e, lab in tracks if lab == label]
+                rows.append(_spectral_embedding(np.concatenate(parts)))
+            embeddings = np.stack(rows)
+        return SimpleNamespace(speaker_diarization=annotation, speaker_embeddings=embeddings)
+
+    return run
+
+
+def _consistency(out: list, script: list[tuple[float, float, str]]) -> float:
+    """Share of speech time whose predicted label maps to the true speaker under the best one-to-one mapping."""
+    truth = sorted({name for _, _, name in script})
+    pred = sorted({s.speaker for s in out})
+    conf = np.zeros((len(truth), len(pred)))
+    for seg in out:
+        for s, e, name in script:
+            overlap = min(seg.end, e) - max(seg.start, s)
+            if overlap > 0:
+                conf[truth.index(name), pred.index(seg.speaker)] += overlap
+    rows, cols = linear_sum_assignment(-conf)
+    return float(conf[rows, cols].sum() / conf.sum())
+
+
+def _run_diarize(audio: np.ndarray, script: list[tuple[float, float, str]], with_embeddings: bool) -> list:
+    with patch("voiceforge.stt.diarizer.Pipeline") as p:
+        p.from_pretrained.return_value = _fake_pipeline(script, with_embeddings)
+        d = Diarizer(auth_token="bench")
+        return d.diarize(audio, sample_rate=SAMPLE_RATE)
+
+
+@pytest.mark.benchmark
+def test_bench_diarizer_cross_window_linking(benchmark: BenchmarkFixture) -> None:
+    """20 min, 4 speakers: linked labels stay consistent (> 0.95) vs per-window labels; report sec per audio minute."""
+    minutes = 20.0
+    audio, script = _synthetic_meeting(minutes)
+
+    t0 = time.perf_counter()
+    unlinked = _run_diarize(audio, script, with_embeddings=False)
+    unlinked_sec = time.perf_counter() - t0
+    linked = benchmark.pedantic(_run_diarize, args=(audio, script, True), rounds=3, iterations=1)
+
+    linked_consistency = _consistency(linked, script)
+    unlinked_consistency = _consistency(unlinked, script)
+    per_minute = benchmark.stats.stats.mean / minutes
+    benchmark.extra_info.update(
+        {
+            "audio_minutes": minutes,
+            "windows": int(np.ceil(minutes * 60 / WINDOW_SEC)),
+            "consistency_linked": round(linked_consistency, 4),
+            "consistency_per_window_labels": round(unlinked_consistency, 4),
+            "speakers_linked": len({s.speaker for s in linked}),
+            "sec_per_audio_minute": round(per_minute, 5),
+            "sec_per_audio_minute_unlinked": round(unlinked_sec / minutes, 5),
+        }
+    )
+    print(benchmark.extra_info)
+    assert len({s.speaker for s in linked}) == len(_VOICES)
+    assert linked_consistency > 0.95
+    assert linked_consistency > unlinked_consistency
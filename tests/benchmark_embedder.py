@@ -0,0 +1,87 @@
+"""Benchmark: ONNX MiniLM embedder — per-query latency and chunks/sec by batch size.
+
+Run: uv run pytest tests/benchmark_embedder.py -s. Needs the model in get_default_model_dir() (skipped otherwise).
+Chunks are synthetic with mixed lengths (20-250 words), like PDF/Markdown chunks; the chunks/sec figure is compared
+with the previous behaviour of padding every input to MAX_LENGTH in input order.
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from voiceforge.rag import _onnx_runner
+from voiceforge.rag.embedder import MAX_LENGTH, MiniLMEmbedder, get_default_model_dir
+
+_BATCH_SIZES = (1, 8, 32, 64)
+_N_CHUNKS = 256
+
+
+def _embedder() -> MiniLMEmbedder:
+    try:
+        return MiniLMEmbedder(get_default_model_dir())
+    except (FileNotFoundError, ImportError) as e:
+        pytest.skip(f"MiniLM ONNX model unavailable: {e}")
+
+
+def _chunks(n: int, seed: int = 0) -> list[str]:
+    rng = np.random.default_rng(seed)
+    words = [
+        "meeting",
+        "budget",
+        "contract",
+        "release",
+        "schedule",
+        "review",
+        "customer",
+        "report",
+        "quarter",
+        "risk",
+        "owner",
+        "deadline",
+    ]
+    return [" ".join(rng.choice(words, size=int(rng.integers(20, 250)))) for _ in range(n)]
+
+
+def _encode_fixed_padding(emb: MiniLMEmbedder, texts: list[str], batch_size: int) -> np.ndarray:
+    """Previous behaviour: input order, every batch padded to MAX_LENGTH."""
+    out = []
+    for i in range(0, len(texts), batch_size):
+        enc = emb._tokenizer.encode_batch(texts[i : i + batch_size], add_special_tokens=True)
+        input_ids, mask = _onnx_runner._token_arrays(enc, MAX_LENGTH)
+        pad = MAX_LENGTH - input_ids.shape[1]
+        out.append(_onnx_runner._run(emb._session, np.pad(input_ids, ((0, 0), (0, pad))), np.pad(mask, ((0, 0), (0, pad)))))
+    return np.vstack(out)
+
+
+@pytest.mark.benchmark
+def test_bench_embed_query_latency(benchmark: BenchmarkFixture) -> None:
+    """One short search query (the HybridSearcher path)."""
+    emb = _embedder()
+    benchmark(emb.encode, ["when is the contract renewal deadline"])
+    benchmark.extra_info["query_ms"] = round(benchmark.stats.stats.mean * 1000, 2)
+    print(benchmark.extra_info)
+
+
+@pytest.mark.benchmark
+def test_bench_embed_chunks_per_sec(benchmark: BenchmarkFixture) -> None:
+    """Chunks/sec at several batch sizes, bucketed dynamic padding vs fixed MAX_LENGTH padding."""
+    emb = _embedder()
+    texts = _chunks(_N_CHUNKS)
+    for bs in _BATCH_SIZES:
+        t0 = time.perf_counter()
+        dynamic = emb.encode(texts, batch_size=bs)
+        dynamic_sec = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        fixed = _encode_fixed_padding(emb, texts, bs)
+        fixed_sec = time.perf_counter() - t0
+        benchmark.extra_info[f"chunks_per_sec_bs{bs}"] = round(_N_CHUNKS / dynamic_sec, 1)
+        benchmark.extra_info[f"chunks_per_sec_bs{bs}_fixed_padding"] = round(_N_CHUNKS / fixed_sec, 1)
+        if fixed.ndim == 2 and fixed.shape[1] == dynamic.shape[1]:
+            cos = np.sum(dynamic * fixed, axis=1) / (np.linalg.norm(dynamic, axis=1) * np.linalg.norm(fixed, axis=1))
+            benchmark.extra_info[f"min_cosine_vs_fixed_bs{bs}"] = round(float(cos.min()), 5)
+    benchmark.pedantic(emb.encode, args=(texts,), kwargs={"batch_size": 32}, rounds=3, iterations=1)
+    print(benchmark.extra_info)
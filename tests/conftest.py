@@ -18,6 +18,35 @@ def raise_when_called(exc: Exception):
     return _inner
 
 
+@pytest.fixture(autouse=True)
+def _fresh_backend_registry():
+    """Process-wide backend caches (settings, keyring presence, Ollama health) must not leak between tests."""
+    from voiceforge.core import backends
+
+    backends.invalidate()
+    yield
+    backends.invalidate()
+
+
+@pytest.fixture(autouse=True)
+def _close_transcript_pools():
+    """Shared TranscriptLog connections (default DB per XDG_DATA_HOME) are closed after each test."""
+    yield
+    from voiceforge.core.transcript_log import close_transcript_pools
+
+    close_transcript_pools()
+
+
+@pytest.fixture(autouse=True)
+def _clear_analysis_cache():
+    """Pipeline results cached by audio hash must not leak into tests that mock STT/step 2 differently."""
+    from voiceforge.core.analysis_cache import clear_analysis_cache
+
+    clear_analysis_cache()
+    yield
+    clear_analysis_cache()
+
+
 @pytest.fixture
 def mock_pw_record_silence():
     """Mock pw-record subprocess: stdout yields silence PCM (s16le 16kHz mono). Reusable in CI."""
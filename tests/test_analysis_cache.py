@@ -0,0 +1,120 @@
+"""Analysis cache (core.analysis_cache): content-addressed step 1/2 results, STT overlap reuse, LRU memory cap."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+
+from voiceforge.core.analysis_cache import AnalysisCache, audio_digest
+from voiceforge.core.pipeline import TARGET_SAMPLE_RATE, AnalysisPipeline
+
+SR = TARGET_SAMPLE_RATE
+
+
+@dataclass
+class _Seg:
+    start: float
+    end: float
+    text: str
+    words: list = field(default_factory=list)
+
+
+def _noise(seconds: float, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).integers(-3000, 3000, int(seconds * SR), dtype=np.int16)
+
+
+def test_lru_evicts_under_memory_cap() -> None:
+    cache = AnalysisCache(max_bytes=2500)
+    cache.put("a", np.zeros(500, dtype=np.int16))
+    cache.put("b", np.zeros(500, dtype=np.int16))
+    assert cache.get("a") is not None  # a is now most recently used
+    cache.put("c", np.zeros(500, dtype=np.int16))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.nbytes == 2000
+    cache.put("huge", np.zeros(4000, dtype=np.int16))  # larger than the cap: not stored
+    assert cache.get("huge") is None
+    cache.resize(1000)
+    assert cache.nbytes <= 1000
+
+
+def test_shifted_window_reuses_segments_inside_overlap() -> None:
+    stream = _noise(13)
+    old, new = stream[: 10 * SR], stream[3 * SR :]
+    cache = AnalysisCache(max_bytes=10 * 1024 * 1024)
+    segments = [_Seg(0, 2, "a"), _Seg(2.5, 4, "b"), _Seg(4.5, 6, "c"), _Seg(6.5, 8, "d"), _Seg(8.5, 9.5, "e")]
+    cache.put_stt(audio_digest(old), "local:tiny:auto", old, SR, segments, "a b c d e")
+
+    assert cache.find_overlap(new, SR, "local:small:auto") is None  # other model: no reuse
+    reused, cut = cache.find_overlap(new, SR, "local:tiny:auto")
+    # "a"/"b" start before the new window, "e" ends within the margin of the old window's end
+    assert [(s.text, s.start, s.end) for s in reused] == [("c", 1.5, 3.0), ("d", 3.5, 5.0)]
+    assert cut == 5 * SR
+    assert cache.find_overlap(_noise(10, seed=1), SR, "local:tiny:auto") is None
+
+
+def test_overlap_reuses_segment_starting_right_after_new_window_start() -> None:
+    """The margin applies to the cached window's end only; a segment starting just inside this window is kept."""
+    stream = _noise(13)
+    old, new = stream[: 10 * SR], stream[3 * SR :]
+    cache = AnalysisCache(max_bytes=10 * 1024 * 1024)
+    cache.put_stt(audio_digest(old), "local:tiny:auto", old, SR, [_Seg(3.2, 4.5, "edge"), _Seg(5.0, 6.0, "x")], "edge x")
+
+    reused, cut = cache.find_overlap(new, SR, "local:tiny:auto")
+    assert [s.text for s in reused] == ["edge", "x"]
+    assert cut == 3 * SR
+
+
+def test_pipeline_skips_stt_and_step2_for_same_window_and_transcribes_only_new_tail(tmp_path: Path) -> None:
+    stream = _noise(16)
+    ring = tmp_path / "ring.raw"
+    cfg = SimpleNamespace(
+        sample_rate=SR,
+        model_size="tiny",
+        pyannote_restart_hours=2,
+        pipeline_step2_timeout_sec=10.0,
+        pii_mode="ON",
+        calendar_context_enabled=False,
+        language="auto",
+        get_ring_file_path=lambda: str(ring),
+        get_rag_db_path=lambda: str(tmp_path / "rag.db"),
+    )
+    stt_calls: list[float] = []
+    step2_calls: list[str] = []
+
+    def fake_stt(audio, sample_rate, model_size, language_hint=None, cfg=None, out_warnings=None):
+        stt_calls.append(len(audio) / sample_rate)
+        segs = [_Seg(t, t + 1.5, f"s{t}") for t in np.arange(0.0, len(audio) / sample_rate - 1.5, 2.0)]
+        return (segs, " ".join(s.text for s in segs))
+
+    def fake_diar(audio_f, sample_rate, restart_hours, linker=None):
+        step2_calls.append("diarization")
+        return (["SPEAKER_00"], [])
+
+    def fake_rag(transcript, rag_db_path, for_short_capture=False):
+        step2_calls.append("rag")
+        return ("context", [], [])
+
+    with (
+        patch("voiceforge.core.pipeline._step1_stt", side_effect=fake_stt),
+        patch("voiceforge.core.pipeline._step2_diarization", side_effect=fake_diar),
+        patch("voiceforge.core.pipeline._step2_rag", side_effect=fake_rag),
+        AnalysisPipeline(cfg) as pipeline,
+    ):
+        ring.write_bytes(stream[: 10 * SR].tobytes())
+        first, _ = pipeline.run(seconds=10)
+        again, _ = pipeline.run(seconds=10)
+        assert stt_calls == [10.0]
+        assert step2_calls == ["diarization", "rag"]
+        assert again.transcript == first.transcript and again.context == "context"
+
+        ring.write_bytes(stream.tobytes())  # 6 s later: window shifted by 6 s
+        shifted, _ = pipeline.run(seconds=10)
+    assert stt_calls[1] < 10.0  # only the tail after the reused overlap
+    starts = [s.start for s in shifted.segments]
+    assert starts == sorted(starts) and starts[0] == 0.0
+    assert shifted.segments[-1].end <= 10.0
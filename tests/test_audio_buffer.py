@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import numpy as np
 
-from voiceforge.audio.buffer import BYTES_PER_SAMPLE, CHANNELS, SAMPLE_RATE, RingBuffer
+from voiceforge.audio.buffer import BYTES_PER_SAMPLE, CHANNELS, SAMPLE_RATE, RingBuffer, pcm_to_float32
 
 
 def test_ring_buffer_constants() -> None:
@@ -16,8 +16,8 @@ def test_ring_buffer_constants() -> None:
 def test_ring_buffer_write_empty_no_op() -> None:
     buf = RingBuffer(maxlen_seconds=1.0)
     buf.write(b"")
-    assert buf._total_bytes == 0
-    assert len(buf._chunks) == 0
+    assert buf.total_samples == 0
+    assert buf.available_samples == 0
 
 
 def test_ring_buffer_write_and_read_last() -> None:
@@ -51,7 +51,8 @@ def test_ring_buffer_drops_oldest_when_over_capacity() -> None:
     buf.write(b"\x00\x03" * 8000)  # total 1.5 s — should drop first 0.5 s
     out = buf.read_last(1.0)
     assert len(out) == 16000
-    assert buf._total_bytes <= 32000
+    assert buf.available_samples == buf.capacity == 16000
+    assert buf.total_samples == 24000
 
 
 def test_ring_buffer_read_last_less_than_stored() -> None:
@@ -61,3 +62,92 @@ def test_ring_buffer_read_last_less_than_stored() -> None:
     out = buf.read_last(0.25)  # 0.25 s = 4000 samples
     assert len(out) == 4000
     np.testing.assert_array_equal(out, np.arange(12000, 16000, dtype=np.int16))
+
+
+def test_ring_buffer_read_since_cursor_and_gap() -> None:
+    """read_since returns only samples after the cursor; odd trailing bytes wait for the next write."""
+    buf = RingBuffer(maxlen_seconds=1.0, sample_rate=100)  # 100 samples retained
+    data = np.arange(250, dtype=np.int16).tobytes()
+    buf.write(data[:61])  # 30 samples + odd byte
+    out, total = buf.read_since(None)
+    assert total == 30
+    np.testing.assert_array_equal(out, np.arange(30, dtype=np.int16))
+    buf.write(data[61:100])
+    out, total = buf.read_since(30)
+    assert total == 50 == buf.total_samples
+    np.testing.assert_array_equal(out, np.arange(30, 50, dtype=np.int16))
+    for i in range(100, 500, 40):
+        buf.write(data[i : i + 40])
+    out, total = buf.read_since(50)  # cursor fell out of the retained window
+    assert total == 250
+    np.testing.assert_array_equal(out, np.arange(150, 250, dtype=np.int16))
+    out, total = buf.read_since(240, max_samples=5)
+    np.testing.assert_array_equal(out, np.arange(245, 250, dtype=np.int16))
+    assert buf.read_since(250)[0].size == 0
+
+
+def test_ring_buffer_wrap_read_range_and_views() -> None:
+    """Positions are on the sample clock; a non-wrapping range can be read as a view, a wrapping one is one copy."""
+    buf = RingBuffer(maxlen_seconds=1.0, sample_rate=10)  # 10 samples
+    buf.write(np.arange(14, dtype=np.int16).tobytes())  # larger than capacity: keeps the last 10
+    out, first = buf.read_range(0, 14)
+    assert first == 4
+    np.testing.assert_array_equal(out, np.arange(4, 14, dtype=np.int16))
+    view, first = buf.read_range(5, 9, copy=False)  # clock 5..8 sits at ring 5..8: no wrap
+    assert first == 5 and view.base is not None
+    np.testing.assert_array_equal(view, [5, 6, 7, 8])
+    buf.write(np.arange(14, 17, dtype=np.int16).tobytes())
+    np.testing.assert_array_equal(buf.read_last(0.5), np.arange(12, 17, dtype=np.int16))
+    assert buf.read_range(20, 30)[0].size == 0
+
+
+def test_ring_buffer_float_mirror_matches_conversion() -> None:
+    """float32=True converts once on write; float reads equal pcm_to_float32 of the int16 samples."""
+    pcm = np.array([-32768, -16384, 0, 1, 16384, 32767] * 3, dtype=np.int16)
+    mirrored = RingBuffer(maxlen_seconds=1.0, sample_rate=8, float32=True)
+    plain = RingBuffer(maxlen_seconds=1.0, sample_rate=8)
+    for buf in (mirrored, plain):
+        buf.write(pcm[:7].tobytes())
+        buf.write(pcm[7:].tobytes())  # wraps
+    expected = pcm_to_float32(pcm[-8:])
+    for buf in (mirrored, plain):
+        out = buf.read_last(1.0, dtype=np.float32)
+        assert out.dtype == np.float32
+        np.testing.assert_array_equal(out, expected)
+        got, total = buf.read_since(15, dtype=np.float32)
+        assert total == 18
+        np.testing.assert_array_equal(got, expected[-3:])
+    np.testing.assert_array_equal(mirrored.read_last(1.0), pcm[-8:])
+
+
+def test_ring_buffer_read_drops_samples_the_writer_is_overwriting() -> None:
+    """A reader racing the writer never returns a mix of old and new audio: the announced range is dropped."""
+    buf = RingBuffer(maxlen_seconds=1.0, sample_rate=10)
+    buf.write(np.arange(10, dtype=np.int16).tobytes())
+    buf._writing = 13  # writer announced 3 more samples, not yet published
+    out, first = buf.read_range(0, 10)
+    assert first == 3
+    np.testing.assert_array_equal(out, np.arange(3, 10, dtype=np.int16))
+    out, total = buf.read_since(0)
+    assert total == 10 and total - out.size > 0  # caller sees the gap
+
+
+def test_ring_buffer_float_read_converts_before_checking_writer(monkeypatch) -> None:
+    """Without a float mirror the int16 view is converted before the writer check, so samples the writer
+    overwrites during the conversion are dropped instead of returned."""
+    import voiceforge.audio.buffer as buffer_mod
+
+    buf = RingBuffer(maxlen_seconds=1.0, sample_rate=10)
+    buf.write(np.arange(10, dtype=np.int16).tobytes())
+    real_convert = buffer_mod.pcm_to_float32
+
+    def convert_while_writer_overwrites(pcm: np.ndarray) -> np.ndarray:
+        out = real_convert(pcm)
+        buf._writing = 13  # writer announces 3 samples and overwrites the oldest ones
+        buf._pcm[:3] = 99
+        return out
+
+    monkeypatch.setattr(buffer_mod, "pcm_to_float32", convert_while_writer_overwrites)
+    out, first = buf.read_range(0, 10, dtype=np.float32)
+    assert first == 3
+    np.testing.assert_array_equal(out, real_convert(np.arange(3, 10, dtype=np.int16)))
@@ -168,3 +168,20 @@ def test_reader_loop_handles_empty_data_and_returncode() -> None:
     proc.poll.return_value = 1
     cap._reader_loop(proc, stream, buf, "mic")
     assert stream.read.called
+
+
+def test_reader_loop_appends_to_ring_file(tmp_path) -> None:
+    """With a ring file, mic reader appends only the new bytes to the mmap ring."""
+    import numpy as np
+
+    from voiceforge.audio.buffer import RingBuffer, RingFile, read_ring_file_last
+    from voiceforge.audio.capture import AudioCapture
+
+    cap = AudioCapture(buffer_seconds=1.0)
+    ring = RingFile(tmp_path / "ring.raw", 1.0, 16000)
+    data = np.arange(16000, dtype=np.int16).tobytes()
+    proc = MagicMock()
+    proc.poll.return_value = 0
+    cap._reader_loop(proc, io.BytesIO(data), RingBuffer(1.0, 16000), "mic", ring)
+    ring.close()
+    np.testing.assert_array_equal(read_ring_file_last(tmp_path / "ring.raw", 1.0), np.arange(16000, dtype=np.int16))
@@ -0,0 +1,131 @@
+"""Backend registry: cached Settings, key presence and Ollama health (core.backends)."""
+
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+
+from voiceforge.core import backends
+
+
+def _count_probes(monkeypatch, keys: dict[str, bool], ollama: bool) -> dict[str, int]:
+    calls = {"keys": 0, "ollama": 0}
+
+    def probe_keys() -> dict[str, bool]:
+        calls["keys"] += 1
+        return dict(keys)
+
+    def probe_ollama() -> bool:
+        calls["ollama"] += 1
+        return ollama
+
+    monkeypatch.setattr(backends, "_probe_api_keys", probe_keys)
+    monkeypatch.setattr(backends, "_probe_ollama", probe_ollama)
+    backends.invalidate()
+    return calls
+
+
+@pytest.mark.parametrize(
+    ("mode", "keys", "ollama", "expected"),
+    [
+        ("hybrid", {"anthropic": True}, True, ("anthropic/claude-haiku-4-5", False)),
+        ("hybrid", {}, True, ("ollama/phi3:mini", True)),
+        ("hybrid", {}, False, (None, False)),
+        ("cloud", {}, True, (None, False)),
+        ("offline", {"anthropic": True}, True, ("ollama/phi3:mini", True)),
+    ],
+)
+def test_resolve_effective_llm_modes(monkeypatch, mode, keys, ollama, expected) -> None:
+    _count_probes(monkeypatch, keys, ollama)
+    assert backends.resolve_effective_llm(mode, "anthropic/claude-haiku-4-5", "phi3:mini") == expected
+
+
+def test_health_is_probed_once_within_ttl(monkeypatch) -> None:
+    calls = _count_probes(monkeypatch, {}, True)
+    for _ in range(20):
+        assert backends.resolve_effective_llm("hybrid", "m", "phi3:mini") == ("ollama/phi3:mini", True)
+        assert backends.ollama_available() is True
+    assert calls == {"keys": 1, "ollama": 1}
+    # key present: Ollama is not needed at all
+    calls = _count_probes(monkeypatch, {"openai": True}, True)
+    backends.resolve_effective_llm("hybrid", "m", "phi3:mini")
+    assert calls == {"keys": 1, "ollama": 0}
+    assert backends.api_key_present("openai") is True
+    assert backends.api_key_present("google") is False
+
+
+def test_stale_value_is_served_while_refreshing(monkeypatch) -> None:
+    state = {"up": True, "calls": 0}
+
+    def probe() -> bool:
+        state["calls"] += 1
+        return state["up"]
+
+    value = backends._TTLValue(probe, ttl_sec=0.0)
+    assert value.get() is True
+    state["up"] = False
+    assert value.get() is True  # stale, background refresh started
+    deadline = time.monotonic() + 2.0
+    while value._value is not False and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert value._value is False
+    assert state["calls"] == 2
+
+
+def test_get_settings_rebuilt_on_config_change(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    monkeypatch.delenv("VOICEFORGE_OLLAMA_MODEL", raising=False)
+    cfg_dir = tmp_path / "voiceforge"
+    cfg_dir.mkdir()
+    yaml_path = cfg_dir / "voiceforge.yaml"
+    yaml_path.write_text("ollama_model: llama3:8b\n", encoding="utf-8")
+
+    first = backends.get_settings()
+    assert first.ollama_model == "llama3:8b"
+    assert backends.get_settings() is first
+
+    yaml_path.write_text("ollama_model: qwen2:7b\n", encoding="utf-8")
+    st = yaml_path.stat()
+    os.utime(yaml_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    second = backends.get_settings()
+    assert second is not first
+    assert second.ollama_model == "qwen2:7b"
+
+    monkeypatch.setenv("VOICEFORGE_OLLAMA_MODEL", "mistral:7b")
+    assert backends.get_settings().ollama_model == "mistral:7b"
+
+
+def test_health_refresh_thread_stops(monkeypatch) -> None:
+    calls = _count_probes(monkeypatch, {"openai": True}, True)
+    backends.start_health_refresh(interval_sec=0.01)
+    thread = backends._refresh_thread
+    assert thread is not None and thread.is_alive()
+    deadline = time.monotonic() + 2.0
+    while calls["ollama"] == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    backends.stop_health_refresh()
+    assert calls["ollama"] > 0
+    assert not thread.is_alive()
+    assert backends._refresh_thread is None
+
+
+def test_health_refresh_probes_keys_on_their_own_ttl(monkeypatch) -> None:
+    """Key presence (audited keyring reads) is re-probed once per API_KEY_TTL_SEC, Ollama on every tick."""
+    calls = _count_probes(monkeypatch, {"openai": True}, True)
+    clock = [0.0]
+    monkeypatch.setattr(backends.time, "monotonic", lambda: clock[0])
+
+    class _Ticks:
+        def __init__(self, n: int) -> None:
+            self.n = n
+
+        def wait(self, interval_sec: float) -> bool:
+            clock[0] += interval_sec
+            self.n -= 1
+            return self.n < 0
+
+    interval = backends.OLLAMA_TTL_SEC
+    backends._refresh_loop(interval, _Ticks(8))  # ticks at 15 s .. 120 s
+    assert calls == {"keys": 2, "ollama": 8}
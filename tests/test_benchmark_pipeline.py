@@ -1,4 +1,4 @@
-"""Block 88: Benchmark for pipeline-related operations (TranscriptLog get_sessions).
+"""Block 88: Benchmark for pipeline-related operations (TranscriptLog get_sessions, session listing on 10k sessions).
 
 Full end-to-end pipeline benchmark (audio -> analyze) requires real models and is run manually.
 This test provides a reproducible benchmark for the DB layer used by the pipeline.
@@ -6,7 +6,7 @@ This test provides a reproducible benchmark for the DB layer used by the pipelin
 
 from __future__ import annotations
 
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
 
 import pytest
@@ -38,3 +38,130 @@ def test_benchmark_get_sessions(benchmark: object, tmp_path: Path) -> None:
         assert len(result) == 100
     finally:
         log2.close()
+
+
+BIG_SESSIONS = 12_000  # ~3 years of a busy calendar
+SEGMENTS_PER_SESSION = 8
+
+
+def _fill_big_db(db: Path) -> None:
+    """BIG_SESSIONS sessions (one per ~2 h) with segments and an analysis each, inserted in one transaction."""
+    log = TranscriptLog(db_path=db)
+    conn = log._get_conn()
+    base = datetime(2026, 1, 1, tzinfo=UTC)
+    for i in range(BIG_SESSIONS):
+        started = base - timedelta(hours=2 * i)
+        cur = conn.execute(
+            "INSERT INTO sessions (started_at, ended_at, duration_sec) VALUES (?, ?, ?)",
+            (started.isoformat(), (started + timedelta(minutes=30)).isoformat(), 1800.0),
+        )
+        sid = cur.lastrowid
+        conn.executemany(
+            "INSERT INTO segments (session_id, start_sec, end_sec, speaker, text) VALUES (?, ?, ?, ?, ?)",
+            [(sid, j * 5.0, j * 5.0 + 5, f"SPEAKER_{j % 3}", f"session {i} segment {j}") for j in range(SEGMENTS_PER_SESSION)],
+        )
+        conn.execute(
+            "INSERT INTO analyses (session_id, timestamp, model, questions, answers, recommendations, action_items) "
+            "VALUES (?, ?, 'test', '[]', ?, '[]', '[]')",
+            (sid, started.isoformat(), f'["summary {i}"]'),
+        )
+    conn.commit()
+    log.close()
+
+
+@pytest.mark.benchmark
+def test_benchmark_session_listing_10k(benchmark: object, tmp_path: Path) -> None:
+    """History page (get_sessions_for_display, 50 rows) and a month of get_sessions_in_range on 12k sessions."""
+    db = tmp_path / "big.db"
+    _fill_big_db(db)
+    log = TranscriptLog(db_path=db)
+    try:
+
+        def listing() -> tuple[int, int]:
+            page = log.get_sessions_for_display(50, offset=5000)
+            month = log.get_sessions_in_range(date(2025, 6, 1), date(2025, 6, 30))
+            return len(page), len(month)
+
+        pages, month = benchmark(listing)  # NOSONAR S5864: pytest-benchmark fixture is callable
+        assert pages == 50
+        assert month == 360  # 12 sessions per day
+        row = log.get_sessions_for_display(1)[0]
+        assert (row.segments_count, row.speaker_count) == (SEGMENTS_PER_SESSION, 3)
+        assert row.summary_preview == f"summary {BIG_SESSIONS - 1}"  # newest id = last inserted
+    finally:
+        log.close()
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("n_segments", [1_000, 10_000])
+def test_benchmark_log_session_segments(benchmark: object, tmp_path: Path, n_segments: int) -> None:
+    """log_session throughput for long meetings: bulk segment insert + set-based FTS/counter maintenance."""
+    log = TranscriptLog(db_path=tmp_path / "log.db")
+    segments = [
+        {"start_sec": i * 3.0, "end_sec": i * 3.0 + 3, "speaker": f"SPEAKER_{i % 4}", "text": f"segment {i} of a long meeting"}
+        for i in range(n_segments)
+    ]
+    try:
+        benchmark(log.log_session, segments, model="test", answers=["summary"])  # NOSONAR S5864
+        assert log.get_sessions(1)[0].segments_count == n_segments
+        if benchmark.stats:  # type: ignore[attr-defined]  # None with --benchmark-disable
+            benchmark.extra_info["segments_per_sec"] = round(n_segments / benchmark.stats.stats.mean)  # type: ignore[attr-defined]
+            print(benchmark.extra_info)  # type: ignore[attr-defined]
+    finally:
+        log.close()
+
+
+@pytest.mark.benchmark
+def test_benchmark_month_period_report(benchmark: object, tmp_path: Path) -> None:
+    """Month of transcripts on 12k sessions: streamed period text (one join query) plus SQL period aggregates."""
+    db = tmp_path / "big.db"
+    _fill_big_db(db)
+    log = TranscriptLog(db_path=db)
+    try:
+
+        def report() -> tuple[int, int]:
+            text = log.get_period_text(date(2025, 6, 1), date(2025, 6, 30))
+            stats = log.get_period_stats(date(2025, 6, 1), date(2025, 6, 30))
+            return len(text), stats.segments_count
+
+        chars, segments = benchmark(report)  # NOSONAR S5864: pytest-benchmark fixture is callable
+        assert segments == 360 * SEGMENTS_PER_SESSION
+        assert chars > 0
+    finally:
+        log.close()
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("n_segments", [1_000, 10_000])
+def test_benchmark_speaker_attribution(benchmark: object, n_segments: int) -> None:
+    """Speaker attribution for long meetings: sorted interval join, linear in segments + turns (10x input ~10x time)."""
+    from types import SimpleNamespace
+
+    from voiceforge.stt.speaker_attribution import attribute_segments
+
+    segments = [SimpleNamespace(start=i * 3.0, end=i * 3.0 + 2.5, text=f"segment {i}", words=[]) for i in range(n_segments)]
+    turns = [SimpleNamespace(start=i * 7.0, end=i * 7.0 + 7.5, speaker=f"SPEAKER_{i % 4:02d}") for i in range(n_segments // 2)]
+    out = benchmark(attribute_segments, segments, turns)  # NOSONAR S5864
+    assert len(out) == n_segments and all(a.speaker for a in out)
+    if benchmark.stats:  # type: ignore[attr-defined]  # None with --benchmark-disable
+        benchmark.extra_info["segments_per_sec"] = round(n_segments / benchmark.stats.stats.mean)  # type: ignore[attr-defined]
+        print(benchmark.extra_info)  # type: ignore[attr-defined]
+
+
+@pytest.mark.benchmark
+def test_benchmark_ring_buffer_write_read_last(benchmark: object) -> None:
+    """Capture ring at PipeWire chunk size: 100 ms writes into a 5 min ring, then a 30 s float read (analyze window)."""
+    import numpy as np
+
+    from voiceforge.audio.buffer import RingBuffer
+
+    buf = RingBuffer(300.0, 16000, float32=True)
+    chunk = np.zeros(1600, dtype=np.int16).tobytes()
+
+    def run() -> np.ndarray:
+        for _ in range(300):
+            buf.write(chunk)
+        return buf.read_last(30.0, dtype=np.float32)
+
+    out = benchmark(run)  # NOSONAR S5864
+    assert out.size == 30 * 16000 and out.dtype == np.float32
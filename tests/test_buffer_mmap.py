@@ -51,3 +51,116 @@ def test_read_ring_file_last_request_more_than_file(tmp_path: Path) -> None:
     p.write_bytes(half_sec.tobytes())
     out = read_ring_file_last(p, 10.0, sample_rate=16000)
     assert len(out) == 8000
+
+
+def test_ring_file_preallocated_and_empty(tmp_path: Path) -> None:
+    """RingFile preallocates header + capacity; no samples until append."""
+    from voiceforge.audio.buffer import RING_FILE_HEADER_SIZE, RingFile, is_ring_file, ring_file_has_audio
+
+    p = tmp_path / "ring.raw"
+    ring = RingFile(p, maxlen_seconds=1.0, sample_rate=16000)
+    try:
+        assert p.stat().st_size == RING_FILE_HEADER_SIZE + 32000
+        assert is_ring_file(p)
+        assert not ring_file_has_audio(p)
+        assert len(read_ring_file_last(p, 1.0)) == 0
+    finally:
+        ring.close()
+
+
+def test_ring_file_append_and_wrapped_tail(tmp_path: Path) -> None:
+    """Appends wrap around the head pointer; reader unwraps the tail in order."""
+    from voiceforge.audio.buffer import RingFile, ring_file_has_audio
+
+    p = tmp_path / "ring.raw"
+    ring = RingFile(p, maxlen_seconds=1.0, sample_rate=1000)  # capacity 1000 samples
+    try:
+        data = np.arange(2500, dtype=np.int16)
+        for i in range(0, 2500, 300):
+            ring.append(data[i : i + 300].tobytes())
+        assert ring.total_samples == 2500
+        assert ring_file_has_audio(p)
+        out = read_ring_file_last(p, 1.0, sample_rate=1000)
+        np.testing.assert_array_equal(out, data[-1000:])
+        out_half = read_ring_file_last(p, 0.4, sample_rate=1000)
+        np.testing.assert_array_equal(out_half, data[-400:])
+    finally:
+        ring.close()
+
+
+def test_ring_file_zero_copy_view_and_odd_bytes(tmp_path: Path) -> None:
+    """copy=False returns a read-only view for a contiguous tail; odd trailing byte is carried to next append."""
+    from voiceforge.audio.buffer import RingFile
+
+    p = tmp_path / "ring.raw"
+    ring = RingFile(p, maxlen_seconds=1.0, sample_rate=1000)
+    try:
+        raw = np.arange(10, dtype=np.int16).tobytes()
+        ring.append(raw[:5])
+        ring.append(raw[5:])
+        assert ring.total_samples == 10
+        view = read_ring_file_last(p, 1.0, sample_rate=1000, copy=False)
+        assert not view.flags.writeable
+        np.testing.assert_array_equal(view, np.arange(10, dtype=np.int16))
+    finally:
+        ring.close()
+
+
+def test_ring_file_append_larger_than_capacity(tmp_path: Path) -> None:
+    """A single append larger than the ring keeps only the newest capacity samples."""
+    from voiceforge.audio.buffer import RingFile
+
+    p = tmp_path / "ring.raw"
+    ring = RingFile(p, maxlen_seconds=0.1, sample_rate=1000)  # 100 samples
+    try:
+        ring.append(np.arange(50, dtype=np.int16).tobytes())
+        ring.append(np.arange(50, 300, dtype=np.int16).tobytes())
+        out = read_ring_file_last(p, 10.0, sample_rate=1000)
+        np.testing.assert_array_equal(out, np.arange(200, 300, dtype=np.int16))
+        assert ring.total_samples == 300
+    finally:
+        ring.close()
+
+
+def test_ring_file_reopen_keeps_audio_and_sample_clock(tmp_path: Path) -> None:
+    """Reopening a matching ring file keeps its audio (crash recovery); create=True or another capacity resets it."""
+    from voiceforge.audio.buffer import RingFile
+
+    p = tmp_path / "ring.raw"
+    ring = RingFile(p, maxlen_seconds=1.0, sample_rate=1000)
+    ring.append(np.arange(600, dtype=np.int16).tobytes())
+    ring.close()
+    ring = RingFile(p, maxlen_seconds=1.0, sample_rate=1000)
+    try:
+        assert ring.total_samples == 600
+        ring.append(np.arange(600, 700, dtype=np.int16).tobytes())
+        np.testing.assert_array_equal(read_ring_file_last(p, 1.0, sample_rate=1000), np.arange(700, dtype=np.int16))
+    finally:
+        ring.close()
+    ring = RingFile(p, maxlen_seconds=1.0, sample_rate=1000, create=True)
+    ring.close()
+    assert len(read_ring_file_last(p, 1.0, sample_rate=1000)) == 0
+    RingFile(p, maxlen_seconds=1.0, sample_rate=1000).close()
+    ring = RingFile(p, maxlen_seconds=0.5, sample_rate=1000)
+    try:
+        assert ring.total_samples == 0
+    finally:
+        ring.close()
+
+
+def test_ring_file_reader_drops_samples_the_writer_announced(tmp_path: Path) -> None:
+    """Seqlock check: samples the writer announced it is overwriting (writing field) are dropped after the copy."""
+    from voiceforge.audio.buffer import _RING_U64, _RING_WRITING_POS, RingFile, read_ring_file_since
+
+    p = tmp_path / "ring.raw"
+    ring = RingFile(p, maxlen_seconds=0.1, sample_rate=1000)  # 100 samples
+    try:
+        ring.append(np.arange(100, dtype=np.int16).tobytes())
+        assert ring._mm is not None
+        _RING_U64.pack_into(ring._mm, _RING_WRITING_POS, 130)  # writer is copying 30 more samples
+        np.testing.assert_array_equal(read_ring_file_last(p, 1.0, sample_rate=1000), np.arange(30, 100, dtype=np.int16))
+        out, total = read_ring_file_since(p, 0, 1000)
+        assert total == 100
+        np.testing.assert_array_equal(out, np.arange(30, 100, dtype=np.int16))
+    finally:
+        ring.close()
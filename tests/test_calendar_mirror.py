@@ -0,0 +1,238 @@
+"""Local CalDAV mirror: ctag skip, sync-token / ETag incremental refresh, recurring expansion, local lookups."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from caldav.lib import error as dav_error
+
+from voiceforge.calendar import mirror as mirror_mod
+from voiceforge.calendar.mirror import CalendarMirror, CalendarSync
+
+_NOW = datetime.now(UTC).replace(microsecond=0)
+
+
+def _ical(uid: str, summary: str, start: datetime, minutes: int = 30, rrule: str = "") -> str:
+    fmt = "%Y%m%dT%H%M%SZ"
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//test//EN",
+        "BEGIN:VEVENT",
+        f"UID:{uid}",
+        f"DTSTAMP:{start.strftime(fmt)}",
+        f"DTSTART:{start.strftime(fmt)}",
+        f"DTEND:{(start + timedelta(minutes=minutes)).strftime(fmt)}",
+        f"SUMMARY:{summary}",
+    ]
+    if rrule:
+        lines.append(f"RRULE:{rrule}")
+    return "\r\n".join([*lines, "END:VEVENT", "END:VCALENDAR"])
+
+
+class _Obj:
+    def __init__(self, server: _FakeCalendar, href: str, with_data: bool) -> None:
+        self._server = server
+        self.url = href
+        etag = server.items.get(href, (None, None))[0]
+        self.props = {"{DAV:}getetag": etag} if etag else {}
+        self.data = server.items[href][1] if with_data and href in server.items else None
+
+    def load(self) -> None:
+        self._server.loads.append(self.url)
+        if self.url not in self._server.items:
+            raise dav_error.NotFoundError(self.url)
+        self.data = self._server.items[self.url][1]
+
+
+class _Collection(list):
+    def __init__(self, objects: list[_Obj], sync_token: str) -> None:
+        super().__init__(objects)
+        self.sync_token = sync_token
+
+
+class _FakeCalendar:
+    """CalDAV collection stand-in: ctag, sync-collection REPORT with a change log, ETags per resource."""
+
+    def __init__(self, url: str, name: str, supports_sync: bool = True) -> None:
+        self.url = url
+        self.name = name
+        self.items: dict[str, tuple[str, str]] = {}
+        self.version = 0
+        self.changes: list[tuple[int, str]] = []
+        self.supports_sync = supports_sync
+        self.loads: list[str] = []
+        self.reports: list[str | None] = []
+
+    def put(self, href: str, ical: str) -> None:
+        self.version += 1
+        self.items[href] = (f'"e{self.version}"', ical)
+        self.changes.append((self.version, href))
+
+    def delete(self, href: str) -> None:
+        self.version += 1
+        self.items.pop(href)
+        self.changes.append((self.version, href))
+
+    def get_property(self, prop) -> str:
+        return f"ctag-{self.version}"
+
+    def objects_by_sync_token(self, sync_token=None, load_objects=False) -> _Collection:
+        self.reports.append(sync_token)
+        if not self.supports_sync:  # library fallback: full listing with data and a fake token
+            return _Collection([_Obj(self, h, with_data=True) for h in self.items], f"fake-{self.version}")
+        if sync_token is None:
+            hrefs = list(self.items)
+        else:
+            since = int(sync_token.split("-")[1])
+            hrefs = list(dict.fromkeys(h for v, h in self.changes if v > since))
+        return _Collection([_Obj(self, h, with_data=False) for h in hrefs], f"tok-{self.version}")
+
+
+class _Principal:
+    def __init__(self, calendars: list[_FakeCalendar]) -> None:
+        self._calendars = calendars
+
+    def calendars(self) -> list[_FakeCalendar]:
+        return self._calendars
+
+
+@pytest.fixture
+def server(monkeypatch):
+    cal = _FakeCalendar("https://dav.example/cal/work/", "Work")
+    clients: list[object] = []
+
+    class FakeClient:
+        def __init__(self, url, username, password) -> None:
+            clients.append(self)
+
+        def principal(self) -> _Principal:
+            return _Principal([cal])
+
+    monkeypatch.setattr("caldav.davclient.DAVClient", FakeClient)
+    monkeypatch.setattr(mirror_mod, "_require_caldav_credentials", lambda: (("https://dav.example", "u", "p"), None))
+    cal.clients = clients
+    return cal
+
+
+def test_sync_skips_unchanged_by_ctag_and_applies_incremental_changes(tmp_path: Path, server: _FakeCalendar) -> None:
+    server.put("/a.ics", _ical("a", "Standup", _NOW + timedelta(hours=1)))
+    server.put("/b.ics", _ical("b", "Review", _NOW + timedelta(hours=3)))
+    sync = CalendarSync(CalendarMirror(tmp_path / "m.db"))
+
+    first = sync.sync_once()
+    assert (first.fetched, first.unchanged) == (2, 0)
+    assert [e["summary"] for e in sync.mirror.events_starting(_NOW, _NOW + timedelta(hours=24))] == ["Standup", "Review"]
+
+    server.loads.clear()
+    second = sync.sync_once()
+    assert second.unchanged == 1
+    assert server.reports == [None]  # no REPORT when the ctag is unchanged
+
+    server.put("/a.ics", _ical("a", "Standup (moved)", _NOW + timedelta(hours=5)))
+    server.delete("/b.ics")
+    third = sync.sync_once()
+    assert server.reports[-1] == "tok-2"
+    assert (third.fetched, third.deleted) == (1, 1)
+    assert sorted(server.loads) == ["/a.ics", "/b.ics"]
+    events = sync.mirror.events_starting(_NOW, _NOW + timedelta(hours=24))
+    assert [e["summary"] for e in events] == ["Standup (moved)"]
+    assert len(server.clients) == 1  # one DAVClient (HTTP session) for all syncs
+    sync.mirror.close()
+
+
+def test_full_listing_without_sync_token_downloads_only_changed_etags(tmp_path: Path, server: _FakeCalendar) -> None:
+    server.supports_sync = False
+    server.put("/a.ics", _ical("a", "One", _NOW + timedelta(hours=1)))
+    server.put("/b.ics", _ical("b", "Two", _NOW + timedelta(hours=2)))
+    mirror = CalendarMirror(tmp_path / "m.db")
+    sync = CalendarSync(mirror)
+    sync.sync_once()
+
+    server.put("/b.ics", _ical("b", "Two v2", _NOW + timedelta(hours=2)))
+    server.delete("/a.ics")
+    stats = sync.sync_once()
+
+    assert (stats.fetched, stats.deleted) == (1, 1)
+    assert mirror.etags(server.url) == {"/b.ics": '"e3"'}
+    assert [e["summary"] for e in mirror.events_starting(_NOW, _NOW + timedelta(days=1))] == ["Two v2"]
+    mirror.close()
+
+
+def test_recurring_events_expand_and_ended_lookup(tmp_path: Path, server: _FakeCalendar) -> None:
+    server.put("/daily.ics", _ical("d", "Daily", _NOW - timedelta(hours=1, minutes=30), minutes=30, rrule="FREQ=DAILY;COUNT=5"))
+    mirror = CalendarMirror(tmp_path / "m.db")
+    CalendarSync(mirror).sync_once()
+
+    upcoming = mirror.events_starting(_NOW, _NOW + timedelta(days=7))
+    ended = mirror.events_ending(_NOW - timedelta(hours=2), _NOW - timedelta(minutes=1))
+    assert len(upcoming) == 4
+    assert [e["summary"] for e in ended] == ["Daily"]
+    mirror.close()
+
+
+def test_lookups_read_mirror_without_network(tmp_path: Path, server: _FakeCalendar, monkeypatch) -> None:
+    server.put("/a.ics", _ical("a", "Planning", _NOW + timedelta(hours=2)))
+    service = CalendarSync(CalendarMirror(tmp_path / "m.db"))
+    service.sync_once()
+    service.start = lambda: None  # no background thread in the test
+    monkeypatch.setattr(mirror_mod, "_service", service)
+    server.reports.clear()
+
+    ctx, err = mirror_mod.next_meeting_context(hours_ahead=24)
+    events, _ = mirror_mod.upcoming_events(hours_ahead=1)
+
+    assert err is None
+    assert ctx.startswith("Next meeting: Planning")
+    assert events == []
+    assert server.reports == []
+    service.mirror.close()
+
+
+def test_first_read_waits_for_initial_sync(tmp_path: Path, server: _FakeCalendar, monkeypatch) -> None:
+    """One-shot CLI analyze: the mirror is still empty, so the read waits (bounded) for the first background sync."""
+    server.put("/a.ics", _ical("a", "Planning", _NOW + timedelta(hours=2)))
+    service = CalendarSync(CalendarMirror(tmp_path / "m.db"), interval_sec=3600)
+    monkeypatch.setattr(mirror_mod, "_service", service)
+    try:
+        ctx, err = mirror_mod.next_meeting_context(hours_ahead=24)
+    finally:
+        service.stop()
+    assert err is None and ctx.startswith("Next meeting: Planning")
+    assert service.has_synced
+    service.mirror.close()
+
+
+def test_lookups_report_missing_credentials(tmp_path: Path, monkeypatch) -> None:
+    missing = "Missing keyring keys: caldav_url. Set: keyring set voiceforge <key>"
+    monkeypatch.setattr(mirror_mod, "_require_caldav_credentials", lambda: (None, missing))
+    service = CalendarSync(CalendarMirror(tmp_path / "m.db"))
+    service.start = lambda: pytest.fail("no background sync without credentials")
+    monkeypatch.setattr(mirror_mod, "_service", service)
+    assert mirror_mod.upcoming_events() == ([], missing)
+    assert mirror_mod.events_ended_at_least_minutes_ago() == ([], missing)
+    assert mirror_mod.next_meeting_context() == ("", missing)
+    service.mirror.close()
+
+
+def test_reads_reuse_credential_check_from_last_sync(tmp_path: Path, server: _FakeCalendar, monkeypatch) -> None:
+    """Lookups do not hit the keyring (audited secret reads) on every call; the sync refreshes the result."""
+    lookups: list[int] = []
+
+    def creds():
+        lookups.append(1)
+        return ("https://dav.example", "u", "p"), None
+
+    monkeypatch.setattr(mirror_mod, "_require_caldav_credentials", creds)
+    service = CalendarSync(CalendarMirror(tmp_path / "m.db"))
+    service.sync_once()
+    service.start = lambda: None
+    monkeypatch.setattr(mirror_mod, "_service", service)
+    for _ in range(3):
+        assert mirror_mod.upcoming_events()[1] is None
+    assert len(lookups) == 1
+    service.sync_once()
+    assert len(lookups) == 2
+    service.mirror.close()
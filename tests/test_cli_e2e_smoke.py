@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import sys
 import types
+from pathlib import Path
 
 import numpy as np
 from typer.testing import CliRunner
@@ -20,10 +21,18 @@ def _last_json_line(stdout: str) -> dict:
 
 
 class _FakeAudioCapture:
-    def __init__(self, sample_rate: int, buffer_seconds: float, monitor_source: str | None) -> None:
+    def __init__(
+        self,
+        sample_rate: int,
+        buffer_seconds: float,
+        monitor_source: str | None,
+        ring_file_path: str | None = None,
+        mic_float32: bool = False,
+    ) -> None:
         self.sample_rate = sample_rate
         self.buffer_seconds = buffer_seconds
         self.monitor_source = monitor_source
+        self.ring_file_path = ring_file_path
 
     def start(self) -> None:
         return None
@@ -127,7 +136,7 @@ def test_cli_listen_live_summary_smoke(monkeypatch, tmp_path) -> None:
     monkeypatch.setattr(main_mod.time, "monotonic", lambda: next(ticks, 2.0))
     monkeypatch.setattr(main_mod.time, "sleep", lambda _seconds: None)
 
-    def noop_live_summary_worker(_stop_event, _interval_sec) -> None:
+    def noop_live_summary_worker(_stop_event, _interval_sec, _audio_source=None) -> None:
         return None
 
     monkeypatch.setattr(main_mod, "_live_summary_listen_worker", noop_live_summary_worker)
@@ -189,13 +198,16 @@ def test_cli_index_watch_smoke_with_mocks(monkeypatch, tmp_path) -> None:
     }
 
     class _FakeKnowledgeIndexer:
-        def __init__(self, db_path: str) -> None:
+        def __init__(self, db_path: str, **kwargs: object) -> None:
             records["indexer_init"].append(db_path)  # type: ignore[union-attr]
 
         def add_file(self, path) -> int:
             records["add_file"].append(str(path))  # type: ignore[union-attr]
             return 2
 
+        def add_files(self, paths, **kwargs) -> types.SimpleNamespace:
+            return types.SimpleNamespace(indexed={str(Path(p).resolve()): self.add_file(p) for p in paths})
+
         def prune_sources_not_in(self, keep_sources: set[str], only_under_prefix: str | None = None) -> int:
             records["prune_args"] = (keep_sources, only_under_prefix)
             return 1
@@ -204,7 +216,7 @@ def test_cli_index_watch_smoke_with_mocks(monkeypatch, tmp_path) -> None:
             return None
 
     class _FakeKBWatcher:
-        def __init__(self, watch_dir, db_path) -> None:
+        def __init__(self, watch_dir, db_path, **kwargs) -> None:
             records["watcher_init"] = (str(watch_dir), str(db_path))
 
         def run(self) -> None:
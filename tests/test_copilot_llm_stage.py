@@ -0,0 +1,172 @@
+"""Concurrent copilot LLM stage: analysis, fast-track and deep-track in parallel with per-track deadlines."""
+
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from voiceforge.core.contracts import BudgetExceeded
+from voiceforge.llm import router
+from voiceforge.main import _run_llm_stage
+
+_FAST = SimpleNamespace(answer=["Say yes"], dos=["Be brief"], donts=[], clarify=["Which date?"], confidence=0.8)
+_DEEP = SimpleNamespace(risks=["Scope creep"], strategy=" Anchor on price ", emotion="", objections=[], follow_up_suggestions=[])
+_DEADLINES = {"fast": 5.0, "deep": 5.0}
+
+
+def test_llm_stage_publishes_fast_cards_before_analysis_and_deep() -> None:
+    fast_published = threading.Event()
+    published: list[str] = []
+
+    def main_call():
+        assert fast_published.wait(5.0)
+        return ("analysis", 0.01)
+
+    def deep_call():
+        assert fast_published.wait(5.0)
+        return (_DEEP, 0.002)
+
+    def on_cards(track: str, fields: dict) -> None:
+        published.append(track)
+        if track == "fast":
+            assert fields["copilot_answer"] == ["Say yes"]
+            fast_published.set()
+
+    llm_result, cost, fields, copilot_cost = _run_llm_stage(
+        main_call, {"fast": lambda: (_FAST, 0.001), "deep": deep_call}, _DEADLINES, on_copilot_cards=on_cards
+    )
+    assert llm_result == "analysis"
+    assert cost == pytest.approx(0.01)
+    assert copilot_cost == pytest.approx(0.003)
+    assert published == ["fast", "deep"]
+    assert fields["copilot_clarify"] == ["Which date?"]
+    assert fields["copilot_strategy"] == "Anchor on price"
+    assert fields["copilot_emotion"] is None
+
+
+def test_llm_stage_deep_deadline_leaves_empty_cards() -> None:
+    release = threading.Event()
+
+    def slow_deep():
+        release.wait(5.0)
+        return (_DEEP, 0.5)
+
+    t0 = time.monotonic()
+    try:
+        _, _, fields, copilot_cost = _run_llm_stage(
+            lambda: ("analysis", 0.01),
+            {"fast": lambda: (_FAST, 0.001), "deep": slow_deep},
+            {"fast": 5.0, "deep": 0.2},
+        )
+    finally:
+        release.set()
+    assert time.monotonic() - t0 < 2.0
+    assert fields["copilot_answer"] == ["Say yes"]
+    assert fields["copilot_risk"] == []
+    assert fields["copilot_strategy"] == ""
+    assert copilot_cost == pytest.approx(0.001)
+
+
+def test_llm_stage_track_failure_and_main_error() -> None:
+    def boom():
+        raise RuntimeError("deep failed")
+
+    _, _, fields, copilot_cost = _run_llm_stage(
+        lambda: ("analysis", 0.0), {"fast": lambda: (_FAST, 0.001), "deep": boom}, _DEADLINES
+    )
+    assert fields["copilot_objections"] == []
+    assert copilot_cost == pytest.approx(0.001)
+
+    def main_fails():
+        raise BudgetExceeded("over")
+
+    with pytest.raises(BudgetExceeded):
+        _run_llm_stage(main_fails, {"fast": lambda: (_FAST, 0.0)}, _DEADLINES)
+
+
+def test_run_analyze_pipeline_for_copilot_sums_costs_and_publishes(monkeypatch) -> None:
+    from voiceforge.core.config import Settings
+    from voiceforge.main import run_analyze_pipeline
+
+    result = SimpleNamespace(
+        segments=[SimpleNamespace(start=0.0, end=2.0, text="Can we ship on Friday?")],
+        transcript="Can we ship on Friday?",
+        diar_segments=[],
+        context="",
+        transcript_redacted="Can we ship on Friday?",
+        warnings=[],
+    )
+
+    class FakePipeline:
+        def __init__(self, cfg=None, speaker_linker=None):
+            self.cfg = cfg
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            return False
+
+        def run(self, _sec, source=None):
+            return (result, None)
+
+    analysis = SimpleNamespace(questions=[], answers=["Friday works"], recommendations=[], next_directions=[], action_items=[])
+    monkeypatch.setattr("voiceforge.main._get_config", lambda: Settings())
+    monkeypatch.setattr("voiceforge.main.Settings.get_effective_llm", lambda self: ("openai/gpt-4o-mini", False))
+    monkeypatch.setattr("voiceforge.llm.router.get_budget_warning_if_near_limit", lambda cfg: None)
+    monkeypatch.setattr("voiceforge.llm.router.analyze_meeting", lambda *a, **k: (analysis, 0.01))
+    monkeypatch.setattr("voiceforge.llm.router.analyze_copilot_fast", lambda *a, **k: (_FAST, 0.001))
+    monkeypatch.setattr("voiceforge.llm.router.analyze_copilot_deep", lambda *a, **k: (_DEEP, 0.002))
+    published: list[str] = []
+    with patch("voiceforge.core.pipeline.AnalysisPipeline", FakePipeline):
+        _, _, analysis_for_log = run_analyze_pipeline(
+            10, for_copilot=True, on_copilot_cards=lambda track, fields: published.append(track)
+        )
+    assert sorted(published) == ["deep", "fast"]
+    assert analysis_for_log["copilot_dos"] == ["Be brief"]
+    assert analysis_for_log["copilot_risk"] == ["Scope creep"]
+    assert analysis_for_log["cost_usd"] == pytest.approx(0.013)
+
+
+def test_concurrent_calls_reserve_budget(monkeypatch) -> None:
+    """In-flight reservations count against the daily limit until released."""
+    cfg = SimpleNamespace(daily_budget_limit_usd=1.0)
+    monkeypatch.setattr("voiceforge.core.metrics.get_cost_today", lambda: 0.7)
+    router._reserve_budget(cfg, 0.3)
+    try:
+        with pytest.raises(BudgetExceeded):
+            router._reserve_budget(cfg, 0.1)
+    finally:
+        router._release_budget(0.3)
+    router._reserve_budget(cfg, 0.1)
+    router._release_budget(0.1)
+    assert router._inflight_reserved_usd == pytest.approx(0.0)
+
+
+def test_analyze_meeting_stream_reserves_and_releases_budget(monkeypatch) -> None:
+    """The streaming analysis goes through the same reservation as complete_structured."""
+    cfg = SimpleNamespace(daily_budget_limit_usd=1.0)
+    seen: list[float] = []
+    monkeypatch.setattr("voiceforge.core.backends.get_settings", lambda: cfg)
+    monkeypatch.setattr("voiceforge.core.metrics.get_cost_today", lambda: 0.0)
+    monkeypatch.setattr(router, "_try_ollama_faq", lambda *a, **k: None)
+    monkeypatch.setattr(router, "_estimate_call_cost", lambda prompt, model_id, max_tokens: 0.25)
+
+    def fake_stream(prompt, model=None):
+        seen.append(router._inflight_reserved_usd)
+        yield ""
+
+    monkeypatch.setattr(router, "stream_completion", fake_stream)
+    _result, cost = router.analyze_meeting_stream("hello", model="anthropic/claude-haiku-4-5")
+    assert cost == pytest.approx(0.0)
+    assert seen == [pytest.approx(0.25)]
+    assert router._inflight_reserved_usd == pytest.approx(0.0)
+
+    monkeypatch.setattr("voiceforge.core.metrics.get_cost_today", lambda: 1.0)
+    with pytest.raises(BudgetExceeded):
+        router.analyze_meeting_stream("hello", model="anthropic/claude-haiku-4-5")
+    assert router._inflight_reserved_usd == pytest.approx(0.0)
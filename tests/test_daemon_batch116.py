@@ -9,6 +9,7 @@ from types import SimpleNamespace
 from typing import cast
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 from conftest import raise_when_called
 
@@ -169,16 +170,17 @@ def test_daemon_listen_start_and_stop_manage_threads(monkeypatch) -> None:
 
 
 def test_daemon_dbus_streaming_emitter_loop_handles_queue_item(monkeypatch) -> None:
-    emitted: list[tuple[str, str, int, bool]] = []
+    emitted: list[tuple[object, ...]] = []
     iface = SimpleNamespace(
-        TranscriptChunk=lambda *args: emitted.append(args) or daemon._dbus_emitter_stop.set()  # type: ignore[name-defined]
+        TranscriptChunk=lambda *args: emitted.append(args),
+        StreamingTranscriptAdvanced=lambda cursor: emitted.append((cursor,)) or daemon._dbus_emitter_stop.set(),  # type: ignore[name-defined]
     )
     daemon = _make_daemon(iface=cast(DaemonVoiceForgeInterface, iface))
-    daemon._streaming_chunk_queue.put(("hello", "SPEAKER_01", 1.25, True))
+    daemon._streaming_chunk_queue.put(("hello", "SPEAKER_01", 1.25, True, 3))
 
     daemon._dbus_streaming_emitter_loop()
 
-    assert emitted == [("hello", "SPEAKER_01", 1250, True)]
+    assert emitted == [("hello", "SPEAKER_01", 1250, True), (3,)]
 
 
 def test_daemon_dbus_streaming_emitter_loop_logs_errors(monkeypatch) -> None:
@@ -268,7 +270,7 @@ def test_daemon_search_rag_get_ids_and_upcoming_events_success(monkeypatch, tmp_
         lambda db_path: SimpleNamespace(search=lambda query, top_k: search_results),
     )
     monkeypatch.setattr("voiceforge.core.transcript_log.TranscriptLog", FakeLogDb)
-    monkeypatch.setattr("voiceforge.calendar.get_upcoming_events", lambda hours_ahead=48: ([{"summary": "Demo"}], None))
+    monkeypatch.setattr("voiceforge.calendar.mirror.upcoming_events", lambda hours_ahead=48: ([{"summary": "Demo"}], None))
 
     rag_hits = json.loads(daemon.search_rag(" roadmap ", top_k=50))
     ids = json.loads(daemon.get_session_ids_with_action_items())
@@ -291,7 +293,7 @@ def test_daemon_upcoming_events_skip_and_create_event_paths(monkeypatch) -> None
             # No-op for test fake (S1186).
             pass
 
-    monkeypatch.setattr("voiceforge.calendar.get_upcoming_events", lambda hours_ahead=48: ([], "calendar disabled"))
+    monkeypatch.setattr("voiceforge.calendar.mirror.upcoming_events", lambda hours_ahead=48: ([], "calendar disabled"))
     monkeypatch.setattr("voiceforge.core.transcript_log.TranscriptLog", FakeLogDb)
     monkeypatch.setattr("voiceforge.calendar.create_event", lambda **kwargs: ("uid-123", None))
     daemon = _make_daemon()
@@ -343,58 +345,77 @@ def test_daemon_streaming_loop_short_circuits_without_capture_or_imports(monkeyp
     daemon._streaming_capture = None
     daemon._streaming_loop()
 
-    daemon._streaming_capture = SimpleNamespace(get_chunk=lambda seconds: (None, None))
+    daemon._streaming_capture = SimpleNamespace(read_mic_since=lambda cursor, max_seconds=None: (None, 0))
     with patch.dict(sys.modules, {"voiceforge.stt": None, "voiceforge.stt.streaming": None}):
         daemon._streaming_loop()
 
 
-def test_daemon_streaming_loop_processes_chunk_and_logs_failure(monkeypatch) -> None:
-    processed: list[tuple[object, float]] = []
+class _StopAfter:
+    def __init__(self, ticks: int) -> None:
+        self.ticks = ticks
+        self.calls = 0
+
+    def is_set(self) -> bool:
+        return self.calls > self.ticks
+
+    def wait(self, timeout=None) -> bool:
+        self.calls += 1
+        return self.calls > self.ticks
+
+
+def test_daemon_streaming_loop_feeds_from_cursor_with_one_engine(monkeypatch) -> None:
+    """One engine per session; each tick reads only audio after the cursor and feeds it at its absolute position."""
+    reads: list[object] = []
+    engines: list[object] = []
     warnings: list[tuple[tuple[object, ...], dict[str, object]]] = []
     daemon = _make_daemon(settings_overrides={"sample_rate": 4})
-    daemon._streaming_capture = SimpleNamespace(
-        calls=0,
-        get_chunk=lambda seconds: (SimpleNamespace(size=4), None),
-    )
 
-    class FakeStop:
-        def __init__(self) -> None:
-            self.calls = 0
+    def read_mic_since(cursor, max_seconds=None, dtype=np.int16):
+        reads.append(cursor)
+        total = 8 * len(reads)
+        return (np.zeros(8, dtype=np.int16), total)
 
-        def is_set(self) -> bool:
-            return self.calls > 0
+    class FakeEngine:
+        def __init__(self, *args, **kwargs) -> None:
+            self.fed: list[tuple[int, int]] = []
+            self.processed = 0
+            self.finished = False
+            engines.append(self)
 
-        def wait(self, timeout=None) -> bool:
-            self.calls += 1
-            return self.calls > 1
+        def set_transcriber(self, transcriber) -> None:
+            pass
+
+        def feed(self, audio, start_sample=None) -> None:
+            self.fed.append((audio.size, start_sample))
+
+        def process(self) -> list:
+            self.processed += 1
+            return []
 
-    daemon._streaming_stop = FakeStop()
-    fake_stream = SimpleNamespace(process_chunk=lambda mic, start_offset_sec=0.0: processed.append((mic, start_offset_sec)))
+        def finish(self) -> list:
+            self.finished = True
+            return []
+
+    daemon._streaming_capture = SimpleNamespace(read_mic_since=read_mic_since)
+    daemon._streaming_stop = _StopAfter(3)
     monkeypatch.setattr("voiceforge.core.daemon._streaming_language_hint", lambda cfg: "en")
     monkeypatch.setattr("voiceforge.core.daemon.log.warning", lambda *args, **kwargs: warnings.append((args, kwargs)))
-
-    with patch.dict(
-        sys.modules,
-        {
-            "voiceforge.stt": SimpleNamespace(get_transcriber_for_config=lambda cfg, model_size_override=None: "tx"),
-            "voiceforge.stt.streaming": SimpleNamespace(StreamingTranscriber=lambda *args, **kwargs: fake_stream),
-        },
-    ):
+    modules = {
+        "voiceforge.stt": SimpleNamespace(get_transcriber_for_config=lambda cfg, model_size_override=None: "tx"),
+        "voiceforge.stt.streaming": SimpleNamespace(StreamingEngine=FakeEngine, ENGINE_MAX_BUFFER_SEC=15.0),
+    }
+    with patch.dict(sys.modules, modules):
         daemon._streaming_loop()
 
-    assert len(processed) == 1
-    assert processed[0][0].size == 4
-    assert processed[0][1] == pytest.approx(0.0)
-
-    daemon._streaming_capture = SimpleNamespace(get_chunk=raise_when_called(RuntimeError("capture fail")))
-    daemon._streaming_stop = FakeStop()
-    with patch.dict(
-        sys.modules,
-        {
-            "voiceforge.stt": SimpleNamespace(get_transcriber_for_config=lambda cfg, model_size_override=None: "tx"),
-            "voiceforge.stt.streaming": SimpleNamespace(StreamingTranscriber=lambda *args, **kwargs: fake_stream),
-        },
-    ):
+    assert len(engines) == 1
+    assert reads == [None, 8, 16]
+    assert engines[0].fed == [(8, 0), (8, 8), (8, 16)]
+    assert engines[0].processed == 3
+    assert engines[0].finished
+
+    daemon._streaming_capture = SimpleNamespace(read_mic_since=raise_when_called(RuntimeError("capture fail")))
+    daemon._streaming_stop = _StopAfter(1)
+    with patch.dict(sys.modules, modules):
         daemon._streaming_loop()
     assert warnings and warnings[-1][0][0] == "daemon.streaming_stt.failed"
 
@@ -413,23 +434,22 @@ def test_daemon_listen_loop_handles_import_error_and_persists_ring(monkeypatch,
         daemon._listen_loop()
     assert daemon.is_listening() is False
 
-    class FakeMic:
-        size = 4
-
-        @staticmethod
-        def tobytes() -> bytes:
-            return b"abcd"
+    captures: list[object] = []
 
     class FakeCapture:
         def __init__(self, **kwargs) -> None:
+            self.kwargs = kwargs
             self.started = False
             self.stopped = False
+            self.flushes = 0
+            captures.append(self)
 
         def start(self) -> None:
             self.started = True
 
-        def get_chunk(self, seconds):
-            return (FakeMic(), None)
+        def flush_ring_file(self) -> bool:
+            self.flushes += 1
+            return True
 
         def stop(self) -> None:
             self.stopped = True
@@ -458,7 +478,13 @@ def test_daemon_listen_loop_handles_import_error_and_persists_ring(monkeypatch,
     with patch.dict(sys.modules, {"voiceforge.audio.capture": SimpleNamespace(AudioCapture=FakeCapture)}):
         daemon._listen_loop()
 
-    assert (tmp_path / "ring.raw").read_bytes() == b"abcd"
+    # Capture appends to the mmap ring file itself; the loop only syncs it (no full-ring rewrite).
+    assert len(captures) == 1
+    cap = captures[0]
+    assert cap.kwargs["ring_file_path"] == str(tmp_path / "ring.raw")
+    assert cap.flushes == 1
+    assert cap.stopped is True
+    assert not (tmp_path / "ring.raw").exists()
 
 
 @pytest.mark.asyncio
@@ -514,7 +540,7 @@ def test_calendar_autostart_try_start_starts_only_for_window(monkeypatch) -> Non
     started: list[int] = []
     daemon.listen_start = lambda: started.append(1)
     monkeypatch.setattr(
-        "voiceforge.calendar.get_upcoming_events",
+        "voiceforge.calendar.mirror.upcoming_events",
         lambda hours_ahead=1: ([{"start_iso": "2026-03-08T10:10:00+00:00"}], None),
     )
     fake_now = SimpleNamespace(
@@ -526,7 +552,7 @@ def test_calendar_autostart_try_start_starts_only_for_window(monkeypatch) -> Non
     _calendar_try_start_listen(daemon, 15)
     assert started == [1]
 
-    monkeypatch.setattr("voiceforge.calendar.get_upcoming_events", lambda hours_ahead=1: ([], None))
+    monkeypatch.setattr("voiceforge.calendar.mirror.upcoming_events", lambda hours_ahead=1: ([], None))
     _calendar_try_start_listen(daemon, 15)
     assert started == [1]
 
@@ -555,3 +581,34 @@ async def test_watchdog_task_stops_on_event() -> None:
     await asyncio.sleep(0.05)
     stop.set()
     await task  # completes normally when stop is set
+
+
+def test_daemon_copilot_release_without_capture_cancels_speculative_stt() -> None:
+    """Early release paths still stop the speculative session and give the pooled copilot model back."""
+    daemon = _make_daemon()
+    session = MagicMock()
+    daemon._copilot_speculative = (session, "copilot-model")
+    daemon._copilot_capture_start_time = 1.0
+    daemon._listen_capture = None
+
+    assert daemon._do_capture_release_sync() == ("error", None, False)
+    assert daemon._copilot_speculative is None
+    session.cancel.assert_called_once()
+    daemon._model_manager.release_stt.assert_called_once_with("copilot-model")
+
+
+def test_daemon_speculative_start_releases_previous_session(monkeypatch) -> None:
+    """A new capture's speculative session replaces a leftover one only after cancelling and releasing it."""
+    daemon = _make_daemon()
+    old = MagicMock()
+    daemon._copilot_speculative = (old, "old-model")
+    daemon._copilot_capture_start_time = 5.0
+    daemon._listen_capture = SimpleNamespace(read_mic_since=lambda cursor, max_seconds=None: (np.zeros(0), 0))
+    daemon._model_manager.acquire_stt.return_value = "new-model"
+    monkeypatch.setattr("voiceforge.stt.speculative.SpeculativeTranscription.start", lambda self: self)
+
+    daemon._start_speculative_stt(5.0, "tiny", 1.0)
+
+    old.cancel.assert_called_once()
+    daemon._model_manager.release_stt.assert_called_once_with("old-model")
+    assert daemon._copilot_speculative[1] == "new-model"
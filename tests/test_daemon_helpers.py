@@ -313,6 +313,35 @@ def test_daemon_index_paths_empty_array_kc9() -> None:
     data = json.loads(out)
     assert data.get("ok") is True
     assert data.get("errors") == []
+    assert data.get("job_id") is None
+    assert daemon.get_index_job_status() == "[]"
+
+
+def test_daemon_index_paths_queues_job_kc9(tmp_path) -> None:
+    """KC9: index_paths returns a job id at once; missing paths are reported, the rest is queued."""
+    daemon = _make_daemon()
+    fake_jobs = MagicMock()
+    fake_jobs.submit.return_value = SimpleNamespace(job_id="7")
+    fake_jobs.get.return_value = SimpleNamespace(to_dict=lambda: {"job_id": "7", "state": "running"})
+    daemon._index_jobs = fake_jobs
+    out = json.loads(daemon.index_paths(json.dumps([str(tmp_path), str(tmp_path / "missing"), ""])))
+    assert out["job_id"] == "7"
+    assert out["ok"] is False
+    assert out["errors"] == [f"not found: {tmp_path / 'missing'}"]
+    fake_jobs.submit.assert_called_once_with([tmp_path.resolve()])
+    assert json.loads(daemon.get_index_job_status("7")) == [{"job_id": "7", "state": "running"}]
+
+
+def test_daemon_stop_index_jobs_stops_queue_kc9() -> None:
+    """Shutdown stops the indexing workers (they close the warm indexer); a second stop is a no-op."""
+    daemon = _make_daemon()
+    daemon.stop_index_jobs()
+    fake_jobs = MagicMock()
+    daemon._index_jobs = fake_jobs
+    daemon.stop_index_jobs()
+    daemon.stop_index_jobs()
+    fake_jobs.stop.assert_called_once_with()
+    assert daemon.get_index_job_status() == "[]"
 
 
 def test_daemon_search_rag_empty_query() -> None:
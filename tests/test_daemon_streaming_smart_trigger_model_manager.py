@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import itertools
 import json
 import time
 from unittest.mock import MagicMock, patch
@@ -105,41 +106,29 @@ def test_model_manager_set_get_global() -> None:
     set_model_manager(None)
 
 
-def test_streaming_transcriber_class_exists() -> None:
-    """StreamingTranscriber exists and has expected interface."""
-    from voiceforge.stt import streaming
+def test_streaming_engine_passes_language_to_transcribe() -> None:
+    """StreamingEngine passes language hint to transcriber.transcribe (Roadmap #9/#7)."""
+    from voiceforge.stt.streaming import StreamingEngine
 
-    assert hasattr(streaming, "StreamingTranscriber")
+    mock_transcriber = MagicMock()
+    mock_transcriber.transcribe.return_value = []
+    engine = StreamingEngine(mock_transcriber, sample_rate=16000, language="ru")
+    engine.feed(np.zeros(16000, dtype=np.float32), start_sample=0)
+    engine.process()
 
+    mock_transcriber.transcribe.assert_called_once()
+    assert mock_transcriber.transcribe.call_args[1].get("language") == "ru"
 
-def test_streaming_transcriber_passes_language_to_transcribe() -> None:
-    """StreamingTranscriber passes language hint to transcriber.transcribe (Roadmap #9/#7)."""
-    from voiceforge.stt.streaming import StreamingTranscriber
-    from voiceforge.stt.transcriber import Segment
 
-    mock_transcriber = MagicMock()
-    mock_transcriber.transcribe.return_value = [
-        Segment(start=0.0, end=1.0, text="hello", language="ru", confidence=0.95),
-    ]
-    chunks: list[tuple[object, object]] = []
-
-    def on_final(seg: object) -> None:
-        chunks.append(("final", seg))
-
-    stream = StreamingTranscriber(
-        mock_transcriber,
-        sample_rate=16000,
-        language="ru",
-        on_final=on_final,
-    )
-    audio = np.zeros(200, dtype=np.float32)
-    stream.process_chunk(audio, start_offset_sec=0.0)
+def test_streaming_engine_skips_too_short_audio() -> None:
+    """StreamingEngine.process() with < 100 samples in the window does not call transcribe."""
+    from voiceforge.stt.streaming import StreamingEngine
 
-    mock_transcriber.transcribe.assert_called_once()
-    call_kw = mock_transcriber.transcribe.call_args[1]
-    assert call_kw.get("language") == "ru"
-    assert len(chunks) == 1
-    assert chunks[0][0] == "final"
+    mock_transcriber = MagicMock()
+    engine = StreamingEngine(mock_transcriber, sample_rate=16000, min_chunk_sec=0.0)
+    engine.feed(np.zeros(50, dtype=np.float32), start_sample=0)
+    assert engine.process() == []
+    mock_transcriber.transcribe.assert_not_called()
 
 
 # --- Daemon: more coverage for get_streaming_transcript, get_api_version, get_capabilities, get_sessions/get_session_detail/get_indexed_paths (exception/no file) ---
@@ -276,15 +265,24 @@ def test_daemon_get_analytics_parses_7d_and_30d(tmp_path, monkeypatch) -> None:
 # --- SmartTrigger: VAD no segments, cooldown, and fired path (mocked) ---
 
 
+def _energy_probs(audio_f: np.ndarray) -> np.ndarray:
+    """Stand-in for Silero: a 512-sample window is speech when it is non-silent."""
+    return (np.abs(audio_f.reshape(-1, 512)).mean(axis=1) > 0.01).astype(np.float32)
+
+
+def _speech_then_silence(speech_sec: float, silence_sec: float, sr: int = 16000) -> np.ndarray:
+    return np.concatenate((np.full(int(speech_sec * sr), 3000, dtype=np.int16), np.zeros(int(silence_sec * sr), dtype=np.int16)))
+
+
 def test_smart_trigger_check_returns_false_when_vad_returns_no_segments(tmp_path) -> None:
-    """SmartTrigger.check() returns False when VAD returns no speech segments."""
+    """SmartTrigger.check() returns False when VAD finds no speech."""
     from voiceforge.audio.smart_trigger import SmartTrigger
 
     # File large enough for min_speech + min_silence
     min_samples = int(16000 * (30.0 + 3.0)) * 2
     ring = tmp_path / "ring.pcm"
     ring.write_bytes(b"\x00\x00" * min_samples)
-    with patch("faster_whisper.vad.get_speech_timestamps", return_value=[]):
+    with patch.object(SmartTrigger, "_speech_probs", staticmethod(_energy_probs)):
         trigger = SmartTrigger(sample_rate=16000)
         assert trigger.check(str(ring)) is False
 
@@ -293,14 +291,9 @@ def test_smart_trigger_check_returns_false_when_speech_too_short(tmp_path) -> No
     """SmartTrigger.check() returns False when total speech duration < min_speech_sec."""
     from voiceforge.audio.smart_trigger import SmartTrigger
 
-    min_samples = int(16000 * (30.0 + 3.0)) * 2
     ring = tmp_path / "ring.pcm"
-    ring.write_bytes(b"\x00\x00" * min_samples)
-    # Segments that sum to 10s speech (less than 30s)
-    with patch(
-        "faster_whisper.vad.get_speech_timestamps",
-        return_value=[{"start": 0, "end": 160000}],
-    ):
+    ring.write_bytes(_speech_then_silence(10.0, 26.0).tobytes())  # 10s speech (less than 30s)
+    with patch.object(SmartTrigger, "_speech_probs", staticmethod(_energy_probs)):
         trigger = SmartTrigger(sample_rate=16000, min_speech_sec=30.0)
         assert trigger.check(str(ring)) is False
 
@@ -309,58 +302,145 @@ def test_smart_trigger_check_returns_true_when_conditions_met(tmp_path) -> None:
     """SmartTrigger.check() returns True when enough speech, silence, and past cooldown."""
     from voiceforge.audio.smart_trigger import SmartTrigger
 
-    # 35s of "audio" (33s speech + 2s trailing would fail silence; we need 33s speech + 4s silence)
-    n_samples = 16000 * 37
-    ring = tmp_path / "ring.pcm"
-    ring.write_bytes(b"\x00\x00" * n_samples)
     # Speech 0..33s, then silence 33..37s (4s)
-    with patch(
-        "faster_whisper.vad.get_speech_timestamps",
-        return_value=[{"start": 0, "end": 33 * 16000}],
-    ):
+    ring = tmp_path / "ring.pcm"
+    ring.write_bytes(_speech_then_silence(33.0, 4.0).tobytes())
+    with patch.object(SmartTrigger, "_speech_probs", staticmethod(_energy_probs)):
         trigger = SmartTrigger(sample_rate=16000, min_speech_sec=30.0, min_silence_sec=3.0, cooldown_sec=0.0)
         assert trigger.check(str(ring)) is True
 
 
-# --- Streaming: process_chunk empty, feed + flush (mocked) ---
+def test_smart_trigger_incremental_consumes_only_new_samples(tmp_path) -> None:
+    """With a growing mmap ring, each tick scores only appended audio; pause detected across ticks."""
+    from voiceforge.audio.buffer import RingFile
+    from voiceforge.audio.smart_trigger import SmartTrigger
 
+    audio = _speech_then_silence(33.0, 4.0)
+    ring = RingFile(tmp_path / "ring.raw", maxlen_seconds=20.0, sample_rate=16000)
+    trigger = SmartTrigger(sample_rate=16000, min_speech_sec=30.0, min_silence_sec=3.0, cooldown_sec=0.0, window_sec=60.0)
+    fired: list[bool] = []
+    step = 2 * 16000
+    try:
+        with patch.object(SmartTrigger, "_speech_probs", staticmethod(_energy_probs)):
+            for i in range(0, len(audio), step):
+                ring.append(audio[i : i + step].tobytes())
+                fired.append(trigger.check(tmp_path / "ring.raw"))
+                assert trigger.samples_processed_last_tick == len(audio[i : i + step])
+    finally:
+        ring.close()
+    # Ring (20s) is shorter than the speech, yet the ledger remembers 33s of speech
+    assert fired[-1] is True
+    assert not any(fired[:-1])
+    assert trigger.stats()["samples_processed_total"] == len(audio)
+    assert trigger.stats()["ticks"] == len(fired)
+
+
+def test_smart_trigger_resets_when_ring_recreated(tmp_path) -> None:
+    """A new ring (sample clock behind the cursor) restarts the ledger instead of reading stale state."""
+    from voiceforge.audio.buffer import RingFile
+    from voiceforge.audio.smart_trigger import SmartTrigger
 
-def test_streaming_process_chunk_empty_array_no_call(tmp_path) -> None:
-    """StreamingTranscriber.process_chunk() with empty array does not call transcriber."""
-    from voiceforge.stt.streaming import StreamingTranscriber
+    path = tmp_path / "ring.raw"
+    ring = RingFile(path, maxlen_seconds=5.0, sample_rate=16000)
+    ring.append(np.full(4 * 16000, 3000, dtype=np.int16).tobytes())
+    ring.close()
+    trigger = SmartTrigger(sample_rate=16000, min_speech_sec=1.0, min_silence_sec=1.0, cooldown_sec=0.0)
+    with patch.object(SmartTrigger, "_speech_probs", staticmethod(_energy_probs)):
+        assert trigger.check(path) is False
+        ring = RingFile(path, maxlen_seconds=5.0, sample_rate=16000, create=True)
+        ring.append(np.zeros(16000, dtype=np.int16).tobytes())
+        ring.close()
+        assert trigger.check(path) is False  # fresh ledger: silence only, previous speech forgotten
+        assert trigger.samples_processed_last_tick == 16000
+
+
+# --- StreamingEngine: committed prefix, absolute timestamps, bounded re-decode ---
+
+
+class _ScriptedTranscriber:
+    """Fake STT over float audio whose sample values are absolute sample indices.
+    Returns script words fully inside the window (relative times); the newest word is misheard
+    while it ends within the last 0.5 s of the window, so it only stabilises on a later decode."""
+
+    def __init__(self, words: list[tuple[float, float, str]], sample_rate: int = 16000, with_words: bool = True) -> None:
+        self.words = words
+        self.sample_rate = sample_rate
+        self.with_words = with_words
+        self.calls: list[dict] = []
+
+    def transcribe(self, audio, **kwargs):
+        from voiceforge.stt.transcriber import Segment, Word
+
+        self.calls.append(kwargs)
+        t0 = float(audio[0]) / self.sample_rate
+        t1 = t0 + audio.size / self.sample_rate
+        heard = [(s, e, w) for s, e, w in self.words if s >= t0 and e <= t1]
+        out = []
+        for i, (s, e, w) in enumerate(heard):
+            text = w.upper() + "?" if i == len(heard) - 1 and e > t1 - 0.5 else w
+            words = [Word(start=s - t0, end=e - t0, text=text)] if self.with_words else []
+            out.append(Segment(start=s - t0, end=e - t0, text=text, language="en", confidence=0.9, words=words))
+        return out
+
+
+def _stream_through(engine, seconds: float, tick_sec: float = 1.0, sample_rate: int = 16000) -> None:
+    step = int(tick_sec * sample_rate)
+    for start in range(0, int(seconds * sample_rate), step):
+        engine.feed(np.arange(start, start + step, dtype=np.float32), start_sample=start)
+        engine.process()
+    engine.finish()
+
+
+def test_streaming_engine_commits_each_word_once_with_absolute_timestamps() -> None:
+    """LocalAgreement: finals cover the script exactly once, in order, with absolute stream times."""
+    from voiceforge.stt.streaming import StreamingEngine
+
+    script = [(0.1 + 0.5 * i, 0.5 + 0.5 * i, f"w{i}") for i in range(40)]  # 20 s of speech
+    tx = _ScriptedTranscriber(script)
+    finals: list[object] = []
+    partials: list[str] = []
+    engine = StreamingEngine(tx, sample_rate=16000, language="en", on_final=finals.append, on_partial=partials.append)
+    _stream_through(engine, 21.0)
 
-    mock_transcriber = MagicMock()
-    stream = StreamingTranscriber(mock_transcriber, sample_rate=16000)
-    stream.process_chunk(np.array([], dtype=np.float32), start_offset_sec=0.0)
-    mock_transcriber.transcribe.assert_not_called()
+    words = [w for seg in finals for w in seg.text.split()]
+    assert words == [w for _, _, w in script]
+    assert finals[0].start == pytest.approx(0.1)
+    assert finals[-1].end == pytest.approx(script[-1][1])
+    assert all(a.end <= b.start for a, b in itertools.pairwise(finals))
+    assert partials and all("?" in p for p in partials)  # unstable tail only ever shows up as partial
+    assert all(call["language"] == "en" and call["word_timestamps"] for call in tx.calls)
+    assert "w37" in tx.calls[-1]["initial_prompt"]
 
 
-def test_streaming_feed_flushes_when_buffer_full() -> None:
-    """StreamingTranscriber.feed() flushes chunk when buffer duration >= chunk_duration."""
-    from voiceforge.stt.streaming import StreamingTranscriber
-    from voiceforge.stt.transcriber import Segment
+def test_streaming_engine_redecode_bounded_by_context_tail() -> None:
+    """Committed audio is trimmed: per decode only new audio + context tail + pending words are re-decoded."""
+    from voiceforge.stt.streaming import StreamingEngine
+
+    script = [(0.1 + 0.5 * i, 0.5 + 0.5 * i, f"w{i}") for i in range(110)]  # 55 s
+    engine = StreamingEngine(_ScriptedTranscriber(script), sample_rate=16000, context_sec=1.0)
+    _stream_through(engine, 56.0)
+    stats = engine.stats()
+    assert stats["committed_words_total"] == 110
+    # Re-decoding the whole growing window would cost O(n^2) (~1.5M samples); bounded tail keeps it ~3x audio
+    assert stats["decoded_samples_total"] < 4 * stats["fed_samples_total"]
 
-    mock_transcriber = MagicMock()
-    mock_transcriber.transcribe.return_value = [
-        Segment(start=0.0, end=1.0, text="hi", language="en", confidence=0.9),
-    ]
-    finals: list[object] = []
 
-    def on_final(seg: object) -> None:
-        finals.append(seg)
+def test_streaming_engine_segment_fallback_and_gap_reset() -> None:
+    """Backends without word timings still commit; an audio gap finalizes the hypothesis and restarts the window."""
+    from voiceforge.stt.streaming import StreamingEngine
 
-    stream = StreamingTranscriber(
-        mock_transcriber,
-        sample_rate=16000,
-        chunk_duration_sec=2.0,
-        overlap_sec=0.5,
-        on_final=on_final,
-    )
-    # Feed 2.5s of audio so one chunk is flushed
-    n_samples = int(16000 * 2.5)
-    stream.feed(np.zeros(n_samples, dtype=np.float32))
-    assert mock_transcriber.transcribe.called
-    assert len(finals) >= 1
+    script = [(0.1 + 0.5 * i, 0.5 + 0.5 * i, f"w{i}") for i in range(8)]
+    finals: list[object] = []
+    engine = StreamingEngine(_ScriptedTranscriber(script, with_words=False), sample_rate=16000, on_final=finals.append)
+    for start in range(0, 3 * 16000, 16000):
+        engine.feed(np.arange(start, start + 16000, dtype=np.float32), start_sample=start)
+        engine.process()
+    assert engine.cursor == 3 * 16000
+    engine.feed(np.arange(10 * 16000, 11 * 16000, dtype=np.float32), start_sample=10 * 16000)  # samples lost
+    assert engine.cursor == 11 * 16000
+    words = [w for seg in finals for w in seg.text.split()]
+    assert words == ["w0", "w1", "w2", "w3", "w4", "W5?"]  # unstable tail flushed as-is at the gap
+    assert finals[-1].end == pytest.approx(3.0)
 
 
 # --- model_manager: swap_model (stt/llm/unknown), unload_stt, get_transcriber (mocked) ---
@@ -406,16 +486,18 @@ def test_model_manager_swap_model_empty_name_returns_error() -> None:
 
 
 def test_model_manager_unload_stt_clears_transcriber() -> None:
-    """ModelManager.unload_stt() clears _transcriber and runs gc."""
+    """ModelManager.unload_stt() drops idle pooled models and runs gc."""
     from voiceforge.core.model_manager import ModelManager
 
     cfg = MagicMock()
     cfg.model_size = "tiny"
     cfg.default_llm = "x"
     mgr = ModelManager(cfg)
-    mgr._transcriber = MagicMock()
+    with patch("voiceforge.stt.transcriber.Transcriber"):
+        mgr.get_transcriber()
+    assert mgr.resident_stt_sizes() == ["tiny"]
     mgr.unload_stt()
-    assert mgr._transcriber is None
+    assert mgr.resident_stt_sizes() == []
 
 
 def test_model_manager_unload_stt_calls_torch_cuda_when_available() -> None:
@@ -429,11 +511,13 @@ def test_model_manager_unload_stt_calls_torch_cuda_when_available() -> None:
     cfg.model_size = "tiny"
     cfg.default_llm = "x"
     mgr = ModelManager(cfg)
-    mgr._transcriber = MagicMock()
+    with patch("voiceforge.stt.transcriber.Transcriber"):
+        mgr.get_transcriber()
+    assert mgr.resident_stt_sizes() == ["tiny"]
     with patch.dict("sys.modules", {"torch": mock_torch}):
         mgr.unload_stt()
     mock_torch.cuda.empty_cache.assert_called_once()
-    assert mgr._transcriber is None
+    assert mgr.resident_stt_sizes() == []
 
 
 def test_model_manager_unload_stt_handles_import_error() -> None:
@@ -453,10 +537,12 @@ def test_model_manager_unload_stt_handles_import_error() -> None:
     cfg.model_size = "tiny"
     cfg.default_llm = "x"
     mgr = ModelManager(cfg)
-    mgr._transcriber = MagicMock()
+    with patch("voiceforge.stt.transcriber.Transcriber"):
+        mgr.get_transcriber()
+    assert mgr.resident_stt_sizes() == ["tiny"]
     with patch("builtins.__import__", side_effect=fake_import):
         mgr.unload_stt()
-    assert mgr._transcriber is None
+    assert mgr.resident_stt_sizes() == []
 
 
 def test_model_manager_swap_stt_handles_import_error() -> None:
@@ -476,7 +562,6 @@ def test_model_manager_swap_stt_handles_import_error() -> None:
     cfg.model_size = "tiny"
     cfg.default_llm = "x"
     mgr = ModelManager(cfg)
-    mgr._transcriber = None
     with patch("builtins.__import__", side_effect=fake_import):
         mgr.swap_stt("small")
     assert mgr._stt_model_size == "small"
@@ -500,7 +585,7 @@ def test_model_manager_get_transcriber_lazy_loads_and_reuses() -> None:
         MockTranscriber.assert_called_once()
 
 
-# --- streaming: resample (same rate; different rate with scipy), process_chunk int16, on_partial ---
+# --- streaming: resample (same rate; different rate with scipy) ---
 
 
 def test_streaming_resample_same_rate_passthrough() -> None:
@@ -535,54 +620,6 @@ def test_streaming_resample_n_less_than_one_returns_unchanged() -> None:
     assert out is audio
 
 
-def test_streaming_process_chunk_int16_converts_to_float() -> None:
-    """StreamingTranscriber.process_chunk() accepts int16 and calls transcribe."""
-    from voiceforge.stt.streaming import StreamingTranscriber
-    from voiceforge.stt.transcriber import Segment
-
-    mock_transcriber = MagicMock()
-    mock_transcriber.transcribe.return_value = [
-        Segment(start=0.0, end=0.5, text="x", language="en", confidence=0.9),
-    ]
-    stream = StreamingTranscriber(mock_transcriber, sample_rate=16000)
-    # > 100 samples so _process_chunk runs
-    stream.process_chunk(np.zeros(200, dtype=np.int16), start_offset_sec=0.0)
-    mock_transcriber.transcribe.assert_called_once()
-
-
-def test_streaming_on_partial_called() -> None:
-    """StreamingTranscriber calls on_partial when segment has text."""
-    from voiceforge.stt.streaming import StreamingTranscriber
-    from voiceforge.stt.transcriber import Segment
-
-    mock_transcriber = MagicMock()
-    mock_transcriber.transcribe.return_value = [
-        Segment(start=0.0, end=1.0, text="hello", language="en", confidence=0.95),
-    ]
-    partials: list[str] = []
-
-    def on_partial(text: str) -> None:
-        partials.append(text)
-
-    stream = StreamingTranscriber(
-        mock_transcriber,
-        sample_rate=16000,
-        on_partial=on_partial,
-    )
-    stream.process_chunk(np.zeros(500, dtype=np.float32), start_offset_sec=0.0)
-    assert partials == ["hello"]
-
-
-def test_streaming_process_chunk_skips_too_short_audio() -> None:
-    """StreamingTranscriber.process_chunk() with < 100 samples does not call transcribe."""
-    from voiceforge.stt.streaming import StreamingTranscriber
-
-    mock_transcriber = MagicMock()
-    stream = StreamingTranscriber(mock_transcriber, sample_rate=16000)
-    stream.process_chunk(np.zeros(50, dtype=np.float32), start_offset_sec=0.0)
-    mock_transcriber.transcribe.assert_not_called()
-
-
 # --- daemon: _streaming_language_hint, _env_flag, _pid_path, status, swap_model, is_listening ---
 
 
@@ -793,12 +830,8 @@ def test_smart_trigger_check_returns_false_when_silence_too_short(tmp_path) -> N
     from voiceforge.audio.smart_trigger import SmartTrigger
 
     # 37s total; speech 0..35s -> 2s silence (need 3s)
-    n_samples = 16000 * 37
     ring = tmp_path / "ring.pcm"
-    ring.write_bytes(b"\x00\x00" * n_samples)
-    with patch(
-        "faster_whisper.vad.get_speech_timestamps",
-        return_value=[{"start": 0, "end": 35 * 16000}],
-    ):
+    ring.write_bytes(_speech_then_silence(35.0, 2.0).tobytes())
+    with patch.object(SmartTrigger, "_speech_probs", staticmethod(_energy_probs)):
         trigger = SmartTrigger(sample_rate=16000, min_speech_sec=30.0, min_silence_sec=3.0, cooldown_sec=0.0)
         assert trigger.check(str(ring)) is False
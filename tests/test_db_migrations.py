@@ -185,3 +185,53 @@ def test_metrics_migrations_on_existing_db(tmp_path, monkeypatch) -> None:
         assert _table_exists(conn, "schema_migrations")
     finally:
         conn.close()
+
+
+def test_transcript_session_stats_backfilled_and_maintained(tmp_path: Path) -> None:
+    """006: counters/preview backfilled for pre-006 sessions, then kept by triggers (insert, delete, purge)."""
+    db_path = tmp_path / "transcripts.db"
+    log_db = TranscriptLog(db_path=db_path)
+    segments = [
+        {"start_sec": 0, "end_sec": 1, "speaker": "A", "text": "one"},
+        {"start_sec": 1, "end_sec": 2, "speaker": "B", "text": "two"},
+        {"start_sec": 2, "end_sec": 3, "speaker": "", "text": "three"},
+    ]
+    first = log_db.log_session(segments, answers=['Plan "agreed"\nnext'])
+    log_db.close()
+
+    conn = sqlite3.connect(db_path)
+    conn.executescript(
+        """
+        DROP TABLE session_stats;
+        DROP TABLE session_speakers;
+        DROP TRIGGER sessions_stats_ai;
+        DROP TRIGGER segments_stats_ai;
+        UPDATE schema_version SET version = 5;
+        """
+    )
+    conn.close()
+
+    log_db = TranscriptLog(db_path=db_path)
+    [row] = log_db.get_sessions_for_display()
+    assert (row.id, row.segments_count, row.speaker_count, row.summary_preview) == (first, 3, 2, "Plan agreed next")
+
+    old = datetime(2020, 1, 1, 23, 30, tzinfo=UTC)
+    second = log_db.log_session(segments[:1], started_at=old, ended_at=old, answers=["x"])
+    log_db.log_session(segments + segments[:1], answers=["later"])
+    rows = {r.id: r for r in log_db.get_sessions_for_display(last_n=10)}
+    assert (rows[second].segments_count, rows[second].speaker_count) == (1, 1)
+    assert rows[second + 1].segments_count == 4
+    assert rows[second + 1].summary_preview == "later"
+    assert [s.id for s in log_db.get_sessions_for_date(date(2020, 1, 1))] == [second]
+    assert [s.id for s in log_db.get_sessions_in_range(date(2019, 12, 31), date(2020, 1, 2))] == [second]
+    assert log_db.get_sessions_for_date(date(2020, 1, 2)) == []
+
+    conn = log_db._get_conn()
+    conn.execute("DELETE FROM segments WHERE session_id = ? AND speaker = 'B'", (first,))
+    conn.commit()
+    rows = {r.id: r for r in log_db.get_sessions_for_display(last_n=10)}
+    assert (rows[first].segments_count, rows[first].speaker_count) == (2, 1)
+
+    assert log_db.purge_before(date(2021, 1, 1)) == 1
+    assert conn.execute("SELECT COUNT(*) FROM session_stats WHERE session_id = ?", (second,)).fetchone()[0] == 0
+    log_db.close()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import numpy as np
@@ -69,3 +70,116 @@ def test_diarizer_diarize_supports_pyannote4_diarize_output() -> None:
 
     assert len(out) == 1
     assert out[0].speaker == "SPEAKER_00"
+
+
+class _Seg:
+    def __init__(self, start: float, end: float) -> None:
+        self.start = start
+        self.end = end
+
+
+class _Annotation:
+    def __init__(self, tracks: list[tuple[float, float, str]]) -> None:
+        self._tracks = tracks
+
+    def itertracks(self, yield_label: bool = False):
+        return [(_Seg(s, e), None, lab) for s, e, lab in self._tracks]
+
+    def labels(self) -> list[str]:
+        return sorted({lab for _, _, lab in self._tracks})
+
+
+def test_speaker_linker_matches_centroids_across_windows() -> None:
+    """Local speakers are matched one-to-one to session centroids; unseen voices open new labels."""
+    from voiceforge.stt.diarizer import SpeakerLinker
+
+    a, b, c = np.eye(3, dtype=np.float32)
+    linker = SpeakerLinker()
+    assert linker.link(np.stack([a, b]), [5.0, 3.0]) == ["SPEAKER_00", "SPEAKER_01"]
+    # Next window: pyannote restarted its labels and lists B first; noisy embeddings still link
+    assert linker.link(np.stack([b + 0.2 * a, a + 0.1 * c]), [4.0, 4.0]) == ["SPEAKER_01", "SPEAKER_00"]
+    assert linker.link(np.stack([c, a]), [2.0, 2.0]) == ["SPEAKER_02", "SPEAKER_00"]
+    assert linker.num_speakers == 3
+
+    capped = SpeakerLinker(max_speakers=1)
+    assert capped.link(np.stack([a, b]), [1.0, 1.0]) == ["SPEAKER_00", "SPEAKER_00"]
+
+
+def test_diarizer_links_window_local_labels_with_speaker_embeddings() -> None:
+    """Every window restarts at SPEAKER_00; output labels follow the voice (speaker_embeddings), not the window."""
+    a, b = np.eye(2, dtype=np.float32)
+    outputs = [
+        SimpleNamespace(
+            speaker_diarization=_Annotation([(0, 10, "SPEAKER_00"), (10, 30, "SPEAKER_01")]), speaker_embeddings=np.stack([a, b])
+        ),
+        SimpleNamespace(
+            speaker_diarization=_Annotation([(0, 20, "SPEAKER_00"), (20, 30, "SPEAKER_01")]), speaker_embeddings=np.stack([b, a])
+        ),
+    ]
+    pipe = MagicMock(side_effect=outputs)
+    with patch("voiceforge.stt.diarizer.Pipeline") as p:
+        p.from_pretrained.return_value = pipe
+        with patch("voiceforge.stt.diarizer.psutil") as psutil_mod:
+            psutil_mod.Process.return_value.memory_info.return_value.rss = 1024 * 1024
+            d = Diarizer(auth_token="token")
+            out = d.diarize(np.zeros(int(2 * WINDOW_SEC * 100), dtype=np.float32), sample_rate=100)
+
+    assert [(s.start, s.end, s.speaker) for s in out] == [
+        (0, 10, "SPEAKER_00"),
+        (10, 30, "SPEAKER_01"),
+        (30, 50, "SPEAKER_01"),
+        (50, 60, "SPEAKER_00"),
+    ]
+
+
+def _diarize_windows(outputs: list[object], windows: int, linker=None) -> list[DiarSegment]:
+    pipe = MagicMock(side_effect=outputs)
+    with patch("voiceforge.stt.diarizer.Pipeline") as p:
+        p.from_pretrained.return_value = pipe
+        with patch("voiceforge.stt.diarizer.psutil") as psutil_mod:
+            psutil_mod.Process.return_value.memory_info.return_value.rss = 1024 * 1024
+            d = Diarizer(auth_token="token")
+            d._embed_local_speakers = MagicMock(return_value=None)  # no embedding model either
+            return d.diarize(np.zeros(int(windows * WINDOW_SEC * 100), dtype=np.float32), sample_rate=100, linker=linker)
+
+
+def test_diarizer_session_linker_keeps_labels_across_calls_and_maps_unlinked_windows() -> None:
+    """One linker per session: the same voice keeps its label in the next analysis; a window without embeddings
+    reuses the session label its local label got last time instead of pyannote's raw SPEAKER_00."""
+    from voiceforge.stt.speaker_linker import SpeakerLinker
+
+    a, b = np.eye(2, dtype=np.float32)
+    linker = SpeakerLinker()
+    first = _diarize_windows(
+        [SimpleNamespace(speaker_diarization=_Annotation([(0, 30, "SPEAKER_00")]), speaker_embeddings=np.stack([b]))],
+        1,
+        linker,
+    )
+    second = _diarize_windows(
+        [
+            SimpleNamespace(
+                speaker_diarization=_Annotation([(0, 10, "SPEAKER_00"), (10, 30, "SPEAKER_01")]),
+                speaker_embeddings=np.stack([a, b]),
+            ),
+            SimpleNamespace(speaker_diarization=_Annotation([(0, 30, "SPEAKER_00")]), speaker_embeddings=None),
+        ],
+        2,
+        linker,
+    )
+
+    assert [s.speaker for s in first] == ["SPEAKER_00"]
+    assert [s.speaker for s in second] == ["SPEAKER_01", "SPEAKER_00", "SPEAKER_01"]
+
+
+def test_diarizer_unlinked_windows_do_not_grow_session_labels() -> None:
+    """Without embeddings every window maps its local labels onto the same session labels; labels stay bounded."""
+    from voiceforge.stt.speaker_linker import SpeakerLinker
+
+    linker = SpeakerLinker()
+    window = SimpleNamespace(
+        speaker_diarization=_Annotation([(0, 10, "SPEAKER_00"), (10, 30, "SPEAKER_01")]), speaker_embeddings=None
+    )
+    segments = _diarize_windows([window] * 6, 6, linker)
+
+    assert {s.speaker for s in segments} == {"SPEAKER_00", "SPEAKER_01"}
+    assert linker.map_unlinked(["SPEAKER_01", "SPEAKER_02"]) == ["SPEAKER_01", "SPEAKER_02"]
@@ -0,0 +1,81 @@
+"""LLM response cache: long-lived WAL connection, in-memory LRU front tier, indexed background expiry."""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel
+
+from voiceforge.llm import cache as llm_cache
+from voiceforge.llm.cache import ResponseCache
+
+
+class _Answer(BaseModel):
+    text: str
+    items: list[str] = []
+
+
+@pytest.fixture
+def rc(tmp_path: Path):
+    c = ResponseCache(tmp_path / "llm_response_cache.db", memory_size=2)
+    yield c
+    c.close()
+
+
+def test_memory_tier_serves_repeats_without_validation(rc: ResponseCache, monkeypatch) -> None:
+    rc.set("k1", "m", "_Answer", _Answer(text="hi", items=["a"]), 0.01, ttl_seconds=60)
+    validations: list[object] = []
+    monkeypatch.setattr(_Answer, "model_validate", classmethod(lambda cls, data: validations.append(data)))
+
+    got, cost = rc.get("k1", _Answer, 60)
+    got.items.append("mutated")
+    again, _ = rc.get("k1", _Answer, 60)
+
+    assert (got.text, cost) == ("hi", 0.01)
+    assert again.items == ["a"]  # callers get copies
+    assert validations == []
+
+
+def test_lru_eviction_falls_back_to_disk_and_ttl_expires(rc: ResponseCache) -> None:
+    for key in ("k1", "k2", "k3"):
+        rc.set(key, "m", "_Answer", _Answer(text=key), 0.0, ttl_seconds=60)
+    assert list(rc._memory) == ["k2", "k3"]
+
+    got, _ = rc.get("k1", _Answer, 60)  # evicted from RAM, still on disk
+    assert got.text == "k1"
+    assert list(rc._memory) == ["k3", "k1"]
+
+    rc._memory["k3"] = (rc._memory["k3"][0], 0.0, time.time() - 120)
+    rc._conn.execute("UPDATE response_cache SET created_at = '2000-01-01T00:00:00+00:00' WHERE key_hash = 'k3'")
+    assert rc.get("k3", _Answer, 60) is None
+    assert rc._conn.execute("SELECT COUNT(*) FROM response_cache WHERE key_hash = 'k3'").fetchone()[0] == 0
+
+
+def test_purge_expired_uses_created_at_index(rc: ResponseCache) -> None:
+    rc.set("old", "m", "_Answer", _Answer(text="old"), 0.0, ttl_seconds=60)
+    rc.set("new", "m", "_Answer", _Answer(text="new"), 0.0, ttl_seconds=60)
+    rc._conn.execute("UPDATE response_cache SET created_at = '2000-01-01T00:00:00+00:00' WHERE key_hash = 'old'")
+    rc._conn.commit()
+
+    plan = rc._conn.execute("EXPLAIN QUERY PLAN DELETE FROM response_cache WHERE created_at < ?", ("x",)).fetchall()
+    assert any("idx_response_cache_created_at" in str(row) for row in plan)
+    assert rc.purge_expired(60) == 1
+    assert [r[0] for r in rc._conn.execute("SELECT key_hash FROM response_cache")] == ["new"]
+
+
+def test_module_api_reuses_one_wal_connection(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path))
+    monkeypatch.setattr(llm_cache, "_caches", {})
+    llm_cache.set("k", "m", "_Answer", _Answer(text="x"), 0.02, ttl_seconds=60)
+    assert llm_cache.get("k", _Answer, 60)[0].text == "x"
+    assert llm_cache.get("missing", _Answer, 60) is None
+    assert llm_cache.get("k", _Answer, 0) is None
+    assert len(llm_cache._caches) == 1
+    db = tmp_path / "voiceforge" / "llm_response_cache.db"
+    conn = sqlite3.connect(str(db))
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    conn.close()
+    llm_cache._caches[str(db)].close()
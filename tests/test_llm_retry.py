@@ -99,7 +99,7 @@ def test_response_cache_second_call_hits_cache(tmp_path: object) -> None:
     with patch.dict(os.environ, {"XDG_DATA_HOME": str(tmp_path)}, clear=False):
         import voiceforge.llm.cache as cache_mod
 
-        cache_mod._init_done_paths.clear()
+        cache_mod._caches.clear()
         with (
             patch("voiceforge.core.metrics.get_cost_today", return_value=0.0),
             patch("voiceforge.core.config.Settings") as mock_settings,
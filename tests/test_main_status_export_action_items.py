@@ -111,16 +111,9 @@ def test_main_ical_and_session_helpers(monkeypatch, tmp_path: Path) -> None:
     assert "DTEND:20260308T100130Z" in vevent
 
 
-def test_main_template_and_speaker_helpers() -> None:
+def test_main_template_helpers() -> None:
     from voiceforge import main
 
-    diar_segments = [
-        SimpleNamespace(start=0.0, end=1.0, speaker="S1"),
-        SimpleNamespace(start=1.0, end=2.0, speaker="S2"),
-    ]
-    assert main._speaker_for_interval(1.1, 1.8, diar_segments) == "S2"
-    assert main._speaker_for_interval(2.5, 3.0, diar_segments) == ""
-
     lines, analysis = main._format_template_result(
         "standup",
         SimpleNamespace(model_dump=lambda mode="json": {"done": ["a"], "planned": ["b"], "blockers": ["c"]}),
@@ -375,14 +368,11 @@ def test_main_weekly_report_formats_and_stats_fallback(monkeypatch, tmp_path: Pa
     echoed: list[tuple[str, bool]] = []
 
     class _FakeTranscriptLog:
-        def get_sessions_in_range(self, from_date, to_date):
-            return [SimpleNamespace(id=11), SimpleNamespace(id=12)]
+        def get_period_stats(self, from_date, to_date):
+            return SimpleNamespace(sessions_count=2, action_items_by_status={"done": 1})
 
-        def get_action_items(self, limit: int):
-            return [
-                SimpleNamespace(session_id=11, description="Ship feature", status="done"),
-                SimpleNamespace(session_id=99, description="Ignore", status="todo"),
-            ]
+        def get_action_items_in_range(self, from_date, to_date):
+            return [SimpleNamespace(session_id=11, description="Ship feature", status="done")]
 
         def close(self) -> None:
             return None
@@ -395,6 +385,7 @@ def test_main_weekly_report_formats_and_stats_fallback(monkeypatch, tmp_path: Pa
     payload = json.loads(echoed[-1][0])
     assert payload["sessions_count"] == 2
     assert payload["action_items_count"] == 1
+    assert payload["action_items_by_status"] == {"done": 1}
     assert payload["action_items"][0]["description"] == "Ship feature"
 
     echoed.clear()
@@ -32,13 +32,18 @@ class _FakeCapture:
         arr = np.zeros(0, dtype=np.int16)
         return arr, arr
 
+    def flush_ring_file(self) -> bool:
+        """No mmap ring file in this fake."""
+        return False
+
 
 class _FakeCaptureWithAudio:
-    """Capture fake that always has audio available for final snapshot persistence."""
+    """Capture fake that always has audio and records ring file syncs."""
+
+    flushes: list[float]
 
     def __init__(self, *args: object, **kwargs: object) -> None:
-        """No-op init for test fake."""
-        return None
+        _FakeCaptureWithAudio.flushes = []
 
     def start(self) -> None:
         """No-op start for test fake."""
@@ -53,6 +58,11 @@ class _FakeCaptureWithAudio:
         mon = np.zeros(0, dtype=np.int16)
         return mic, mon
 
+    def flush_ring_file(self) -> bool:
+        """Record the msync of the (fake) mmap ring file."""
+        self.flushes.append(time.monotonic())
+        return True
+
 
 def test_meeting_help_exposes_command() -> None:
     """Meeting command is in CLI and --help shows template, no-analyze, seconds."""
@@ -125,7 +135,9 @@ def test_meeting_analyze_on_exit_calls_pipeline(monkeypatch, tmp_path) -> None:
 
     monkeypatch.setattr("voiceforge.cli.meeting.signal.signal", capture_signal)
 
-    def fake_pipeline(seconds: int, template: str | None = None) -> tuple[str, list, dict]:
+    def fake_pipeline(
+        seconds: int, template: str | None = None, audio_source: object = None, speaker_linker: object = None
+    ) -> tuple[str, list, dict]:
         return (
             "Summary: test",
             [{"start_sec": 0, "end_sec": 1, "speaker": "S1", "text": "hi"}],
@@ -165,7 +177,7 @@ def test_meeting_analyze_on_exit_calls_pipeline(monkeypatch, tmp_path) -> None:
 
 
 def test_meeting_final_flush_persists_ring_before_analyze(monkeypatch, tmp_path) -> None:
-    """Meeting should persist a final ring snapshot so quick stop still analyzes without prior listen."""
+    """Meeting syncs the mmap ring file once more on stop, before analyze; it never writes a snapshot over it."""
     monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path / "runtime"))
     monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
     monkeypatch.setattr("voiceforge.audio.capture.AudioCapture", _FakeCaptureWithAudio)
@@ -177,12 +189,12 @@ def test_meeting_final_flush_persists_ring_before_analyze(monkeypatch, tmp_path)
 
     monkeypatch.setattr("voiceforge.cli.meeting.signal.signal", capture_signal)
 
-    observed_ring: dict[str, object] = {}
+    flushes_before_analyze: list[int] = []
 
-    def fake_pipeline(seconds: int, template: str | None = None) -> tuple[str, list, dict]:
-        ring = tmp_path / "runtime" / "voiceforge" / "ring.raw"
-        observed_ring["exists"] = ring.exists()
-        observed_ring["size"] = ring.stat().st_size if ring.exists() else 0
+    def fake_pipeline(
+        seconds: int, template: str | None = None, audio_source: object = None, speaker_linker: object = None
+    ) -> tuple[str, list, dict]:
+        flushes_before_analyze.append(len(_FakeCaptureWithAudio.flushes))
         return ("Summary: flushed", [], {"model": "test", "cost_usd": 0.0})
 
     monkeypatch.setattr(main_mod, "run_analyze_pipeline", fake_pipeline)
@@ -209,6 +221,7 @@ def test_meeting_final_flush_persists_ring_before_analyze(monkeypatch, tmp_path)
     t.join(timeout=2.0)
 
     assert result.exit_code == 0, result.stdout + result.stderr
-    assert observed_ring.get("exists") is True
-    assert int(observed_ring.get("size", 0)) > 0
+    assert flushes_before_analyze and flushes_before_analyze[0] >= 2  # periodic sync + final sync on stop
+    ring_dir = tmp_path / "runtime" / "voiceforge"
+    assert not (ring_dir / "ring.raw").exists() and not (ring_dir / "ring.tmp").exists()
     assert "Summary: flushed" in result.stdout
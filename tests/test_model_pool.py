@@ -0,0 +1,85 @@
+"""ModelManager STT pool: shared ref-counted models, LRU eviction under stt_pool_mb, per-context copilot size."""
+
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+from typing import ClassVar
+from unittest.mock import patch
+
+import pytest
+
+from voiceforge.core import model_manager
+from voiceforge.core.model_manager import ModelManager, effective_stt_model_size
+
+
+class _FakeTranscriber:
+    loads: ClassVar[list[str]] = []
+
+    def __init__(self, model_size: str, **kwargs) -> None:
+        self._model_size = model_size
+        _FakeTranscriber.loads.append(model_size)
+
+
+@pytest.fixture
+def fake_transcriber():
+    _FakeTranscriber.loads = []
+    with patch("voiceforge.stt.transcriber.Transcriber", _FakeTranscriber):
+        yield _FakeTranscriber
+
+
+def _manager(pool_mb: int = 2048) -> ModelManager:
+    return ModelManager(SimpleNamespace(model_size="small", default_llm="x", stt_pool_mb=pool_mb))
+
+
+def test_sizes_stay_resident_and_are_shared(fake_transcriber) -> None:
+    mgr = _manager()
+    with mgr.stt() as small, mgr.stt("tiny") as tiny:
+        assert mgr.acquire_stt() is small  # second user of the same size shares the instance
+        mgr.release_stt(small)
+    for _ in range(3):  # copilot capture / analyze alternation: no reloads
+        with mgr.stt_size_override("tiny"), mgr.stt() as t:
+            assert t is tiny
+        assert mgr.get_transcriber() is small
+    assert fake_transcriber.loads == ["small", "tiny"]
+    assert mgr.get_stt_model_size() == "small"
+    assert mgr.resident_stt_sizes() == ["tiny", "small"]
+
+
+def test_lru_eviction_skips_models_in_use(fake_transcriber) -> None:
+    mgr = _manager(pool_mb=700)  # small (500) + tiny (120) fit, base (200) does not
+    pinned = mgr.acquire_stt("small")
+    mgr.get_transcriber()  # small again, still pinned once
+    with mgr.stt("tiny"):
+        pass
+    with mgr.stt("base"):
+        assert mgr.resident_stt_sizes() == ["small", "base"]  # idle tiny evicted, pinned small kept
+    mgr.release_stt(pinned)
+    mgr.swap_stt("medium")
+    assert mgr.resident_stt_sizes() == ["small", "base"]  # swap only changes the default size
+    mgr.unload_stt()
+    assert mgr.resident_stt_sizes() == []
+
+
+def test_concurrent_acquire_loads_once(fake_transcriber) -> None:
+    mgr = _manager()
+    got: list[object] = []
+    threads = [threading.Thread(target=lambda: got.append(mgr.get_transcriber())) for _ in range(8)]
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+    assert fake_transcriber.loads == ["small"]
+    assert len({id(t) for t in got}) == 1
+
+
+def test_effective_size_follows_override_and_manager(monkeypatch) -> None:
+    cfg = SimpleNamespace(model_size="medium")
+    monkeypatch.setattr(model_manager, "_instance", None)
+    assert effective_stt_model_size(cfg) == "medium"
+    mgr = _manager()
+    monkeypatch.setattr(model_manager, "_instance", mgr)
+    assert effective_stt_model_size(cfg) == "small"
+    with mgr.stt_size_override("tiny"):
+        assert effective_stt_model_size(cfg) == "tiny"
+    assert effective_stt_model_size(cfg) == "small"
@@ -119,7 +119,7 @@ def test_run_analyze_pipeline_returns_no_llm_backend_error_when_effective_llm_no
             self.transcript_redacted = "x"
 
     class FakePipeline:
-        def __init__(self, cfg=None):
+        def __init__(self, cfg=None, speaker_linker=None):
             # Empty: test fake (S1186).
             pass
 
@@ -129,7 +129,7 @@ def test_run_analyze_pipeline_returns_no_llm_backend_error_when_effective_llm_no
         def __exit__(self, *args):
             return False
 
-        def run(self, _sec):
+        def run(self, _sec, source=None):
             return (FakeResult(), None)
 
     monkeypatch.setattr("voiceforge.main._get_config", lambda: Settings())
@@ -155,7 +155,7 @@ def test_run_analyze_pipeline_skips_llm_on_silence(monkeypatch) -> None:
             self.warnings = []
 
     class FakePipeline:
-        def __init__(self, cfg=None):
+        def __init__(self, cfg=None, speaker_linker=None):
             # No-op for test fake (S1186).
             pass
 
@@ -165,7 +165,7 @@ def test_run_analyze_pipeline_skips_llm_on_silence(monkeypatch) -> None:
         def __exit__(self, *args):
             return False
 
-        def run(self, _sec):
+        def run(self, _sec, source=None):
             return (FakeResult(), None)
 
     monkeypatch.setattr("voiceforge.main._get_config", lambda: Settings())
@@ -9,6 +9,7 @@ from unittest.mock import MagicMock, patch
 import numpy as np
 import pytest
 
+from voiceforge.audio.source import CaptureSource, PcmSource
 from voiceforge.core.pipeline import (
     TARGET_SAMPLE_RATE,
     AnalysisPipeline,
@@ -18,6 +19,7 @@ from voiceforge.core.pipeline import (
     _prepare_audio,
     _rag_merge_results,
     _resample_to_16k,
+    _step1_stt,
     _with_calendar_context,
 )
 from voiceforge.rag.searcher import SearchResult
@@ -139,7 +141,7 @@ def test_with_calendar_context_enabled_injects_calendar(
 ) -> None:
     """_with_calendar_context appends calendar context when enabled and available."""
     monkeypatch.setattr(
-        "voiceforge.calendar.caldav_poll.get_next_meeting_context",
+        "voiceforge.calendar.mirror.next_meeting_context",
         lambda **kw: ("Next meeting: Standup — 2025-03-04T10:00:00+00:00", None),
     )
     cfg = SimpleNamespace(calendar_context_enabled=True)
@@ -159,7 +161,7 @@ def test_with_calendar_context_exception_returns_context_unchanged(
 ) -> None:
     """_with_calendar_context on exception returns context without calendar."""
     monkeypatch.setattr(
-        "voiceforge.calendar.caldav_poll.get_next_meeting_context",
+        "voiceforge.calendar.mirror.next_meeting_context",
         lambda **kw: _raise_cal_error(),
     )
     cfg = SimpleNamespace(calendar_context_enabled=True)
@@ -172,7 +174,7 @@ def test_with_calendar_context_enabled_empty_cal_returns_unchanged(
 ) -> None:
     """_with_calendar_context when calendar returns empty string leaves context unchanged."""
     monkeypatch.setattr(
-        "voiceforge.calendar.caldav_poll.get_next_meeting_context",
+        "voiceforge.calendar.mirror.next_meeting_context",
         lambda **kw: ("", None),
     )
     cfg = SimpleNamespace(calendar_context_enabled=True)
@@ -188,16 +190,15 @@ def test_rag_merge_results_empty_queries_returns_empty() -> None:
 
 
 def test_rag_merge_results_merges_by_chunk_id() -> None:
-    """_rag_merge_results merges results by chunk_id keeping higher score."""
-    r1 = SearchResult(chunk_id=1, content="first", source="", page=0, chunk_index=0, timestamp="", score=0.8)
-    r2 = SearchResult(chunk_id=1, content="first", source="", page=0, chunk_index=0, timestamp="", score=0.9)
-    r3 = SearchResult(chunk_id=2, content="second", source="", page=0, chunk_index=0, timestamp="", score=0.7)
+    """_rag_merge_results sends all non-empty queries to one search_many call."""
+    r1 = SearchResult(chunk_id=1, content="first", source="", page=0, chunk_index=0, timestamp="", score=0.9)
+    r2 = SearchResult(chunk_id=2, content="second", source="", page=0, chunk_index=0, timestamp="", score=0.7)
     searcher = MagicMock()
-    searcher.search = MagicMock(side_effect=[[r1, r3], [r2]])
-    out = _rag_merge_results(["q1", "q2"], searcher)
-    assert "first" in out
-    assert "second" in out
-    searcher.search.assert_called()
+    searcher.search_many = MagicMock(return_value=[r1, r2])
+    out = _rag_merge_results(["q1", " ", "q2"], searcher)
+    assert out == "first\nsecond"
+    searcher.search_many.assert_called_once_with(["q1", "q2"], top_k=3)
+    searcher.search.assert_not_called()
 
 
 def test_resample_to_16k_no_scipy_returns_unchanged(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -227,6 +228,21 @@ def test_pipeline_run_returns_none_when_no_ring(tmp_path: Path) -> None:
     assert err is not None
 
 
+def test_prepare_audio_from_memory_and_capture_sources_skips_ring_file(tmp_path: Path) -> None:
+    """In-memory sources need no ring file; PcmSource hands the tail to STT as a view of the caller's buffer."""
+    cfg = _make_cfg(tmp_path, tmp_path / "missing.raw")
+    pcm = np.arange(3 * TARGET_SAMPLE_RATE, dtype=np.int16)
+    audio, rate = _prepare_audio(cfg, seconds=2, source=PcmSource(pcm, TARGET_SAMPLE_RATE))
+    assert rate == TARGET_SAMPLE_RATE
+    assert len(audio) == 2 * TARGET_SAMPLE_RATE
+    assert np.shares_memory(audio, pcm)
+
+    monitor = np.ones(TARGET_SAMPLE_RATE, dtype=np.int16)
+    capture = SimpleNamespace(get_chunk=lambda seconds: (np.zeros(0, dtype=np.int16), monitor))
+    audio, _ = _prepare_audio(cfg, seconds=1, source=CaptureSource(capture, TARGET_SAMPLE_RATE))
+    assert audio is monitor  # mic empty: monitor audio
+
+
 @patch("voiceforge.core.pipeline._step1_stt")
 def test_pipeline_run_returns_none_when_stt_raises(
     mock_stt: object,
@@ -331,3 +347,24 @@ def test_pipeline_run_skips_step2_when_no_speech(
     assert result.diar_segments == []
     assert result.context == ""
     mock_gather.assert_not_called()
+
+
+def test_step1_stt_requests_word_timestamps_for_speaker_split() -> None:
+    """Analyze STT asks for word timestamps: attribute_segments splits segments at speaker turns with them."""
+    from contextlib import contextmanager
+
+    calls: list[dict] = []
+
+    class _Pooled:
+        def transcribe(self, audio, **kwargs):
+            calls.append(kwargs)
+            return []
+
+    @contextmanager
+    def stt(warnings=None):
+        yield _Pooled()
+
+    manager = SimpleNamespace(stt=stt)
+    with patch("voiceforge.core.model_manager.get_model_manager", return_value=manager):
+        _step1_stt(np.zeros(1600, dtype=np.float32), 16000, "tiny", cfg=SimpleNamespace(stt_backend="local"))
+    assert calls and calls[0]["word_timestamps"] is True
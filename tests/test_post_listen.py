@@ -59,7 +59,9 @@ def test_listen_auto_analyze_runs_pipeline_on_stop(monkeypatch, tmp_path) -> Non
 
     pipeline_called: list[tuple[int, str | None]] = []
 
-    def track_pipeline(seconds: int, template: str | None = None, dry_run: bool = False) -> tuple[str, list, dict]:
+    def track_pipeline(
+        seconds: int, template: str | None = None, dry_run: bool = False, audio_source: object = None
+    ) -> tuple[str, list, dict]:
         pipeline_called.append((seconds, template))
         return ("ok", [], {"model": "x", "cost_usd": 0.0})
 
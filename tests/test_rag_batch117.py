@@ -31,6 +31,9 @@ def test_index_directory_skips_excluded_and_collects_indexed_paths(tmp_path: Pat
             added.append(path)
             return 2
 
+        def add_files(self, paths: list[Path], **kwargs: object) -> types.SimpleNamespace:
+            return types.SimpleNamespace(indexed={str(Path(p).resolve()): self.add_file(Path(p)) for p in paths})
+
     total, indexed_paths = main_mod._index_directory(FakeIndexer(), tmp_path, ["*.tmp.txt"])
 
     assert total == 4
@@ -48,13 +51,16 @@ def test_index_command_directory_prunes_removed_sources_with_fake_indexer(monkey
     records: dict[str, object] = {"init": [], "added": [], "pruned": []}
 
     class FakeKnowledgeIndexer:
-        def __init__(self, db_path: str) -> None:
+        def __init__(self, db_path: str, **kwargs: object) -> None:
             records["init"].append(db_path)  # type: ignore[index]
 
         def add_file(self, path: Path) -> int:
             records["added"].append(path.name)  # type: ignore[index]
             return 3
 
+        def add_files(self, paths: list[Path], **kwargs: object) -> types.SimpleNamespace:
+            return types.SimpleNamespace(indexed={str(Path(p).resolve()): self.add_file(Path(p)) for p in paths})
+
         def prune_sources_not_in(self, keep_sources: set[str], only_under_prefix: str | None = None) -> int:
             records["pruned"].append((sorted(keep_sources), only_under_prefix))  # type: ignore[index]
             return 2
@@ -172,3 +178,50 @@ def test_searcher_helpers_cover_query_sanitization_and_rrf() -> None:
     assert searcher._sanitize_fts5_query('alpha "OR" beta') == '"alpha ""OR"" beta"'
     fused = searcher._reciprocal_rank_fusion([(1, 0.1), (2, 0.2)], [(2, 0.3), (3, 0.4)], k=10)
     assert [chunk_id for chunk_id, _score in fused] == [2, 1, 3]
+
+
+def test_search_many_merges_queries_on_fts_only_db(tmp_path: Path, monkeypatch) -> None:
+    db = tmp_path / "rag.db"
+    conn = sqlite3.connect(str(db))
+    conn.executescript(
+        """
+        CREATE TABLE chunks (id INTEGER PRIMARY KEY, source TEXT, page INTEGER, chunk_index INTEGER,
+            timestamp TEXT, content TEXT);
+        CREATE VIRTUAL TABLE fts_chunks USING fts5(content, chunk_id UNINDEXED);
+        """
+    )
+    for cid, text in enumerate(["budget review for q3", "contract renewal deadline", "budget and contract"], start=1):
+        conn.execute("INSERT INTO chunks VALUES (?, '/kb/a.md', 0, ?, 't', ?)", (cid, cid, text))
+        conn.execute("INSERT INTO fts_chunks(content, chunk_id) VALUES (?, ?)", (text, cid))
+    conn.commit()
+    conn.close()
+    monkeypatch.setattr(searcher, "sqlite_vec", None)
+    hs = searcher.HybridSearcher(str(db), model_dir=str(tmp_path))
+
+    results = hs.search_many(["budget", "", "contract"], top_k=3)
+
+    assert sorted(r.chunk_id for r in results) == [1, 2, 3]
+    assert [r.score for r in results] == sorted((r.score for r in results), reverse=True)
+    assert hs.search_many(["  "]) == []
+    hs.close()
+
+
+def test_query_embedding_cache_batches_misses_and_evicts_lru(tmp_path: Path) -> None:
+    import numpy as np
+
+    calls: list[list[str]] = []
+
+    class FakeEmbedder:
+        def encode(self, texts: list[str], batch_size: int = 32):
+            calls.append(list(texts))
+            return np.ones((len(texts), 4), dtype=np.float32)
+
+    hs = searcher.HybridSearcher(str(tmp_path / "rag.db"), model_dir=str(tmp_path), query_cache_size=2)
+    hs._embedder = FakeEmbedder()
+
+    assert len(hs._embed_queries(["Budget", "contract", "budget "])) == 3
+    hs._embed_queries(["BUDGET", "contract"])
+    hs._embed_queries(["deadline"])  # evicts "budget" (least recently used)
+    hs._embed_queries(["contract", "budget"])
+
+    assert calls == [["budget", "contract"], ["deadline"], ["budget"]]
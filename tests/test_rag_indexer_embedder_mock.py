@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import sqlite3
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
 
+from voiceforge.rag import _onnx_runner
 from voiceforge.rag.embedder import (
     EMBED_DIM,
     MiniLMEmbedder,
@@ -19,7 +22,9 @@ from voiceforge.rag.indexer import (
     CHUNK_TOKENS,
     KnowledgeIndexer,
     _chunk_text,
+    _dedup_keep_mask,
     _sections_to_new_chunks,
+    _vec_blob,
 )
 
 
@@ -71,6 +76,40 @@ def test_minilm_embedder_encode_with_mock_onnx(tmp_path: Path) -> None:
     assert out.shape == (2, EMBED_DIM)
 
 
+class _FakeTokenizer:
+    """Each word → one token id (its length), between [CLS]=101 and [SEP]=102."""
+
+    def encode_batch(self, texts: list[str], add_special_tokens: bool = True) -> list[SimpleNamespace]:
+        return [SimpleNamespace(ids=[101, *(len(w) for w in t.split()), 102]) for t in texts]
+
+
+class _FakeTokenSession:
+    """Token-level output only: each token's vector is its id repeated EMBED_DIM times."""
+
+    def __init__(self) -> None:
+        self.widths: list[int] = []
+
+    def get_inputs(self) -> list[SimpleNamespace]:
+        return [SimpleNamespace(name="input_ids"), SimpleNamespace(name="attention_mask")]
+
+    def run(self, _names, feed: dict[str, np.ndarray]) -> list[np.ndarray]:
+        self.widths.append(feed["input_ids"].shape[1])
+        return [np.repeat(feed["input_ids"][:, :, None].astype(np.float32), EMBED_DIM, axis=2)]
+
+
+def test_encode_batch_buckets_by_length_and_pools_with_mask() -> None:
+    """Texts sorted into length buckets padded to their own longest sequence; masked mean; input order kept."""
+    texts = ["a", "aaa bb cccc dd e", "bb", "aaaa bbbb cccc", "x y"]
+    session = _FakeTokenSession()
+    out = _onnx_runner.encode_batch(session, _FakeTokenizer(), texts, max_length=5, batch_size=2)
+
+    assert session.widths == [5, 4, 3]  # 7 tokens truncated to 5; then (5, 4) → 4; then 3
+    expected = [np.mean([101, *(len(w) for w in t.split()), 102][:5]) for t in texts]
+    np.testing.assert_allclose(out[:, 0], expected, rtol=1e-6)
+    assert out.shape == (len(texts), EMBED_DIM)
+    assert out.dtype == np.float32
+
+
 def test_chunk_text_splits_by_tokens() -> None:
     """_chunk_text splits text into ~CHUNK_TOKENS words per chunk."""
     words = ["w"] * 500
@@ -101,3 +140,53 @@ def test_knowledge_indexer_add_file_unsupported_raises(tmp_path: Path) -> None:
     bad_file.write_text("x")
     with pytest.raises(ValueError, match="Unsupported format"):
         idx.add_file(bad_file)
+
+
+def _plain_rag_conn() -> sqlite3.Connection:
+    """RAG schema without the sqlite-vec extension: vec_chunks as a plain (rowid, embedding) table."""
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(
+        """
+        CREATE TABLE chunks (id INTEGER PRIMARY KEY, source TEXT NOT NULL, page INTEGER NOT NULL,
+            chunk_index INTEGER NOT NULL, timestamp TEXT NOT NULL, content TEXT NOT NULL, content_hash TEXT);
+        CREATE TABLE vec_chunks (rowid INTEGER PRIMARY KEY, embedding BLOB);
+        CREATE VIRTUAL TABLE fts_chunks USING fts5(content, chunk_id UNINDEXED);
+        """
+    )
+    return conn
+
+
+def test_dedup_keep_mask_against_index_and_batch() -> None:
+    """Drops rows similar to an indexed vector or to an earlier kept row of the same batch."""
+    conn = _plain_rag_conn()
+    conn.execute("INSERT INTO vec_chunks(rowid, embedding) VALUES (1, ?)", (_vec_blob(np.array([1.0, 0.0, 0.0])),))
+    batch = np.array([[0.99, 0.05, 0.0], [0.0, 1.0, 0.0], [0.0, 0.98, 0.05], [0.0, 0.0, 1.0]], dtype=np.float32)
+    keep = _dedup_keep_mask(conn.cursor(), batch, threshold=0.95)
+    assert keep.tolist() == [False, True, False, True]
+
+
+def test_add_texts_batches_embeddings_and_bulk_writes(tmp_path: Path) -> None:
+    """One encode call per document (adds + updates), rows written for chunks/vec/fts; then incremental update."""
+    conn = _plain_rag_conn()
+    idx = KnowledgeIndexer(tmp_path / "vec.db", embed_batch_size=16)
+    idx._conn = conn
+    embedder = MagicMock()
+    rng = np.random.default_rng(0)
+    embedder.encode.side_effect = lambda texts, batch_size: rng.standard_normal((len(texts), EMBED_DIM)).astype(np.float32)
+    idx._embedder = embedder
+    sections = [f"section {i} " + " ".join(f"w{i}_{j}" for j in range(30)) for i in range(5)]
+
+    assert idx._add_texts("doc.md", sections) == (5, 0, 0)
+    embedder.encode.assert_called_once()
+    assert len(embedder.encode.call_args.args[0]) == 5
+    assert embedder.encode.call_args.kwargs["batch_size"] == 16
+    ids = [r[0] for r in conn.execute("SELECT id FROM chunks ORDER BY id")]
+    assert ids == [r[0] for r in conn.execute("SELECT rowid FROM vec_chunks ORDER BY rowid")]
+    assert conn.execute("SELECT COUNT(*) FROM fts_chunks").fetchone()[0] == 5
+
+    sections[2] = "changed " + sections[2]
+    assert idx._add_texts("doc.md", sections[:4]) == (0, 1, 1)
+    assert len(embedder.encode.call_args.args[0]) == 1
+    assert conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0] == 4
+    assert conn.execute("SELECT COUNT(*) FROM vec_chunks").fetchone()[0] == 4
+    assert conn.execute("SELECT content FROM fts_chunks WHERE fts_chunks MATCH 'changed'").fetchone() is not None
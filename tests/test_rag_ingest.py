@@ -0,0 +1,165 @@
+"""Staged multi-document ingestion (parse pool → batched embedding → single SQLite writer)."""
+
+from __future__ import annotations
+
+import sqlite3
+import sys
+import types
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from voiceforge.rag.embedder import EMBED_DIM
+from voiceforge.rag.indexer import KnowledgeIndexer
+from voiceforge.rag.ingest import parse_document, run_ingest
+from voiceforge.rag.watcher import KBWatcher, _ensure_indexed_table, _file_sha256
+
+
+def _plain_indexer(tmp_path: Path) -> tuple[KnowledgeIndexer, MagicMock]:
+    """KnowledgeIndexer on a file DB with the RAG schema minus sqlite-vec (vec_chunks as a plain table)."""
+    db = tmp_path / "rag.db"
+    conn = sqlite3.connect(str(db))
+    conn.executescript(
+        """
+        CREATE TABLE chunks (id INTEGER PRIMARY KEY, source TEXT NOT NULL, page INTEGER NOT NULL,
+            chunk_index INTEGER NOT NULL, timestamp TEXT NOT NULL, content TEXT NOT NULL, content_hash TEXT);
+        CREATE TABLE vec_chunks (rowid INTEGER PRIMARY KEY, embedding BLOB);
+        CREATE VIRTUAL TABLE fts_chunks USING fts5(content, chunk_id UNINDEXED);
+        """
+    )
+    idx = KnowledgeIndexer(db)
+    idx._conn = conn
+    embedder = MagicMock()
+    rng = np.random.default_rng(0)
+    embedder.encode.side_effect = lambda texts, batch_size: rng.standard_normal((len(texts), EMBED_DIM)).astype(np.float32)
+    idx._embedder = embedder
+    return idx, embedder
+
+
+def _write_docs(tmp_path: Path, n: int) -> list[Path]:
+    kb = tmp_path / "kb"
+    kb.mkdir()
+    paths = []
+    for i in range(n):
+        p = kb / f"doc{i}.txt"
+        p.write_text(" ".join(f"doc{i}_word{j}" for j in range(600)), encoding="utf-8")
+        paths.append(p)
+    return paths
+
+
+def test_parse_document_reports_unsupported_and_chunks_text(tmp_path: Path) -> None:
+    bad = tmp_path / "x.xyz"
+    bad.write_text("x")
+    assert "Unsupported format" in (parse_document(str(bad)).error or "")
+    good = tmp_path / "a.txt"
+    good.write_text("alpha beta gamma")
+    doc = parse_document(str(good))
+    assert doc.error is None
+    assert [c.content for c in doc.chunks] == ["alpha beta gamma"]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_ingest_indexes_files_and_reports_failures(tmp_path: Path, workers: int) -> None:
+    idx, embedder = _plain_indexer(tmp_path)
+    paths = _write_docs(tmp_path, 4)
+    broken = tmp_path / "kb" / "broken.xyz"
+    broken.write_text("x")
+    progress: list[int] = []
+    errors: list[str] = []
+
+    stats = run_ingest(
+        idx,
+        [*paths, broken],
+        workers=workers,
+        on_progress=lambda s: progress.append(s.files_done),
+        on_error=lambda source, message: errors.append(Path(source).name),
+    )
+
+    assert set(stats.indexed) == {str(p.resolve()) for p in paths}
+    assert errors == ["broken.xyz"]
+    assert stats.files_done == 5
+    assert progress[-1] == 5
+    chunks = idx._conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+    assert stats.chunks_added == chunks == sum(stats.indexed.values()) == 8  # 600 words → 2 chunks per file
+    assert sum(len(c.args[0]) for c in embedder.encode.call_args_list) == stats.chunks_embedded == 8
+    assert idx._conn.execute("SELECT COUNT(*) FROM vec_chunks").fetchone()[0] == chunks
+
+    again = run_ingest(idx, paths, workers=workers)
+    assert again.chunks_added == again.chunks_updated == again.chunks_embedded == 0
+
+
+def test_watcher_indexes_several_due_files_in_one_run(tmp_path: Path, monkeypatch) -> None:
+    pdfs = []
+    for name in ("a.pdf", "b.pdf", "c.pdf"):
+        p = tmp_path / name
+        p.write_bytes(b"%PDF-1.4 " + name.encode())
+        pdfs.append(p)
+    db_path = tmp_path / "rag.db"
+    conn = sqlite3.connect(str(db_path))
+    _ensure_indexed_table(conn)
+    conn.execute("INSERT INTO indexed_files(path, sha256) VALUES (?, ?)", (str(pdfs[0].resolve()), _file_sha256(pdfs[0])))
+    conn.commit()
+    conn.close()
+    calls: list[list[str]] = []
+
+    class FakeKnowledgeIndexer:
+        def __init__(self, db_arg: Path) -> None:
+            assert db_arg == db_path
+
+        def add_files(self, paths: list[str], workers: int | None = None) -> types.SimpleNamespace:
+            calls.append(sorted(Path(p).name for p in paths))
+            return types.SimpleNamespace(indexed={paths[0]: 3}, failed={paths[1]: "bad pdf"})
+
+        def close(self) -> None:
+            return None
+
+    fake_indexer = types.ModuleType("voiceforge.rag.indexer")
+    fake_indexer.KnowledgeIndexer = FakeKnowledgeIndexer
+    monkeypatch.setitem(sys.modules, "voiceforge.rag.indexer", fake_indexer)
+
+    watcher = KBWatcher(tmp_path, db_path, debounce_sec=1.0)
+    for p in pdfs:
+        watcher._on_pdf_event(str(p), now=0.0)
+    results = {Path(r.path).name: r for r in watcher._process_pending(now=5.0)}
+
+    assert calls == [["b.pdf", "c.pdf"]]
+    assert results["a.pdf"].status == "skipped"
+    assert (results["b.pdf"].status, results["b.pdf"].added) == ("indexed", 3)
+    assert (results["c.pdf"].status, results["c.pdf"].reason) == ("error", "bad pdf")
+    conn = sqlite3.connect(str(db_path))
+    rows = dict(conn.execute("SELECT path, sha256 FROM indexed_files").fetchall())
+    conn.close()
+    assert str(pdfs[1].resolve()) in rows
+    assert str(pdfs[2].resolve()) not in rows
+
+
+def test_watcher_index_many_uses_configured_embed_batch_size(tmp_path: Path, monkeypatch) -> None:
+    """rag_embed_batch_size reaches the KnowledgeIndexer of a batched watcher run."""
+    pdfs = [tmp_path / f"{name}.pdf" for name in ("a", "b")]
+    for i, p in enumerate(pdfs):
+        p.write_bytes(b"%PDF-1.4 " + bytes([i]))
+    batch_sizes: list[int] = []
+
+    class FakeKnowledgeIndexer:
+        def __init__(self, db_arg: Path, embed_batch_size: int = 64) -> None:
+            batch_sizes.append(embed_batch_size)
+
+        def add_files(self, paths: list[str], workers: int | None = None) -> types.SimpleNamespace:
+            return types.SimpleNamespace(indexed=dict.fromkeys(paths, 1), failed={})
+
+        def close(self) -> None:
+            return None
+
+    fake_indexer = types.ModuleType("voiceforge.rag.indexer")
+    fake_indexer.KnowledgeIndexer = FakeKnowledgeIndexer
+    monkeypatch.setitem(sys.modules, "voiceforge.rag.indexer", fake_indexer)
+
+    watcher = KBWatcher(tmp_path, tmp_path / "rag.db", debounce_sec=1.0, embed_batch_size=16)
+    for p in pdfs:
+        watcher._on_pdf_event(str(p), now=0.0)
+    results = watcher._process_pending(now=5.0)
+
+    assert [r.status for r in results] == ["indexed", "indexed"]
+    assert batch_sizes == [16]
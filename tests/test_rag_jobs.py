@@ -0,0 +1,117 @@
+"""Daemon indexing job queue (rag.jobs): immediate job ids, coalescing, warm indexer, progress updates."""
+
+from __future__ import annotations
+
+import threading
+import types
+from pathlib import Path
+
+from voiceforge.rag.jobs import IndexJobQueue, collect_files
+
+
+class _FakeIndexer:
+    instances = 0
+
+    def __init__(self, gate: threading.Event | None = None) -> None:
+        type(self).instances += 1
+        self.gate = gate
+        self.calls: list[list[str]] = []
+        self.pruned: list[str] = []
+        self.closed = False
+
+    def add_files(self, paths, *, workers=None, on_progress=None, on_error=None):
+        if self.gate is not None:
+            self.gate.wait(5)
+        names = sorted(Path(p).name for p in paths)
+        self.calls.append(names)
+        stats = types.SimpleNamespace(
+            indexed={str(p): 1 for p in paths if not str(p).endswith("bad.txt")},
+            files_done=len(paths),
+            chunks_added=len(paths),
+            chunks_updated=0,
+        )
+        for p in paths:
+            if str(p).endswith("bad.txt"):
+                on_error(str(p), "parse failed")
+        on_progress(stats)
+        return stats
+
+    def prune_sources_not_in(self, keep, only_under_prefix=None):
+        self.pruned.append(only_under_prefix)
+        return 0
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _wait(queue: IndexJobQueue, job_id: str) -> None:
+    done = threading.Event()
+    for _ in range(500):
+        job = queue.get(job_id)
+        if job is not None and job.state in ("done", "failed"):
+            return
+        done.wait(0.01)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+def test_collect_files_filters_extensions_and_excludes(tmp_path: Path) -> None:
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "a.md").write_text("a")
+    (tmp_path / "sub" / "b.pdf").write_bytes(b"%PDF")
+    (tmp_path / "c.tmp.txt").write_text("c")
+    (tmp_path / "d.bin").write_bytes(b"\x00")
+    assert [f.name for f in collect_files(tmp_path, ["*.tmp.txt"])] == ["a.md", "b.pdf"]
+    assert collect_files(tmp_path / "d.bin") == []
+
+
+def test_jobs_return_immediately_reuse_indexer_and_coalesce(tmp_path: Path) -> None:
+    kb = tmp_path / "kb"
+    kb.mkdir()
+    for name in ("a.md", "b.txt", "bad.txt"):
+        (kb / name).write_text(name)
+    extra = tmp_path / "extra.md"
+    extra.write_text("x")
+    gate = threading.Event()
+    indexers: list[_FakeIndexer] = []
+    updates: list[tuple[str, str]] = []
+
+    def factory() -> _FakeIndexer:
+        indexers.append(_FakeIndexer(gate))
+        return indexers[-1]
+
+    jobs = IndexJobQueue(factory, on_update=lambda j: updates.append((j.job_id, j.state)))
+    first = jobs.submit([kb])  # blocks in add_files until gate is set
+    second = jobs.submit([extra, kb / "a.md"])
+    third = jobs.submit([str(extra)])  # still queued → coalesced into second
+    assert third is second
+    assert first.job_id != second.job_id
+    gate.set()
+    _wait(jobs, first.job_id)
+    _wait(jobs, second.job_id)
+
+    assert len(indexers) == 1  # warm indexer reused across jobs
+    assert indexers[0].calls == [["a.md", "b.txt", "bad.txt"], ["a.md", "extra.md"]]
+    assert indexers[0].pruned == [str(kb.resolve())]  # only directories are pruned
+    assert first.state == "done"
+    assert (first.files_total, first.files_done) == (3, 3)
+    assert any("parse failed" in e for e in first.errors)
+    assert (first.job_id, "queued") in updates and (first.job_id, "done") in updates
+    assert [j.job_id for j in jobs.jobs()] == [first.job_id, second.job_id]
+
+    jobs.stop()
+    assert indexers[0].closed
+
+
+def test_job_fails_when_indexer_raises(tmp_path: Path) -> None:
+    doc = tmp_path / "a.md"
+    doc.write_text("a")
+
+    def factory() -> _FakeIndexer:
+        raise ImportError("Install [rag]")
+
+    jobs = IndexJobQueue(factory)
+    job = jobs.submit([doc])
+    _wait(jobs, job.job_id)
+    assert job.state == "failed"
+    assert job.errors == ["Install [rag]"]
+    jobs.stop()
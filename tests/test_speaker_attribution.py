@@ -0,0 +1,62 @@
+"""Speaker attribution (stt.speaker_attribution): max-overlap interval join, word-level splits at speaker changes."""
+
+from __future__ import annotations
+
+import random
+from types import SimpleNamespace
+
+from voiceforge.stt.speaker_attribution import SpeakerTimeline, attribute_segments, speaker_for_interval
+
+
+def _turn(start: float, end: float, speaker: str) -> SimpleNamespace:
+    return SimpleNamespace(start=start, end=end, speaker=speaker)
+
+
+def _scan(start: float, end: float, turns: list) -> str:
+    """Reference: linear scan, first turn with the largest overlap."""
+    best, best_overlap = "", 0.0
+    for d in sorted(turns, key=lambda d: d.start):
+        overlap = min(end, d.end) - max(start, d.start)
+        if overlap > best_overlap:
+            best, best_overlap = d.speaker, overlap
+    return best
+
+
+def test_assign_matches_linear_scan_with_overlapping_turns() -> None:
+    rng = random.Random(7)
+    turns = []
+    for _ in range(300):
+        start = rng.uniform(0, 600)
+        turns.append(_turn(start, start + rng.uniform(0.2, 40), f"S{rng.randrange(5)}"))
+    turns.append(_turn(0.0, 700.0, "LONG"))  # one turn spanning everything
+    queries = [(a, a + rng.uniform(0.1, 15)) for a in (rng.uniform(-10, 700) for _ in range(500))]
+    got = SpeakerTimeline(turns).assign([q[0] for q in queries], [q[1] for q in queries])
+    assert got == [_scan(a, b, turns) for a, b in queries]
+
+
+def test_no_overlap_and_empty_inputs() -> None:
+    turns = [_turn(0.0, 1.0, "S1"), _turn(1.0, 2.0, "S2")]
+    assert speaker_for_interval(1.1, 1.8, turns) == "S2"
+    assert speaker_for_interval(2.5, 3.0, turns) == ""
+    assert speaker_for_interval(0.0, 1.0, []) == ""
+    assert SpeakerTimeline(turns).assign([], []) == []
+
+
+def test_segment_spanning_speaker_change_is_split_on_words() -> None:
+    turns = [_turn(0.0, 2.0, "A"), _turn(2.0, 5.0, "B")]
+    words = [
+        SimpleNamespace(start=0.1, end=0.5, text="hello"),
+        SimpleNamespace(start=0.6, end=1.9, text="there"),
+        SimpleNamespace(start=2.1, end=2.6, text="hi"),
+        SimpleNamespace(start=2.7, end=3.5, text="back"),
+    ]
+    spanning = SimpleNamespace(start=0.0, end=3.6, text="hello there hi back", words=words)
+    plain = SimpleNamespace(start=3.8, end=4.5, text="ok", words=[])
+    out = attribute_segments([spanning, plain], turns)
+    assert [(a.start, a.end, a.speaker, a.text) for a in out] == [
+        (0.0, 1.9, "A", "hello there"),
+        (2.1, 3.6, "B", "hi back"),
+        (3.8, 4.5, "B", "ok"),
+    ]
+    unsplit = attribute_segments([spanning], turns, split_words=False)
+    assert [(a.speaker, a.text) for a in unsplit] == [("A", "hello there hi back")]
@@ -0,0 +1,134 @@
+"""Speculative copilot STT (stt.speculative): incremental decode while the key is held, tail-only decode on release."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from voiceforge.audio.source import PcmSource
+from voiceforge.core.pipeline import TARGET_SAMPLE_RATE, AnalysisPipeline
+from voiceforge.stt.speculative import SpeculativeTranscription
+from voiceforge.stt.transcriber import Segment, Word
+
+SR = TARGET_SAMPLE_RATE
+_STREAM = (np.arange(6 * SR) // 4).astype(np.int16)  # sample value == clock sample // 4 (int16 -> float is exact)
+_SCRIPT = [(0.3 + 0.25 * i, 0.5 + 0.25 * i, f"w{i}") for i in range(20)]  # clock seconds
+
+
+class _Capture:
+    """read_mic_since over _STREAM; append(n) makes n more samples available."""
+
+    def __init__(self, available: int, retained: int | None = None) -> None:
+        self.available = available
+        self.retained = retained
+        self._lock = threading.Lock()
+
+    def append(self, n: int) -> None:
+        with self._lock:
+            self.available += n
+
+    def read_since(self, start_sample, max_seconds=None):
+        with self._lock:
+            total = self.available
+        oldest = 0 if self.retained is None else max(0, total - self.retained)
+        start = oldest if start_sample is None else max(start_sample, oldest)
+        return (_STREAM[start:total], total)
+
+
+class _Transcriber:
+    """Script words fully inside the decoded window, times relative to the window."""
+
+    def __init__(self) -> None:
+        self.windows: list[int] = []
+
+    def transcribe(self, audio, **kwargs):
+        t0 = round(float(audio[0]) * 32768.0) * 4 / SR
+        t1 = t0 + audio.size / SR
+        self.windows.append(audio.size)
+        return [
+            Segment(start=s - t0, end=e - t0, text=w, language="en", confidence=0.9, words=[Word(s - t0, e - t0, w)])
+            for s, e, w in _SCRIPT
+            if s >= t0 and e <= t1
+        ]
+
+
+def _wait_for(session: SpeculativeTranscription, total: int) -> None:
+    deadline = time.monotonic() + 5.0
+    while session._cursor < total and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+
+def test_finish_decodes_only_tail_and_returns_capture_relative_segments() -> None:
+    capture = _Capture(available=8000)
+    tx = _Transcriber()
+    session = SpeculativeTranscription(tx, capture.read_since, SR, start_sample=2000, interval_sec=0.01).start()
+    for _ in range(9):
+        capture.append(8000)
+        _wait_for(session, capture.available)
+    capture.append(4000)  # released before the next tick
+    audio, segments, transcript = session.finish()
+
+    assert np.array_equal(audio, _STREAM[2000:84000])
+    assert transcript == " ".join(w for _, _, w in _SCRIPT)
+    assert segments[0].start == pytest.approx(0.3 - 2000 / SR, abs=1e-3)
+    assert all(0.0 <= s.start < s.end <= audio.size / SR for s in segments)
+    assert tx.windows[-1] < audio.size  # release decodes the uncommitted tail, not the whole capture
+
+
+def test_finish_returns_none_when_capture_overran_cursor() -> None:
+    capture = _Capture(available=16000, retained=4000)
+    session = SpeculativeTranscription(_Transcriber(), capture.read_since, SR, start_sample=0, interval_sec=0.01)
+    session.start()
+    _wait_for(session, capture.available)
+    capture.append(8000)  # more than the capture retains between two reads
+    assert session.finish() is None
+
+
+def test_pipeline_uses_precomputed_stt_for_whole_pcm_source(tmp_path: Path) -> None:
+    cfg = SimpleNamespace(
+        sample_rate=SR,
+        model_size="tiny",
+        pyannote_restart_hours=2,
+        pipeline_step2_timeout_sec=10.0,
+        pii_mode="ON",
+        calendar_context_enabled=False,
+        language="auto",
+        analysis_cache_mb=0,
+        get_ring_file_path=lambda: str(tmp_path / "missing.raw"),
+        get_rag_db_path=lambda: str(tmp_path / "rag.db"),
+    )
+    pcm = np.ones(int(2.5 * SR), dtype=np.int16)
+    segments = [Segment(start=0.2, end=1.0, text="hello there", language="en", confidence=0.9)]
+    source = PcmSource(pcm, SR, stt=(segments, "hello there"))
+    with (
+        patch("voiceforge.core.pipeline._step1_stt", side_effect=AssertionError("STT must be skipped")) as stt,
+        patch("voiceforge.core.pipeline._step2_diarization", return_value=([], [])),
+        patch("voiceforge.core.pipeline._step2_rag", return_value=("", [], [])),
+        AnalysisPipeline(cfg) as pipeline,
+    ):
+        result, err = pipeline.run(seconds=3, source=source)
+        assert err is None and result.transcript == "hello there"
+        stt.side_effect = lambda *a, **k: ([], "")
+        pipeline.run(seconds=2, source=source)  # only part of the audio: precomputed STT does not apply
+        assert stt.call_count == 1
+
+
+def test_kept_audio_is_bounded_by_max_seconds() -> None:
+    capture = _Capture(available=8000)
+    session = SpeculativeTranscription(
+        _Transcriber(), capture.read_since, SR, start_sample=0, interval_sec=0.01, max_seconds=1.0
+    ).start()
+    for _ in range(6):
+        capture.append(8000)
+        _wait_for(session, capture.available)
+    audio, segments, _ = session.finish()
+
+    assert np.array_equal(audio, _STREAM[56000 - SR : 56000])  # only the newest second is kept
+    assert session._kept == SR
+    assert segments and all(s.end > 0.0 for s in segments)
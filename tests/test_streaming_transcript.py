@@ -0,0 +1,94 @@
+"""Streaming transcript log (core.streaming_transcript): sequence cursors, bounded ring, spill to TranscriptLog."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from voiceforge.core.dbus_service import DaemonVoiceForgeInterface
+from voiceforge.core.streaming_transcript import StreamingTranscript
+from voiceforge.core.transcript_log import TranscriptLog
+
+
+def _texts(reply: dict) -> list[str]:
+    return [f["text"] for f in reply["finals"]]
+
+
+def _transcript(tmp_path: Path, ring_size: int = 4, spill_batch: int = 2) -> StreamingTranscript:
+    db = tmp_path / "transcripts.db"
+    return StreamingTranscript(ring_size, spill_batch, log_factory=lambda: TranscriptLog(db, pooled=False))
+
+
+def test_since_returns_only_new_finals_and_partial(tmp_path: Path) -> None:
+    st = _transcript(tmp_path)
+    for i in range(3):
+        st.add_final(f"w{i}", float(i), i + 0.5)
+    st.set_partial("tail")
+
+    first = st.since(0)
+    assert _texts(first) == ["w0", "w1", "w2"] and [f["seq"] for f in first["finals"]] == [1, 2, 3]
+    assert first["cursor"] == 3 and first["partial"] == "tail"
+    assert not (first["more"] or first["reset"] or first["truncated"])
+
+    st.add_final("w3", 3.0, 3.5)
+    again = st.since(first["cursor"])
+    assert _texts(again) == ["w3"] and again["cursor"] == 4 and again["partial"] == "tail"
+    assert st.since(4)["finals"] == []
+
+
+def test_ring_spills_to_transcript_log_and_late_clients_read_back(tmp_path: Path) -> None:
+    st = _transcript(tmp_path)
+    for i in range(11):
+        st.add_final(f"w{i}", float(i), i + 0.5)
+
+    assert len(st.snapshot()["finals"]) <= 4 + 2  # ring stays bounded
+    assert _texts(st.since(0)) == [f"w{i}" for i in range(11)]
+    page = st.since(2, limit=3)
+    assert _texts(page) == ["w2", "w3", "w4"] and page["cursor"] == 5 and page["more"]
+
+    st.reset()  # new listen session: spill cleared, numbering continues
+    st.add_final("next", 0.0, 1.0)
+    stale = st.since(5)
+    assert _texts(stale) == ["next"] and stale["truncated"] and stale["cursor"] == 12
+
+
+def test_cursor_ahead_of_log_resets_to_beginning(tmp_path: Path) -> None:
+    st = _transcript(tmp_path)
+    st.add_final("hello", 0.0, 1.0)
+    reply = st.since(900)  # client kept a cursor from before a daemon restart
+    assert reply["reset"] and _texts(reply) == ["hello"] and reply["cursor"] == 1
+
+
+def test_failed_spill_keeps_ring_bounded_and_reports_truncation() -> None:
+    class _Broken:
+        def log_streaming_finals(self, finals, replace=False):
+            raise OSError("disk full")
+
+        def close(self) -> None:
+            pass
+
+    st = StreamingTranscript(2, 1, log_factory=_Broken)
+    for i in range(5):
+        st.add_final(f"w{i}", float(i), i + 0.5)
+    reply = st.since(0)
+    assert reply["truncated"] and _texts(reply) == ["w3", "w4"]
+
+
+def test_dbus_get_streaming_transcript_since_envelope(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("VOICEFORGE_IPC_ENVELOPE", "1")
+    st = StreamingTranscript()
+    st.add_final("hello", 0.0, 1.0)
+    iface = DaemonVoiceForgeInterface(
+        analyze_fn=lambda seconds, template=None: "ok",
+        status_fn=lambda: "idle",
+        listen_start_fn=lambda: None,
+        listen_stop_fn=lambda: None,
+        is_listening_fn=lambda: True,
+        optional={"get_streaming_transcript_since_fn": lambda cursor: json.dumps(st.since(cursor))},
+    )
+    payload = json.loads(DaemonVoiceForgeInterface.GetStreamingTranscriptSince.__wrapped__(iface, 0))
+    assert payload["ok"] is True
+    assert payload["data"]["streaming_transcript"]["cursor"] == 1
+    assert _texts(payload["data"]["streaming_transcript"]) == ["hello"]
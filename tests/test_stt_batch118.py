@@ -11,17 +11,24 @@ import numpy as np
 from typer.testing import CliRunner
 
 import voiceforge.main as main_mod
-from voiceforge.stt.streaming import StreamingTranscriber
-from voiceforge.stt.transcriber import Segment, Transcriber
+from voiceforge.stt.transcriber import Transcriber
 
 runner = CliRunner()
 
 
 class _FakeAudioCapture:
-    def __init__(self, sample_rate: int, buffer_seconds: float, monitor_source: str | None) -> None:
+    def __init__(
+        self,
+        sample_rate: int,
+        buffer_seconds: float,
+        monitor_source: str | None,
+        ring_file_path: str | None = None,
+        mic_float32: bool = False,
+    ) -> None:
         self.sample_rate = sample_rate
         self.buffer_seconds = buffer_seconds
         self.monitor_source = monitor_source
+        self.ring_file_path = ring_file_path
 
     def start(self) -> None:
         return None
@@ -41,23 +48,6 @@ def _last_json_line(stdout: str) -> dict:
     raise AssertionError(f"No JSON payload found in output: {stdout}")
 
 
-def test_streaming_process_chunk_reuses_float32_buffer_without_resample() -> None:
-    seen: list[np.ndarray] = []
-
-    class FakeTranscriber:
-        def transcribe(self, audio, **kwargs):  # type: ignore[no-untyped-def]
-            seen.append(audio)
-            return [Segment(start=0.0, end=0.5, text="ok", language="en", confidence=0.9)]
-
-    audio = np.linspace(-0.25, 0.25, 512, dtype=np.float32)
-    stream = StreamingTranscriber(FakeTranscriber(), sample_rate=16000)
-
-    stream.process_chunk(audio, start_offset_sec=0.0)
-
-    assert len(seen) == 1
-    assert seen[0] is audio
-
-
 def test_transcriber_transcribe_reuses_float32_input_for_model_call(monkeypatch) -> None:
     class FakeModel:
         def __init__(self) -> None:
@@ -174,3 +174,153 @@ def test_get_session_meta_nonexistent(tmp_path: Path) -> None:
     log = TranscriptLog(db_path=tmp_path / "t.db")
     assert log.get_session_meta(99999) is None
     log.close()
+
+
+def test_log_segments_incremental_then_finish_session(tmp_path: Path) -> None:
+    """Streaming: start_session → log_segments_incremental (FTS + counters set-based) → log_session(session_id=...)."""
+    log = TranscriptLog(db_path=tmp_path / "t.db")
+    started = datetime(2026, 3, 2, 10, 0, tzinfo=UTC)
+    sid = log.start_session(started_at=started)
+    first = [{"start_sec": i, "end_sec": i + 1, "speaker": f"S{i % 2}", "text": f"alpha {i}"} for i in range(3)]
+    assert log.log_segments_incremental(sid, first) == 3
+    assert log.log_segments_incremental(sid, []) == 0
+    assert log.get_sessions()[0].segments_count == 3
+    assert log.get_session_meta(sid)[2] == pytest.approx(3.0)
+
+    rest = [{"start_sec": 10, "end_sec": 12.5, "speaker": "S2", "text": "beta closing"}]
+    assert log.log_session(rest, ended_at=started + timedelta(minutes=5), answers=["done"], session_id=sid) == sid
+    [row] = log.get_sessions_for_display()
+    assert (row.segments_count, row.speaker_count, row.summary_preview) == (4, 3, "done")
+    assert log.get_session_meta(sid)[2] == pytest.approx(12.5)
+    assert [r[0] for r in log.search_transcripts("alpha")] == [sid, sid, sid]
+    assert [r[1] for r in log.search_transcripts("closing")] == ["beta closing"]
+    with pytest.raises(ValueError, match="Unknown session_id"):
+        log.log_segments_incremental(sid + 1, first)
+    log.close()
+
+
+def test_log_session_bulk_is_atomic(tmp_path: Path) -> None:
+    """Segments, analysis and action items are written in one transaction; a failure leaves nothing behind."""
+    log = TranscriptLog(db_path=tmp_path / "t.db")
+    segments = [{"start_sec": i, "end_sec": i + 1, "speaker": "A", "text": f"t{i}"} for i in range(1000)]
+    with pytest.raises(TypeError):
+        log.log_session(segments, answers=[object()])  # json.dumps fails after the segments were inserted
+    assert log.get_sessions() == []
+    assert log.search_transcripts("t1") == []
+    sid = log.log_session(segments, action_items=[{"description": f"a{i}"} for i in range(3)])
+    assert log.get_sessions()[0].segments_count == 1000
+    assert [a.idx_in_analysis for a in log.get_action_items(session_id=sid)] == [0, 1, 2]
+    conn = log._get_conn()
+    assert conn.execute("SELECT COUNT(*) FROM segments_bulk_load").fetchone()[0] == 0
+    assert [r[1] for r in log.search_transcripts("t999")] == ["t999"]
+    log.close()
+
+
+def test_default_transcript_log_uses_shared_pool(tmp_path: Path, monkeypatch) -> None:
+    """TranscriptLog() shares one pool per process: migrations checked once, query_only readers, bounded readers."""
+    import sqlite3
+    import threading
+
+    import voiceforge.core.transcript_log as mod
+
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path))
+    migrated: list[Path] = []
+    real_migrate = mod._ensure_migrated
+    monkeypatch.setattr(mod, "_ensure_migrated", lambda conn, path: (migrated.append(path), real_migrate(conn, path)))
+
+    writer = TranscriptLog()
+    sid = writer.log_session([{"start_sec": 0, "end_sec": 1, "speaker": "A", "text": "pooled"}])
+    writer.close()
+    results: list[int] = []
+
+    def read() -> None:
+        for _ in range(20):
+            log = TranscriptLog()
+            results.append(log.get_sessions(last_n=5)[0].id)
+            log.close()
+
+    threads = [threading.Thread(target=read) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == [sid] * 160
+    assert len(migrated) == 1
+    pool = mod.get_transcript_pool()
+    assert pool is TranscriptLog()._pool
+    assert pool._opened <= mod.POOL_READERS
+    with pool.reader() as conn, pytest.raises(sqlite3.OperationalError):
+        conn.execute("DELETE FROM sessions")
+    assert TranscriptLog(db_path=tmp_path / "own.db")._pool is None
+
+
+def test_period_report_streams_sessions_and_aggregates_in_sql(tmp_path: Path) -> None:
+    log = TranscriptLog(db_path=tmp_path / "t.db")
+    day = datetime(2025, 5, 5, 9, 0, tzinfo=UTC)
+    first = log.log_session(
+        [
+            {"start_sec": 5, "end_sec": 6, "speaker": "B", "text": "second " * 20},
+            {"start_sec": 0, "end_sec": 1, "speaker": "A", "text": "first"},
+        ],
+        started_at=day,
+        ended_at=day,
+        action_items=[{"description": "Ship"}, {"description": "Review"}],
+    )
+    second = log.log_session(
+        [{"start_sec": 0, "end_sec": 1, "speaker": "A", "text": "later"}],
+        started_at=day + timedelta(hours=2),
+        ended_at=day + timedelta(hours=2),
+        action_items=[{"description": "Plan"}],
+    )
+    log.log_session([{"start_sec": 0, "end_sec": 1, "speaker": "A", "text": "outside"}], started_at=day - timedelta(days=3))
+    log.update_action_item_statuses_in_db(first, [(0, "done")])
+    d = day.date()
+
+    rows = list(log.iter_period_segments(d, d, batch_size=1))
+    assert [(sid, seg.text[:6]) for sid, _, seg in rows] == [(first, "first"), (first, "second"), (second, "later")]
+    excerpts = list(log.iter_period_sessions(d, d, max_chars_per_session=20))
+    assert [(e.session_id, e.segments_count, e.speakers, e.truncated) for e in excerpts] == [
+        (first, 2, ["A", "B"], True),
+        (second, 1, ["A"], False),
+    ]
+    assert len(excerpts[0].text) <= 20
+    full = log.get_period_text(d, d)
+    assert full.startswith(f"[Сессия {first} ") and "later" in full and "outside" not in full
+    assert log.get_daily_transcript_text(d) == full
+    short = log.get_period_text(d, d, max_chars=120)
+    assert len(short) <= 120 and "later" in short  # budget split per session
+
+    stats = log.get_period_stats(d, d)
+    assert (stats.sessions_count, stats.sessions_with_segments, stats.segments_count) == (2, 2, 3)
+    assert stats.action_items_by_status == {"done": 1, "open": 2}
+    items = log.get_action_items_in_range(d, d)
+    assert [(a.session_id, a.description, a.status) for a in items] == [
+        (first, "Ship", "done"),
+        (first, "Review", "open"),
+        (second, "Plan", "open"),
+    ]
+    log.close()
+
+
+def test_pool_writer_rolls_back_failed_block(tmp_path: Path) -> None:
+    """A writer block that raises leaves no open transaction: the next write does not commit its statements."""
+    from datetime import date
+
+    import voiceforge.core.transcript_log as mod
+
+    pool = mod.TranscriptPool(tmp_path / "pool.db")
+    log = TranscriptLog(db_path=tmp_path / "pool.db")
+    log._pool = pool
+    with pytest.raises(RuntimeError), pool.writer() as conn:
+        conn.execute(
+            "INSERT INTO period_reports (period_from, period_to, report_text, created_at) VALUES (?, ?, ?, ?)",
+            ("2026-01-01", "2026-01-31", "half-done", "2026-02-01"),
+        )
+        raise RuntimeError("failed mid-write")
+    with pool.writer() as conn:
+        assert not conn.in_transaction
+    log.save_daily_report(date(2026, 2, 1), report_text="next write")
+    assert log.get_period_report(date(2026, 1, 1), date(2026, 1, 31)) is None
+    assert log.get_daily_report(date(2026, 2, 1))[0] == "next write"
+    pool.close()
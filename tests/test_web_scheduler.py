@@ -0,0 +1,104 @@
+"""Web request scheduler (web.scheduler): bounded analysis pool, 429 + Retry-After, read pool for light endpoints."""
+
+from __future__ import annotations
+
+import json
+import socket
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from voiceforge.web import scheduler
+
+
+@pytest.fixture(autouse=True)
+def _fresh_executors(monkeypatch):
+    monkeypatch.setenv("VOICEFORGE_WEB_ANALYZE_WORKERS", "1")
+    monkeypatch.setenv("VOICEFORGE_WEB_ANALYZE_QUEUE", "1")
+    scheduler.shutdown_executors()
+    yield
+    scheduler.shutdown_executors()
+
+
+def _fill_analyze_pool(gate: threading.Event) -> list:
+    executor = scheduler.get_analyze_executor()
+    return [executor.submit(gate.wait, 5) for _ in range(executor.capacity)]
+
+
+def test_bounded_executor_admits_capacity_then_rejects() -> None:
+    executor = scheduler.BoundedExecutor("test", workers=1, queue_size=1)
+    gate = threading.Event()
+    running = executor.submit(gate.wait, 5)
+    waiting = executor.submit(lambda: "done")
+    assert executor.queued >= 1
+    with pytest.raises(scheduler.ExecutorFull) as exc:
+        executor.submit(lambda: None)
+    assert exc.value.retry_after == scheduler.DEFAULT_RETRY_AFTER_SEC
+    gate.set()
+    assert running.result(5) is True
+    assert waiting.result(5) == "done"
+    assert executor.queued == 0
+    assert executor.submit(lambda: 1).result(5) == 1  # slots released
+    assert 1 <= executor._retry_after_locked() < scheduler.DEFAULT_RETRY_AFTER_SEC  # estimate from measured runs
+    executor.shutdown(wait=True)
+
+
+def test_async_analyze_returns_429_when_queue_full_and_reads_stay_available(monkeypatch) -> None:
+    try:
+        from starlette.testclient import TestClient
+    except ImportError:
+        pytest.skip("starlette test client not installed")
+
+    from voiceforge.web import server_async
+
+    monkeypatch.setattr(server_async, "_sync_status", lambda: (200, server_async._CONTENT_TYPE_JSON, b'{"ok": true}'))
+    gate = threading.Event()
+    blockers = _fill_analyze_pool(gate)
+    try:
+        client = TestClient(server_async._build_app())
+        for path in ("/api/analyze", "/api/analyze/stream"):
+            r = client.post(path, json={"seconds": 5})
+            assert r.status_code == 429
+            assert r.headers["retry-after"] == str(scheduler.DEFAULT_RETRY_AFTER_SEC)
+            assert r.json()["error"]["code"] == "TOO_MANY_REQUESTS"
+        assert client.get("/api/status").json() == {"ok": True}
+        assert client.get("/health").status_code == 200
+    finally:
+        gate.set()
+        for f in blockers:
+            f.result(5)
+
+
+def test_sync_server_analyze_returns_429_when_queue_full(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
+    from voiceforge.web.server import _PooledHTTPServer, _VoiceForgeHandler
+
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    server = _PooledHTTPServer(("127.0.0.1", port), _VoiceForgeHandler, workers=2)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    gate = threading.Event()
+    blockers = _fill_analyze_pool(gate)
+    try:
+        req = urllib.request.Request(
+            f"http://127.0.0.1:{port}/api/analyze",
+            data=json.dumps({"seconds": 5}).encode("utf-8"),
+            method="POST",
+            headers={"Content-Type": "application/json"},
+        )
+        with pytest.raises(urllib.error.HTTPError) as exc:
+            urllib.request.urlopen(req, timeout=5)
+        assert exc.value.code == 429
+        assert exc.value.headers["Retry-After"] == str(scheduler.DEFAULT_RETRY_AFTER_SEC)
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=5) as r:
+            assert r.status == 200
+    finally:
+        gate.set()
+        for f in blockers:
+            f.result(5)
+        server.shutdown()
+        server.server_close()